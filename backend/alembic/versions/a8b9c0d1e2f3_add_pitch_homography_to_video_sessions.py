@@ -0,0 +1,39 @@
+"""add pitch homography to video_sessions
+
+Revision ID: a8b9c0d1e2f3
+Revises: f7a8b9c0d1e2
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a8b9c0d1e2f3"
+down_revision: str | Sequence[str] | None = "f7a8b9c0d1e2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Store the calibration homography on video_sessions."""
+    op.add_column(
+        "video_sessions",
+        sa.Column(
+            "pitch_homography",
+            sa.JSON(),
+            nullable=True,
+            comment="3x3 pixel-to-pitch homography computed from pitch_corners when saved",
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Remove the calibration homography from video_sessions."""
+    op.drop_column("video_sessions", "pitch_homography")
@@ -0,0 +1,39 @@
+"""add heartbeat_at to video_analysis_jobs
+
+Revision ID: c4d5e6f7a8b9
+Revises: ab12cd34ef56
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4d5e6f7a8b9"
+down_revision: str | Sequence[str] | None = "ab12cd34ef56"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add worker heartbeat timestamp to video_analysis_jobs."""
+    op.add_column(
+        "video_analysis_jobs",
+        sa.Column(
+            "heartbeat_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="Last worker heartbeat while the job was running",
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Remove worker heartbeat timestamp from video_analysis_jobs."""
+    op.drop_column("video_analysis_jobs", "heartbeat_at")
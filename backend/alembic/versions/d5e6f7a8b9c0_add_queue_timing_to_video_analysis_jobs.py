@@ -0,0 +1,49 @@
+"""add queue timing to video_analysis_jobs
+
+Revision ID: d5e6f7a8b9c0
+Revises: c4d5e6f7a8b9
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d5e6f7a8b9c0"
+down_revision: str | Sequence[str] | None = "c4d5e6f7a8b9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add queue entry time and measured queue wait to video_analysis_jobs."""
+    op.add_column(
+        "video_analysis_jobs",
+        sa.Column(
+            "queued_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="When the job last entered the queue",
+        ),
+    )
+    op.add_column(
+        "video_analysis_jobs",
+        sa.Column(
+            "queue_wait_seconds",
+            sa.Float(),
+            nullable=True,
+            comment="Seconds spent queued before a worker claimed the job",
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Remove queue timing columns from video_analysis_jobs."""
+    op.drop_column("video_analysis_jobs", "queue_wait_seconds")
+    op.drop_column("video_analysis_jobs", "queued_at")
@@ -0,0 +1,49 @@
+"""add pose cache counts to video_analysis_jobs
+
+Revision ID: e6f7a8b9c0d1
+Revises: d5e6f7a8b9c0
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e6f7a8b9c0d1"
+down_revision: str | Sequence[str] | None = "d5e6f7a8b9c0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add pose cache hit/miss counts to video_analysis_jobs."""
+    op.add_column(
+        "video_analysis_jobs",
+        sa.Column(
+            "pose_cache_hits",
+            sa.Integer(),
+            nullable=True,
+            comment="Analysis passes served from the pose cache (last run)",
+        ),
+    )
+    op.add_column(
+        "video_analysis_jobs",
+        sa.Column(
+            "pose_cache_misses",
+            sa.Integer(),
+            nullable=True,
+            comment="Analysis passes that ran pose extraction (last run)",
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Remove pose cache counts from video_analysis_jobs."""
+    op.drop_column("video_analysis_jobs", "pose_cache_misses")
+    op.drop_column("video_analysis_jobs", "pose_cache_hits")
@@ -0,0 +1,39 @@
+"""add chunk plan to video_analysis_jobs
+
+Revision ID: f7a8b9c0d1e2
+Revises: e6f7a8b9c0d1
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f7a8b9c0d1e2"
+down_revision: str | Sequence[str] | None = "e6f7a8b9c0d1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add the GPU chunk plan to video_analysis_jobs."""
+    op.add_column(
+        "video_analysis_jobs",
+        sa.Column(
+            "chunk_plan",
+            sa.JSON(),
+            nullable=True,
+            comment="How GPU chunks were planned (method, keyframe-aligned start frames)",
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Remove the GPU chunk plan from video_analysis_jobs."""
+    op.drop_column("video_analysis_jobs", "chunk_plan")
@@ -54,6 +54,8 @@ class Settings(BaseSettings):
     COACH_PLUS_S3_PREFIX: str = Field(default="coach_plus", alias="COACH_PLUS_S3_PREFIX")
     S3_UPLOAD_URL_EXPIRES_SECONDS: int = Field(default=3600, alias="S3_UPLOAD_URL_EXPIRES_SECONDS")
     S3_STREAM_URL_EXPIRES_SECONDS: int = Field(default=300, alias="S3_STREAM_URL_EXPIRES_SECONDS")
+    # S3-compatible endpoint for worker video reads (MinIO, local stand-ins); empty = AWS
+    S3_ENDPOINT_URL: str = Field(default="", alias="S3_ENDPOINT_URL")
     SQS_VIDEO_ANALYSIS_QUEUE_URL: str = Field(default="", alias="SQS_VIDEO_ANALYSIS_QUEUE_URL")
 
     # Coach Pro Plus analysis worker (DB-backed queue)
@@ -64,9 +66,70 @@ class Settings(BaseSettings):
         default=True, alias="COACH_PLUS_DEEP_ANALYSIS_ENABLED"
     )
     COACH_PLUS_QUICK_MAX_SECONDS: int = Field(default=30, alias="COACH_PLUS_QUICK_MAX_SECONDS")
+    # Also write pose frames as JSON next to the .npz pose arrays (export only)
+    COACH_PLUS_POSE_JSON_EXPORT: bool = Field(default=False, alias="COACH_PLUS_POSE_JSON_EXPORT")
+    # Chunk artifacts downloaded at once while aggregating GPU results
+    COACH_PLUS_AGGREGATION_DOWNLOAD_CONCURRENCY: int = Field(
+        default=8, alias="COACH_PLUS_AGGREGATION_DOWNLOAD_CONCURRENCY"
+    )
+    # Ball tracking: "detect" (full search per frame) or opt-in "kalman" (predicted-window search)
+    COACH_PLUS_BALL_TRACKING_MODE: str = Field(
+        default="detect", alias="COACH_PLUS_BALL_TRACKING_MODE"
+    )
+    # Workers decode straight from a presigned URL (ranged reads) instead of downloading first
+    COACH_PLUS_STREAM_VIDEO_INPUT: bool = Field(default=True, alias="COACH_PLUS_STREAM_VIDEO_INPUT")
+    # Must outlive the longest analysis: the decoder issues new ranged requests when it seeks
+    COACH_PLUS_VIDEO_STREAM_URL_EXPIRES_SECONDS: int = Field(
+        default=21600, alias="COACH_PLUS_VIDEO_STREAM_URL_EXPIRES_SECONDS"
+    )
+    # Content-addressed pose results reused by retries and re-analysis of the same video
+    COACH_PLUS_POSE_CACHE_ENABLED: bool = Field(default=True, alias="COACH_PLUS_POSE_CACHE_ENABLED")
+    # Bump when the pose model file is replaced in place (invalidates cached poses)
+    COACH_PLUS_POSE_MODEL_VERSION: str = Field(default="1", alias="COACH_PLUS_POSE_MODEL_VERSION")
+    # DEEP pass: sample densely around detected motion, sparsely elsewhere (frame budget)
+    COACH_PLUS_MOTION_SAMPLING_ENABLED: bool = Field(
+        default=False, alias="COACH_PLUS_MOTION_SAMPLING_ENABLED"
+    )
+    COACH_PLUS_MOTION_DENSE_FPS: float = Field(default=30.0, alias="COACH_PLUS_MOTION_DENSE_FPS")
+    COACH_PLUS_MOTION_FRAME_BUDGET: int = Field(default=600, alias="COACH_PLUS_MOTION_FRAME_BUDGET")
+    # Reuse warmed pose detectors across videos in a worker process (false: one per video)
+    COACH_PLUS_POSE_DETECTOR_REUSE: bool = Field(
+        default=True, alias="COACH_PLUS_POSE_DETECTOR_REUSE"
+    )
+    # Workers push job stage/progress to the job's event stream (postgres/inprocess channels)
+    COACH_PLUS_JOB_PROGRESS_PUSH: bool = Field(default=True, alias="COACH_PLUS_JOB_PROGRESS_PUSH")
+    # Idle seconds between keep-alive comments on an open job event stream
+    COACH_PLUS_JOB_PROGRESS_KEEPALIVE_SECONDS: float = Field(
+        default=15.0, alias="COACH_PLUS_JOB_PROGRESS_KEEPALIVE_SECONDS"
+    )
     COACH_PLUS_STALE_JOB_THRESHOLD_SECONDS: int = Field(
         default=1800, alias="COACH_PLUS_STALE_JOB_THRESHOLD_SECONDS"
     )
+    # Processes for CPU-bound analysis (0 = run in a thread of the worker process)
+    COACH_PLUS_ANALYSIS_PROCESSES: int = Field(default=1, alias="COACH_PLUS_ANALYSIS_PROCESSES")
+    COACH_PLUS_HEARTBEAT_SECONDS: float = Field(default=15.0, alias="COACH_PLUS_HEARTBEAT_SECONDS")
+    # Concurrent jobs per worker; one slot is kept for clips up to FAST_LANE_SECONDS
+    COACH_PLUS_WORKER_SLOTS: int = Field(default=2, alias="COACH_PLUS_WORKER_SLOTS")
+    COACH_PLUS_FAST_LANE_SECONDS: float = Field(default=120.0, alias="COACH_PLUS_FAST_LANE_SECONDS")
+    # Cap on the summed duration of videos being analysed at once on this host
+    COACH_PLUS_MAX_INFLIGHT_VIDEO_SECONDS: float = Field(
+        default=3600.0, alias="COACH_PLUS_MAX_INFLIGHT_VIDEO_SECONDS"
+    )
+    # Worker wake-ups: auto | postgres | sqs | inprocess (polling backs off to the max)
+    COACH_PLUS_WAKEUP_CHANNEL: str = Field(default="auto", alias="COACH_PLUS_WAKEUP_CHANNEL")
+    COACH_PLUS_WAKEUP_SQS_QUEUE_URL: str = Field(
+        default="", alias="COACH_PLUS_WAKEUP_SQS_QUEUE_URL"
+    )
+    COACH_PLUS_IDLE_POLL_MAX_SECONDS: float = Field(
+        default=30.0, alias="COACH_PLUS_IDLE_POLL_MAX_SECONDS"
+    )
+
+    # GPU Chunked Processing
+    CHUNK_SECONDS: int = Field(default=30, alias="CHUNK_SECONDS")
+    # Move chunk boundaries onto keyframes (probed once at upload) so chunk seeks are exact
+    CHUNK_KEYFRAME_ALIGN: bool = Field(default=True, alias="CHUNK_KEYFRAME_ALIGN")
+    SAMPLE_FPS: float = Field(default=10.0, alias="SAMPLE_FPS")
+    MAX_WIDTH: int = Field(default=640, alias="MAX_WIDTH")
 
     @field_validator("STATIC_ROOT", mode="before")
     @classmethod
@@ -128,6 +191,10 @@ class Settings(BaseSettings):
     def s3_stream_url_expires_seconds(self) -> int:
         return self.S3_STREAM_URL_EXPIRES_SECONDS
 
+    @property
+    def s3_endpoint_url(self) -> str:
+        return self.S3_ENDPOINT_URL
+
     @property
     def sqs_video_analysis_queue_url(self) -> str:
         return self.SQS_VIDEO_ANALYSIS_QUEUE_URL
@@ -144,9 +211,93 @@ class Settings(BaseSettings):
     def coach_plus_quick_max_seconds(self) -> int:
         return self.COACH_PLUS_QUICK_MAX_SECONDS
 
+    @property
+    def coach_plus_pose_json_export(self) -> bool:
+        return self.COACH_PLUS_POSE_JSON_EXPORT
+
+    @property
+    def coach_plus_aggregation_download_concurrency(self) -> int:
+        return self.COACH_PLUS_AGGREGATION_DOWNLOAD_CONCURRENCY
+
+    @property
+    def coach_plus_ball_tracking_mode(self) -> str:
+        return self.COACH_PLUS_BALL_TRACKING_MODE
+
+    @property
+    def coach_plus_stream_video_input(self) -> bool:
+        return self.COACH_PLUS_STREAM_VIDEO_INPUT
+
+    @property
+    def coach_plus_video_stream_url_expires_seconds(self) -> int:
+        return self.COACH_PLUS_VIDEO_STREAM_URL_EXPIRES_SECONDS
+
+    @property
+    def coach_plus_pose_cache_enabled(self) -> bool:
+        return self.COACH_PLUS_POSE_CACHE_ENABLED
+
+    @property
+    def coach_plus_pose_model_version(self) -> str:
+        return self.COACH_PLUS_POSE_MODEL_VERSION
+
+    @property
+    def coach_plus_motion_sampling_enabled(self) -> bool:
+        return self.COACH_PLUS_MOTION_SAMPLING_ENABLED
+
+    @property
+    def coach_plus_motion_dense_fps(self) -> float:
+        return self.COACH_PLUS_MOTION_DENSE_FPS
+
+    @property
+    def coach_plus_motion_frame_budget(self) -> int:
+        return self.COACH_PLUS_MOTION_FRAME_BUDGET
+
+    @property
+    def coach_plus_pose_detector_reuse(self) -> bool:
+        return self.COACH_PLUS_POSE_DETECTOR_REUSE
+
+    @property
+    def coach_plus_job_progress_push(self) -> bool:
+        return self.COACH_PLUS_JOB_PROGRESS_PUSH
+
+    @property
+    def coach_plus_job_progress_keepalive_seconds(self) -> float:
+        return self.COACH_PLUS_JOB_PROGRESS_KEEPALIVE_SECONDS
+
     @property
     def coach_plus_stale_job_threshold_seconds(self) -> int:
         return self.COACH_PLUS_STALE_JOB_THRESHOLD_SECONDS
 
+    @property
+    def coach_plus_analysis_processes(self) -> int:
+        return self.COACH_PLUS_ANALYSIS_PROCESSES
+
+    @property
+    def coach_plus_heartbeat_seconds(self) -> float:
+        return self.COACH_PLUS_HEARTBEAT_SECONDS
+
+    @property
+    def coach_plus_worker_slots(self) -> int:
+        return self.COACH_PLUS_WORKER_SLOTS
+
+    @property
+    def coach_plus_fast_lane_seconds(self) -> float:
+        return self.COACH_PLUS_FAST_LANE_SECONDS
+
+    @property
+    def coach_plus_max_inflight_video_seconds(self) -> float:
+        return self.COACH_PLUS_MAX_INFLIGHT_VIDEO_SECONDS
+
+    @property
+    def coach_plus_wakeup_channel(self) -> str:
+        return self.COACH_PLUS_WAKEUP_CHANNEL
+
+    @property
+    def coach_plus_wakeup_sqs_queue_url(self) -> str:
+        return self.COACH_PLUS_WAKEUP_SQS_QUEUE_URL
+
+    @property
+    def coach_plus_idle_poll_max_seconds(self) -> float:
+        return self.COACH_PLUS_IDLE_POLL_MAX_SECONDS
+
 
 settings = Settings()
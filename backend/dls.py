@@ -1,15 +1,19 @@
 # backend/dls.py
 from __future__ import annotations
 
-import csv
-import json
-import math
+import logging
 import os
 from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Literal
 
+from backend.services.dls import resources as dls_resources
+from backend.services.dls.resources import ResourceGrid
+
+logger = logging.getLogger(__name__)
+
 # ------------------------------
 # Resource tables (externalized)
 # ------------------------------
@@ -22,53 +26,46 @@ from typing import Any, Literal
 # 0,0,0,0,...,0
 
 
-@dataclass
 class ResourceTable:
-    # resources[overs_remaining][wickets_lost] -> percentage 0..100
-    resources: list[list[float]]  # index by overs_remaining (int), 0..M
-    max_overs: int
+    """
+    Resources remaining (%) as a function of (overs_remaining, wickets_lost).
+
+    Thin view over a process-wide ``ResourceGrid`` (see
+    backend/services/dls/resources.py), which stores the table at ball
+    resolution so lookups are O(1) and can be vectorised via ``self.grid``.
+    """
+
+    __slots__ = ("_grid",)
+
+    def __init__(self, grid: ResourceGrid) -> None:
+        self._grid = grid
+
+    @property
+    def grid(self) -> ResourceGrid:
+        return self._grid
+
+    @property
+    def max_overs(self) -> int:
+        return self.grid.format_overs
+
+    @property
+    def resources(self) -> list[list[float]]:
+        # resources[overs_remaining][wickets_lost] -> percentage 0..100
+        return self.grid.over_rows()
 
     @classmethod
     def from_csv(cls, path: str) -> ResourceTable:
-        if not os.path.exists(path):
-            raise FileNotFoundError(f"DLS resource CSV not found: {path}")
-        rows: list[list[float]] = []
-        with open(path, newline="") as f:
-            r = csv.DictReader(f)
-            # Expect overs_remaining + w0..w9
-            tmp: dict[int, list[float]] = {}
-            max_over = 0
-            for rec in r:
-                o = int(float(rec["overs_remaining"]))
-                max_over = max(max_over, o)
-                cols: list[float] = []
-                for w in range(10):
-                    cols.append(float(rec.get(f"w{w}", 0.0)))
-                tmp[o] = cols
-            # Normalize to contiguous 0..max_over
-            rows = [tmp.get(o, [0.0] * 10) for o in range(max_over + 1)]
-        return cls(resources=rows, max_overs=len(rows) - 1)
+        return cls(dls_resources.csv_grid(str(Path(path).resolve())))
 
     def R(self, overs_remaining: float, wickets_lost: int) -> float:
         """
         Return resources remaining (%) for a given (overs_remaining, wickets_lost).
-        Linearâ€`interpolate on fractional overs; clamp wickets 0..9 and overs 0..max.
+        Linear-interpolate on fractional overs; clamp wickets 0..9 and overs 0..max.
         """
-        w = max(0, min(9, wickets_lost))
-        if overs_remaining <= 0:
-            return 0.0
-        if overs_remaining >= self.max_overs:
-            return self.resources[self.max_overs][w]
-        # Interpolate between floor and ceil
-        lo = int(overs_remaining)
-        hi = min(self.max_overs, lo + 1)
-        frac = overs_remaining - lo
-        Rlo = self.resources[lo][w]
-        Rhi = self.resources[hi][w]
-        return (1 - frac) * Rlo + frac * Rhi
+        return float(self.grid.R(overs_remaining, wickets_lost))
 
 
-@dataclass
+@dataclass(frozen=True)
 class DLSEnv:
     table: ResourceTable
     # G is the â€œaverage 50-over scoreâ€ constant used in DLS (ICC uses ~245 for ODI).
@@ -213,11 +210,26 @@ def par_score_now(
     return int(math.floor(S1 * (R2_used_so_far / R1_total)) + 1)
 
 
+class DLSMissingTable(FileNotFoundError):
+    """Raised when no DLS lookup table is available for the requested format."""
+
+
 # Convenience to load T20/ODI tables
+@lru_cache(maxsize=16)
 def load_env(kind: Literal["odi", "t20"], base_dir: str) -> DLSEnv:
+    """
+    DLS environment for ``kind`` from ``{base_dir}/static/dls/{kind}.csv``.
+
+    Cached for the process; the returned env is immutable and shared by every
+    caller. Raises ``DLSMissingTable`` (a ``FileNotFoundError``) when the CSV
+    does not exist.
+    """
     # Put your CSVs in backend/static/dls/{odi.csv,t20.csv}
     path = os.path.join(base_dir, "static", "dls", f"{kind}.csv")
+    if not os.path.exists(path):
+        raise DLSMissingTable(f"DLS resource CSV not found: {path}")
     table = ResourceTable.from_csv(path)
+    logger.info(f"Loaded DLS {kind} resource table from {path}")
     # Choose G constant (rarely used in simple R2/R1 scenarios, but kept configurable)
     G = 245.0 if kind == "odi" else 150.0
     return DLSEnv(table=table, G=G)
@@ -226,8 +238,6 @@ def load_env(kind: Literal["odi", "t20"], base_dir: str) -> DLSEnv:
 # ---------------------------------------------------------------------------
 # Lightweight public helper used by tests / CLI tooling
 # ---------------------------------------------------------------------------
-class DLSMissingTable(FileNotFoundError):
-    """Raised when no DLS lookup table is available for the requested format."""
 
 
 @dataclass
@@ -239,64 +249,12 @@ class DLSComputation:
     R2_used: float
 
 
-def _load_json_table(path: Path, format_overs: int) -> ResourceTable:
-    """Build a ResourceTable from a legacy JSON placeholder file."""
-    payload = json.loads(path.read_text(encoding="utf-8"))
-    max_wickets = 10  # DLS tables define wickets lost 0..9 (10th wicket ends innings)
-    resources: list[list[float]] = []
-
-    for overs_left in range(format_overs + 1):
-        overs_bowled = float(format_overs - overs_left)
-        row: list[float] = []
-        for w in range(max_wickets):
-            w_key = str(w)
-            series: dict[str, Any] | None = payload.get(w_key)
-            if not series:
-                # Fallback to simple proportional model when data missing
-                remaining = max(0.0, (overs_left / max(1, format_overs)) * 100.0)
-                row.append(remaining)
-                continue
-
-            start_raw = float(series.get("0", 100.0))
-            end_raw = float(series.get(str(format_overs), 0.0))
-            denom = start_raw - end_raw if start_raw != end_raw else 1.0
-
-            ob_floor = math.floor(overs_bowled)
-            ob_ceil = math.ceil(overs_bowled)
-            ob_floor = max(0, min(format_overs, ob_floor))
-            ob_ceil = max(0, min(format_overs, ob_ceil))
-
-            raw_floor = float(series.get(str(ob_floor), end_raw))
-            raw_ceil = float(series.get(str(ob_ceil), end_raw))
-
-            if ob_floor == ob_ceil:
-                raw = raw_floor
-            else:
-                frac = overs_bowled - ob_floor
-                raw = raw_floor + (raw_ceil - raw_floor) * frac
-
-            remaining = (raw - end_raw) / (denom or 1.0) * 100.0
-            remaining = max(0.0, min(100.0, remaining))
-            row.append(remaining)
-        resources.append(row)
-
-    return ResourceTable(resources=resources, max_overs=format_overs)
-
-
 def _resource_table_for_format(format_overs: int) -> ResourceTable:
-    base_dir = Path(__file__).resolve().parent
-
-    # Priority: CSV in static/dls/<format>.csv (matches load_env expectations)
-    csv_path = base_dir / "static" / "dls" / f"{format_overs}.csv"
-    if csv_path.exists():
-        return ResourceTable.from_csv(str(csv_path))
-
-    # Fallback: legacy JSON placeholder static/dls_<overs>.json
-    json_path = base_dir / "static" / f"dls_{format_overs}.json"
-    if json_path.exists():
-        return _load_json_table(json_path, format_overs=format_overs)
-
-    raise DLSMissingTable(f"No DLS table found for {format_overs}-over format")
+    # Priority: CSV in static/dls/<format>.csv, then legacy JSON static/dls_<overs>.json
+    grid = dls_resources.bundled_grid(format_overs)
+    if grid is None:
+        raise DLSMissingTable(f"No DLS table found for {format_overs}-over format")
+    return ResourceTable(grid)
 
 
 def compute_dls_target(
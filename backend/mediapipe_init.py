@@ -11,6 +11,7 @@ Environment:
 
 import logging
 import os
+from functools import lru_cache
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -148,6 +149,21 @@ def get_model_path() -> str:
     return str(model_path)
 
 
+@lru_cache(maxsize=2)
+def _read_model_asset(model_path: str, mtime_ns: int) -> bytes:
+    with open(model_path, "rb") as f:
+        return f.read()
+
+
+def load_model_asset(model_path: str) -> bytes:
+    """Return the model file's bytes, read once per process (again if the file changes).
+
+    Detectors are rebuilt for every VIDEO-mode analysis; building them from the
+    loaded bytes keeps the model off the disk after the first build.
+    """
+    return _read_model_asset(model_path, Path(model_path).stat().st_mtime_ns)
+
+
 def get_running_mode() -> str:
     """Get and validate MediaPipe running mode.
 
@@ -230,7 +246,7 @@ def build_pose_landmarker():
         running_mode = running_mode_map[running_mode_str]
 
         options = PoseLandmarkerOptions(
-            base_options=BaseOptions(model_asset_path=model_path),
+            base_options=BaseOptions(model_asset_buffer=load_model_asset(model_path)),
             running_mode=running_mode,
             num_poses=1,  # Single person detection
         )
@@ -250,7 +266,7 @@ def build_pose_landmarker():
     except Exception as e:
         # Clear error message for common failure cases
         error_msg = str(e)
-        if "model_asset_path" in error_msg or "model asset" in error_msg.lower():
+        if "model_asset" in error_msg or "model asset" in error_msg.lower():
             raise RuntimeError(
                 f"Failed to load model file: {model_path}\n"
                 f"Model may be corrupted or in wrong format.\n"
@@ -8,28 +8,51 @@ Feature-gated by role (coach_pro_plus, org_pro).
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
 from datetime import UTC, datetime
 from typing import Annotated, Any
 from uuid import uuid4
 
 import boto3
+import numpy as np
 from backend import security
 from backend.config import settings
+from backend.services.ball_tracking_service import (
+    classify_lengths,
+    classify_lines,
+    compute_homography,
+    homography_to_json,
+    load_homography,
+    project_points_to_pitch,
+)
 from backend.services.coach_findings import generate_findings
 from backend.services.coach_report_service import generate_report_text
+from backend.services.job_progress import (
+    TERMINAL_JOB_STATUSES,
+    get_job_progress_hub,
+    job_progress_event,
+)
+from backend.services.job_wakeup import CHUNKS_TOPIC, JOBS_TOPIC, publish_wakeup
 from backend.services.pose_metrics import build_pose_metric_evidence, compute_pose_metrics
-from backend.services.s3_service import s3_service
+from backend.services.s3_service import cached_presigned_get_url, s3_service
 from backend.services.video_chunking import (
-    create_chunk_specs,
     get_video_duration_from_s3,
+    plan_video_chunks,
 )
 from backend.services.video_job_recovery import (
+    STALE_CANDIDATE_STATUSES,
     is_retryable_video_job,
     mark_stale_video_analysis_jobs,
     retry_video_analysis_job,
 )
-from backend.sql_app.database import get_db
+from backend.services.video_job_summary import (
+    JOB_RESULT_FIELDS,
+    SessionJobSummary,
+    load_session_job_summaries,
+)
+from backend.sql_app.database import get_db, get_session_local
 from backend.sql_app.models import (
     OwnerTypeEnum,
     RoleEnum,
@@ -43,7 +66,8 @@ from backend.sql_app.models import (
     VideoSessionStatus,
 )
 from botocore.exceptions import ClientError
-from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -56,15 +80,6 @@ logger = logging.getLogger(__name__)
 JOB_ARTIFACT_COMPLETE_STATES = frozenset(
     {VideoAnalysisJobStatus.completed, VideoAnalysisJobStatus.done}
 )
-JOB_RESULT_FIELDS = (
-    "results",
-    "quick_results",
-    "deep_results",
-    "quick_findings",
-    "deep_findings",
-    "quick_results_s3_key",
-    "deep_results_s3_key",
-)
 
 
 # ============================================================================
@@ -179,6 +194,10 @@ class VideoAnalysisJobRead(BaseModel):
     deep_results_url: str | None = None
 
     created_at: datetime
+    queued_at: datetime | None = None
+    queue_wait_seconds: float | None = None
+    pose_cache_hits: int | None = None
+    pose_cache_misses: int | None = None
     started_at: datetime | None = None
     completed_at: datetime | None = None
     updated_at: datetime
@@ -316,13 +335,24 @@ def _can_access_video_session(user: User, session: VideoSession) -> bool:
     return False
 
 
-def _build_job_artifact_metadata(job: VideoAnalysisJob) -> dict[str, Any]:
-    results_available = any(getattr(job, field_name, None) for field_name in JOB_RESULT_FIELDS)
-    report_available = bool(job.quick_report or job.deep_report)
-    pdf_available = bool(job.pdf_s3_key)
+async def _publish_job_queued(db: AsyncSession, job: VideoAnalysisJob) -> None:
+    """Wake idle workers for a job that has just been (re)queued."""
+    if job.status != VideoAnalysisJobStatus.queued:
+        return
+    if job.deep_mode == "gpu":
+        await publish_wakeup(CHUNKS_TOPIC, job.id, db=db)
+    await publish_wakeup(JOBS_TOPIC, job.id, db=db)
+
 
+def _artifact_metadata(
+    job_status: VideoAnalysisJobStatus,
+    *,
+    results_available: bool,
+    report_available: bool,
+    pdf_available: bool,
+) -> dict[str, Any]:
     missing_artifacts: list[str] = []
-    if job.status in JOB_ARTIFACT_COMPLETE_STATES:
+    if job_status in JOB_ARTIFACT_COMPLETE_STATES:
         if not results_available:
             missing_artifacts.append("analysis_results")
         if not report_available:
@@ -338,25 +368,35 @@ def _build_job_artifact_metadata(job: VideoAnalysisJob) -> dict[str, Any]:
     }
 
 
-def _build_session_history_metadata(session: VideoSession) -> dict[str, Any]:
-    jobs_with_created_at = [item for item in session.analysis_jobs if item.created_at]
-    if jobs_with_created_at:
-        latest_job = max(jobs_with_created_at, key=lambda item: item.created_at)
-    elif session.analysis_jobs:
-        latest_job = max(session.analysis_jobs, key=lambda item: item.updated_at)
-    else:
-        latest_job = None
-    latest_job_metadata = _build_job_artifact_metadata(latest_job) if latest_job else {}
+def _build_job_artifact_metadata(job: VideoAnalysisJob) -> dict[str, Any]:
+    return _artifact_metadata(
+        job.status,
+        results_available=any(getattr(job, field_name, None) for field_name in JOB_RESULT_FIELDS),
+        report_available=bool(job.quick_report or job.deep_report),
+        pdf_available=bool(job.pdf_s3_key),
+    )
+
+
+def _build_session_history_metadata(summary: SessionJobSummary | None) -> dict[str, Any]:
+    if summary is None:
+        return {"analysis_job_count": 0}
+    latest_job = summary.latest_job
+    latest_job_metadata = _artifact_metadata(
+        latest_job.status,
+        results_available=latest_job.results_available,
+        report_available=latest_job.report_available,
+        pdf_available=latest_job.pdf_available,
+    )
     return {
-        "analysis_job_count": len(session.analysis_jobs),
-        "latest_job_id": latest_job.id if latest_job else None,
-        "latest_job_status": latest_job.status.value if latest_job else None,
-        "latest_job_created_at": latest_job.created_at if latest_job else None,
-        "latest_job_completed_at": latest_job.completed_at if latest_job else None,
-        "latest_job_results_available": latest_job_metadata.get("results_available", False),
-        "latest_job_report_available": latest_job_metadata.get("report_available", False),
-        "latest_job_pdf_available": latest_job_metadata.get("pdf_available", False),
-        "missing_artifacts": latest_job_metadata.get("missing_artifacts", []),
+        "analysis_job_count": summary.job_count,
+        "latest_job_id": latest_job.id,
+        "latest_job_status": latest_job.status.value,
+        "latest_job_created_at": latest_job.created_at,
+        "latest_job_completed_at": latest_job.completed_at,
+        "latest_job_results_available": latest_job_metadata["results_available"],
+        "latest_job_report_available": latest_job_metadata["report_available"],
+        "latest_job_pdf_available": latest_job_metadata["pdf_available"],
+        "missing_artifacts": latest_job_metadata["missing_artifacts"],
     }
 
 
@@ -403,32 +443,24 @@ async def list_video_sessions(
     # Build query based on user role
     if current_user.is_superuser:
         # Superusers see all sessions
-        query = select(VideoSession).options(selectinload(VideoSession.analysis_jobs))
+        query = select(VideoSession)
     elif current_user.role == RoleEnum.org_pro:
         # Org users see their org sessions plus personal fallback sessions.
-        query = (
-            select(VideoSession)
-            .where(
-                (
-                    (VideoSession.owner_type == OwnerTypeEnum.org)
-                    & (VideoSession.owner_id == current_user.org_id)
-                )
-                | (
-                    (VideoSession.owner_type == OwnerTypeEnum.coach)
-                    & (VideoSession.owner_id == current_user.id)
-                )
+        query = select(VideoSession).where(
+            (
+                (VideoSession.owner_type == OwnerTypeEnum.org)
+                & (VideoSession.owner_id == current_user.org_id)
             )
-            .options(selectinload(VideoSession.analysis_jobs))
-        )
-    else:
-        # Coach users see only their own sessions
-        query = (
-            select(VideoSession)
-            .where(
+            | (
                 (VideoSession.owner_type == OwnerTypeEnum.coach)
                 & (VideoSession.owner_id == current_user.id)
             )
-            .options(selectinload(VideoSession.analysis_jobs))
+        )
+    else:
+        # Coach users see only their own sessions
+        query = select(VideoSession).where(
+            (VideoSession.owner_type == OwnerTypeEnum.coach)
+            & (VideoSession.owner_id == current_user.id)
         )
 
     # Apply status filters (performance optimization)
@@ -451,9 +483,13 @@ async def list_video_sessions(
     result = await db.execute(query)
     sessions = result.scalars().all()
 
+    # Job summaries come from one projection query; job rows (and their
+    # results/report JSON) are never loaded for a listing
+    summaries = await load_session_job_summaries(db, [session.id for session in sessions])
+
     return [
         VideoSessionRead.model_validate(session).model_copy(
-            update=_build_session_history_metadata(session)
+            update=_build_session_history_metadata(summaries.get(session.id))
         )
         for session in sessions
     ]
@@ -489,11 +525,7 @@ async def get_video_session(
         )
 
     # Fetch session from database
-    result = await db.execute(
-        select(VideoSession)
-        .options(selectinload(VideoSession.analysis_jobs))
-        .where(VideoSession.id == session_id)
-    )
+    result = await db.execute(select(VideoSession).where(VideoSession.id == session_id))
     session = result.scalar_one_or_none()
 
     if not session:
@@ -505,8 +537,9 @@ async def get_video_session(
             detail="You don't have access to this session",
         )
 
+    summaries = await load_session_job_summaries(db, [session.id])
     return VideoSessionRead.model_validate(session).model_copy(
-        update=_build_session_history_metadata(session)
+        update=_build_session_history_metadata(summaries.get(session.id))
     )
 
 
@@ -724,6 +757,7 @@ async def create_analysis_job(
         status=VideoAnalysisJobStatus.queued,
         stage="QUEUED",
         progress_pct=0,
+        queued_at=datetime.now(UTC),
         deep_enabled=bool(settings.COACH_PLUS_DEEP_ANALYSIS_ENABLED),
         analysis_mode=analysis_mode,  # Store analysis mode
     )
@@ -731,6 +765,7 @@ async def create_analysis_job(
     db.add(job)
     await db.commit()
     await db.refresh(job)
+    await publish_wakeup(JOBS_TOPIC, job.id, db=db)
 
     return VideoAnalysisJobRead.model_validate(job)
 
@@ -771,7 +806,7 @@ async def list_analysis_jobs(
     # List jobs for this session
     result = await db.execute(
         select(VideoAnalysisJob)
-        .options(selectinload(VideoAnalysisJob.session), selectinload(VideoAnalysisJob.chunks))
+        .options(selectinload(VideoAnalysisJob.session))
         .where(VideoAnalysisJob.session_id == session_id)
         .order_by(VideoAnalysisJob.created_at.desc())
     )
@@ -825,12 +860,10 @@ async def get_analysis_job(
             detail="Insufficient feature access: video_analysis_enabled",
         )
 
-    await mark_stale_video_analysis_jobs(db, job_id=job_id)
-
     # Fetch job (eager-load session to avoid async lazy-load / MissingGreenlet)
     result = await db.execute(
         select(VideoAnalysisJob)
-        .options(selectinload(VideoAnalysisJob.session), selectinload(VideoAnalysisJob.chunks))
+        .options(selectinload(VideoAnalysisJob.session))
         .where(VideoAnalysisJob.id == job_id)
     )
     job = result.scalar_one_or_none()
@@ -846,6 +879,10 @@ async def get_analysis_job(
             detail="You don't have access to this job",
         )
 
+    # Only in-flight jobs can go stale; this refreshes `job` when it does
+    if job.status in STALE_CANDIDATE_STATUSES:
+        await mark_stale_video_analysis_jobs(db, job_id=job_id)
+
     job_read = VideoAnalysisJobRead.model_validate(job)
 
     updates = {
@@ -860,29 +897,20 @@ async def get_analysis_job(
     try:
         url_updates: dict[str, Any] = {}
         if job.quick_results_s3_key:
-            quick_url = s3_service.generate_presigned_get_url(
-                bucket=settings.S3_COACH_VIDEOS_BUCKET,
-                key=job.quick_results_s3_key,
-                expires_in=settings.S3_STREAM_URL_EXPIRES_SECONDS,
+            quick_url, _ = cached_presigned_get_url(
+                settings.S3_COACH_VIDEOS_BUCKET, job.quick_results_s3_key
             )
             url_updates["quick_results_url"] = quick_url
 
         if job.deep_results_s3_key:
-            deep_url = s3_service.generate_presigned_get_url(
-                bucket=settings.S3_COACH_VIDEOS_BUCKET,
-                key=job.deep_results_s3_key,
-                expires_in=settings.S3_STREAM_URL_EXPIRES_SECONDS,
+            deep_url, _ = cached_presigned_get_url(
+                settings.S3_COACH_VIDEOS_BUCKET, job.deep_results_s3_key
             )
             url_updates["deep_results_url"] = deep_url
 
         # Attach video streaming URL for this single job
         if session.s3_bucket and session.s3_key:
-            expires_in = settings.S3_STREAM_URL_EXPIRES_SECONDS
-            url = s3_service.generate_presigned_get_url(
-                bucket=session.s3_bucket,
-                key=session.s3_key,
-                expires_in=expires_in,
-            )
+            url, expires_in = cached_presigned_get_url(session.s3_bucket, session.s3_key)
             updates["video_stream"] = VideoStreamUrlRead(
                 video_url=url,
                 expires_in=expires_in,
@@ -906,6 +934,99 @@ async def get_analysis_job(
     return job_read
 
 
+def _sse_event(event: dict[str, Any]) -> str:
+    return f"event: progress\ndata: {json.dumps(event, separators=(',', ':'))}\n\n"
+
+
+async def _poll_job_event(job_id: str) -> dict[str, Any] | None:
+    """Current snapshot of a streamed job, marking it failed first if it went stale.
+
+    Uses its own short-lived session: the stream outlives the request's session.
+    Returns None once the job no longer exists.
+    """
+    async with get_session_local()() as db:
+        await mark_stale_video_analysis_jobs(db, job_id=job_id)
+        job = await db.get(VideoAnalysisJob, job_id)
+        return job_progress_event(job) if job is not None else None
+
+
+@router.get("/analysis-jobs/{job_id}/events")
+async def stream_analysis_job_events(
+    job_id: str,
+    request: Request,
+    current_user: Annotated[User, Depends(security.get_current_active_user)],
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """
+    Server-sent events with the job's stage/progress as workers report it.
+
+    The first event is the current snapshot; the stream ends after a terminal
+    status (done/completed/failed), when clients fetch the job once for results.
+    While no progress arrives the job is re-read at every keepalive, so a job
+    whose worker died is marked stale and ends the stream as failed.
+    """
+    if not await _check_feature_access(current_user, "video_analysis_enabled"):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Insufficient feature access: video_analysis_enabled",
+        )
+
+    result = await db.execute(
+        select(VideoAnalysisJob)
+        .options(selectinload(VideoAnalysisJob.session))
+        .where(VideoAnalysisJob.id == job_id)
+    )
+    job = result.scalar_one_or_none()
+    if not job:
+        raise HTTPException(status_code=404, detail="Analysis job not found")
+    if not _can_access_video_session(current_user, job.session):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You don't have access to this job",
+        )
+
+    # Only in-flight jobs can go stale; this refreshes `job` when it does
+    if job.status in STALE_CANDIDATE_STATUSES:
+        await mark_stale_video_analysis_jobs(db, job_id=job_id)
+
+    hub = get_job_progress_hub()
+    await hub.ensure_started()
+    # Subscribe before taking the snapshot so no transition falls in between
+    queue = hub.subscribe(job_id)
+    snapshot = job_progress_event(job)
+    # The stream can run for hours; don't hold a pooled connection for it
+    await db.close()
+
+    async def _events():
+        try:
+            yield _sse_event(snapshot)
+            if snapshot["status"] in TERMINAL_JOB_STATUSES:
+                return
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(
+                        queue.get(), settings.COACH_PLUS_JOB_PROGRESS_KEEPALIVE_SECONDS
+                    )
+                except TimeoutError:
+                    event = await _poll_job_event(job_id)
+                    if event is None:
+                        return
+                    if event["status"] not in TERMINAL_JOB_STATUSES:
+                        yield ": keepalive\n\n"
+                        continue
+                yield _sse_event(event)
+                if event.get("status") in TERMINAL_JOB_STATUSES:
+                    return
+        finally:
+            hub.unsubscribe(job_id, queue)
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/analysis-jobs/{job_id}/retry", response_model=VideoAnalysisJobRead)
 async def retry_analysis_job(
     job_id: str,
@@ -944,6 +1065,7 @@ async def retry_analysis_job(
             status_code=status.HTTP_409_CONFLICT,
             detail=str(exc),
         ) from exc
+    await _publish_job_queued(db, job)
 
     job_read = VideoAnalysisJobRead.model_validate(job)
     return job_read.model_copy(
@@ -1608,12 +1730,7 @@ async def get_video_stream_url(
     if not session.s3_bucket or not session.s3_key:
         raise HTTPException(status_code=404, detail="Video not available for this session")
 
-    expires_in = settings.S3_STREAM_URL_EXPIRES_SECONDS
-    video_url = s3_service.generate_presigned_get_url(
-        bucket=session.s3_bucket,
-        key=session.s3_key,
-        expires_in=expires_in,
-    )
+    video_url, expires_in = cached_presigned_get_url(session.s3_bucket, session.s3_key)
     return VideoStreamUrlRead(
         video_url=video_url,
         expires_in=expires_in,
@@ -1934,15 +2051,15 @@ async def complete_video_upload(
             duration = await get_video_duration_from_s3(bucket, key, tmp_path)
             job.video_duration_seconds = duration
 
-            # Create chunk specifications
-            chunk_specs = create_chunk_specs(
-                duration_seconds=duration,
-                chunk_seconds=settings.CHUNK_SECONDS,
+            # Plan chunks on keyframes (reads the downloaded copy's packets once)
+            chunk_plan = await asyncio.to_thread(
+                plan_video_chunks, tmp_path, duration, settings.CHUNK_SECONDS
             )
+            job.chunk_plan = chunk_plan.describe()
 
             # Create chunk records
             chunks = []
-            for spec in chunk_specs:
+            for spec in chunk_plan.specs:
                 chunk = VideoAnalysisChunk(
                     job_id=job.id,
                     chunk_index=spec["index"],
@@ -1960,10 +2077,12 @@ async def complete_video_upload(
             job.status = VideoAnalysisJobStatus.queued
             job.stage = "DEEP_QUEUED"
             job.progress_pct = 0
+            job.queued_at = datetime.now(UTC)
 
             logger.info(
                 f"GPU mode: created {len(chunks)} chunks for job_id={job.id} "
-                f"duration={duration:.2f}s chunk_size={settings.CHUNK_SECONDS}s"
+                f"duration={duration:.2f}s chunk_size={settings.CHUNK_SECONDS}s "
+                f"plan={chunk_plan.method}"
             )
         except Exception as e:
             logger.error(f"Failed to create chunks: job_id={job.id} error={e!s}")
@@ -1986,6 +2105,7 @@ async def complete_video_upload(
         job.status = VideoAnalysisJobStatus.queued
         job.stage = "QUEUED"
         job.progress_pct = 0
+        job.queued_at = datetime.now(UTC)
 
     # Common cleanup
     job.error_message = None
@@ -1993,6 +2113,7 @@ async def complete_video_upload(
     session.status = VideoSessionStatus.uploaded
 
     await db.commit()
+    await _publish_job_queued(db, job)
 
     return VideoUploadCompleteResponse(
         job_id=job.id,
@@ -2666,9 +2787,14 @@ async def save_pitch_calibration(
             status_code=400, detail=f"Expected exactly 4 corners, got {len(request.corners)}"
         )
 
-    # Save corners to session
+    # Save corners with their homography, computed once here for every pitch-map read
     corners_data = [{"x": c.x, "y": c.y} for c in request.corners]
+    try:
+        homography = compute_homography(corners_data)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Invalid pitch corners: {e!s}") from e
     session.pitch_corners = {"corners": corners_data}
+    session.pitch_homography = homography_to_json(homography)
     await db.commit()
 
     logger.info(f"Pitch calibration saved for session {session_id}")
@@ -2680,6 +2806,52 @@ async def save_pitch_calibration(
     )
 
 
+def _session_homography(session: VideoSession) -> np.ndarray | None:
+    """Pixel-to-pitch homography saved with the session's calibration.
+
+    Sessions calibrated before the homography was stored fall back to computing
+    it from their corners.
+    """
+    homography = load_homography(session.pitch_homography)
+    if homography is None and session.pitch_corners:
+        try:
+            homography = compute_homography(session.pitch_corners.get("corners") or [])
+        except Exception as e:
+            logger.warning(f"Pitch calibration unusable for session {session.id}: {e}")
+    return homography
+
+
+def _pitch_map_points(
+    deep_results: dict[str, Any], homography: np.ndarray | None
+) -> list[dict[str, Any]]:
+    """Bounce points in normalized pitch space (0-100) with length and line.
+
+    Uses the analysis' ``pitch_map`` when present; otherwise the tracked bounce
+    points (pixels) are projected with the session homography in one call. Points
+    without length/line labels are classified together.
+    """
+    points = [dict(p) for p in deep_results.get("pitch_map") or []]
+    if not points and homography is not None:
+        trajectory = (deep_results.get("ball_tracking") or {}).get("trajectory") or {}
+        bounces = [b for b in [trajectory.get("bounce_point")] if b]
+        projected = project_points_to_pitch([(b["x"], b["y"]) for b in bounces], homography)
+        points = [
+            {"x": float(x), "y": float(y), "timestamp": b.get("timestamp")}
+            for b, (x, y) in zip(bounces, projected, strict=True)
+            if np.isfinite(x) and np.isfinite(y)
+        ]
+
+    unlabelled = [p for p in points if p.get("length") is None or p.get("line") is None]
+    if unlabelled:
+        xy = np.array([(p.get("x", 0), p.get("y", 0)) for p in unlabelled], dtype=np.float64)
+        lengths = classify_lengths(xy[:, 1])
+        lines = classify_lines(xy[:, 0])
+        for p, length, line in zip(unlabelled, lengths, lines, strict=True):
+            p["length"] = p.get("length") or length
+            p["line"] = p.get("line") or line
+    return points
+
+
 class PitchMapPoint(BaseModel):
     """Single point on the pitch map."""
 
@@ -2740,6 +2912,7 @@ async def get_pitch_map(
         select(VideoAnalysisJob)
         .where(VideoAnalysisJob.session_id == session_id)
         .order_by(VideoAnalysisJob.created_at.desc())
+        .limit(1)
     )
     job = job_result.scalar_one_or_none()
 
@@ -2762,13 +2935,12 @@ async def get_pitch_map(
             message=f"Analysis not complete. Current status: {job.status}",
         )
 
-    # Extract pitch map data from deep_results
-    deep_results = job.deep_results or {}
-    pitch_map_data = deep_results.get("pitch_map", [])
-
     # Check if calibration was used
     calibrated = bool(session.pitch_corners)
 
+    # Pitch map from deep_results (or tracked bounces projected with the calibration)
+    pitch_map_data = _pitch_map_points(job.deep_results or {}, _session_homography(session))
+
     if not pitch_map_data:
         return PitchMapResponse(
             session_id=session_id,
@@ -2979,13 +3151,14 @@ async def get_zone_accuracy_report(
         select(VideoAnalysisJob)
         .where(VideoAnalysisJob.session_id == session_id)
         .order_by(VideoAnalysisJob.created_at.desc())
+        .limit(1)
     )
     job = job_result.scalar_one_or_none()
 
     if not job or not job.deep_results:
         raise HTTPException(status_code=400, detail="No analysis data available for this session")
 
-    pitch_map_data = job.deep_results.get("pitch_map", [])
+    pitch_map_data = _pitch_map_points(job.deep_results, _session_homography(session))
 
     if not pitch_map_data:
         return ZoneReportResponse(
@@ -3000,17 +3173,6 @@ async def get_zone_accuracy_report(
             avg_miss_distance=None,
         )
 
-    # Analyze hits vs misses
-    hits = 0
-    misses = 0
-    miss_distances = []
-    miss_breakdown = {
-        "above": 0,
-        "below": 0,
-        "left": 0,
-        "right": 0,
-    }
-
     # Extract zone definition (assuming rectangular zone)
     zone_def = zone.definition_json
     x_min = zone_def.get("x", 0)
@@ -3026,38 +3188,28 @@ async def get_zone_accuracy_report(
     x_max += request.tolerance
     y_max += request.tolerance
 
-    for point in pitch_map_data:
-        px = point.get("x", 0)
-        py = point.get("y", 0)
+    # Analyze hits vs misses over all deliveries at once
+    xy = np.array([(p.get("x", 0), p.get("y", 0)) for p in pitch_map_data], dtype=np.float64)
+    px, py = xy[:, 0], xy[:, 1]
+    inside = (x_min <= px) & (px <= x_max) & (y_min <= py) & (py <= y_max)
+    miss_x, miss_y = px[~inside], py[~inside]
 
-        # Check if point is inside zone (with tolerance)
-        if x_min <= px <= x_max and y_min <= py <= y_max:
-            hits += 1
-        else:
-            misses += 1
-
-            # Calculate miss distance (simplified: distance to zone center)
-            zone_center_x = (x_min + x_max) / 2
-            zone_center_y = (y_min + y_max) / 2
-            distance = ((px - zone_center_x) ** 2 + (py - zone_center_y) ** 2) ** 0.5
-            miss_distances.append(distance)
-
-            # Classify miss direction
-            if py < y_min:
-                miss_breakdown["above"] += 1
-            elif py > y_max:
-                miss_breakdown["below"] += 1
-
-            if px < x_min:
-                miss_breakdown["left"] += 1
-            elif px > x_max:
-                miss_breakdown["right"] += 1
+    # Miss distance (simplified: distance to zone center) and direction
+    miss_distances = np.hypot(miss_x - (x_min + x_max) / 2, miss_y - (y_min + y_max) / 2)
+    miss_breakdown = {
+        "above": int((miss_y < y_min).sum()),
+        "below": int((miss_y > y_max).sum()),
+        "left": int((miss_x < x_min).sum()),
+        "right": int((miss_x > x_max).sum()),
+    }
 
+    hits = int(inside.sum())
+    misses = len(miss_x)
     total = hits + misses
     hit_rate = (hits / total * 100) if total > 0 else 0.0
 
-    nearest_miss = min(miss_distances) if miss_distances else None
-    avg_miss = sum(miss_distances) / len(miss_distances) if miss_distances else None
+    nearest_miss = float(miss_distances.min()) if misses else None
+    avg_miss = float(miss_distances.mean()) if misses else None
 
     return ZoneReportResponse(
         zone_id=zone.id,
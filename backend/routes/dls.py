@@ -9,6 +9,9 @@ from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend import dls as dlsmod
+from backend.services import dls_par_timeline
+from backend.services.dls_scenarios import ScenarioUnavailable, get_scenarios, team1_runs
+from backend.services.live_bus import emit_dls_scenarios_update
 from backend.sql_app import crud
 from backend.sql_app.database import get_db
 
@@ -38,23 +41,6 @@ class DLSParOut(BaseModel):
     ahead_by: int
 
 
-def _team1_runs(g: Any) -> int:
-    fis_any: Any = getattr(g, "first_inning_summary", None)
-    if isinstance(fis_any, dict) and "runs" in fis_any:
-        try:
-            return int(cast(Any, fis_any["runs"]))
-        except Exception:
-            pass  # nosec
-    # Fallback: sum from ledger for innings 1
-    total = 0
-    for d_any in getattr(g, "deliveries", []) or []:
-        d = d_any.model_dump() if hasattr(d_any, "model_dump") else dict(d_any)
-        if int(d.get("inning", 1) or 1) != 1:
-            continue
-        total += int(d.get("runs_scored") or 0)
-    return total
-
-
 @router.post("/{game_id}/dls/revised-target", response_model=DLSRevisedOut)
 async def dls_revised_target(game_id: str, body: DLSRequest, db: AsyncSession = Depends(get_db)):
     game = await crud.get_game(db, game_id=game_id)
@@ -76,7 +62,7 @@ async def dls_revised_target(game_id: str, body: DLSRequest, db: AsyncSession =
         interruptions=interruptions,
     )
 
-    S1 = _team1_runs(g)
+    S1 = team1_runs(g)
     M2 = int(body.max_overs or (g.overs_limit or (50 if body.kind == "odi" else 20)))
     R2_total = env.table.R(M2, 0)
 
@@ -103,7 +89,7 @@ async def dls_par_now(game_id: str, body: DLSRequest, db: AsyncSession = Depends
         deliveries=deliveries_m,
         interruptions=list(getattr(g, "interruptions", [])),
     )
-    S1 = _team1_runs(g)
+    S1 = team1_runs(g)
 
     balls_so_far = int(getattr(g, "overs_completed", 0)) * 6 + int(getattr(g, "balls_this_over", 0))
     wkts_so_far = int(getattr(g, "total_wickets", 0))
@@ -115,3 +101,38 @@ async def dls_par_now(game_id: str, body: DLSRequest, db: AsyncSession = Depends
     par = dlsmod.par_score_now(S1=S1, R1_total=R1_total, R2_used_so_far=R2_used)
     runs_now = int(getattr(g, "total_runs", 0))
     return DLSParOut(R1_total=R1_total, R2_used=R2_used, S1=S1, par=par, ahead_by=runs_now - par)
+
+
+@router.get("/{game_id}/dls/scenarios")
+async def dls_scenarios(game_id: str, db: AsyncSession = Depends(get_db)) -> dict[str, Any]:
+    """
+    What-if revised targets for every remaining interruption point, overs lost
+    and wickets down. Cached per ledger version; a recomputed table is also
+    pushed to the game room as ``dls:scenarios``.
+    """
+    game = await crud.get_game(db, game_id=game_id)
+    if not game:
+        raise HTTPException(status_code=404, detail="Game not found")
+    try:
+        payload, changed = get_scenarios(game_id, game, str(BASE_DIR))
+    except ScenarioUnavailable as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    if changed:
+        await emit_dls_scenarios_update(game_id, payload)
+    return payload
+
+
+@router.get("/{game_id}/dls/par-timeline")
+async def dls_par_timeline_chart(
+    game_id: str, db: AsyncSession = Depends(get_db)
+) -> dict[str, Any]:
+    """Par vs actual after every legal ball of the chase (par-vs-actual chart data)."""
+    game = await crud.get_game(db, game_id=game_id)
+    if not game:
+        raise HTTPException(status_code=404, detail="Game not found")
+    timeline = dls_par_timeline.sync(game_id, game, str(BASE_DIR))
+    if timeline is None:
+        raise HTTPException(
+            status_code=409, detail="Par timeline is only available during a 20 or 50 over chase"
+        )
+    return timeline.chart()
@@ -49,6 +49,7 @@ async def set_overs_limit(
     if new_limit_balls < bowled_balls:
         raise HTTPException(status_code=400, detail="New limit is less than overs already bowled")
 
+    previous_limit = getattr(g, "overs_limit", None)
     g.overs_limit = int(body.overs_limit)
 
     try:
@@ -60,6 +61,7 @@ async def set_overs_limit(
             "type": "overs_reduction",
             "at_delivery_index": len(getattr(g, "deliveries", []) or []),
             "new_overs_limit": int(body.overs_limit),
+            "previous_overs_limit": previous_limit,
         }
     )
     g.interruptions = interruptions
@@ -5,9 +5,9 @@ from collections.abc import Mapping, Sequence
 from pathlib import Path
 from typing import Annotated, Any, Literal, cast
 
-from backend import dls as dlsmod
 from backend.domain.constants import as_extra_code as norm_extra
 from backend.routes import games as _games_impl
+from backend.services import dls_par_timeline, dls_scenarios
 from backend.services import game_helpers as gh
 from backend.services import validation as validation_helpers
 from backend.services.historical_import_delivery_service import coerce_delivery_ledger
@@ -81,14 +81,6 @@ def _gh(name: str, *args: Any, **kwargs: Any) -> Any:
     return None
 
 
-# Small runtime helper to coerce unknown values to int safely for static checks
-def _to_int_safe(x: Any) -> int:
-    try:
-        return int(x)  # type: ignore[arg-type]
-    except Exception:
-        return 0  # nosec
-
-
 # Local helper: close innings if all out or overs exhausted (ported from main.py)
 async def _maybe_close_innings(g: Any) -> None:
     balls_limit = (g.overs_limit or 0) * 6
@@ -825,72 +817,15 @@ async def get_snapshot(
     snap["mini_batting_card"] = _gh("_mini_batting_card", g)
     snap["mini_bowling_card"] = _gh("_mini_bowling_card", g)
 
-    # DLS panel best-effort (matches main.py logic)
+    # DLS panel best-effort: O(1) read from the incrementally maintained par timeline
     try:
-        overs_limit_opt = cast(int | None, getattr(g, "overs_limit", None))
-        current_innings = int(getattr(g, "current_inning", 1) or 1)
-        if (
-            isinstance(overs_limit_opt, int)
-            and current_innings >= 2
-            and overs_limit_opt in (20, 50)
-        ):
-            format_overs = int(overs_limit_opt)
-            kind: Literal["odi", "t20"] = "odi" if format_overs >= 40 else "t20"
-            env = dlsmod.load_env(kind, str(BASE_DIR))
-
-            deliveries_m: list[Mapping[str, Any]] = list(getattr(g, "deliveries", []))
-            interruptions = list(getattr(g, "interruptions", []))
-
-            R1_total = dlsmod.total_resources_team1(
-                env=env,
-                max_overs_initial=format_overs,
-                deliveries=deliveries_m,
-                interruptions=interruptions,
-            )
-            s1 = 0
-            fis_any = getattr(g, "first_inning_summary", None)
-            if isinstance(fis_any, dict) and "runs" in fis_any:
-                try:
-                    # use safe coercion helper to avoid pyright unknown-arg warnings
-                    s1 = _to_int_safe(fis_any["runs"])
-                except Exception:
-                    s1 = 0  # nosec
-            else:
-                # Sum runs from first-innings deliveries using a typed local list to avoid
-                # partially-unknown generator types in static checks.
-                s1 = 0
-                deliveries_list: list[Mapping[str, Any]] = list(getattr(g, "deliveries", []) or [])
-                for d in deliveries_list:
-                    try:
-                        if int(d.get("inning", 1) or 1) == 1:
-                            s1 += int(d.get("runs_scored") or 0)
-                    except Exception:
-                        # Ignore malformed entries
-                        continue  # nosec
-
-            overs_completed = float(getattr(g, "overs_completed", 0.0) or 0.0)
-            balls_this_over = float(getattr(g, "balls_this_over", 0.0) or 0.0)
-            team2_overs_left_now = max(
-                0.0, float(format_overs) - (overs_completed + (balls_this_over / 6.0))
+        timeline = dls_par_timeline.sync(game_id, g, str(BASE_DIR))
+        if timeline is not None:
+            balls_now = int(getattr(g, "overs_completed", 0) or 0) * 6 + int(
+                getattr(g, "balls_this_over", 0) or 0
             )
-            team2_wkts_now = int(getattr(g, "total_wickets", 0)) if current_innings == 2 else 0
-
-            R_start = env.table.R(format_overs, 0)
-            R_remaining = env.table.R(team2_overs_left_now, team2_wkts_now)
-            R2_used = max(0.0, R_start - R_remaining)
-
-            try:
-                par_raw = dlsmod.par_score_now(S1=s1, R1_total=R1_total, R2_used_so_far=R2_used)
-                par_now = _to_int_safe(par_raw)
-            except Exception:
-                par_now = 0  # nosec
-            try:
-                target_raw = dlsmod.revised_target(S1=s1, R1_total=R1_total, R2_total=R_start)
-                target_full = _to_int_safe(target_raw)
-            except Exception:
-                target_full = 0  # nosec
-
-            snap["dls"] = {"method": "DLS", "par": par_now, "target": target_full}
+            par_now = timeline.par_now(balls_now, int(getattr(g, "total_wickets", 0) or 0))
+            snap["dls"] = {"method": "DLS", "par": par_now, "target": timeline.target}
     except Exception:
         # Leave snapshot_service panel if ours fails
         pass  # nosec
@@ -1274,6 +1209,7 @@ async def add_delivery(
     from backend.services.prediction_service import get_win_probability
 
     await emit_state_update(game_id, snap)
+    await dls_scenarios.publish_scenarios_if_tracked(game_id, u, str(BASE_DIR))
 
     # Calculate and emit win probability prediction
     try:
@@ -1440,6 +1376,7 @@ async def undo_last_delivery(
     from backend.services.live_bus import emit_state_update
 
     await emit_state_update(game_id, snapshot)
+    await dls_scenarios.publish_scenarios_if_tracked(game_id, u, str(BASE_DIR))
 
     return snapshot
 
@@ -1545,6 +1482,8 @@ async def correct_delivery(
     # Update the deliveries ledger
     deliveries[target_idx] = target_delivery
     g.deliveries = deliveries  # type: ignore[assignment]
+    dls_par_timeline.invalidate(game_id)
+    dls_scenarios.invalidate(game_id)
 
     # Reset runtime and scorecards, then replay all deliveries
     def _reset_runtime_and_scorecards(game: Any) -> None:
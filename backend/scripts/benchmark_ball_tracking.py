@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Ball tracking benchmark.
+
+Runs ``BallTracker`` in ``detect`` mode (full search every frame) and ``kalman``
+mode (predicted-window search after lock-on) over the same clip, reporting
+throughput in frames/s next to a decode-only pass and whether both modes find
+the same release and bounce points.
+
+Usage:
+    python backend/scripts/benchmark_ball_tracking.py                 # synthetic 1080p delivery
+    python backend/scripts/benchmark_ball_tracking.py --video delivery.mp4 --ball-color white
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.services.ball_tracking_service import BallPosition, BallTracker
+
+
+def _synthesize(path: Path, seconds: float, fps: float) -> Path:
+    """A red ball on a green field: rises, drops under gravity and bounces once."""
+    import cv2
+
+    width, height = 1920, 1080
+    ground = height * 0.8
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), fps, (width, height))
+    try:
+        for i in range(int(seconds * fps)):
+            t = i / fps
+            x = width * 0.08 + width * 0.35 * t
+            y = height * 0.3 - 150.0 * t + 450.0 * t * t
+            if y > ground:
+                y = ground - (y - ground) * 0.6
+            frame = np.empty((height, width, 3), dtype=np.uint8)
+            frame[:] = (40, 140, 40)
+            cv2.circle(frame, (round(x), round(y)), 10, (0, 0, 230), -1)
+            writer.write(frame)
+    finally:
+        writer.release()
+    return path
+
+
+def _decode_fps(video: str, sample_fps: float) -> float:
+    import cv2
+
+    from backend.services.frame_sampler import FrameSampler
+
+    cap = cv2.VideoCapture(video)
+    try:
+        interval = max(1, int(cap.get(cv2.CAP_PROP_FPS) / sample_fps))
+        started = time.perf_counter()
+        frames = sum(1 for _ in FrameSampler(cv2, cap, frame_interval=interval))
+        return frames / (time.perf_counter() - started)
+    finally:
+        cap.release()
+
+
+def _point(position: BallPosition | None) -> dict[str, Any] | None:
+    if position is None:
+        return None
+    return {"frame": position.frame_num, "x": round(position.x, 1), "y": round(position.y, 1)}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--video", type=str, default=None, help="Clip to use (default: synthetic)")
+    parser.add_argument("--seconds", type=float, default=2.5, help="Synthetic clip length")
+    parser.add_argument("--fps", type=float, default=30.0, help="Synthetic clip frame rate")
+    parser.add_argument("--sample-fps", type=float, default=30.0)
+    parser.add_argument("--max-width", type=int, default=1280)
+    parser.add_argument("--ball-color", default="red")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="ball_bench_") as tmpdir:
+        video = args.video or str(_synthesize(Path(tmpdir) / "clip.avi", args.seconds, args.fps))
+
+        report: dict[str, Any] = {"decode_only_fps": round(_decode_fps(video, args.sample_fps), 1)}
+        points = {}
+        for mode in BallTracker.TRACKING_MODES:
+            tracker = BallTracker(ball_color=args.ball_color, tracking_mode=mode)
+            trajectory = tracker.track_ball_in_video(
+                video, sample_fps=args.sample_fps, max_width=args.max_width
+            )
+            points[mode] = (
+                _point(trajectory.release_point),
+                _point(trajectory.bounce_point),
+            )
+            report[mode] = {
+                "frames_per_second": round(trajectory.processing_fps, 1),
+                "detected_frames": trajectory.detected_frames,
+                "release_point": points[mode][0],
+                "bounce_point": points[mode][1],
+            }
+
+    same_frames = all(
+        (a or {}).get("frame") == (b or {}).get("frame")
+        for a, b in zip(points["detect"], points["kalman"], strict=True)
+    )
+    report["speedup"] = round(
+        report["kalman"]["frames_per_second"] / max(report["detect"]["frames_per_second"], 1e-9), 2
+    )
+    report["same_release_and_bounce_frames"] = same_frames
+    print(json.dumps(report, indent=2))
+    return 0 if same_frames else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
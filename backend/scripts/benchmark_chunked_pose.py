@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Chunked pose extraction benchmark.
+
+Compares one full-range pose extraction against the GPU-worker fan-out
+(``create_chunk_specs`` + ``extract_chunk_poses`` per chunk in a process pool)
+and checks that the chunks together sample exactly the frames of the full run.
+
+Usage:
+    python backend/scripts/benchmark_chunked_pose.py                  # synthetic 10-minute clip
+    python backend/scripts/benchmark_chunked_pose.py --video clip.mp4 --workers 8
+    python backend/scripts/benchmark_chunked_pose.py --detector mediapipe
+
+``--detector stub`` (default) replaces MediaPipe with a fixed-cost stand-in so
+the benchmark runs without the model file; ``--stub-ms`` sets its per-frame cost.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.services import pose_service
+from backend.services.video_chunking import create_chunk_specs, get_video_duration
+
+_STUB_MS = 5.0
+
+
+class _StubDetector:
+    def detect_for_video(self, image: Any, timestamp_ms: int) -> Any:
+        deadline = time.perf_counter() + _STUB_MS / 1000.0
+        while time.perf_counter() < deadline:
+            pass
+        return SimpleNamespace(pose_landmarks=[])
+
+    def close(self) -> None:
+        pass
+
+
+def _stub_dependencies():
+    import cv2
+
+    mp = SimpleNamespace(
+        Image=lambda image_format, data: SimpleNamespace(data=data),
+        ImageFormat=SimpleNamespace(SRGB=1),
+    )
+    return cv2, mp, _StubDetector, lambda: "stub", lambda: "detect_for_video"
+
+
+def _init_worker(detector: str, stub_ms: float) -> None:
+    global _STUB_MS
+    _STUB_MS = stub_ms
+    if detector == "stub":
+        pose_service._import_cv2_and_mediapipe = _stub_dependencies
+
+
+def _run_chunk(spec: dict[str, Any], video: str, sample_fps: float, max_width: int) -> Any:
+    from backend.workers.gpu_chunk_worker import extract_chunk_poses
+
+    started = time.perf_counter()
+    data = extract_chunk_poses(
+        video_path=video,
+        start_sec=spec["start_sec"],
+        end_sec=spec["end_sec"],
+        sample_fps=sample_fps,
+        max_width=max_width,
+    )
+    frame_nums = [p["frame_num"] for p in data["poses"]]
+    return spec["index"], frame_nums, time.perf_counter() - started
+
+
+def _synthesize(path: Path, seconds: float, fps: float) -> Path:
+    import cv2
+
+    width, height = 640, 360
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), fps, (width, height))
+    rng = np.random.default_rng(0)
+    base = rng.integers(0, 255, size=(height, width, 3), dtype=np.uint8)
+    try:
+        for i in range(int(seconds * fps)):
+            writer.write(np.roll(base, i, axis=1))
+    finally:
+        writer.release()
+    return path
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--video", type=str, default=None, help="Clip to use (default: synthetic)")
+    parser.add_argument("--seconds", type=float, default=600.0, help="Synthetic clip length")
+    parser.add_argument("--fps", type=float, default=30.0, help="Synthetic clip frame rate")
+    parser.add_argument("--chunk-seconds", type=int, default=30)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--sample-fps", type=float, default=10.0)
+    parser.add_argument("--max-width", type=int, default=640)
+    parser.add_argument("--detector", choices=["stub", "mediapipe"], default="stub")
+    parser.add_argument("--stub-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="pose_bench_") as tmpdir:
+        video = args.video or str(_synthesize(Path(tmpdir) / "clip.avi", args.seconds, args.fps))
+        duration = get_video_duration(video)
+        specs = create_chunk_specs(duration, args.chunk_seconds)
+
+        _init_worker(args.detector, args.stub_ms)
+        started = time.perf_counter()
+        full = pose_service.extract_pose_keypoints_from_video(
+            video, sample_fps=args.sample_fps, max_width=args.max_width
+        )
+        full_s = time.perf_counter() - started
+        full_frames = [f["frame_num"] for f in full["frames"]]
+
+        started = time.perf_counter()
+        with ProcessPoolExecutor(
+            max_workers=args.workers,
+            initializer=_init_worker,
+            initargs=(args.detector, args.stub_ms),
+        ) as pool:
+            futures = [
+                pool.submit(_run_chunk, spec, video, args.sample_fps, args.max_width)
+                for spec in specs
+            ]
+            results = sorted(f.result() for f in futures)
+        chunked_s = time.perf_counter() - started
+        chunk_frames = [n for _, frames, _ in results for n in frames]
+
+    report = {
+        "video_seconds": round(duration, 1),
+        "chunks": len(specs),
+        "workers": args.workers,
+        "detector": args.detector,
+        "full_run_s": round(full_s, 2),
+        "chunked_run_s": round(chunked_s, 2),
+        "speedup": round(full_s / chunked_s, 2) if chunked_s else None,
+        "sampled_frames_full": len(full_frames),
+        "sampled_frames_chunked": len(chunk_frames),
+        "identical_sampling": chunk_frames == full_frames,
+        "slowest_chunk_s": round(max(t for _, _, t in results), 2),
+    }
+    print(json.dumps(report, indent=2))
+    return 0 if report["identical_sampling"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
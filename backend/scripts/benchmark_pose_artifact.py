@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Pose artifact format benchmark.
+
+Builds a synthetic chunk pose timeline (every frame detected, 33 landmarks) and
+compares the JSON chunk artifact the GPU workers used to upload against the
+``.npz`` artifact written by ``dumps_pose_npz``: serialised size, and the time
+to parse it back (``json.loads`` versus ``loads_pose_npz``). Also checks that
+the npz round trip returns the same landmarks.
+
+Usage:
+    python backend/scripts/benchmark_pose_artifact.py                  # 60 s chunk at 30 fps
+    python backend/scripts/benchmark_pose_artifact.py --frames 600 --repeats 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# to_frames() imports pose_service, which loads settings
+os.environ.setdefault("APP_SECRET_KEY", "benchmark")
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite://")
+
+from backend.services.pose_artifact import (
+    LANDMARK_CHANNELS,
+    LANDMARK_COUNT,
+    PoseArrays,
+    dumps_pose_npz,
+    loads_pose_npz,
+)
+
+
+def _synthetic_poses(frames: int, fps: float) -> PoseArrays:
+    rng = np.random.default_rng(0)
+    timestamp = np.arange(frames, dtype=np.float64) / fps
+    return PoseArrays(
+        landmarks=rng.random((frames, LANDMARK_COUNT, len(LANDMARK_CHANNELS)), dtype=np.float32),
+        frame_num=np.arange(frames, dtype=np.int32),
+        timestamp=timestamp,
+        timestamp_ms=np.round(timestamp * 1000).astype(np.int64),
+        detected=np.ones(frames, dtype=bool),
+        metadata={"chunk_index": 0, "fps": fps},
+    )
+
+
+def _median_ms(fn: Callable[[], Any], repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return round(statistics.median(timings) * 1000, 3)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--frames", type=int, default=1800, help="Sampled frames in the chunk")
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    poses = _synthetic_poses(args.frames, args.fps)
+    json_body = json.dumps({"metadata": poses.metadata, "poses": poses.to_frames()}).encode()
+    npz32 = dumps_pose_npz(poses)
+    half = PoseArrays(
+        landmarks=poses.landmarks.astype(np.float16),
+        frame_num=poses.frame_num,
+        timestamp=poses.timestamp,
+        timestamp_ms=poses.timestamp_ms,
+        detected=poses.detected,
+        metadata=poses.metadata,
+    )
+    npz16 = dumps_pose_npz(half)
+
+    loaded = loads_pose_npz(npz32)
+    report = {
+        "frames": args.frames,
+        "json": {
+            "size_mb": round(len(json_body) / 1e6, 3),
+            "parse_ms": _median_ms(lambda: json.loads(json_body), args.repeats),
+        },
+        "npz_float32": {
+            "size_mb": round(len(npz32) / 1e6, 3),
+            "parse_ms": _median_ms(lambda: loads_pose_npz(npz32), args.repeats),
+        },
+        "npz_float16": {
+            "size_mb": round(len(npz16) / 1e6, 3),
+            "parse_ms": _median_ms(lambda: loads_pose_npz(npz16), args.repeats),
+        },
+        "identical_round_trip": bool(
+            np.array_equal(loaded.landmarks, poses.landmarks)
+            and np.array_equal(loaded.frame_num, poses.frame_num)
+        ),
+    }
+    report["size_ratio"] = round(len(json_body) / len(npz32), 1)
+    print(json.dumps(report, indent=2))
+    return 0 if report["identical_round_trip"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Video session listing benchmark.
+
+Seeds a coach with many video sessions whose analysis jobs carry realistic
+results/findings/report JSON, then pages through ``GET /sessions`` the way the
+endpoint used to (``selectinload(VideoSession.analysis_jobs)``) and the way it
+does now (summary projection via ``load_session_job_summaries``), reporting wall
+time and peak Python memory for each and whether both produce the same metadata.
+
+Usage:
+    python backend/scripts/benchmark_session_listing.py              # 500 sessions, sqlite file
+    python backend/scripts/benchmark_session_listing.py --sessions 500 --jobs 3 --result-kb 400
+
+The data is seeded into a throwaway sqlite file, never the configured database.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+os.environ.setdefault("APP_SECRET_KEY", "benchmark")
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite://")
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import selectinload
+
+from backend.services.video_job_summary import (
+    JOB_RESULT_FIELDS,
+    load_session_job_summaries,
+)
+from backend.sql_app.models import (
+    OwnerTypeEnum,
+    VideoAnalysisChunk,
+    VideoAnalysisJob,
+    VideoAnalysisJobStatus,
+    VideoSession,
+    VideoSessionStatus,
+)
+
+COACH_ID = "benchmark-coach"
+
+
+def _results_payload(kb: int) -> dict[str, Any]:
+    """Pose-metric style results of roughly ``kb`` kilobytes."""
+    frame = {"t": 0.0, "keypoints": {f"point_{i}": [0.5, 0.5, 0.9] for i in range(33)}}
+    frame_bytes = len(json.dumps(frame))
+    return {"frames": [frame] * max(1, kb * 1024 // frame_bytes), "summary": {"frames": 1}}
+
+
+async def _seed(sessionmaker: async_sessionmaker, sessions: int, jobs: int, kb: int) -> None:
+    results = _results_payload(kb)
+    findings = {"findings": [{"code": "HEAD_MOVEMENT", "detail": "x" * 200}] * 20}
+    report = {"summary": "y" * 2000, "sections": [{"text": "z" * 500}] * 10}
+    now = datetime.now(UTC)
+    async with sessionmaker() as db:
+        for s in range(sessions):
+            session = VideoSession(
+                owner_type=OwnerTypeEnum.coach,
+                owner_id=COACH_ID,
+                title=f"Session {s}",
+                player_ids=[],
+                status=VideoSessionStatus.ready,
+                created_at=now - timedelta(minutes=s),
+            )
+            db.add(session)
+            await db.flush()
+            for j in range(jobs):
+                done = j == jobs - 1
+                status = VideoAnalysisJobStatus.done if done else VideoAnalysisJobStatus.failed
+                db.add(
+                    VideoAnalysisJob(
+                        session_id=session.id,
+                        status=status,
+                        created_at=now - timedelta(minutes=s, seconds=jobs - j),
+                        quick_results=results,
+                        deep_results=results if done else None,
+                        quick_findings=findings,
+                        deep_report=report if done else None,
+                    )
+                )
+            if s % 50 == 49:
+                await db.commit()
+        await db.commit()
+
+
+def _eager_metadata(session: VideoSession) -> dict[str, Any]:
+    """The per-session metadata as computed from fully loaded jobs."""
+    if not session.analysis_jobs:
+        return {"analysis_job_count": 0}
+    latest = max(session.analysis_jobs, key=lambda item: item.created_at)
+    return {
+        "analysis_job_count": len(session.analysis_jobs),
+        "latest_job_id": latest.id,
+        "latest_job_results_available": any(getattr(latest, f) for f in JOB_RESULT_FIELDS),
+        "latest_job_report_available": bool(latest.quick_report or latest.deep_report),
+    }
+
+
+def _summary_metadata(summary: Any) -> dict[str, Any]:
+    if summary is None:
+        return {"analysis_job_count": 0}
+    latest = summary.latest_job
+    return {
+        "analysis_job_count": summary.job_count,
+        "latest_job_id": latest.id,
+        "latest_job_results_available": latest.results_available,
+        "latest_job_report_available": latest.report_available,
+    }
+
+
+def _sessions_query(page_size: int, offset: int):
+    return (
+        select(VideoSession)
+        .where(
+            (VideoSession.owner_type == OwnerTypeEnum.coach) & (VideoSession.owner_id == COACH_ID)
+        )
+        .offset(offset)
+        .limit(page_size)
+        .order_by(VideoSession.created_at.desc())
+    )
+
+
+async def _list_eager(sessionmaker, page_size: int, total: int) -> list[dict[str, Any]]:
+    listed = []
+    for offset in range(0, total, page_size):
+        async with sessionmaker() as db:
+            query = _sessions_query(page_size, offset).options(
+                selectinload(VideoSession.analysis_jobs)
+            )
+            sessions = (await db.execute(query)).scalars().all()
+            listed.extend(_eager_metadata(session) for session in sessions)
+    return listed
+
+
+async def _list_projection(sessionmaker, page_size: int, total: int) -> list[dict[str, Any]]:
+    listed = []
+    for offset in range(0, total, page_size):
+        async with sessionmaker() as db:
+            sessions = (await db.execute(_sessions_query(page_size, offset))).scalars().all()
+            summaries = await load_session_job_summaries(db, [session.id for session in sessions])
+            listed.extend(_summary_metadata(summaries.get(session.id)) for session in sessions)
+    return listed
+
+
+async def _measure(list_fn, sessionmaker, page_size: int, total: int, repeats: int):
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        listed = await list_fn(sessionmaker, page_size, total)
+        timings.append(time.perf_counter() - started)
+    tracemalloc.start()
+    await list_fn(sessionmaker, page_size, total)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return listed, {
+        "median_ms": round(statistics.median(timings) * 1000, 1),
+        "per_page_ms": round(statistics.median(timings) * 1000 / -(-total // page_size), 1),
+        "peak_memory_mb": round(peak / 1024 / 1024, 1),
+    }
+
+
+async def _run(args: argparse.Namespace, database_url: str) -> int:
+    engine = create_async_engine(database_url)
+    tables = [t.__table__ for t in (VideoSession, VideoAnalysisJob, VideoAnalysisChunk)]
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda c: VideoSession.metadata.create_all(c, tables=tables))
+    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
+    try:
+        await _seed(sessionmaker, args.sessions, args.jobs, args.result_kb)
+        eager, eager_stats = await _measure(
+            _list_eager, sessionmaker, args.page_size, args.sessions, args.repeats
+        )
+        projected, projected_stats = await _measure(
+            _list_projection, sessionmaker, args.page_size, args.sessions, args.repeats
+        )
+    finally:
+        await engine.dispose()
+
+    report = {
+        "sessions": args.sessions,
+        "jobs_per_session": args.jobs,
+        "result_kb_per_job": args.result_kb,
+        "page_size": args.page_size,
+        "selectinload_jobs": eager_stats,
+        "summary_projection": projected_stats,
+        "speedup": round(eager_stats["median_ms"] / max(projected_stats["median_ms"], 1e-9), 1),
+        "same_metadata": eager == projected,
+    }
+    print(json.dumps(report, indent=2))
+    return 0 if report["same_metadata"] else 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sessions", type=int, default=500)
+    parser.add_argument("--jobs", type=int, default=2, help="Analysis jobs per session")
+    parser.add_argument("--result-kb", type=int, default=200, help="Size of each results JSON")
+    parser.add_argument("--page-size", type=int, default=100, help="GET /sessions limit (max 100)")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="session_listing_bench_") as tmpdir:
+        return asyncio.run(_run(args, f"sqlite+aiosqlite:///{tmpdir}/bench.db"))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,4 +1,9 @@
-"""CLI for Phase 5P deterministic training-dataset artifact builds (no model training)."""
+"""CLI for Phase 5P deterministic training-dataset artifact builds (no model training).
+
+``--format json|csv`` builds the artifact in memory. ``--format jsonl|parquet``
+streams rows to disk batch by batch and writes the artifact metadata to
+``{name}.manifest.json``; use these for large archive exports.
+"""
 
 from __future__ import annotations
 
@@ -7,6 +12,7 @@ import asyncio
 import csv
 import json
 from pathlib import Path
+from typing import Any
 
 from sqlalchemy.exc import OperationalError
 
@@ -14,6 +20,8 @@ from backend.services.model_training_dataset_builder import (
     DatasetBuildFilters,
     DatasetBuildRequest,
     build_model_training_dataset,
+    serialize_dataset_row,
+    stream_model_training_dataset,
 )
 from backend.sql_app.database import get_session_local
 
@@ -40,6 +48,107 @@ def _write_csv(output_path: Path, rows: list[dict[str, object]]) -> None:
         writer.writerows(rows)
 
 
+def _as_text(value: object) -> str | None:
+    return None if value is None else str(value)
+
+
+class _JsonlRowWriter:
+    def __init__(self, output_path: Path) -> None:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = output_path.open("w", encoding="utf-8", newline="\n")
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        for row in rows:
+            self._handle.write(serialize_dataset_row(row))
+            self._handle.write("\n")
+
+    def close(self) -> None:
+        self._handle.close()
+
+
+class _ParquetRowWriter:
+    def __init__(self, output_path: Path) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self._pa = pa
+        self._schema = pa.schema(
+            [
+                ("match_id", pa.string()),
+                ("innings_number", pa.int32()),
+                ("batting_team_name", pa.string()),
+                ("bowling_team_name", pa.string()),
+                ("match_type", pa.string()),
+                ("venue", pa.string()),
+                ("season", pa.string()),
+                ("competition", pa.string()),
+                ("source_format", pa.string()),
+                ("source_hash_sha256", pa.string()),
+                ("runs", pa.int32()),
+                ("wickets", pa.int32()),
+                ("extras", pa.int32()),
+                ("legal_balls", pa.int32()),
+                ("overs", pa.float64()),
+                ("run_rate", pa.float64()),
+                ("result", pa.string()),
+            ]
+        )
+        self._string_fields = {f.name for f in self._schema if f.type == pa.string()}
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._writer = pq.ParquetWriter(output_path, self._schema)
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        normalized = [
+            {
+                name: _as_text(row.get(name)) if name in self._string_fields else row.get(name)
+                for name in self._schema.names
+            }
+            for row in rows
+        ]
+        self._writer.write_table(self._pa.Table.from_pylist(normalized, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+async def _run_streaming(
+    args: argparse.Namespace, request: DatasetBuildRequest, output_dir: Path, output_base: str
+) -> int:
+    session_maker = get_session_local()
+    rows_path = output_dir / f"{output_base}.{args.format}"
+    writer = (
+        _ParquetRowWriter(rows_path) if args.format == "parquet" else _JsonlRowWriter(rows_path)
+    )
+
+    try:
+        async with session_maker() as session:
+            manifest = await stream_model_training_dataset(
+                session, request, writer.write, batch_size=args.batch_size
+            )
+    except OperationalError as exc:
+        raise RuntimeError(
+            "Dataset build failed because required database tables are not ready. "
+            "Run migrations (e.g., `alembic upgrade head`) before running this builder."
+        ) from exc
+    finally:
+        writer.close()
+
+    manifest["rows_file"] = rows_path.name
+    manifest["rows_format"] = args.format
+    manifest_path = output_dir / f"{output_base}.manifest.json"
+    _write_json(manifest_path, manifest)
+
+    print(f"Dataset schema: {manifest['dataset_schema_version']}")
+    print(f"Included matches: {manifest['included_match_count']}")
+    print(f"Excluded matches: {manifest['excluded_match_count']}")
+    print(f"Rows: {manifest['row_count']}")
+    print(f"Rows SHA-256: {manifest['rows_sha256']}")
+    print(f"Manifest: {manifest_path}")
+    print(f"Rows file: {rows_path}")
+
+    return 0
+
+
 async def _run(args: argparse.Namespace) -> int:
     session_maker = get_session_local()
 
@@ -52,6 +161,11 @@ async def _run(args: argparse.Namespace) -> int:
         )
     )
 
+    output_dir = Path(args.output_dir) if args.output_dir else _default_output_dir()
+    output_base = args.output_name or "training_dataset_v1"
+    if args.format in {"jsonl", "parquet"}:
+        return await _run_streaming(args, request, output_dir, output_base)
+
     async with session_maker() as session:
         try:
             artifact = await build_model_training_dataset(session, request)
@@ -61,9 +175,6 @@ async def _run(args: argparse.Namespace) -> int:
                 "Run migrations (e.g., `alembic upgrade head`) before running this builder."
             ) from exc
 
-    output_dir = Path(args.output_dir) if args.output_dir else _default_output_dir()
-    output_base = args.output_name or "training_dataset_v1"
-
     json_path = output_dir / f"{output_base}.json"
     _write_json(json_path, artifact)
 
@@ -84,13 +195,26 @@ async def _run(args: argparse.Namespace) -> int:
     return 0
 
 
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description=(
             "Build deterministic model-training dataset artifacts from governed historical imports"
         )
     )
-    parser.add_argument("--format", choices=["json", "csv"], default="json")
+    parser.add_argument("--format", choices=["json", "csv", "jsonl", "parquet"], default="json")
+    parser.add_argument(
+        "--batch-size",
+        type=_positive_int,
+        default=500,
+        help="Games per fetch when streaming (jsonl/parquet formats)",
+    )
     parser.add_argument("--output-dir", type=str, default=None)
     parser.add_argument("--output-name", type=str, default=None)
     parser.add_argument("--source-format", type=str, default=None)
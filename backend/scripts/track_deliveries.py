@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Batch Delivery Tracking CLI
+
+Usage:
+    python backend/scripts/track_deliveries.py clips/*.mp4
+    python backend/scripts/track_deliveries.py clips/*.mp4 --workers 4 --ball-color white
+
+Tracks the ball in every clip concurrently and prints one JSON line per delivery
+as it completes, followed by the session consistency summary.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+from typing import Any
+
+# Add backend to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.services.ball_tracking_batch import DeliveryResult, track_deliveries
+from backend.services.ball_tracking_service import BallTracker, DeliveryConsistency
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+
+
+def _summarise(result: DeliveryResult) -> dict[str, Any]:
+    line: dict[str, Any] = {"index": result.index, "video_path": result.video_path}
+    if result.error is not None:
+        line["error"] = result.error
+        return line
+    trajectory, metrics = result.trajectory, result.metrics
+    line.update(
+        detection_rate=round(trajectory.detection_rate, 1),
+        processing_fps=round(trajectory.processing_fps, 1),
+        release_frame=trajectory.release_point.frame_num if trajectory.release_point else None,
+        bounce_frame=trajectory.bounce_point.frame_num if trajectory.bounce_point else None,
+        ball_speed_estimate=metrics.ball_speed_estimate,
+        swing_deviation=metrics.swing_deviation,
+    )
+    return line
+
+
+def main() -> int:
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(description="Track the ball across many delivery clips")
+    parser.add_argument("video_paths", nargs="+", help="Delivery clips")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes")
+    parser.add_argument("--sample-fps", type=float, default=30.0)
+    parser.add_argument("--max-width", type=int, default=1280)
+    parser.add_argument("--ball-color", default="red", choices=["red", "white", "pink"])
+    parser.add_argument("--tracking-mode", default="detect", choices=BallTracker.TRACKING_MODES)
+    args = parser.parse_args()
+
+    consistency = DeliveryConsistency()
+    failed = 0
+    for result in track_deliveries(
+        args.video_paths,
+        ball_color=args.ball_color,
+        tracking_mode=args.tracking_mode,
+        sample_fps=args.sample_fps,
+        max_width=args.max_width,
+        max_workers=args.workers,
+        consistency=consistency,
+    ):
+        failed += result.error is not None
+        print(json.dumps(_summarise(result)), flush=True)
+
+    print(json.dumps({"consistency": consistency.summary()}, indent=2))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,144 @@
+"""
+Ball Tracking Batch - track many delivery clips concurrently.
+
+A bowling session is usually dozens of short delivery clips. Tracking them one
+after another leaves all but one core idle, so ``track_deliveries`` fans the
+clips out over a process pool and yields each ``DeliveryResult`` as soon as its
+clip is done (completion order, not input order):
+
+- only ``2 * workers`` clips are in flight at once, so finished trajectories do
+  not pile up in the parent while the caller is still consuming earlier ones,
+- worker processes are recycled every ``tasks_per_worker`` clips, bounding any
+  memory OpenCV's decoders hold on to between clips,
+- a failing clip yields a result with ``error`` set instead of aborting the batch,
+- an optional ``DeliveryConsistency`` is updated before each result is yielded,
+  so the session summary is current after every delivery.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+from collections.abc import Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+
+from backend.services.ball_tracking_service import (
+    BallMetrics,
+    BallTracker,
+    BallTrajectory,
+    DeliveryConsistency,
+    analyze_ball_trajectory,
+)
+
+logger = logging.getLogger(__name__)
+
+# Clips a worker process tracks before it is replaced by a fresh one
+DEFAULT_TASKS_PER_WORKER = 16
+
+
+@dataclass
+class DeliveryResult:
+    """Tracking outcome for one clip of a batch."""
+
+    index: int  # position of the clip in the input list
+    video_path: str
+    trajectory: BallTrajectory | None = None
+    metrics: BallMetrics | None = None
+    error: str | None = None
+
+
+def _track_delivery(
+    index: int,
+    video_path: str,
+    ball_color: str,
+    tracking_mode: str,
+    sample_fps: float,
+    max_width: int,
+) -> DeliveryResult:
+    """Pool entry point: track one clip and compute its metrics."""
+    try:
+        tracker = BallTracker(ball_color=ball_color, tracking_mode=tracking_mode)
+        trajectory = tracker.track_ball_in_video(
+            video_path, sample_fps=sample_fps, max_width=max_width
+        )
+        metrics = analyze_ball_trajectory(trajectory)
+    except Exception as exc:
+        logger.warning(f"Ball tracking failed for delivery {index} ({video_path}): {exc}")
+        return DeliveryResult(index=index, video_path=video_path, error=str(exc))
+    return DeliveryResult(
+        index=index, video_path=video_path, trajectory=trajectory, metrics=metrics
+    )
+
+
+def track_deliveries(
+    video_paths: Sequence[str | Path],
+    *,
+    ball_color: str = "red",
+    tracking_mode: str = "detect",
+    sample_fps: float = 30.0,
+    max_width: int = 1280,
+    max_workers: int | None = None,
+    tasks_per_worker: int = DEFAULT_TASKS_PER_WORKER,
+    consistency: DeliveryConsistency | None = None,
+) -> Iterator[DeliveryResult]:
+    """
+    Track ball trajectories across many delivery clips concurrently.
+
+    Args:
+        video_paths: Delivery clips to track
+        ball_color: Ball color passed to ``BallTracker``
+        tracking_mode: Tracking mode passed to ``BallTracker``
+        sample_fps: Target frames per second for sampling
+        max_width: Maximum frame width for processing
+        max_workers: Worker processes (default: CPU count, capped at the number
+            of clips); 0 tracks the clips one by one in this process
+        tasks_per_worker: Clips a worker process tracks before it is replaced
+        consistency: Updated with every successful trajectory before it is yielded
+
+    Yields:
+        DeliveryResult per clip, in completion order
+    """
+    pending = [(index, str(path)) for index, path in enumerate(video_paths)]
+    options = (ball_color, tracking_mode, sample_fps, max_width)
+    workers = (os.cpu_count() or 1) if max_workers is None else max_workers
+    workers = min(workers, len(pending))
+
+    def _record(result: DeliveryResult) -> DeliveryResult:
+        if consistency is not None and result.trajectory is not None:
+            consistency.add(result.trajectory)
+        return result
+
+    if workers <= 1:
+        for index, path in pending:
+            yield _record(_track_delivery(index, path, *options))
+        return
+
+    logger.info(f"Tracking {len(pending)} deliveries: workers={workers}")
+    clips = iter(pending)
+    in_flight: set[Future[DeliveryResult]] = set()
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        max_tasks_per_child=max(1, tasks_per_worker),
+    )
+
+    def _submit_next() -> None:
+        clip = next(clips, None)
+        if clip is not None:
+            in_flight.add(pool.submit(_track_delivery, *clip, *options))
+
+    try:
+        for _ in range(2 * workers):
+            _submit_next()
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                in_flight.discard(future)
+                _submit_next()
+                yield _record(future.result())
+    finally:
+        # Also reached when the caller stops iterating early: drop queued clips
+        pool.shutdown(wait=True, cancel_futures=True)
@@ -4,18 +4,28 @@ Ball Tracking Service - Coach Pro Plus Video Analysis
 Tracks cricket ball trajectory in video using computer vision.
 Detects release points, flight path, bounce points, and ball velocity.
 
-Uses OpenCV color-based tracking with Kalman filtering for smoothing.
+Uses OpenCV color-based detection. Two tracking modes:
+
+- ``detect``: searches every sampled frame in full,
+- ``kalman``: acquires the ball on a downsampled frame, then follows it with a
+  constant-acceleration Kalman filter, searching only a window around the
+  predicted position and falling back to full-frame acquisition after misses.
 """
 
 from __future__ import annotations
 
 import logging
+import math
+import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 
+from backend.services.frame_sampler import FrameSampler, is_video_url, video_source_label
+
 logger = logging.getLogger(__name__)
 
 
@@ -63,6 +73,10 @@ class BallTrajectory:
     max_velocity: float = 0.0
     trajectory_length: float = 0.0  # total pixel distance
 
+    # Tracker throughput
+    tracking_mode: str = "detect"
+    processing_fps: float = 0.0  # sampled frames tracked per second of wall time
+
 
 @dataclass
 class BallMetrics:
@@ -89,9 +103,78 @@ class BallMetrics:
     release_consistency: float = 100.0  # 0-100, lower variance = higher score
 
 
+class BallKalmanFilter:
+    """Constant-acceleration Kalman filter over a ball's pixel position.
+
+    State per axis is position, velocity and acceleration (px, px/s, px/s^2);
+    unmodelled jerk (bounces, bat contact) is the process noise.
+    """
+
+    def __init__(
+        self,
+        x: float,
+        y: float,
+        *,
+        measurement_sigma: float = 2.0,
+        velocity_sigma: float = 1500.0,
+        acceleration_sigma: float = 3000.0,
+        jerk_sigma: float = 50000.0,
+    ):
+        # State order: x, vx, ax, y, vy, ay
+        self.state = np.array([x, 0.0, 0.0, y, 0.0, 0.0])
+        axis_variance = [measurement_sigma**2, velocity_sigma**2, acceleration_sigma**2]
+        self.covariance = np.diag(axis_variance * 2)
+        self.measurement_variance = measurement_sigma**2
+        self.jerk_variance = jerk_sigma**2
+
+    @property
+    def position(self) -> tuple[float, float]:
+        return float(self.state[0]), float(self.state[3])
+
+    @property
+    def velocity(self) -> tuple[float, float]:
+        return float(self.state[1]), float(self.state[4])
+
+    def position_sigma(self) -> float:
+        """Standard deviation of the position estimate (worst axis), in pixels."""
+        return math.sqrt(max(self.covariance[0, 0], self.covariance[3, 3]))
+
+    def predict(self, dt: float) -> tuple[float, float]:
+        """Advance the state by ``dt`` seconds; returns the predicted position."""
+        axis = np.array([[1.0, dt, dt * dt / 2], [0.0, 1.0, dt], [0.0, 0.0, 1.0]])
+        jerk_gain = np.array([dt**3 / 6, dt * dt / 2, dt])
+        transition = np.kron(np.eye(2), axis)
+        noise = np.kron(np.eye(2), np.outer(jerk_gain, jerk_gain) * self.jerk_variance)
+
+        self.state = transition @ self.state
+        self.covariance = transition @ self.covariance @ transition.T + noise
+        return self.position
+
+    def update(self, x: float, y: float) -> None:
+        """Correct the state with a measured position."""
+        observe = np.zeros((2, 6))
+        observe[0, 0] = observe[1, 3] = 1.0
+
+        innovation = np.array([x, y]) - observe @ self.state
+        innovation_cov = observe @ self.covariance @ observe.T + np.eye(2) * (
+            self.measurement_variance
+        )
+        gain = self.covariance @ observe.T @ np.linalg.inv(innovation_cov)
+
+        self.state = self.state + gain @ innovation
+        self.covariance = (np.eye(6) - gain @ observe) @ self.covariance
+
+
 class BallTracker:
     """Tracks cricket ball in video using color-based detection."""
 
+    TRACKING_MODES = ("detect", "kalman")
+
+    # Kalman mode: consecutive window misses before searching full frames again
+    MAX_ROI_MISSES = 3
+    # Smallest ball radius (px) the downsampled acquisition search may shrink to
+    MIN_ACQUISITION_RADIUS = 3.0
+
     # Default HSV ranges for cricket balls
     BALL_COLOR_RANGES = {
         "red": {
@@ -108,7 +191,14 @@ class BallTracker:
         },
     }
 
-    def __init__(self, ball_color: str = "red", min_radius: int = 5, max_radius: int = 50):
+    def __init__(
+        self,
+        ball_color: str = "red",
+        min_radius: int = 5,
+        max_radius: int = 50,
+        tracking_mode: str = "detect",
+        acquisition_width: int = 640,
+    ):
         """
         Initialize ball tracker.
 
@@ -116,45 +206,61 @@ class BallTracker:
             ball_color: Color of ball ("red", "white", or "pink")
             min_radius: Minimum ball radius in pixels
             max_radius: Maximum ball radius in pixels
+            tracking_mode: "detect" (full search every frame) or "kalman"
+                (predicted-window search after lock-on)
+            acquisition_width: Frame width for the kalman mode's full-frame
+                acquisition search
         """
         self.ball_color = ball_color.lower()
         self.min_radius = min_radius
         self.max_radius = max_radius
+        self.tracking_mode = tracking_mode.lower()
+        self.acquisition_width = acquisition_width
 
         if self.ball_color not in self.BALL_COLOR_RANGES:
             raise ValueError(
                 f"Unsupported ball color: {ball_color}. "
                 f"Choose from: {list(self.BALL_COLOR_RANGES.keys())}"
             )
+        if self.tracking_mode not in self.TRACKING_MODES:
+            raise ValueError(
+                f"Unsupported tracking mode: {tracking_mode}. Choose from: {list(self.TRACKING_MODES)}"
+            )
 
     def track_ball_in_video(
         self,
         video_path: str,
         sample_fps: float = 30.0,
         max_width: int = 1280,
+        on_frame: Callable[[int], None] | None = None,
     ) -> BallTrajectory:
         """
         Track ball throughout video.
 
         Args:
-            video_path: Path to video file
+            video_path: Path to video file or HTTP(S) URL (e.g. presigned S3 URL)
             sample_fps: Target frames per second for sampling
-            max_width: Maximum frame width for processing
+            max_width: Maximum frame width for processing; wider frames are
+                downscaled (positions are still reported in video pixels)
+            on_frame: Called after every sampled frame with the number of frames
+                sampled so far; an exception it raises stops tracking
 
         Returns:
             BallTrajectory with all detected positions
         """
         cv2 = _import_cv2()
 
-        video_path_obj = Path(video_path)
-        if not video_path_obj.exists():
-            raise FileNotFoundError(f"Video file not found: {video_path_obj}")
+        # Local files and HTTP(S) URLs (streamed with ranged reads) are both accepted
+        source = str(video_path)
+        label = video_source_label(source)
+        if not is_video_url(source) and not Path(source).exists():
+            raise FileNotFoundError(f"Video file not found: {label}")
 
-        logger.info(f"Tracking {self.ball_color} ball in video: {video_path_obj}")
+        logger.info(f"Tracking {self.ball_color} ball in video: {label}")
 
-        cap = cv2.VideoCapture(str(video_path_obj))
+        cap = cv2.VideoCapture(source)
         if not cap.isOpened():
-            raise ValueError(f"Cannot open video file: {video_path_obj}")
+            raise ValueError(f"Cannot open video file: {label}")
 
         total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
         fps = cap.get(cv2.CAP_PROP_FPS)
@@ -168,30 +274,32 @@ class BallTracker:
         # Sampling setup
         frame_interval = max(1, int(fps / sample_fps))
         positions: list[BallPosition] = []
-        frame_num = 0
         sampled = 0
+        follower = _PredictiveSearch(self, max_width) if self.tracking_mode == "kalman" else None
 
+        started = time.perf_counter()
         try:
-            while True:
-                ret, frame = cap.read()
-                if not ret:
-                    break
-
-                # Sample frames
-                if frame_num % frame_interval == 0:
-                    timestamp = frame_num / fps
-
-                    # Detect ball in frame
-                    ball_pos = self._detect_ball_in_frame(frame, frame_num, timestamp)
-                    if ball_pos:
-                        positions.append(ball_pos)
-
-                    sampled += 1
-
-                frame_num += 1
+            # Skipped frames are only grabbed; sampled frames are retrieved
+            for frame_num, frame in FrameSampler(cv2, cap, frame_interval=frame_interval):
+                timestamp = frame_num / fps
+
+                # Detect ball in frame
+                if follower is not None:
+                    ball_pos = follower.step(frame, frame_num, timestamp)
+                else:
+                    ball_pos = self._detect_ball_in_frame(
+                        frame, frame_num, timestamp, max_width=max_width
+                    )
+                if ball_pos:
+                    positions.append(ball_pos)
+
+                sampled += 1
+                if on_frame is not None:
+                    on_frame(sampled)
 
         finally:
             cap.release()
+        elapsed = time.perf_counter() - started
 
         # Calculate velocities
         self._calculate_velocities(positions, fps)
@@ -202,6 +310,8 @@ class BallTracker:
             total_frames=total_frames,
             detected_frames=len(positions),
             detection_rate=len(positions) / sampled * 100 if sampled > 0 else 0,
+            tracking_mode=self.tracking_mode,
+            processing_fps=sampled / elapsed if elapsed > 0 else 0.0,
         )
 
         # Identify key points
@@ -212,7 +322,8 @@ class BallTracker:
 
         logger.info(
             f"Ball tracking complete: {len(positions)}/{sampled} frames "
-            f"({trajectory.detection_rate:.1f}% detection rate)"
+            f"({trajectory.detection_rate:.1f}% detection rate) "
+            f"mode={self.tracking_mode} {trajectory.processing_fps:.1f} frames/s"
         )
 
         return trajectory
@@ -222,6 +333,8 @@ class BallTracker:
         frame: np.ndarray,
         frame_num: int,
         timestamp: float,
+        *,
+        max_width: int | None = None,
     ) -> BallPosition | None:
         """
         Detect ball in a single frame using color-based detection.
@@ -230,21 +343,52 @@ class BallTracker:
             frame: Video frame (BGR image)
             frame_num: Frame number
             timestamp: Timestamp in seconds
+            max_width: Downscale wider frames to this width before searching
 
         Returns:
             BallPosition if detected, None otherwise
         """
+        scale = _processing_scale(frame, max_width)
+        found = self._find_ball(_resize(frame, scale), scale)
+        if found is None:
+            return None
+        x, y, radius, score = found
+
+        return BallPosition(
+            frame_num=frame_num,
+            timestamp=timestamp,
+            x=x / scale,
+            y=y / scale,
+            confidence=score,
+            radius=radius / scale,
+        )
+
+    def _find_ball(
+        self, image: np.ndarray, scale: float = 1.0
+    ) -> tuple[float, float, float, float] | None:
+        """
+        Best ball candidate in an image (a frame, a window of one, or a downscaled copy).
+
+        Args:
+            image: BGR image
+            scale: Size of ``image`` relative to the video frame; radius limits
+                and the noise kernel are scaled to match
+
+        Returns:
+            (x, y, radius, score) in ``image`` pixels, or None
+        """
         cv2 = _import_cv2()
 
         # Convert to HSV
-        hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
 
         # Create mask for ball color
         color_range = self.BALL_COLOR_RANGES[self.ball_color]
         mask = cv2.inRange(hsv, color_range["lower"], color_range["upper"])
 
         # Morphological operations to reduce noise
-        kernel: np.ndarray = np.ones((5, 5), np.uint8)
+        kernel_size = 5 if scale >= 1.0 else max(3, round(5 * scale) | 1)
+        kernel: np.ndarray = np.ones((kernel_size, kernel_size), np.uint8)
         mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel)
         mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel)
 
@@ -257,16 +401,18 @@ class BallTracker:
         # Find largest circular contour
         best_circle = None
         best_score = 0
+        min_radius = self.min_radius * scale
+        max_radius = self.max_radius * scale
 
         for contour in contours:
             area = cv2.contourArea(contour)
-            if area < (np.pi * self.min_radius**2):
+            if area < (np.pi * min_radius**2):
                 continue
 
             # Fit circle
             (x, y), radius = cv2.minEnclosingCircle(contour)
 
-            if radius < self.min_radius or radius > self.max_radius:
+            if radius < min_radius or radius > max_radius:
                 continue
 
             # Calculate circularity score
@@ -274,7 +420,7 @@ class BallTracker:
             circularity = 4 * np.pi * area / (perimeter**2) if perimeter > 0 else 0
 
             # Score combines circularity and size appropriateness
-            size_score = 1.0 - abs(radius - 15) / 15  # Prefer ~15 pixel radius
+            size_score = 1.0 - abs(radius / scale - 15) / 15  # Prefer ~15 pixel radius
             score = circularity * 0.7 + size_score * 0.3
 
             if score > best_score:
@@ -285,15 +431,22 @@ class BallTracker:
             return None
 
         x, y, radius = best_circle
-
-        return BallPosition(
-            frame_num=frame_num,
-            timestamp=timestamp,
-            x=float(x),
-            y=float(y),
-            confidence=float(best_score),
-            radius=float(radius),
-        )
+        return float(x), float(y), float(radius), float(best_score)
+
+    def _find_ball_near(
+        self, frame: np.ndarray, x: float, y: float, half_size: float, scale: float
+    ) -> tuple[float, float, float, float] | None:
+        """``_find_ball`` within a square window of the frame; result in frame pixels."""
+        height, width = frame.shape[:2]
+        x0, x1 = max(0, int(x - half_size)), min(width, int(x + half_size) + 1)
+        y0, y1 = max(0, int(y - half_size)), min(height, int(y + half_size) + 1)
+        if x1 - x0 < 2 or y1 - y0 < 2:
+            return None
+        found = self._find_ball(_resize(frame[y0:y1, x0:x1], scale), scale)
+        if found is None:
+            return None
+        bx, by, radius, score = found
+        return x0 + bx / scale, y0 + by / scale, radius / scale, score
 
     def _calculate_velocities(self, positions: list[BallPosition], fps: float) -> None:
         """Calculate velocity for each position based on adjacent frames."""
@@ -381,6 +534,84 @@ class BallTracker:
         trajectory.trajectory_length = total_distance
 
 
+def _processing_scale(frame: np.ndarray, max_width: int | None) -> float:
+    width = frame.shape[1]
+    if not max_width or width <= max_width:
+        return 1.0
+    return max_width / width
+
+
+def _resize(image: np.ndarray, scale: float) -> np.ndarray:
+    if scale >= 1.0:
+        return image
+    cv2 = _import_cv2()
+    height, width = image.shape[:2]
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    return cv2.resize(image, size, interpolation=cv2.INTER_LINEAR)
+
+
+class _PredictiveSearch:
+    """Kalman-mode frame loop state: acquire, lock on, follow the predicted window."""
+
+    def __init__(self, tracker: BallTracker, max_width: int | None):
+        self.tracker = tracker
+        self.max_width = max_width
+        self.filter: BallKalmanFilter | None = None
+        self.last_timestamp = 0.0
+        self.misses = 0
+        self.full_searches = 0
+        self.window_searches = 0
+
+    def step(self, frame: np.ndarray, frame_num: int, timestamp: float) -> BallPosition | None:
+        tracker = self.tracker
+        scale = _processing_scale(frame, self.max_width)
+        found = None
+
+        if self.filter is not None:
+            # Locked on: search only where the ball should be
+            x, y = self.filter.predict(timestamp - self.last_timestamp)
+            self.last_timestamp = timestamp
+            half_size = 4 * tracker.max_radius + 3 * self.filter.position_sigma()
+            self.window_searches += 1
+            found = tracker._find_ball_near(frame, x, y, half_size, scale)
+            if found is None:
+                self.misses += 1
+                if self.misses >= tracker.MAX_ROI_MISSES:
+                    self.filter = None
+                return None
+            self.misses = 0
+            self.filter.update(found[0], found[1])
+        else:
+            # Acquisition: coarse search on a downsampled frame, refined at full scale
+            coarse_scale = min(
+                scale,
+                max(
+                    tracker.acquisition_width / frame.shape[1],
+                    tracker.MIN_ACQUISITION_RADIUS / max(1, tracker.min_radius),
+                ),
+            )
+            self.full_searches += 1
+            coarse = tracker._find_ball(_resize(frame, coarse_scale), coarse_scale)
+            if coarse is not None:
+                x, y = coarse[0] / coarse_scale, coarse[1] / coarse_scale
+                found = tracker._find_ball_near(frame, x, y, 2 * tracker.max_radius, scale)
+            if found is None:
+                return None
+            self.filter = BallKalmanFilter(found[0], found[1])
+            self.last_timestamp = timestamp
+            self.misses = 0
+
+        x, y, radius, score = found
+        return BallPosition(
+            frame_num=frame_num,
+            timestamp=timestamp,
+            x=x,
+            y=y,
+            confidence=score,
+            radius=radius,
+        )
+
+
 def analyze_ball_trajectory(
     trajectory: BallTrajectory,
 ) -> BallMetrics:
@@ -494,6 +725,72 @@ def _classify_trajectory_shape(
     return "straight"
 
 
+@dataclass
+class _RunningStats:
+    """Running mean and population variance (Welford), one value at a time."""
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / self.count if self.count else 0.0
+
+
+@dataclass
+class DeliveryConsistency:
+    """Consistency across deliveries, accumulated as each trajectory arrives.
+
+    Holds only running statistics, so batch tracking can report an up-to-date
+    summary without keeping every trajectory in memory.
+    """
+
+    delivery_count: int = 0
+    release_x: _RunningStats = field(default_factory=_RunningStats)
+    release_y: _RunningStats = field(default_factory=_RunningStats)
+    velocity: _RunningStats = field(default_factory=_RunningStats)
+
+    def add(self, trajectory: BallTrajectory) -> None:
+        self.delivery_count += 1
+        if trajectory.release_point is not None:
+            self.release_x.add(trajectory.release_point.x)
+            self.release_y.add(trajectory.release_point.y)
+        self.velocity.add(trajectory.avg_velocity)
+
+    def summary(self) -> dict[str, Any]:
+        """Consistency metrics in the ``analyze_multiple_deliveries`` format."""
+        if not self.delivery_count:
+            return {"delivery_count": 0, "consistency_score": 0}
+        if not self.release_x.count:
+            return {"delivery_count": self.delivery_count, "consistency_score": 0}
+
+        variance_x = self.release_x.variance
+        variance_y = self.release_y.variance
+
+        # Consistency score: lower variance = higher score
+        # Normalize to 0-100 (assume variance > 100 is poor)
+        total_variance = variance_x + variance_y
+        consistency_score = max(0, 100 - total_variance)
+
+        return {
+            "delivery_count": self.delivery_count,
+            "consistency_score": float(consistency_score),
+            "release_variance_x": variance_x,
+            "release_variance_y": variance_y,
+            "avg_release_x": self.release_x.mean,
+            "avg_release_y": self.release_y.mean,
+            "velocity_variance": self.velocity.variance,
+            "avg_velocity": self.velocity.mean,
+        }
+
+
 def analyze_multiple_deliveries(
     trajectories: list[BallTrajectory],
 ) -> dict[str, Any]:
@@ -506,41 +803,10 @@ def analyze_multiple_deliveries(
     Returns:
         Dict with consistency metrics
     """
-    if not trajectories:
-        return {"delivery_count": 0, "consistency_score": 0}
-
-    # Extract release points
-    release_points = [t.release_point for t in trajectories if t.release_point is not None]
-
-    if not release_points:
-        return {"delivery_count": len(trajectories), "consistency_score": 0}
-
-    # Calculate variance in release position
-    release_x = [p.x for p in release_points]
-    release_y = [p.y for p in release_points]
-
-    variance_x = float(np.var(release_x))
-    variance_y = float(np.var(release_y))
-
-    # Consistency score: lower variance = higher score
-    # Normalize to 0-100 (assume variance > 100 is poor)
-    total_variance = variance_x + variance_y
-    consistency_score = max(0, 100 - total_variance)
-
-    # Velocity consistency
-    velocities = [t.avg_velocity for t in trajectories]
-    velocity_variance = float(np.var(velocities))
-
-    return {
-        "delivery_count": len(trajectories),
-        "consistency_score": float(consistency_score),
-        "release_variance_x": variance_x,
-        "release_variance_y": variance_y,
-        "avg_release_x": float(np.mean(release_x)),
-        "avg_release_y": float(np.mean(release_y)),
-        "velocity_variance": velocity_variance,
-        "avg_velocity": float(np.mean(velocities)),
-    }
+    consistency = DeliveryConsistency()
+    for trajectory in trajectories:
+        consistency.add(trajectory)
+    return consistency.summary()
 
 
 # ============================================================================
@@ -597,12 +863,52 @@ def compute_homography(corners_px: list[dict[str, float]]) -> np.ndarray:
     return H
 
 
+def homography_to_json(H: np.ndarray) -> list[list[float]]:
+    """Serialise a homography for storage with the session calibration."""
+    return [[float(v) for v in row] for row in np.asarray(H, dtype=np.float64)]
+
+
+def load_homography(stored: Any) -> np.ndarray | None:
+    """Homography stored by ``homography_to_json``; None if absent or malformed."""
+    try:
+        H = np.asarray(stored, dtype=np.float64)
+    except (TypeError, ValueError):
+        return None
+    if H.shape != (3, 3) or not np.isfinite(H).all():
+        return None
+    return H
+
+
+def project_points_to_pitch(points_px: Any, H: np.ndarray) -> np.ndarray:
+    """
+    Project many pixel coordinates to normalized pitch space in one array operation.
+
+    Args:
+        points_px: (N, 2) array-like of pixel (x, y) coordinates
+        H: 3x3 homography matrix from compute_homography()
+
+    Returns:
+        (N, 2) float64 array of (x_norm, y_norm); points on the horizon line are NaN
+    """
+    points = np.asarray(points_px, dtype=np.float64).reshape(-1, 2)
+    projected = points @ H[:, :2].T + H[:, 2]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return projected[:, :2] / projected[:, 2:]
+
+
+def project_trajectory_to_pitch(trajectory: BallTrajectory, H: np.ndarray) -> np.ndarray:
+    """Project every tracked position of ``trajectory`` at once; (N, 2) as above."""
+    return project_points_to_pitch([(p.x, p.y) for p in trajectory.positions], H)
+
+
 def project_point_to_pitch(
     point_px: dict[str, float] | BallPosition, H: np.ndarray
 ) -> tuple[float, float]:
     """
     Project a pixel coordinate to normalized pitch space using homography.
 
+    Use project_points_to_pitch() for more than a handful of points.
+
     Args:
         point_px: Point in pixel space, either {"x": ..., "y": ...} or BallPosition
         H: 3x3 homography matrix from compute_homography()
@@ -612,22 +918,14 @@ def project_point_to_pitch(
             x_norm: 0 (leg side) to 100 (off side)
             y_norm: 0 (bowler's end) to 100 (batsman's end)
     """
-    cv2 = _import_cv2()
-
     # Extract x, y coordinates
     if isinstance(point_px, BallPosition):
         x, y = point_px.x, point_px.y
     else:
         x, y = point_px["x"], point_px["y"]
 
-    # Apply perspective transform
-    pixel_array = np.array([[[x, y]]], dtype=np.float32)
-    pitch_coord = cv2.perspectiveTransform(pixel_array, H)
-
-    x_norm = float(pitch_coord[0][0][0])
-    y_norm = float(pitch_coord[0][0][1])
-
-    return x_norm, y_norm
+    ((x_norm, y_norm),) = project_points_to_pitch([(x, y)], H)
+    return float(x_norm), float(y_norm)
 
 
 def classify_length(y_norm: float) -> str:
@@ -674,3 +972,23 @@ def classify_line(x_norm: float) -> str:
         return "off_stump"
     else:
         return "wide_off"
+
+
+def classify_lengths(y_norm: Any) -> list[str]:
+    """Vectorised classify_length() over an array of normalized y-coordinates."""
+    y = np.asarray(y_norm, dtype=np.float64)
+    return np.select(
+        [y >= 85, y >= 65, y >= 40, y >= 20],
+        ["yorker", "full", "good_length", "short"],
+        default="bouncer",
+    ).tolist()
+
+
+def classify_lines(x_norm: Any) -> list[str]:
+    """Vectorised classify_line() over an array of normalized x-coordinates."""
+    x = np.asarray(x_norm, dtype=np.float64)
+    return np.select(
+        [x < 20, x < 40, x <= 60, x <= 80],
+        ["wide_leg", "leg_stump", "middle", "off_stump"],
+        default="wide_off",
+    ).tolist()
@@ -8,12 +8,21 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+from collections import deque
+from collections.abc import AsyncIterator, Sequence
 from typing import Any, cast
 
 import boto3
 from backend.config import settings
 from backend.services.coach_findings import generate_findings
 from backend.services.coach_report_service import generate_report_text
+from backend.services.pose_artifact import (
+    POSE_NPZ_CONTENT_TYPE,
+    PoseArrays,
+    PoseArraysBuffer,
+    dumps_pose_npz,
+    loads_pose_npz,
+)
 from backend.services.pose_metrics import build_pose_metric_evidence, compute_pose_metrics
 from backend.sql_app.models import VideoAnalysisChunk, VideoAnalysisJob
 from sqlalchemy import select
@@ -22,31 +31,42 @@ from sqlalchemy.ext.asyncio import AsyncSession
 logger = logging.getLogger(__name__)
 
 
-async def _download_json_from_s3(bucket: str, key: str) -> dict[str, Any]:
-    """Download JSON artifact from S3.
+async def _download_bytes_from_s3(bucket: str, key: str) -> bytes:
+    """Download an artifact from S3.
 
     Args:
         bucket: S3 bucket name
         key: S3 object key
 
     Returns:
-        Parsed JSON payload
+        Raw object body
     """
-    s3 = cast(Any, boto3.client("s3", region_name=settings.AWS_REGION))
     loop = asyncio.get_running_loop()
 
-    def _get() -> dict[str, Any]:
+    def _get() -> bytes:
+        s3 = cast(Any, boto3.client("s3", region_name=settings.AWS_REGION))
         response = s3.get_object(Bucket=bucket, Key=key)
-        body = response["Body"].read()
-        return json.loads(body)
+        return response["Body"].read()
 
     return await loop.run_in_executor(None, _get)
 
 
-async def _upload_json_to_s3(*, bucket: str, key: str, payload: dict[str, Any]) -> None:
-    """Upload JSON payload to S3."""
+def _load_chunk_poses(key: str, body: bytes) -> PoseArrays:
+    """Parse a chunk artifact: ``.npz`` pose arrays, or a legacy JSON payload."""
+    if key.endswith(".npz"):
+        return loads_pose_npz(body)
+    payload = json.loads(body)
+    poses = payload.get("poses", [])
+    return PoseArrays.from_frames(
+        poses if isinstance(poses, list) else [], metadata=payload.get("metadata")
+    )
+
+
+async def _upload_bytes_to_s3(
+    *, bucket: str, key: str, body: bytes, content_type: str = POSE_NPZ_CONTENT_TYPE
+) -> None:
+    """Upload a serialized artifact to S3."""
     s3 = cast(Any, boto3.client("s3", region_name=settings.AWS_REGION))
-    body = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
     loop = asyncio.get_running_loop()
 
     def _put() -> None:
@@ -54,51 +74,109 @@ async def _upload_json_to_s3(*, bucket: str, key: str, payload: dict[str, Any])
             Bucket=bucket,
             Key=key,
             Body=body,
-            ContentType="application/json",
+            ContentType=content_type,
         )
 
     await loop.run_in_executor(None, _put)
 
 
-def _merge_chunk_poses(chunks_data: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    """Merge pose landmarks from all chunks into single timeline.
+async def _upload_json_to_s3(*, bucket: str, key: str, payload: dict[str, Any]) -> None:
+    """Upload JSON payload to S3."""
+    body = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    await _upload_bytes_to_s3(bucket=bucket, key=key, body=body, content_type="application/json")
+
+
+async def _iter_chunk_poses(
+    bucket: str, chunks: Sequence[VideoAnalysisChunk], concurrency: int
+) -> AsyncIterator[PoseArrays]:
+    """Download chunk artifacts concurrently, yielding them in chunk order.
+
+    At most ``concurrency`` downloads run ahead of the chunk being yielded, so a
+    slow chunk holds back at most that many buffered artifacts.
 
     Args:
-        chunks_data: List of chunk payloads (sorted by chunk_index)
+        bucket: S3 bucket name
+        chunks: Chunks sorted by chunk_index
+        concurrency: Maximum downloads in flight
 
-    Returns:
-        Combined list of pose frames
+    Yields:
+        Pose arrays per chunk, in the order of ``chunks``
     """
-    all_frames = []
+    for chunk in chunks:
+        if not chunk.artifact_s3_key:
+            raise ValueError(
+                f"Chunk {chunk.id} missing artifact_s3_key (status={chunk.status.value})"
+            )
+
+    async def _fetch(key: str) -> PoseArrays:
+        body = await _download_bytes_from_s3(bucket, key)
+        return _load_chunk_poses(key, body)
+
+    keys = iter([cast(str, chunk.artifact_s3_key) for chunk in chunks])
+    pending: deque[asyncio.Task[PoseArrays]] = deque()
+    try:
+        for key in keys:
+            pending.append(asyncio.create_task(_fetch(key)))
+            if len(pending) >= max(1, concurrency):
+                break
+        while pending:
+            poses = await pending.popleft()
+            next_key = next(keys, None)
+            if next_key is not None:
+                pending.append(asyncio.create_task(_fetch(next_key)))
+            yield poses
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def _merge_chunk_poses(
+    bucket: str, chunks: Sequence[VideoAnalysisChunk], concurrency: int
+) -> PoseArrays:
+    """Merge pose landmarks from all chunks into single timeline.
 
-    for chunk in chunks_data:
-        poses = chunk.get("poses", [])
-        if isinstance(poses, list):
-            all_frames.extend(poses)
+    Each chunk is copied into the timeline as soon as it and its predecessors
+    are downloaded, while later chunks are still in flight; its artifact bytes
+    are released once copied.
 
-    logger.info(f"Merged {len(chunks_data)} chunks into {len(all_frames)} total pose frames")
-    return all_frames
+    Args:
+        bucket: S3 bucket name
+        chunks: Chunks sorted by chunk_index
+        concurrency: Maximum downloads in flight
+
+    Returns:
+        Combined pose timeline
+    """
+    # Sized for the expected sampled frames; the buffer grows if chunks hold more
+    expected = sum(chunk.end_sec - chunk.start_sec for chunk in chunks) * settings.SAMPLE_FPS
+    timeline = PoseArraysBuffer(capacity=int(expected) + len(chunks))
+    async for poses in _iter_chunk_poses(bucket, chunks, concurrency):
+        timeline.append(poses)
+    merged = timeline.build()
+    logger.info(f"Merged {timeline.parts} chunks into {len(merged)} total pose frames")
+    return merged
 
 
-def _compute_aggregated_metrics(
-    all_frames: list[dict[str, Any]], video_duration: float
-) -> dict[str, Any]:
+def _compute_aggregated_metrics(poses: PoseArrays, video_duration: float) -> dict[str, Any]:
     """Compute metrics from aggregated pose data.
 
     Args:
-        all_frames: Combined pose frames from all chunks
+        poses: Combined pose timeline from all chunks
         video_duration: Total video duration in seconds
 
     Returns:
         Metrics dict compatible with compute_pose_metrics
     """
-    frames_with_pose = sum(1 for f in all_frames if f.get("landmarks"))
-    total_frames = len(all_frames)
+    frames_with_pose = int(poses.detected.sum())
+    total_frames = len(poses)
     detection_rate = (frames_with_pose / total_frames * 100) if total_frames > 0 else 0
 
-    # Build pose payload compatible with metrics service
+    # Build pose payload compatible with metrics service; the metrics read the
+    # landmark arrays directly, so no per-frame dicts are built
     pose_payload = {
-        "frames": all_frames,
+        "frames": [],
+        "pose_arrays": poses,
         "total_frames": total_frames,
         "sampled_frames": total_frames,
         "frames_with_pose": frames_with_pose,
@@ -154,22 +232,13 @@ async def aggregate_chunks_and_finalize(db: AsyncSession, job: VideoAnalysisJob)
     if not bucket:
         raise ValueError(f"Missing S3 bucket for job {job.id}")
 
-    # Download all chunk artifacts
-    chunks_data = []
-    for chunk in chunks:
-        if not chunk.artifact_s3_key:
-            raise ValueError(
-                f"Chunk {chunk.id} missing artifact_s3_key (status={chunk.status.value})"
-            )
-
-        chunk_payload = await _download_json_from_s3(bucket, chunk.artifact_s3_key)
-        chunks_data.append(chunk_payload)
-
-    # Merge poses from all chunks
-    all_frames = _merge_chunk_poses(chunks_data)
+    # Download chunk artifacts concurrently, merging them in chunk order as they arrive
+    merged_poses = await _merge_chunk_poses(
+        bucket, chunks, settings.COACH_PLUS_AGGREGATION_DOWNLOAD_CONCURRENCY
+    )
 
     # Compute aggregated metrics
-    metrics_result = _compute_aggregated_metrics(all_frames, job.video_duration_seconds or 0)
+    metrics_result = _compute_aggregated_metrics(merged_poses, job.video_duration_seconds or 0)
 
     # Resolve analysis mode with fallback chain
     resolved_mode = (
@@ -177,15 +246,17 @@ async def aggregate_chunks_and_finalize(db: AsyncSession, job: VideoAnalysisJob)
     )
 
     # Generate findings and report
-    findings_result = generate_findings(metrics_result, context={"analysis_mode": resolved_mode})
+    findings_result = generate_findings(
+        metrics_result, context={"analysis_mode": resolved_mode}, analysis_mode=resolved_mode
+    )
     report_result = cast(dict[str, Any], generate_report_text(findings_result, None))
 
     # Build final results payload
     final_results = {
         "pose_summary": {
-            "total_frames": len(all_frames),
-            "sampled_frames": len(all_frames),
-            "frames_with_pose": sum(1 for f in all_frames if f.get("landmarks")),
+            "total_frames": len(merged_poses),
+            "sampled_frames": len(merged_poses),
+            "frames_with_pose": int(merged_poses.detected.sum()),
             "detection_rate_percent": metrics_result.get("detection_rate_percent", 0),
             "video_fps": 30.0,
             "model": "MediaPipe Pose Landmarker Full",
@@ -201,18 +272,20 @@ async def aggregate_chunks_and_finalize(db: AsyncSession, job: VideoAnalysisJob)
         },
     }
 
-    # Upload final report to S3
+    # Upload final report and the merged pose timeline to S3
     final_key = f"jobs/{job.id}/final_results.json"
     await _upload_json_to_s3(bucket=bucket, key=final_key, payload=final_results)
+    pose_key = f"jobs/{job.id}/deep_pose.npz"
+    await _upload_bytes_to_s3(bucket=bucket, key=pose_key, body=dumps_pose_npz(merged_poses))
 
     # Update job with final results
     job.deep_results = {
         **final_results,
-        "outputs": {"deep_results_s3_key": final_key},
+        "outputs": {"deep_results_s3_key": final_key, "deep_pose_s3_key": pose_key},
     }
     job.results = {"deep": job.deep_results}  # Legacy compat
 
     logger.info(
         f"Chunk aggregation complete: job_id={job.id} "
-        f"total_frames={len(all_frames)} s3_key={final_key}"
+        f"total_frames={len(merged_poses)} s3_key={final_key}"
     )
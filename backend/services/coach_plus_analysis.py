@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any, cast
 
 from backend.services.coach_findings import generate_findings
 from backend.services.coach_report_service import generate_report_text
+from backend.services.motion_sampling import MotionSampling
 from backend.services.pose_metrics import build_pose_metric_evidence, compute_pose_metrics
 
 logger = logging.getLogger(__name__)
@@ -17,6 +19,8 @@ def extract_pose_landmarks(
     sample_fps: float,
     max_width: int = 640,
     max_seconds: float | None = None,
+    start_sec: float | None = None,
+    end_sec: float | None = None,
 ) -> list[dict[str, Any]]:
     """Extract raw pose landmarks from video (for GPU chunk processing).
 
@@ -28,6 +32,8 @@ def extract_pose_landmarks(
         sample_fps: Target sampling rate
         max_width: Max video width for processing
         max_seconds: Max duration to process
+        start_sec: Optional range start (seconds); frame timestamps stay absolute
+        end_sec: Optional range end (seconds, exclusive)
 
     Returns:
         List of pose frames with landmarks
@@ -39,6 +45,8 @@ def extract_pose_landmarks(
         sample_fps=sample_fps,
         max_width=max_width,
         max_seconds=max_seconds,
+        start_sec=start_sec,
+        end_sec=end_sec,
     )
 
     # Return frames with pose landmarks
@@ -125,10 +133,7 @@ def run_pose_metrics_findings_report(
         analysis_mode: REQUIRED analysis mode (batting, bowling, wicketkeeping, fielding).
                       Determines which findings/drills are generated.
     """
-    # Validate analysis_mode is present and valid
-    VALID_MODES = {"batting", "bowling", "wicketkeeping", "fielding"}
-    if not analysis_mode or analysis_mode not in VALID_MODES:
-        raise ValueError(f"Invalid analysis_mode: {analysis_mode}. Must be one of {VALID_MODES}")
+    _validate_analysis_mode(analysis_mode)
 
     from backend.services.pose_service import extract_pose_keypoints_from_video
 
@@ -139,6 +144,112 @@ def run_pose_metrics_findings_report(
         max_seconds=max_seconds,
     )
 
+    return _build_artifacts(
+        pose_data,
+        sample_fps=sample_fps,
+        include_frames=include_frames,
+        max_seconds=max_seconds,
+        player_context=player_context,
+        analysis_mode=cast(str, analysis_mode),
+    )
+
+
+@dataclass(frozen=True)
+class AnalysisPass:
+    """One analysis rate (e.g. QUICK or DEEP) served by ``run_multi_rate_analysis``."""
+
+    name: str
+    sample_fps: float
+    include_frames: bool = False
+    max_seconds: float | None = None
+    motion: MotionSampling | None = None  # Motion-adaptive sampling (see pose_service)
+
+
+def run_multi_rate_analysis(
+    *,
+    video_path: str,
+    passes: list[AnalysisPass],
+    max_width: int = 640,
+    player_context: dict[str, Any] | None = None,
+    analysis_mode: str | None = None,
+    on_artifacts: Callable[[str, AnalysisArtifacts], None] | None = None,
+    on_progress: Callable[[dict[str, float]], None] | None = None,
+    cached_poses: dict[str, dict[str, Any]] | None = None,
+    on_pose: Callable[[str, dict[str, Any]], None] | None = None,
+) -> dict[str, AnalysisArtifacts]:
+    """Run several analysis passes over one shared decode + pose inference pass.
+
+    Equivalent to calling ``run_pose_metrics_findings_report`` once per pass, but frames
+    sampled by more than one pass are decoded and inferred once. ``on_artifacts`` is
+    called (from the calling thread) as soon as each pass's artifacts are ready, so a
+    short QUICK pass can be published while a DEEP pass is still running.
+    ``on_progress`` receives each pass's completed fraction after every analysed frame.
+
+    Passes found in ``cached_poses`` (pose results keyed by pass name, e.g. from the
+    pose cache) skip extraction; the video is only decoded for the remaining passes.
+    ``on_pose`` receives the pose result of every pass that was extracted.
+    """
+    _validate_analysis_mode(analysis_mode)
+
+    from backend.services.pose_service import SamplingPass, extract_pose_keypoints_multi_rate
+
+    by_name = {p.name: p for p in passes}
+    artifacts: dict[str, AnalysisArtifacts] = {}
+
+    def _on_pose(name: str, pose_data: dict[str, Any]) -> None:
+        if on_pose is not None and name not in cached:
+            on_pose(name, pose_data)
+        spec = by_name[name]
+        artifacts[name] = _build_artifacts(
+            pose_data,
+            sample_fps=spec.sample_fps,
+            include_frames=spec.include_frames,
+            max_seconds=spec.max_seconds,
+            player_context=player_context,
+            analysis_mode=cast(str, analysis_mode),
+        )
+        if on_artifacts is not None:
+            on_artifacts(name, artifacts[name])
+
+    cached = {name: data for name, data in (cached_poses or {}).items() if name in by_name}
+    for name, pose_data in cached.items():
+        _on_pose(name, pose_data)
+
+    remaining = [p for p in passes if p.name not in cached]
+    if remaining:
+        extract_pose_keypoints_multi_rate(
+            video_path,
+            [
+                SamplingPass(
+                    p.name, sample_fps=p.sample_fps, max_seconds=p.max_seconds, motion=p.motion
+                )
+                for p in remaining
+            ],
+            max_width=max_width,
+            on_pass_complete=_on_pose,
+            on_progress=on_progress,
+        )
+    # Artifacts in pass order, whichever source they came from
+    return {p.name: artifacts[p.name] for p in passes}
+
+
+def _validate_analysis_mode(analysis_mode: str | None) -> None:
+    # Validate analysis_mode is present and valid
+    VALID_MODES = {"batting", "bowling", "wicketkeeping", "fielding"}
+    if not analysis_mode or analysis_mode not in VALID_MODES:
+        raise ValueError(f"Invalid analysis_mode: {analysis_mode}. Must be one of {VALID_MODES}")
+
+
+def _build_artifacts(
+    pose_data: dict[str, Any],
+    *,
+    sample_fps: float,
+    include_frames: bool,
+    max_seconds: float | None,
+    player_context: dict[str, Any] | None,
+    analysis_mode: str,
+) -> AnalysisArtifacts:
+    """Turn pose extraction output into metrics, findings, report and results payload."""
     normalized = _normalize_pose_data(pose_data)
 
     pose_payload_for_metrics = {
@@ -183,6 +294,9 @@ def run_pose_metrics_findings_report(
         frames_out = (
             pose_data.get("frames") or pose_data.get("frames_data") or pose_data.get("pose_frames")
         )
+        if not frames_out and pose_data.get("pose_arrays") is not None:
+            # Cached results carry landmark arrays rather than frame dicts
+            frames_out = pose_data["pose_arrays"].to_frames()
         if not isinstance(frames_out, list):
             frames_out = None
 
@@ -203,6 +317,8 @@ def run_pose_metrics_findings_report(
             "max_seconds": float(max_seconds) if max_seconds is not None else None,
             "analysis_mode": analysis_mode,
             "analysis_mode_used": analysis_mode,  # Explicit confirmation for frontend
+            "timings": pose_data.get("timings"),
+            "sampling": pose_data.get("sampling"),
         },
     }
 
@@ -6,8 +6,8 @@ from pathlib import Path
 from typing import Any
 
 from .loader import DLSTable, load_table_from_json
-
-_SUPPORTED = {20: "icc_dls_international_20.json", 50: "icc_dls_international_50.json"}
+from .resources import SUPPORTED_INTERNATIONAL as _SUPPORTED
+from .resources import ResourceGrid, international_grid, international_tables_dir
 
 
 def get_supported_formats() -> list[int]:
@@ -15,18 +15,8 @@ def get_supported_formats() -> list[int]:
 
 
 def _default_tables_dir() -> Path:
-    """
-    Resolve the default location of the JSON tables:
-    1) DLS_TABLES_DIR env var (if set)
-    2) ../dls_tables relative to this file
-    """
-    import os
-
-    env = os.getenv("DLS_TABLES_DIR")
-    if env:
-        return Path(env).expanduser().resolve()
-    # package layout: dls/__init__.py -> ../dls_tables/
-    return Path(__file__).resolve().parent.parent.joinpath("dls_tables").resolve()
+    """Location of the JSON tables (``DLS_TABLES_DIR`` env var, else ../dls_tables)."""
+    return international_tables_dir()
 
 
 def get_table_info(format_overs: int) -> dict[str, Any]:
@@ -54,10 +44,7 @@ def get_table_info(format_overs: int) -> dict[str, Any]:
 @lru_cache(maxsize=2)
 def load_international_table(format_overs: int) -> DLSTable:
     """Load and cache the ICC Standard Edition table for 20 or 50 overs."""
-    if format_overs not in _SUPPORTED:
-        raise ValueError(f"Unsupported format: {format_overs}. Supported: {sorted(_SUPPORTED)}")
-    fpath = _default_tables_dir() / _SUPPORTED[format_overs]
-    return load_table_from_json(fpath)
+    return DLSTable.from_grid(international_grid(format_overs))
 
 
 def calculate_dls_target(
@@ -80,9 +67,11 @@ def calculate_dls_target(
 
 __all__ = [
     "DLSTable",
+    "ResourceGrid",
     "calculate_dls_target",
     "get_supported_formats",
     "get_table_info",
+    "international_grid",
     "load_international_table",
     "load_table_from_json",
 ]
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-import json
 from collections.abc import Mapping, Sequence
 from pathlib import Path
 
+import numpy as np
+
+from .resources import ResourceGrid, grid_from_ball_columns, read_ball_table_json
+
 
 class DLSTable:
     """
@@ -23,26 +26,23 @@ class DLSTable:
             resources: Mapping of wickets lost (0-9) to resource arrays.
                        Keys may be str (from JSON) or int; values may be any sequence of floats.
         """
-        self.format_overs = format_overs
-        self.max_balls = format_overs * 6
-
-        # Explicitly type the storage so Pylance knows what's inside.
-        self._resources: dict[int, list[float]] = {}
-
-        # Convert keys to int and values to List[float], with validation.
-        for wickets_key, resource_seq in resources.items():
-            wickets = int(wickets_key)
-            if not (0 <= wickets <= 9):
-                raise ValueError(f"Invalid wickets lost: {wickets}, must be 0-9")
-
-            arr = [float(x) for x in resource_seq]
-            if len(arr) != self.max_balls + 1:
-                raise ValueError(
-                    f"Invalid resource array length for {wickets} wickets: "
-                    f"{len(arr)}, expected {self.max_balls + 1}"
-                )
-
-            self._resources[wickets] = arr
+        self._init_from_grid(grid_from_ball_columns(format_overs, resources))
+
+    @classmethod
+    def from_grid(cls, grid: ResourceGrid) -> DLSTable:
+        """Wrap an already-loaded (typically process-cached) resource grid."""
+        table = cls.__new__(cls)
+        table._init_from_grid(grid)
+        return table
+
+    def _init_from_grid(self, grid: ResourceGrid) -> None:
+        self.grid = grid
+        self.format_overs = grid.format_overs
+        self.max_balls = grid.max_balls
+        # Wicket columns the source table actually defines (others are NaN).
+        self._wickets_present = frozenset(
+            int(w) for w in np.flatnonzero(~np.isnan(grid.values).all(axis=0))
+        )
 
     def resource(self, balls_left: int, wickets_lost: int) -> float:
         """
@@ -51,11 +51,10 @@ class DLSTable:
         balls_left = max(0, min(balls_left, self.max_balls))
         wickets_lost = max(0, min(wickets_lost, 9))
 
-        if wickets_lost not in self._resources:
+        if wickets_lost not in self._wickets_present:
             raise ValueError(f"No resource data for {wickets_lost} wickets lost")
 
-        # Now that _resources is Dict[int, List[float]], this is a float.
-        return self._resources[wickets_lost][balls_left]
+        return float(self.grid.values[balls_left, wickets_lost])
 
     def get_all_resources(self, wickets_lost: int) -> list[float]:
         """
@@ -87,25 +86,4 @@ def load_table_from_json(json_path: str | Path) -> DLSTable:
     """
     Load DLS table from JSON file.
     """
-    json_path = Path(json_path)
-
-    if not json_path.exists():
-        raise FileNotFoundError(f"DLS table file not found: {json_path}")
-
-    try:
-        with open(json_path, encoding="utf-8") as f:
-            data = json.load(f)
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON in {json_path}: {e}") from e
-
-    # Validate required fields
-    for field in ("format_overs", "resources"):
-        if field not in data:
-            raise ValueError(f"Missing required field in JSON: {field}")
-
-    format_overs = int(data["format_overs"])
-
-    # JSON gives us Dict[str, List[float]] (or similar). This matches the widened type.
-    resources: Mapping[int | str, Sequence[float]] = data["resources"]
-
-    return DLSTable(format_overs, resources)
+    return DLSTable.from_grid(read_ball_table_json(json_path))
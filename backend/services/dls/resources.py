@@ -0,0 +1,237 @@
+"""
+Process-wide DLS resource grids.
+
+Every DLS table in the backend (ICC Standard Edition JSON tables, the legacy
+``static/dls_<overs>.json`` placeholders and optional per-over CSV tables) is
+loaded once per process into a read-only NumPy grid indexed by
+``[balls_left, wickets_lost]``. Lookups are O(1) gathers and accept arrays, so
+callers can evaluate whole scenario grids in a single call.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import math
+import os
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+WICKET_COLUMNS = 10  # wickets lost 0..9 (the 10th wicket ends the innings)
+
+SUPPORTED_INTERNATIONAL = {20: "icc_dls_international_20.json", 50: "icc_dls_international_50.json"}
+
+_BACKEND_DIR = Path(__file__).resolve().parent.parent.parent
+
+
+@dataclass(frozen=True, eq=False)
+class ResourceGrid:
+    """Resources remaining (%) indexed by ``values[balls_left, wickets_lost]``."""
+
+    format_overs: int
+    values: npt.NDArray[np.float64]
+
+    def __post_init__(self) -> None:
+        expected = (self.format_overs * 6 + 1, WICKET_COLUMNS)
+        if self.values.shape != expected:
+            raise ValueError(f"Resource grid shape {self.values.shape}, expected {expected}")
+        self.values.setflags(write=False)
+
+    @property
+    def max_balls(self) -> int:
+        return self.format_overs * 6
+
+    def R_balls(self, balls_left: Any, wickets_lost: Any) -> Any:
+        """Resources remaining at whole-ball positions; broadcasts over array inputs."""
+        balls = np.clip(np.asarray(balls_left, dtype=np.int64), 0, self.max_balls)
+        wkts = np.clip(np.asarray(wickets_lost, dtype=np.int64), 0, WICKET_COLUMNS - 1)
+        out = self.values[balls, wkts]
+        return out if out.ndim else float(out)
+
+    def R(self, overs_left: Any, wickets_lost: Any) -> Any:
+        """
+        Resources remaining for (overs_left, wickets_lost); broadcasts over array inputs.
+
+        Fractional positions between balls are linearly interpolated; overs are
+        clamped to ``0..format_overs`` and wickets to ``0..9``. Returns a float for
+        scalar inputs and an ndarray otherwise.
+        """
+        overs = np.asarray(overs_left, dtype=np.float64)
+        wkts = np.clip(np.asarray(wickets_lost, dtype=np.int64), 0, WICKET_COLUMNS - 1)
+        balls = np.clip(overs * 6.0, 0.0, float(self.max_balls))
+        lo = np.floor(balls).astype(np.int64)
+        hi = np.minimum(lo + 1, self.max_balls)
+        frac = balls - lo
+        out = (1.0 - frac) * self.values[lo, wkts] + frac * self.values[hi, wkts]
+        out = np.where(overs <= 0.0, 0.0, out)
+        return out if out.ndim else float(out)
+
+    def over_rows(self) -> list[list[float]]:
+        """Per-over rows ``[overs_left][wickets_lost]`` (legacy list layout)."""
+        return self.values[::6].tolist()
+
+
+def grid_from_over_rows(rows: Sequence[Sequence[float]]) -> ResourceGrid:
+    """Build a ball-resolution grid from per-over rows by linear interpolation."""
+    per_over = np.asarray(rows, dtype=np.float64)
+    if per_over.ndim != 2 or per_over.shape[1] != WICKET_COLUMNS or len(per_over) < 2:
+        raise ValueError(f"Expected (overs + 1, {WICKET_COLUMNS}) rows, got {per_over.shape}")
+    format_overs = len(per_over) - 1
+    ball_pos = np.arange(format_overs * 6 + 1, dtype=np.float64) / 6.0
+    over_pos = np.arange(format_overs + 1, dtype=np.float64)
+    values = np.column_stack(
+        [np.interp(ball_pos, over_pos, per_over[:, w]) for w in range(WICKET_COLUMNS)]
+    )
+    return ResourceGrid(format_overs=format_overs, values=values)
+
+
+def grid_from_ball_columns(
+    format_overs: int, columns: Mapping[int | str, Sequence[float]]
+) -> ResourceGrid:
+    """
+    Build a grid from ``{wickets_lost: [resource at balls_left 0..max_balls]}``.
+
+    Wicket columns missing from ``columns`` are stored as NaN.
+    """
+    max_balls = format_overs * 6
+    values = np.full((max_balls + 1, WICKET_COLUMNS), np.nan, dtype=np.float64)
+    for wickets_key, resource_seq in columns.items():
+        wickets = int(wickets_key)
+        if not (0 <= wickets <= 9):
+            raise ValueError(f"Invalid wickets lost: {wickets}, must be 0-9")
+        arr = [float(x) for x in resource_seq]
+        if len(arr) != max_balls + 1:
+            raise ValueError(
+                f"Invalid resource array length for {wickets} wickets: "
+                f"{len(arr)}, expected {max_balls + 1}"
+            )
+        values[:, wickets] = arr
+    return ResourceGrid(format_overs=format_overs, values=values)
+
+
+def read_ball_table_json(json_path: str | Path) -> ResourceGrid:
+    """Parse an ICC-style JSON table (``format_overs`` + per-wicket ball columns)."""
+    json_path = Path(json_path)
+    if not json_path.exists():
+        raise FileNotFoundError(f"DLS table file not found: {json_path}")
+
+    try:
+        with open(json_path, encoding="utf-8") as f:
+            data = json.load(f)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in {json_path}: {e}") from e
+
+    for field in ("format_overs", "resources"):
+        if field not in data:
+            raise ValueError(f"Missing required field in JSON: {field}")
+
+    return grid_from_ball_columns(int(data["format_overs"]), data["resources"])
+
+
+def read_over_table_csv(path: str | Path) -> ResourceGrid:
+    """Parse a per-over CSV with header ``overs_remaining,w0..w9``."""
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"DLS resource CSV not found: {path}")
+    tmp: dict[int, list[float]] = {}
+    max_over = 0
+    with open(path, newline="") as f:
+        for rec in csv.DictReader(f):
+            o = int(float(rec["overs_remaining"]))
+            max_over = max(max_over, o)
+            tmp[o] = [float(rec.get(f"w{w}", 0.0)) for w in range(WICKET_COLUMNS)]
+    # Normalize to contiguous 0..max_over
+    return grid_from_over_rows([tmp.get(o, [0.0] * WICKET_COLUMNS) for o in range(max_over + 1)])
+
+
+def read_legacy_json(path: Path, format_overs: int) -> ResourceGrid:
+    """Parse a legacy ``{wickets: {overs_bowled: raw}}`` placeholder into a grid."""
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    rows: list[list[float]] = []
+
+    for overs_left in range(format_overs + 1):
+        overs_bowled = float(format_overs - overs_left)
+        row: list[float] = []
+        for w in range(WICKET_COLUMNS):
+            series: dict[str, Any] | None = payload.get(str(w))
+            if not series:
+                # Fallback to simple proportional model when data missing
+                row.append(max(0.0, (overs_left / max(1, format_overs)) * 100.0))
+                continue
+
+            start_raw = float(series.get("0", 100.0))
+            end_raw = float(series.get(str(format_overs), 0.0))
+            denom = start_raw - end_raw if start_raw != end_raw else 1.0
+
+            ob_floor = max(0, min(format_overs, math.floor(overs_bowled)))
+            ob_ceil = max(0, min(format_overs, math.ceil(overs_bowled)))
+            raw_floor = float(series.get(str(ob_floor), end_raw))
+            raw_ceil = float(series.get(str(ob_ceil), end_raw))
+
+            if ob_floor == ob_ceil:
+                raw = raw_floor
+            else:
+                raw = raw_floor + (raw_ceil - raw_floor) * (overs_bowled - ob_floor)
+
+            remaining = (raw - end_raw) / (denom or 1.0) * 100.0
+            row.append(max(0.0, min(100.0, remaining)))
+        rows.append(row)
+
+    return grid_from_over_rows(rows)
+
+
+def international_tables_dir() -> Path:
+    """
+    Resolve the location of the ICC JSON tables:
+    1) DLS_TABLES_DIR env var (if set)
+    2) backend/services/dls_tables
+    """
+    env = os.getenv("DLS_TABLES_DIR")
+    if env:
+        return Path(env).expanduser().resolve()
+    return Path(__file__).resolve().parent.parent.joinpath("dls_tables").resolve()
+
+
+@lru_cache(maxsize=2)
+def international_grid(format_overs: int) -> ResourceGrid:
+    """ICC Standard Edition grid for 20 or 50 overs (loaded once per process)."""
+    if format_overs not in SUPPORTED_INTERNATIONAL:
+        raise ValueError(
+            f"Unsupported format: {format_overs}. Supported: {sorted(SUPPORTED_INTERNATIONAL)}"
+        )
+    return read_ball_table_json(international_tables_dir() / SUPPORTED_INTERNATIONAL[format_overs])
+
+
+@lru_cache(maxsize=8)
+def csv_grid(path: str) -> ResourceGrid:
+    """Per-over CSV table at ``path`` (loaded once per process)."""
+    return read_over_table_csv(path)
+
+
+@lru_cache(maxsize=4)
+def bundled_grid(format_overs: int) -> ResourceGrid | None:
+    """
+    Grid for the bundled tables used by ``dls.compute_dls_target``.
+
+    Priority: ``static/dls/<overs>.csv``, then the legacy ``static/dls_<overs>.json``
+    placeholder. Returns None when neither exists.
+    """
+    csv_path = _BACKEND_DIR / "static" / "dls" / f"{format_overs}.csv"
+    if csv_path.exists():
+        return csv_grid(str(csv_path))
+    json_path = _BACKEND_DIR / "static" / f"dls_{format_overs}.json"
+    if json_path.exists():
+        return read_legacy_json(json_path, format_overs=format_overs)
+    return None
+
+
+def clear_caches() -> None:
+    """Drop every cached grid (tests and table hot-swaps)."""
+    international_grid.cache_clear()
+    csv_grid.cache_clear()
+    bundled_grid.cache_clear()
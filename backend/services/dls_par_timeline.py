@@ -0,0 +1,336 @@
+"""
+Incrementally maintained DLS par-score timeline for a chase.
+
+The timeline keeps the par score (and the chasing side's runs/wickets) after
+every legal ball of the second innings. New deliveries extend it in O(new
+deliveries); an overs reduction during the chase only recomputes the par values
+from the ball where it happened onward, and a change that affects Team 1's
+resources (first-innings total or first-innings reductions) rebuilds it. The
+snapshot then reads the current par in O(1) and the same arrays back the
+par-vs-actual chart endpoint.
+
+Resources used by Team 2 after ``k`` legal balls follow the DLS "resources
+lost" model: the resources available (``R(M0, 0)`` less whatever each chase
+reduction took away at the moment it was applied) minus the resources remaining
+under the overs limit in force at ``k``. With no chase reductions this is the
+same ``R(M, 0) - R(M - overs, w)`` the snapshot used before.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Literal, cast
+
+import numpy as np
+import numpy.typing as npt
+
+from backend import dls as dlsmod
+from backend.domain.constants import norm_extra
+from backend.services.dls.resources import ResourceGrid
+from backend.services.dls_scenarios import team1_runs
+
+SUPPORTED_OVERS = (20, 50)
+
+_CACHE_MAX_GAMES = 256
+_timelines: OrderedDict[str, ParTimeline] = OrderedDict()
+
+
+def _as_dict(d_any: Any) -> dict[str, Any]:
+    return d_any.model_dump() if hasattr(d_any, "model_dump") else dict(d_any)
+
+
+def _fingerprint(d_any: Any) -> str:
+    return json.dumps(_as_dict(d_any), sort_keys=True, default=str)
+
+
+def _inning_of(d: Mapping[str, Any]) -> int:
+    return int(d.get("inning") or 1)
+
+
+def _reductions(g: Any) -> list[tuple[int, int]]:
+    """``(at_delivery_index, new_overs_limit)`` for every overs reduction, in ledger order."""
+    out: list[tuple[int, int]] = []
+    for it in list(getattr(g, "interruptions", []) or []):
+        it_map = _as_dict(it)
+        idx, limit = it_map.get("at_delivery_index"), it_map.get("new_overs_limit")
+        if idx is None or limit is None:
+            continue
+        out.append((int(idx), int(limit)))
+    return sorted(out, key=lambda r: r[0])
+
+
+def initial_overs_limit(g: Any) -> int | None:
+    """
+    Overs per side before any reduction.
+
+    ``POST /games/{id}/overs-limit`` records the limit it replaced; legacy
+    records without it fall back to the game's current limit.
+    """
+    for it in list(getattr(g, "interruptions", []) or []):
+        it_map = _as_dict(it)
+        if it_map.get("new_overs_limit") is not None:
+            prev = it_map.get("previous_overs_limit")
+            if prev is not None:
+                return int(prev)
+            break
+    limit = getattr(g, "overs_limit", None)
+    return int(limit) if limit is not None else None
+
+
+def _overs_float(balls: Any) -> Any:
+    # Same float form as the snapshot (overs_completed + balls_this_over / 6)
+    return balls // 6 + (balls % 6) / 6.0
+
+
+@dataclass
+class ParTimeline:
+    """Per-ball par/runs/wickets for one chase; index ``k`` is after ``k`` legal balls."""
+
+    grid: ResourceGrid
+    format_overs: int
+    S1: int
+    R1_total: float
+    chase_start: int  # ledger index of the first second-innings delivery
+    team1_key: tuple[Any, ...]
+    team1_reductions: list[tuple[int, int]] = field(default_factory=list)
+    chase_reductions: list[tuple[int, int]] = field(default_factory=list)
+    processed: int = 0  # ledger entries consumed so far
+    last_fingerprint: str | None = None
+    # Per chase delivery j (0 = before the first ball): cumulative legal balls / wickets
+    d_balls: list[int] = field(default_factory=lambda: [0])
+    d_wkts: list[int] = field(default_factory=lambda: [0])
+    # Per legal ball k
+    runs: list[int] = field(default_factory=lambda: [0])
+    wickets: list[int] = field(default_factory=lambda: [0])
+    par: list[int] = field(default_factory=list)
+    _total_runs: int = 0
+    _seg_start: npt.NDArray[np.int64] = field(default_factory=lambda: np.zeros(1, np.int64))
+    _seg_limit: npt.NDArray[np.int64] = field(default_factory=lambda: np.zeros(1, np.int64))
+    _seg_avail: npt.NDArray[np.float64] = field(default_factory=lambda: np.zeros(1, np.float64))
+
+    # ------------------------------------------------------------------
+    # Construction / extension
+    # ------------------------------------------------------------------
+    def _schedule(self) -> None:
+        """Resolve chase reductions into (start ball, overs limit, resources available) segments."""
+        starts, limits = [0], [self.format_overs]
+        avail = [float(self.grid.R(self.format_overs, 0))]
+        for idx, new_limit in self.chase_reductions:
+            j = min(max(0, idx - self.chase_start), len(self.d_balls) - 1)
+            p, w = self.d_balls[j], self.d_wkts[j]
+            bowled = _overs_float(p)
+            lost = float(self.grid.R(max(0.0, limits[-1] - bowled), w)) - float(
+                self.grid.R(max(0.0, new_limit - bowled), w)
+            )
+            starts.append(p)
+            limits.append(new_limit)
+            avail.append(avail[-1] - max(0.0, lost))
+        self._seg_start = np.asarray(starts, dtype=np.int64)
+        self._seg_limit = np.asarray(limits, dtype=np.int64)
+        self._seg_avail = np.asarray(avail, dtype=np.float64)
+
+    def _par_for(self, balls: Any, wickets: Any) -> Any:
+        balls = np.asarray(balls, dtype=np.int64)
+        seg = np.searchsorted(self._seg_start, balls, side="right") - 1
+        overs_left = np.maximum(0.0, self._seg_limit[seg] - _overs_float(balls))
+        used = np.maximum(0.0, self._seg_avail[seg] - self.grid.R(overs_left, wickets))
+        if self.R1_total <= 0.0:
+            return np.zeros(balls.shape, dtype=np.int64)
+        return np.floor(self.S1 * (used / self.R1_total)).astype(np.int64) + 1
+
+    def _refresh_from(self, ball: int) -> None:
+        ball = max(0, min(ball, len(self.par)))
+        ks = np.arange(ball, len(self.runs), dtype=np.int64)
+        fresh = self._par_for(ks, np.asarray(self.wickets[ball:], dtype=np.int64))
+        del self.par[ball:]
+        self.par.extend(int(x) for x in fresh)
+
+    def extend(self, deliveries: Sequence[Any]) -> None:
+        """Consume ledger entries past ``processed`` and refresh par from the first touched ball."""
+        if self.processed >= len(deliveries):
+            return
+        first_touched = self.d_balls[-1]
+        balls, wkts, runs = self.d_balls[-1], self.d_wkts[-1], self._total_runs
+        for d_any in deliveries[self.processed :]:
+            d = _as_dict(d_any)
+            if _inning_of(d) < 2:
+                continue
+            x = norm_extra(d.get("extra_type"))
+            off = int(d.get("runs_off_bat") or 0)
+            ex = int(d.get("extra_runs") or 0)
+            if x == "wd":
+                runs += max(1, ex or 1)
+            elif x == "nb":
+                runs += 1 + off
+            elif x in ("b", "lb"):
+                runs += ex
+                balls += 1
+            else:
+                runs += off
+                balls += 1
+            if d.get("is_wicket") and (d.get("dismissal_type") or "").strip():
+                wkts += 1
+
+            self.d_balls.append(balls)
+            self.d_wkts.append(wkts)
+            if balls == len(self.runs) - 1:
+                self.runs[-1], self.wickets[-1] = runs, wkts
+            else:
+                self.runs.append(runs)
+                self.wickets.append(wkts)
+
+        self._total_runs = runs
+        self.processed = len(deliveries)
+        self.last_fingerprint = _fingerprint(deliveries[-1])
+        self._refresh_from(first_touched)
+
+    def apply_chase_reductions(self, reductions: list[tuple[int, int]]) -> None:
+        """Swap in a new chase-reduction list, recomputing par from the earliest changed point."""
+        old, self.chase_reductions = self.chase_reductions, reductions
+        common = 0
+        while common < min(len(old), len(reductions)) and old[common] == reductions[common]:
+            common += 1
+        changed = old[common:] + reductions[common:]
+        if not changed:
+            return
+        first_idx = min(idx for idx, _ in changed)
+        j = min(max(0, first_idx - self.chase_start), len(self.d_balls) - 1)
+        self._schedule()
+        self._refresh_from(self.d_balls[j])
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    @property
+    def balls_bowled(self) -> int:
+        return len(self.runs) - 1
+
+    @property
+    def target(self) -> int:
+        return dlsmod.revised_target(
+            S1=self.S1, R1_total=self.R1_total, R2_total=float(self._seg_avail[-1])
+        )
+
+    def par_now(self, balls: int | None = None, wickets: int | None = None) -> int:
+        """
+        Current par. O(1) when ``balls``/``wickets`` match the timeline head (the
+        normal case); otherwise evaluated directly for the given state.
+        """
+        if (balls is None or balls == self.balls_bowled) and (
+            wickets is None or wickets == self.wickets[-1]
+        ):
+            return self.par[-1]
+        b = self.balls_bowled if balls is None else balls
+        w = self.wickets[-1] if wickets is None else wickets
+        return int(self._par_for(np.asarray([b]), np.asarray([w]))[0])
+
+    def chart(self) -> dict[str, Any]:
+        return {
+            "format_overs": self.format_overs,
+            "overs_limit": int(self._seg_limit[-1]),
+            "S1": self.S1,
+            "R1_total": self.R1_total,
+            "target": self.target,
+            "balls": list(range(len(self.runs))),
+            "overs": [f"{k // 6}.{k % 6}" for k in range(len(self.runs))],
+            "par": list(self.par),
+            "runs": list(self.runs),
+            "wickets": list(self.wickets),
+            "ahead_by": [r - p for r, p in zip(self.runs, self.par, strict=True)],
+        }
+
+
+def _build(g: Any, base_dir: str, team1_key: tuple[Any, ...]) -> ParTimeline:
+    format_overs = cast(int, team1_key[0])
+    kind = "odi" if format_overs == 50 else "t20"
+    env = dlsmod.load_env(cast(Literal["odi", "t20"], kind), base_dir)
+
+    deliveries = list(getattr(g, "deliveries", []) or [])
+    chase_start = next(
+        (i for i, d in enumerate(deliveries) if _inning_of(_as_dict(d)) >= 2), len(deliveries)
+    )
+    reductions = _reductions(g)
+    team1_reductions = [r for r in reductions if r[0] < chase_start]
+    R1_total = dlsmod.total_resources_team1(
+        env=env,
+        max_overs_initial=format_overs,
+        deliveries=cast(list[Mapping[str, Any]], deliveries[:chase_start]),
+        interruptions=[
+            {"at_delivery_index": i, "new_overs_limit": lim} for i, lim in team1_reductions
+        ],
+    )
+    tl = ParTimeline(
+        grid=env.table.grid,
+        format_overs=format_overs,
+        S1=team1_runs(g),
+        R1_total=R1_total,
+        chase_start=chase_start,
+        team1_key=team1_key,
+        team1_reductions=team1_reductions,
+        chase_reductions=[r for r in reductions if r[0] >= chase_start],
+        processed=chase_start,
+        last_fingerprint=_fingerprint(deliveries[chase_start - 1]) if chase_start else None,
+    )
+    tl._schedule()
+    tl._refresh_from(0)
+    tl.extend(deliveries)
+    return tl
+
+
+def _team1_key(g: Any, format_overs: int) -> tuple[Any, ...]:
+    fis_any = getattr(g, "first_inning_summary", None)
+    fis_runs = fis_any.get("runs") if isinstance(fis_any, dict) else None
+    return (format_overs, fis_runs)
+
+
+def sync(game_id: str, g: Any, base_dir: str) -> ParTimeline | None:
+    """
+    Bring the cached timeline for ``game_id`` up to date with ``g``.
+
+    Returns None when the game is not in a DLS chase (first innings, or a format
+    without bundled tables).
+    """
+    format_overs = initial_overs_limit(g)
+    if format_overs not in SUPPORTED_OVERS or int(getattr(g, "current_inning", 1) or 1) < 2:
+        _timelines.pop(game_id, None)
+        return None
+    format_overs = cast(int, format_overs)
+
+    deliveries = list(getattr(g, "deliveries", []) or [])
+    key = _team1_key(g, format_overs)
+    reductions = _reductions(g)
+    tl = _timelines.get(game_id)
+
+    if (
+        tl is None
+        or tl.team1_key != key
+        or tl.team1_reductions != [r for r in reductions if r[0] < tl.chase_start]
+        or len(deliveries) < tl.processed
+        or (tl.processed > 0 and _fingerprint(deliveries[tl.processed - 1]) != tl.last_fingerprint)
+    ):
+        try:
+            tl = _build(g, base_dir, key)
+        except dlsmod.DLSMissingTable:
+            _timelines.pop(game_id, None)
+            return None
+    else:
+        tl.extend(deliveries)
+        tl.apply_chase_reductions([r for r in reductions if r[0] >= tl.chase_start])
+
+    _timelines[game_id] = tl
+    _timelines.move_to_end(game_id)
+    while len(_timelines) > _CACHE_MAX_GAMES:
+        _timelines.popitem(last=False)
+    return tl
+
+
+def invalidate(game_id: str) -> None:
+    """Drop the cached timeline (e.g. after a mid-ledger correction)."""
+    _timelines.pop(game_id, None)
+
+
+def clear_cache() -> None:
+    _timelines.clear()
@@ -0,0 +1,232 @@
+"""
+DLS what-if scenario tables for broadcasters.
+
+For a chase in progress, the table answers "if play stops at point P with W
+wickets down and L overs are lost, what is the revised target?" for every
+remaining interruption point (the current ball, then each over boundary), every
+overs-lost value and every wickets-down value, plus the par score if play never
+resumes from that point.
+
+The whole table is one broadcasted gather over the process-wide resource grid
+(see backend/services/dls/resources.py). Tables are cached per game and ledger
+version, so repeated reads are free until the ledger changes (corrections to
+earlier deliveries drop the entry through ``invalidate``); games whose table has
+been requested are pushed a fresh copy (``dls:scenarios``) on each change.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Literal, cast
+
+import numpy as np
+
+from backend import dls as dlsmod
+from backend.services.dls.resources import ResourceGrid
+from backend.services.live_bus import emit_dls_scenarios_update
+
+SUPPORTED_OVERS = (20, 50)
+
+_CACHE_MAX_GAMES = 256
+_cache: OrderedDict[str, tuple[str, dict[str, Any]]] = OrderedDict()
+
+
+class ScenarioUnavailable(ValueError):
+    """The game is not in a state where DLS scenarios apply."""
+
+
+@dataclass(frozen=True)
+class ChaseState:
+    S1: int
+    R1_total: float
+    max_overs: int
+    balls_bowled: int
+    wickets_lost: int
+
+
+def team1_runs(g: Any) -> int:
+    """Team 1 total: persisted first-innings summary, else summed from the ledger."""
+    fis_any: Any = getattr(g, "first_inning_summary", None)
+    if isinstance(fis_any, dict) and "runs" in fis_any:
+        try:
+            return int(cast(Any, fis_any["runs"]))
+        except Exception:
+            pass  # nosec
+    total = 0
+    for d_any in getattr(g, "deliveries", []) or []:
+        d = d_any.model_dump() if hasattr(d_any, "model_dump") else dict(d_any)
+        if int(d.get("inning", 1) or 1) != 1:
+            continue
+        total += int(d.get("runs_scored") or 0)
+    return total
+
+
+def ledger_version(g: Any) -> str:
+    """
+    Short digest of the ledger tip, interruptions and live counters.
+
+    Only the ledger length and its last entry are hashed, so this stays O(1) in
+    the number of deliveries. It does not cover edits to earlier deliveries
+    (which change R1_total and S1): corrections must call ``invalidate``.
+    """
+    deliveries = list(getattr(g, "deliveries", []) or [])
+    last = deliveries[-1] if deliveries else None
+    if last is not None and hasattr(last, "model_dump"):
+        last = last.model_dump()
+    parts = {
+        "n": len(deliveries),
+        "last": last,
+        "interruptions": list(getattr(g, "interruptions", []) or []),
+        "overs_limit": getattr(g, "overs_limit", None),
+        "inning": getattr(g, "current_inning", None),
+        "fis": getattr(g, "first_inning_summary", None),
+        "overs": getattr(g, "overs_completed", 0),
+        "balls": getattr(g, "balls_this_over", 0),
+        "wickets": getattr(g, "total_wickets", 0),
+    }
+    raw = json.dumps(parts, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha1(raw, usedforsecurity=False).hexdigest()[:16]
+
+
+def chase_state(g: Any, env: dlsmod.DLSEnv) -> ChaseState:
+    overs_limit = getattr(g, "overs_limit", None)
+    if overs_limit not in SUPPORTED_OVERS:
+        raise ScenarioUnavailable("DLS scenarios require a 20 or 50 over match")
+    if int(getattr(g, "current_inning", 1) or 1) < 2:
+        raise ScenarioUnavailable("DLS scenarios are only available during the chase")
+
+    deliveries_m = cast(list[Mapping[str, Any]], list(getattr(g, "deliveries", []) or []))
+    R1_total = dlsmod.total_resources_team1(
+        env=env,
+        max_overs_initial=int(overs_limit),
+        deliveries=deliveries_m,
+        interruptions=list(getattr(g, "interruptions", []) or []),
+    )
+    balls = int(getattr(g, "overs_completed", 0) or 0) * 6 + int(
+        getattr(g, "balls_this_over", 0) or 0
+    )
+    return ChaseState(
+        S1=team1_runs(g),
+        R1_total=R1_total,
+        max_overs=int(overs_limit),
+        balls_bowled=min(balls, int(overs_limit) * 6),
+        wickets_lost=min(int(getattr(g, "total_wickets", 0) or 0), 9),
+    )
+
+
+def compute_scenarios(grid: ResourceGrid, state: ChaseState) -> dict[str, Any]:
+    """
+    Build the scenario table for ``state`` in a single vectorised pass.
+
+    ``targets[p][l][w]`` is the revised target for an interruption at
+    ``interruption_points[p]`` with ``wickets[w]`` down and ``overs_lost[l]``
+    overs lost (None when that many overs do not remain). ``par[p][w]`` is the
+    par score if no further play is possible from that point.
+    """
+    total_balls = state.max_overs * 6
+    first_boundary = (state.balls_bowled // 6 + 1) * 6
+    points = np.array([state.balls_bowled, *range(first_boundary, total_balls, 6)], dtype=np.int64)
+    if state.balls_bowled >= total_balls:
+        points = points[:0]
+    wickets = np.arange(state.wickets_lost, 10, dtype=np.int64)
+    max_lost = (total_balls - state.balls_bowled) // 6
+    overs_lost = np.arange(1, max_lost + 1, dtype=np.int64)
+
+    balls_left = total_balls - points  # (P,)
+    r_start = float(grid.R_balls(total_balls, 0))
+    r_at_stop = grid.R_balls(balls_left[:, None], wickets[None, :])  # (P, W)
+    left_after = balls_left[:, None] - 6 * overs_lost[None, :]  # (P, L)
+    r_after = grid.R_balls(np.maximum(left_after, 0)[:, :, None], wickets[None, None, :])
+
+    r2_used = r_start - r_at_stop  # (P, W)
+    r2_total = r2_used[:, None, :] + r_after  # (P, L, W)
+    if state.R1_total > 0.0:
+        scale = state.S1 / state.R1_total
+        targets = np.floor(r2_total * scale).astype(np.int64) + 1
+        par = np.floor(r2_used * scale).astype(np.int64) + 1
+    else:
+        targets = np.full(r2_total.shape, state.S1 + 1, dtype=np.int64)
+        par = np.zeros(r2_used.shape, dtype=np.int64)
+
+    # Losing every remaining over (or more) is an abandonment, not a resumption.
+    feasible = (left_after > 0)[:, :, None]
+    targets_out = np.where(feasible, targets, -1).tolist()
+    targets_out = [[[t if t >= 0 else None for t in row] for row in block] for block in targets_out]
+
+    return {
+        "format_overs": state.max_overs,
+        "S1": state.S1,
+        "R1_total": state.R1_total,
+        "balls_bowled": state.balls_bowled,
+        "wickets_lost": state.wickets_lost,
+        "interruption_points": [
+            {"balls": int(p), "over": f"{int(p) // 6}.{int(p) % 6}"} for p in points
+        ],
+        "overs_lost": overs_lost.tolist(),
+        "wickets": wickets.tolist(),
+        "targets": targets_out,
+        "par": par.tolist(),
+    }
+
+
+def _env_for(g: Any, base_dir: str) -> dlsmod.DLSEnv:
+    kind = "odi" if getattr(g, "overs_limit", None) == 50 else "t20"
+    try:
+        return dlsmod.load_env(cast(Literal["odi", "t20"], kind), base_dir)
+    except dlsmod.DLSMissingTable as exc:
+        raise ScenarioUnavailable(f"No DLS resource table for {kind}") from exc
+
+
+def get_scenarios(game_id: str, g: Any, base_dir: str) -> tuple[dict[str, Any], bool]:
+    """
+    Cached scenario table for ``g``; returns ``(payload, changed)``.
+
+    ``changed`` is True when the table was (re)computed because the ledger moved
+    on since the cached version. Raises ScenarioUnavailable outside a chase.
+    """
+    version = ledger_version(g)
+    hit = _cache.get(game_id)
+    if hit is not None and hit[0] == version:
+        _cache.move_to_end(game_id)
+        return hit[1], False
+
+    env = _env_for(g, base_dir)
+    payload = compute_scenarios(env.table.grid, chase_state(g, env))
+    payload["game_id"] = game_id
+    payload["version"] = version
+    _cache[game_id] = (version, payload)
+    _cache.move_to_end(game_id)
+    while len(_cache) > _CACHE_MAX_GAMES:
+        _cache.popitem(last=False)
+    return payload, True
+
+
+async def publish_scenarios_if_tracked(game_id: str, g: Any, base_dir: str) -> None:
+    """
+    Push a fresh table to the game room if one was requested before and the
+    ledger changed. Best-effort: never raises into the scoring path.
+    """
+    if game_id not in _cache:
+        return
+    try:
+        payload, changed = get_scenarios(game_id, g, base_dir)
+    except ScenarioUnavailable:
+        _cache.pop(game_id, None)
+        return
+    except Exception:
+        return  # nosec
+    if changed:
+        await emit_dls_scenarios_update(game_id, payload)
+
+
+def invalidate(game_id: str) -> None:
+    """Drop the cached table (e.g. after a mid-ledger correction)."""
+    _cache.pop(game_id, None)
+
+
+def clear_cache() -> None:
+    _cache.clear()
@@ -0,0 +1,283 @@
+"""
+Frame Sampler - shared decode loop for video analysis services.
+
+Pose extraction and ball tracking both analyse a sparse subset of frames
+(typically 2-10 fps out of 30/60 fps footage). Reading every frame with
+``cap.read()`` pays the full decode + colour conversion cost for frames that
+are immediately thrown away. ``FrameSampler`` instead:
+
+- ``grab()``s frames that are skipped (demux/decode only, no conversion),
+- ``retrieve()``s only the frames that are actually sampled, and
+- optionally seeks (``CAP_PROP_POS_FRAMES``) across very large gaps so that
+  sparse sampling does not have to grab through every intermediate frame.
+
+Sources may be local paths or HTTP(S) URLs (``is_video_url``); OpenCV's FFmpeg
+backend reads URLs with ranged requests, so a seek fetches from the target
+offset instead of downloading everything before it.
+
+Sampling is aligned to absolute frame numbers (``frame_num % frame_interval == 0``)
+so that a range starting mid-video samples exactly the frames a full run would.
+
+``DecodePipeline`` moves a sampler (plus per-frame pre-processing) onto a
+background thread feeding a bounded queue, so decode overlaps with inference.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import queue
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Gaps (in frames) at or above which a container seek is used instead of grabbing
+# forward. A seek lands on the previous keyframe and decodes forward from there, so
+# it only pays off when the gap is longer than a typical GOP.
+KEYFRAME_SEEK_MIN_GAP = 250
+
+
+def is_video_url(video_path: Any) -> bool:
+    """True for sources the decoder streams over HTTP(S), e.g. presigned S3 URLs."""
+    return str(video_path).startswith(("http://", "https://"))
+
+
+def video_source_label(video_path: Any) -> str:
+    """Loggable form of a video source: URLs lose their query string (signatures)."""
+    source = str(video_path)
+    return source.split("?", 1)[0] if is_video_url(source) else source
+
+
+def seek_to_frame(cv2: Any, cap: Any, frame_index: int) -> int:
+    """Position ``cap`` so the next read returns ``frame_index``; returns that index.
+
+    Uses a single container seek, then grabs (decodes without converting) forward if
+    the backend landed short of the target. Backends that cannot seek at all are
+    rewound and grabbed forward from frame 0.
+    """
+    cap.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+    try:
+        pos = int(cap.get(cv2.CAP_PROP_POS_FRAMES))
+    except (TypeError, ValueError):
+        pos = -1
+    if pos < 0 or pos > frame_index:
+        cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        pos = 0
+    while pos < frame_index and cap.grab():
+        pos += 1
+    return pos
+
+
+@dataclass
+class SamplerStats:
+    """Decode work done by a ``FrameSampler``."""
+
+    grabbed: int = 0  # frames decoded without conversion (skipped)
+    retrieved: int = 0  # frames decoded and converted (sampled)
+    seeks: int = 0  # container seeks across large gaps
+
+
+class FrameSampler:
+    """Iterate ``(frame_num, frame)`` for every ``frame_interval``-th frame of ``cap``.
+
+    Args:
+        cv2: The OpenCV module (passed in so callers keep their lazy imports).
+        cap: An opened ``cv2.VideoCapture``; the caller owns and releases it.
+        frame_interval: Sample frames whose absolute index is a multiple of this.
+        start_frame: First frame of the range (seeked to once if non-zero).
+        end_frame: Exclusive end of the range; ``None`` reads until end of stream.
+        seek_gap: Minimum gap in frames to seek instead of grab; ``None`` disables.
+        extra_schedules: Further ``(frame_interval, end_frame)`` pairs sampled in the
+            same pass; a frame is yielded once if any schedule wants it.
+        frames: Explicit absolute frame numbers also sampled in the same pass (e.g. a
+            motion-adaptive plan); an ``end_frame`` at or before ``start_frame`` leaves
+            only these.
+
+    After iteration ``position`` is the index of the next undecoded frame (the end
+    of the range, or the frame count at end of stream).
+    """
+
+    def __init__(
+        self,
+        cv2: Any,
+        cap: Any,
+        *,
+        frame_interval: int,
+        start_frame: int = 0,
+        end_frame: int | None = None,
+        seek_gap: int | None = KEYFRAME_SEEK_MIN_GAP,
+        extra_schedules: Sequence[tuple[int, int | None]] = (),
+        frames: Sequence[int] = (),
+    ) -> None:
+        self._cv2 = cv2
+        self._cap = cap
+        self.frame_interval = max(1, int(frame_interval))
+        self.start_frame = max(0, int(start_frame))
+        self.end_frame = end_frame
+        self.seek_gap = seek_gap
+        self.schedules = [(self.frame_interval, end_frame)] + [
+            (max(1, int(interval)), end) for interval, end in extra_schedules
+        ]
+        self.frames = sorted({int(f) for f in frames if f >= self.start_frame})
+        self.position = 0
+        self.stats = SamplerStats()
+
+    def _next_target(self) -> int | None:
+        """Earliest frame at or after ``position`` wanted by any schedule."""
+        targets = []
+        for interval, end in self.schedules:
+            target = -(-self.position // interval) * interval
+            if end is None or target < end:
+                targets.append(target)
+        index = bisect_left(self.frames, self.position)
+        if index < len(self.frames):
+            targets.append(self.frames[index])
+        return min(targets) if targets else None
+
+    def __iter__(self) -> Iterator[tuple[int, Any]]:
+        cap = self._cap
+        if self.start_frame:
+            self.position = seek_to_frame(self._cv2, cap, self.start_frame)
+            self.stats.seeks += 1
+            if self.position < self.start_frame:
+                return  # Stream ended before the range started
+
+        while True:
+            target = self._next_target()
+            if target is None:
+                # Nothing left to sample; the remaining frames need no decoding.
+                ends = [end for _, end in self.schedules if end is not None]
+                self.position = max(self.position, *ends)
+                return
+
+            gap = target - self.position
+            if self.seek_gap is not None and gap >= self.seek_gap:
+                self.position = seek_to_frame(self._cv2, cap, target)
+                self.stats.seeks += 1
+                if self.position < target:
+                    return
+            else:
+                while self.position < target:
+                    if not cap.grab():
+                        return
+                    self.stats.grabbed += 1
+                    self.position += 1
+
+            if not cap.grab():
+                return
+            ok, frame = cap.retrieve()
+            self.position += 1
+            if not ok:
+                logger.warning(f"Failed to retrieve grabbed frame {target}")
+                continue
+            self.stats.retrieved += 1
+            yield target, frame
+
+
+# Sampled frames buffered between the decode thread and the consumer. Small enough
+# to bound memory (a few full-size frames), large enough to absorb inference jitter.
+DECODE_QUEUE_SIZE = 8
+
+_END = object()
+
+
+@dataclass
+class StageTimings:
+    """Wall-clock seconds spent in each stage of a ``DecodePipeline``."""
+
+    decode_s: float = 0.0  # grabbing/retrieving frames (producer thread)
+    preprocess_s: float = 0.0  # ``prepare`` callback (producer thread)
+    queue_wait_s: float = 0.0  # consumer blocked waiting for the next frame
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "decode_s": round(self.decode_s, 4),
+            "preprocess_s": round(self.preprocess_s, 4),
+            "queue_wait_s": round(self.queue_wait_s, 4),
+        }
+
+
+class DecodePipeline:
+    """Run a ``FrameSampler`` plus per-frame pre-processing on a background thread.
+
+    The producer decodes sampled frames, applies ``prepare`` (resize, colour
+    conversion, ...) and hands ``(frame_num, prepared)`` to the consumer through a
+    bounded queue, so decoding overlaps with whatever the consumer does per frame
+    (OpenCV and MediaPipe release the GIL for their heavy lifting).
+
+    Use as a context manager; leaving the block (including via ``break`` or an
+    exception) stops the producer and joins it, so the capture can be released
+    safely afterwards. Exceptions raised in the producer are re-raised in the
+    consumer.
+    """
+
+    def __init__(
+        self,
+        sampler: FrameSampler,
+        prepare: Callable[[Any], Any],
+        *,
+        maxsize: int = DECODE_QUEUE_SIZE,
+    ) -> None:
+        self.sampler = sampler
+        self._prepare = prepare
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max(1, maxsize))
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._produce, name="decode-stage", daemon=True)
+        self.timings = StageTimings()
+
+    def __enter__(self) -> DecodePipeline:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._stop.set()
+        # Unblock a producer waiting on a full queue, then wait for it to finish.
+        while self._thread.is_alive():
+            with contextlib.suppress(queue.Empty):
+                self._queue.get_nowait()
+            self._thread.join(timeout=0.05)
+
+    def _put(self, item: Any) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(self) -> None:
+        timings = self.timings
+        try:
+            frames = iter(self.sampler)
+            while not self._stop.is_set():
+                started = time.perf_counter()
+                item = next(frames, None)
+                decoded = time.perf_counter()
+                timings.decode_s += decoded - started
+                if item is None:
+                    break
+                frame_num, frame = item
+                prepared = self._prepare(frame)
+                timings.preprocess_s += time.perf_counter() - decoded
+                if not self._put((frame_num, prepared)):
+                    return
+        except BaseException as e:  # re-raised in the consumer
+            self._put(e)
+        self._put(_END)
+
+    def __iter__(self) -> Iterator[tuple[int, Any]]:
+        while True:
+            started = time.perf_counter()
+            item = self._queue.get()
+            self.timings.queue_wait_s += time.perf_counter() - started
+            if item is _END:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
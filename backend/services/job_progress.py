@@ -0,0 +1,132 @@
+"""
+Job Progress - push analysis job stage/progress changes to clients.
+
+Workers publish a small snapshot of the job (status, stage, progress, chunk
+counts) on ``JOB_PROGRESS_TOPIC`` of the wake-up channel after every stage
+transition (QUICK, DEEP, chunk completions, AGGREGATING, DONE/FAILED) and when
+the heartbeat forwards progress. The API relays these snapshots to the
+server-sent event stream of the job (``GET /analysis-jobs/{job_id}/events``)
+through the process-wide ``JobProgressHub``, so clients no longer need to poll
+the job endpoint to follow an analysis.
+
+Snapshots are idempotent, so a dropped or repeated event only delays or repeats
+an update; clients re-read the job once it reaches a terminal status. Events
+need a broadcasting channel (``postgres`` or ``inprocess``);
+``COACH_PLUS_JOB_PROGRESS_PUSH=false`` turns publishing off.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.config import settings
+from backend.services.job_wakeup import (
+    JOB_PROGRESS_TOPIC,
+    WakeupChannel,
+    get_wakeup_channel,
+    publish_wakeup,
+)
+
+logger = logging.getLogger(__name__)
+
+# Statuses after which a job's event stream ends
+TERMINAL_JOB_STATUSES = frozenset({"done", "completed", "failed"})
+
+# Events buffered per subscriber; older snapshots are dropped first
+SUBSCRIBER_QUEUE_SIZE = 32
+
+
+def job_progress_event(job: Any) -> dict[str, Any]:
+    """Snapshot of ``job``'s progress; take it before ``commit()`` expires the attributes."""
+    status = getattr(job.status, "value", job.status)
+    return {
+        "job_id": job.id,
+        "status": status,
+        "stage": job.stage,
+        "progress_pct": int(job.progress_pct or 0),
+        "completed_chunks": job.completed_chunks,
+        "total_chunks": job.total_chunks,
+    }
+
+
+async def publish_job_progress(event: dict[str, Any], *, db: AsyncSession | None = None) -> None:
+    """Publish a progress snapshot (best-effort, never raises)."""
+    if not settings.COACH_PLUS_JOB_PROGRESS_PUSH or not get_wakeup_channel().broadcasts:
+        return
+    await publish_wakeup(JOB_PROGRESS_TOPIC, json.dumps(event, separators=(",", ":")), db=db)
+
+
+def _offer(queue: asyncio.Queue[dict[str, Any]], event: dict[str, Any]) -> None:
+    if queue.full():
+        with contextlib.suppress(asyncio.QueueEmpty):
+            queue.get_nowait()
+    queue.put_nowait(event)
+
+
+class JobProgressHub:
+    """Fans progress events out to the event streams open in this process."""
+
+    def __init__(self) -> None:
+        self._subscribers: dict[
+            str, dict[asyncio.Queue[dict[str, Any]], asyncio.AbstractEventLoop]
+        ] = {}
+        self._channel: WakeupChannel | None = None
+        self._start_lock = asyncio.Lock()
+
+    async def ensure_started(self) -> None:
+        """Listen on the progress topic; done once per channel, on the first subscription."""
+        if self._channel is get_wakeup_channel():
+            return
+        async with self._start_lock:
+            channel = get_wakeup_channel()
+            if self._channel is channel:
+                return
+            channel.add_listener(JOB_PROGRESS_TOPIC, self.dispatch)
+            await channel.start([JOB_PROGRESS_TOPIC])
+            self._channel = channel
+
+    def subscribe(self, job_id: str) -> asyncio.Queue[dict[str, Any]]:
+        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.setdefault(job_id, {})[queue] = asyncio.get_running_loop()
+        return queue
+
+    def unsubscribe(self, job_id: str, queue: asyncio.Queue[dict[str, Any]]) -> None:
+        queues = self._subscribers.get(job_id, {})
+        queues.pop(queue, None)
+        if not queues:
+            self._subscribers.pop(job_id, None)
+
+    def dispatch(self, payload: str) -> None:
+        """Channel listener: route one published snapshot to its job's subscribers."""
+        try:
+            event = json.loads(payload)
+            job_id = event["job_id"]
+        except (TypeError, ValueError, KeyError):
+            logger.warning(f"Ignoring malformed job progress payload: {payload[:200]!r}")
+            return
+        try:
+            current = asyncio.get_running_loop()
+        except RuntimeError:
+            current = None
+        for queue, loop in list(self._subscribers.get(job_id, {}).items()):
+            if loop is current:
+                _offer(queue, event)
+            elif not loop.is_closed():
+                loop.call_soon_threadsafe(_offer, queue, event)
+
+
+_hub: JobProgressHub | None = None
+
+
+def get_job_progress_hub() -> JobProgressHub:
+    """The process-wide progress hub."""
+    global _hub
+    if _hub is None:
+        _hub = JobProgressHub()
+    return _hub
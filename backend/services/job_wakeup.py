@@ -0,0 +1,295 @@
+"""
+Job Wake-up - tell idle analysis workers that new work has been queued.
+
+Workers claim jobs and chunks from the database (``SELECT ... FOR UPDATE SKIP
+LOCKED``). Rather than polling that query every second while idle, they wait on
+a wake-up channel and claim as soon as the API (or another worker) publishes on
+it. Polling with an exponential back-off (``IdleBackoff``) remains as a safety
+net for missed wake-ups, so a channel never has to be reliable, only fast.
+
+Channels (``COACH_PLUS_WAKEUP_CHANNEL``):
+
+- ``postgres``: ``LISTEN``/``NOTIFY`` on the application database,
+- ``sqs``: long-polls ``COACH_PLUS_WAKEUP_SQS_QUEUE_URL`` (each message wakes
+  one worker; the others still find the work through polling),
+- ``inprocess``: asyncio events within one process (tests, local dev),
+- ``auto`` (default): ``postgres`` when the database is Postgres, otherwise
+  ``inprocess``.
+
+Publishing is best-effort: a failed wake-up is logged and never fails a request.
+
+Besides waking workers, a topic can carry payloads to listeners registered with
+``add_listener`` (the API relays job progress this way). Only channels that
+broadcast (``inprocess`` and ``postgres``) deliver payloads to every listening
+process; SQS hands each message to a single receiver.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Topics workers wait on
+JOBS_TOPIC = "analysis_jobs"  # queued jobs and chunk sets ready to aggregate
+CHUNKS_TOPIC = "analysis_chunks"  # queued GPU chunks
+JOB_PROGRESS_TOPIC = "analysis_job_progress"  # stage/progress changes relayed to clients
+
+# Postgres NOTIFY channel names are global to the database, so namespace them
+_PG_CHANNEL_PREFIX = "cricksy_"
+
+# SQS long-poll window (the service maximum)
+_SQS_WAIT_SECONDS = 20
+
+
+class WakeupChannel:
+    """In-process wake-ups; subclasses also feed them from an external source.
+
+    Every event loop that waits on a topic gets its own ``asyncio.Event``, and
+    publishing sets each of them thread-safely, so the API and a worker running
+    on different loops of the same process still reach each other.
+    """
+
+    # Whether every process listening on a topic receives each payload
+    broadcasts = True
+
+    def __init__(self) -> None:
+        self._events: dict[str, dict[asyncio.AbstractEventLoop, asyncio.Event]] = {}
+        self._listeners: dict[str, list[Callable[[str], None]]] = {}
+
+    def _event(self, topic: str) -> asyncio.Event:
+        loop = asyncio.get_running_loop()
+        events = self._events.setdefault(topic, {})
+        for other in [other for other in events if other.is_closed()]:
+            del events[other]
+        return events.setdefault(loop, asyncio.Event())
+
+    def _notify(self, topic: str) -> None:
+        try:
+            current = asyncio.get_running_loop()
+        except RuntimeError:
+            current = None
+        for loop, event in list(self._events.get(topic, {}).items()):
+            if loop is current:
+                event.set()
+            elif not loop.is_closed():
+                loop.call_soon_threadsafe(event.set)
+
+    def _deliver(self, topic: str, payload: str) -> None:
+        for callback in list(self._listeners.get(topic, ())):
+            try:
+                callback(payload)
+            except Exception as e:
+                logger.warning(f"Wake-up listener failed: topic={topic} error={e}")
+
+    def add_listener(self, topic: str, callback: Callable[[str], None]) -> None:
+        """Call ``callback(payload)`` for every message on ``topic`` (once started)."""
+        self._listeners.setdefault(topic, []).append(callback)
+
+    async def start(self, topics: Iterable[str]) -> None:
+        """Begin receiving wake-ups for ``topics`` (a no-op in-process)."""
+        for topic in topics:
+            self._event(topic)
+
+    async def close(self) -> None:
+        """Stop receiving external wake-ups."""
+
+    async def publish(
+        self, topic: str, payload: str = "", *, db: AsyncSession | None = None
+    ) -> None:
+        self._notify(topic)
+        self._deliver(topic, payload)
+
+    async def wait(self, topic: str, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for a wake-up on ``topic``; True if woken."""
+        event = self._event(topic)
+        if not event.is_set():
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(event.wait(), timeout)
+        woken = event.is_set()
+        event.clear()
+        return woken
+
+
+class PostgresWakeupChannel(WakeupChannel):
+    """``LISTEN``/``NOTIFY`` on the application database (asyncpg driver)."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._conn: AsyncConnection | None = None
+        self._pg_listeners: list[tuple[str, Any]] = []
+
+    async def start(self, topics: Iterable[str]) -> None:
+        from backend.sql_app.database import get_engine
+
+        topics = list(topics)
+        await super().start(topics)
+        # A dedicated connection held for the worker's lifetime; NOTIFYs arrive on it
+        self._conn = await get_engine().connect()
+        raw = (await self._conn.get_raw_connection()).driver_connection
+        for topic in topics:
+
+            def _on_notify(_conn: Any, _pid: int, _channel: str, payload: str, topic=topic):
+                self._notify(topic)
+                self._deliver(topic, payload)
+
+            await raw.add_listener(_PG_CHANNEL_PREFIX + topic, _on_notify)
+            self._pg_listeners.append((_PG_CHANNEL_PREFIX + topic, _on_notify))
+
+    async def close(self) -> None:
+        if self._conn is None:
+            return
+        with contextlib.suppress(Exception):
+            raw = (await self._conn.get_raw_connection()).driver_connection
+            for channel, callback in self._pg_listeners:
+                await raw.remove_listener(channel, callback)
+        self._pg_listeners.clear()
+        with contextlib.suppress(Exception):
+            await self._conn.close()
+        self._conn = None
+
+    async def publish(
+        self, topic: str, payload: str = "", *, db: AsyncSession | None = None
+    ) -> None:
+        self._notify(topic)
+        if db is None:
+            from backend.sql_app.database import get_session_local
+
+            async with get_session_local()() as own_db:
+                await self._send(own_db, topic, payload)
+        else:
+            await self._send(db, topic, payload)
+
+    @staticmethod
+    async def _send(db: AsyncSession, topic: str, payload: str) -> None:
+        # NOTIFY is transactional: it is delivered when this commit lands
+        await db.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": _PG_CHANNEL_PREFIX + topic, "payload": payload},
+        )
+        await db.commit()
+
+
+class SQSWakeupChannel(WakeupChannel):
+    """Long-polls an SQS queue whose messages carry ``{"topic": ..., "payload": ...}``."""
+
+    broadcasts = False
+
+    def __init__(self, queue_url: str) -> None:
+        super().__init__()
+        self.queue_url = queue_url
+        self._topics: set[str] = set()
+        self._receiver: asyncio.Task[None] | None = None
+
+    async def start(self, topics: Iterable[str]) -> None:
+        topics = list(topics)
+        await super().start(topics)
+        self._topics.update(topics)
+        if self._receiver is None:
+            self._receiver = asyncio.create_task(self._receive_forever())
+
+    async def close(self) -> None:
+        if self._receiver is not None:
+            self._receiver.cancel()
+            await asyncio.gather(self._receiver, return_exceptions=True)
+            self._receiver = None
+
+    async def _receive_forever(self) -> None:
+        from backend.services.sqs_service import sqs_service
+
+        while True:
+            try:
+                messages = await asyncio.to_thread(
+                    sqs_service.receive_messages,
+                    self.queue_url,
+                    max_messages=10,
+                    wait_time_seconds=_SQS_WAIT_SECONDS,
+                )
+            except Exception as e:
+                logger.warning(f"SQS wake-up receive failed: {e}")
+                await asyncio.sleep(_SQS_WAIT_SECONDS)
+                continue
+            for message in messages:
+                body = message.get("body")
+                topic = body.get("topic") if isinstance(body, dict) else None
+                if topic not in self._topics:
+                    continue  # Left for a worker that waits on that topic
+                self._notify(topic)
+                self._deliver(topic, str(body.get("payload") or ""))
+                with contextlib.suppress(Exception):
+                    await asyncio.to_thread(
+                        sqs_service.delete_message, self.queue_url, message["receipt_handle"]
+                    )
+
+    async def publish(
+        self, topic: str, payload: str = "", *, db: AsyncSession | None = None
+    ) -> None:
+        from backend.services.sqs_service import sqs_service
+
+        self._notify(topic)
+        await asyncio.to_thread(
+            sqs_service.send_message, self.queue_url, {"topic": topic, "payload": payload}
+        )
+
+
+class IdleBackoff:
+    """Safety-net poll interval: doubles while idle, resets once work turns up."""
+
+    def __init__(self, initial: float, maximum: float) -> None:
+        self.initial = max(0.01, float(initial))
+        self.maximum = max(self.initial, float(maximum))
+        self.current = self.initial
+
+    def reset(self) -> None:
+        self.current = self.initial
+
+    def next_delay(self) -> float:
+        delay = self.current
+        self.current = min(self.maximum, self.current * 2)
+        return delay
+
+
+_channel: WakeupChannel | None = None
+
+
+def _database_is_postgres() -> bool:
+    url = str(getattr(settings, "DATABASE_URL", "") or "")
+    return not getattr(settings, "IN_MEMORY_DB", False) and url.startswith("postgresql")
+
+
+def get_wakeup_channel() -> WakeupChannel:
+    """The process-wide wake-up channel configured by ``COACH_PLUS_WAKEUP_CHANNEL``."""
+    global _channel
+    if _channel is None:
+        kind = (settings.COACH_PLUS_WAKEUP_CHANNEL or "auto").strip().lower()
+        if kind == "auto":
+            kind = "postgres" if _database_is_postgres() else "inprocess"
+        if kind == "postgres":
+            _channel = PostgresWakeupChannel()
+        elif kind == "sqs" and settings.COACH_PLUS_WAKEUP_SQS_QUEUE_URL:
+            _channel = SQSWakeupChannel(settings.COACH_PLUS_WAKEUP_SQS_QUEUE_URL)
+        else:
+            if kind != "inprocess":
+                logger.warning(f"Unknown or unconfigured wake-up channel {kind!r}; using inprocess")
+            _channel = WakeupChannel()
+    return _channel
+
+
+async def publish_wakeup(topic: str, payload: str = "", *, db: AsyncSession | None = None) -> None:
+    """Wake workers waiting on ``topic``; call after the queued rows are committed.
+
+    ``db`` lets Postgres send the NOTIFY on the caller's connection.
+    """
+    try:
+        await get_wakeup_channel().publish(topic, payload, db=db)
+    except Exception as e:
+        logger.warning(f"Wake-up publish failed: topic={topic} error={e}")
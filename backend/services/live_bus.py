@@ -72,6 +72,15 @@ async def emit_phase_prediction_update(game_id: str, prediction_data: dict[str,
     )
 
 
+async def emit_dls_scenarios_update(game_id: str, scenarios: dict[str, Any]) -> None:
+    """Emit a refreshed DLS what-if scenario table to clients."""
+    await emit(
+        "dls:scenarios",
+        {"game_id": game_id, "scenarios": scenarios},
+        room=game_id,
+    )
+
+
 # Sync-friendly wrapper used by some sync routes (e.g., games_dls)
 def publish_game_update(game_id: str, payload: dict[str, Any]) -> None:
     """
@@ -2,6 +2,11 @@
 
 Builds a governed dataset artifact from validated historical import records.
 No model training occurs here.
+
+``build_model_training_dataset`` returns the whole artifact in memory.
+``stream_model_training_dataset`` produces the same rows and fingerprint but
+scans games in fixed-size batches (deliveries excluded) and hands rows to a
+writer batch by batch, so large archive exports run in flat memory.
 """
 
 from __future__ import annotations
@@ -10,18 +15,21 @@ import datetime as dt
 import hashlib
 import json
 from collections import Counter, defaultdict
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from typing import Any
 
 from backend.services.analyst_access import scoped_games_stmt
 from backend.sql_app.models import Game, GameStatus, HistoricalImportBatch
-from sqlalchemy import select
+from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 _INCOMPLETE_IMPORT_STATUSES: frozenset[str] = frozenset(
     {"scanned", "metadata_extracted", "pending_full_import"}
 )
 _DATASET_SCHEMA_VERSION = "training_dataset_v1"
+_DEFAULT_STREAM_BATCH_SIZE = 500
 
 
 @dataclass(frozen=True)
@@ -42,9 +50,27 @@ class DatasetBuildRequest:
     generated_at: dt.datetime | None = None
 
 
+@dataclass(frozen=True)
+class _MatchRecord:
+    """Game fields needed for eligibility and rows (never the deliveries ledger)."""
+
+    id: str
+    match_type: str | None
+    result: str | None
+    team_a: str | None
+    team_b: str | None
+
+
+@dataclass(frozen=True)
+class _HistoricalMatch:
+    game: _MatchRecord
+    hist_meta: dict[str, Any]
+    innings_summary: list[dict[str, Any]]
+
+
 @dataclass(frozen=True)
 class _EligibleMatch:
-    game: Game
+    game: _MatchRecord
     batch: HistoricalImportBatch
     hist_meta: dict[str, Any]
     innings_summary: list[dict[str, Any]]
@@ -111,9 +137,9 @@ def _normalize_innings_summary(game: Game) -> list[dict[str, Any]]:
     return sorted(normalized, key=lambda item: int(item["inning_no"]))
 
 
-def _extras_by_inning(game: Game) -> dict[int, int]:
+def _extras_by_inning(deliveries_blob: Any) -> dict[int, int]:
     extras_totals: dict[int, int] = defaultdict(int)
-    deliveries = game.deliveries if isinstance(game.deliveries, list) else []
+    deliveries = deliveries_blob if isinstance(deliveries_blob, list) else []
 
     for delivery in deliveries:
         if not isinstance(delivery, dict):
@@ -137,7 +163,7 @@ def _hash_group_key(batch: HistoricalImportBatch) -> str:
 
 
 def _is_match_eligible(
-    game: Game,
+    game: _MatchRecord,
     batch: HistoricalImportBatch,
     hist_meta: dict[str, Any],
     innings_summary: list[dict[str, Any]],
@@ -165,7 +191,7 @@ def _is_match_eligible(
 
 
 def _apply_filters(
-    game: Game,
+    game: _MatchRecord,
     batch: HistoricalImportBatch,
     hist_meta: dict[str, Any],
     filters: DatasetBuildFilters,
@@ -189,52 +215,73 @@ def _team_name(team_blob: Any) -> str | None:
     return None
 
 
-def _build_rows(candidates: list[_EligibleMatch]) -> list[dict[str, Any]]:
+def _scan_game(game: Game) -> _HistoricalMatch | None:
+    hist_meta = _historical_meta(game)
+    if hist_meta is None:
+        return None
+    record = _MatchRecord(
+        id=game.id,
+        match_type=game.match_type,
+        result=game.result,
+        team_a=_team_name(game.team_a),
+        team_b=_team_name(game.team_b),
+    )
+    return _HistoricalMatch(
+        game=record, hist_meta=hist_meta, innings_summary=_normalize_innings_summary(game)
+    )
+
+
+def _candidate_rows(candidate: _EligibleMatch, extras: dict[int, int]) -> list[dict[str, Any]]:
+    game = candidate.game
+    batch = candidate.batch
+    hist_meta = candidate.hist_meta
     rows: list[dict[str, Any]] = []
 
+    for inn in candidate.innings_summary:
+        batting_team = str(inn["team"])
+        bowling_team: str | None = None
+        if game.team_a and game.team_b:
+            if batting_team == game.team_a:
+                bowling_team = game.team_b
+            elif batting_team == game.team_b:
+                bowling_team = game.team_a
+
+        legal_balls = int(inn["legal_balls"])
+        runs = int(inn["runs"])
+        run_rate = round((runs * 6 / legal_balls), 4) if legal_balls > 0 else 0.0
+        inning_no = int(inn["inning_no"])
+
+        rows.append(
+            {
+                "match_id": game.id,
+                "innings_number": inning_no,
+                "batting_team_name": batting_team,
+                "bowling_team_name": bowling_team,
+                "match_type": game.match_type,
+                "venue": hist_meta.get("venue"),
+                "season": hist_meta.get("season"),
+                "competition": hist_meta.get("event_name"),
+                "source_format": batch.source_format,
+                "source_hash_sha256": batch.source_hash_sha256,
+                "runs": runs,
+                "wickets": int(inn["wickets"]),
+                "extras": int(extras.get(inning_no, 0)),
+                "legal_balls": legal_balls,
+                "overs": float(inn["overs"]),
+                "run_rate": run_rate,
+                "result": game.result,
+            }
+        )
+
+    return sorted(rows, key=lambda row: int(row["innings_number"]))
+
+
+def _build_rows(
+    candidates: list[_EligibleMatch], extras_by_game: dict[str, dict[int, int]]
+) -> list[dict[str, Any]]:
+    rows: list[dict[str, Any]] = []
     for candidate in sorted(candidates, key=lambda item: item.game.id):
-        game = candidate.game
-        batch = candidate.batch
-        hist_meta = candidate.hist_meta
-        team_a = _team_name(game.team_a)
-        team_b = _team_name(game.team_b)
-        extras = _extras_by_inning(game)
-
-        for inn in candidate.innings_summary:
-            batting_team = str(inn["team"])
-            bowling_team: str | None = None
-            if team_a and team_b:
-                if batting_team == team_a:
-                    bowling_team = team_b
-                elif batting_team == team_b:
-                    bowling_team = team_a
-
-            legal_balls = int(inn["legal_balls"])
-            runs = int(inn["runs"])
-            run_rate = round((runs * 6 / legal_balls), 4) if legal_balls > 0 else 0.0
-            inning_no = int(inn["inning_no"])
-
-            rows.append(
-                {
-                    "match_id": game.id,
-                    "innings_number": inning_no,
-                    "batting_team_name": batting_team,
-                    "bowling_team_name": bowling_team,
-                    "match_type": game.match_type,
-                    "venue": hist_meta.get("venue"),
-                    "season": hist_meta.get("season"),
-                    "competition": hist_meta.get("event_name"),
-                    "source_format": batch.source_format,
-                    "source_hash_sha256": batch.source_hash_sha256,
-                    "runs": runs,
-                    "wickets": int(inn["wickets"]),
-                    "extras": int(extras.get(inning_no, 0)),
-                    "legal_balls": legal_balls,
-                    "overs": float(inn["overs"]),
-                    "run_rate": run_rate,
-                    "result": game.result,
-                }
-            )
+        rows.extend(_candidate_rows(candidate, extras_by_game.get(candidate.game.id, {})))
 
     return sorted(rows, key=lambda row: (str(row["match_id"]), int(row["innings_number"])))
 
@@ -243,44 +290,61 @@ def _group_exclusions(excluded: list[dict[str, Any]]) -> dict[str, int]:
     return dict(sorted(Counter(str(item["reason"]) for item in excluded).items()))
 
 
+def _canonical_json(payload: Any) -> str:
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
 def _deterministic_fingerprint(payload: dict[str, Any]) -> str:
-    digest = hashlib.sha256(
-        json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode(
-            "utf-8"
-        )
-    ).hexdigest()
+    digest = hashlib.sha256(_canonical_json(payload).encode("utf-8")).hexdigest()
     return digest
 
 
-async def build_model_training_dataset(
-    db: AsyncSession,
-    request: DatasetBuildRequest,
-    current_user: Any | None = None,
-) -> dict[str, Any]:
-    """Build a deterministic, governed model-training dataset artifact.
+def serialize_dataset_row(row: dict[str, Any]) -> str:
+    """Canonical single-line JSON for one dataset row (the JSONL export format)."""
+    return _canonical_json(row)
 
-    Reads only validated historical import records and never mutates official match truth.
+
+class _StreamingFingerprint:
+    """Incremental equivalent of ``_deterministic_fingerprint`` over the full payload.
+
+    ``rows`` sorts last among the payload keys, so the canonical JSON is the
+    header without its closing brace, then the rows array, then ``}``.
     """
-    if current_user is None:
-        stmt = select(Game).where(Game.status == GameStatus.completed)
-    else:
-        stmt = scoped_games_stmt(current_user).where(Game.status == GameStatus.completed)
 
-    games_result = await db.execute(stmt)
-    games = list(games_result.scalars().all())
+    def __init__(self, header: dict[str, Any]) -> None:
+        if not header or any(key > "rows" for key in header):
+            raise ValueError("fingerprint header must be non-empty and sort before 'rows'")
+        self._digest = hashlib.sha256()
+        self._digest.update(_canonical_json(header)[:-1].encode("utf-8"))
+        self._digest.update(b',"rows":[')
+        self._first = True
 
-    historical_games: list[tuple[Game, dict[str, Any]]] = []
-    excluded: list[dict[str, Any]] = []
-    for game in games:
-        hist_meta = _historical_meta(game)
-        if hist_meta is None:
-            continue
-        historical_games.append((game, hist_meta))
+    def update(self, row_json: str) -> None:
+        if not self._first:
+            self._digest.update(b",")
+        self._digest.update(row_json.encode("utf-8"))
+        self._first = False
+
+    def hexdigest(self) -> str:
+        digest = self._digest.copy()
+        digest.update(b"]}")
+        return digest.hexdigest()
 
+
+def _games_stmt(current_user: Any | None) -> Select[tuple[Game]]:
+    if current_user is None:
+        return select(Game).where(Game.status == GameStatus.completed)
+    return scoped_games_stmt(current_user).where(Game.status == GameStatus.completed)
+
+
+async def _load_batches(
+    db: AsyncSession, historical: list[_HistoricalMatch]
+) -> dict[str, HistoricalImportBatch]:
     batch_ids = {
-        str(meta.get("batch_id"))
-        for _, meta in historical_games
-        if isinstance(meta.get("batch_id"), str) and str(meta.get("batch_id")).strip()
+        str(item.hist_meta.get("batch_id"))
+        for item in historical
+        if isinstance(item.hist_meta.get("batch_id"), str)
+        and str(item.hist_meta.get("batch_id")).strip()
     }
 
     batch_lookup: dict[str, HistoricalImportBatch] = {}
@@ -290,10 +354,20 @@ async def build_model_training_dataset(
         )
         for batch in batch_result.scalars().all():
             batch_lookup[batch.id] = batch
+    return batch_lookup
+
 
+def _select_candidates(
+    historical: list[_HistoricalMatch],
+    batch_lookup: dict[str, HistoricalImportBatch],
+    filters: DatasetBuildFilters,
+) -> tuple[list[_EligibleMatch], list[dict[str, Any]]]:
+    excluded: list[dict[str, Any]] = []
     pre_dedupe_candidates: list[_EligibleMatch] = []
 
-    for game, hist_meta in sorted(historical_games, key=lambda item: item[0].id):
+    for item in sorted(historical, key=lambda entry: entry.game.id):
+        game = item.game
+        hist_meta = item.hist_meta
         batch_id_raw = hist_meta.get("batch_id")
         batch_id = str(batch_id_raw).strip() if isinstance(batch_id_raw, str) else ""
         if not batch_id:
@@ -305,19 +379,18 @@ async def build_model_training_dataset(
             excluded.append({"match_id": game.id, "reason": "batch_record_not_found"})
             continue
 
-        if not _apply_filters(game, batch, hist_meta, request.filters):
+        if not _apply_filters(game, batch, hist_meta, filters):
             excluded.append({"match_id": game.id, "reason": "filtered_out"})
             continue
 
-        innings_summary = _normalize_innings_summary(game)
-        ineligible_reason = _is_match_eligible(game, batch, hist_meta, innings_summary)
+        ineligible_reason = _is_match_eligible(game, batch, hist_meta, item.innings_summary)
         if ineligible_reason is not None:
             excluded.append({"match_id": game.id, "reason": ineligible_reason})
             continue
 
         pre_dedupe_candidates.append(
             _EligibleMatch(
-                game=game, batch=batch, hist_meta=hist_meta, innings_summary=innings_summary
+                game=game, batch=batch, hist_meta=hist_meta, innings_summary=item.innings_summary
             )
         )
 
@@ -373,9 +446,15 @@ async def build_model_training_dataset(
                     }
                 )
 
-    rows = _build_rows(final_candidates)
-    included_match_ids = sorted({candidate.game.id for candidate in final_candidates})
+    return final_candidates, excluded
+
 
+def _artifact_header(
+    request: DatasetBuildRequest,
+    included_match_ids: list[str],
+    excluded: list[dict[str, Any]],
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Return (artifact fields without rows/fingerprint, fingerprint payload without rows)."""
     generated_at = request.generated_at or dt.datetime.now(dt.UTC)
     parameters = {
         "source_format": request.filters.source_format,
@@ -386,18 +465,16 @@ async def build_model_training_dataset(
 
     exclusion_reasons = _group_exclusions(excluded)
 
-    fingerprint_payload = {
+    fingerprint_header = {
         "dataset_schema_version": _DATASET_SCHEMA_VERSION,
         "parameters": parameters,
         "included_match_ids": included_match_ids,
         "exclusion_reasons": exclusion_reasons,
-        "rows": rows,
     }
 
-    return {
+    artifact = {
         "dataset_schema_version": _DATASET_SCHEMA_VERSION,
         "generated_at": generated_at.isoformat(),
-        "build_fingerprint": _deterministic_fingerprint(fingerprint_payload),
         "parameters": parameters,
         "provenance": {
             "source": "historical_import_registry",
@@ -412,6 +489,119 @@ async def build_model_training_dataset(
             excluded,
             key=lambda item: (str(item.get("match_id", "")), str(item.get("reason", ""))),
         ),
+    }
+    return artifact, fingerprint_header
+
+
+async def build_model_training_dataset(
+    db: AsyncSession,
+    request: DatasetBuildRequest,
+    current_user: Any | None = None,
+) -> dict[str, Any]:
+    """Build a deterministic, governed model-training dataset artifact.
+
+    Reads only validated historical import records and never mutates official match truth.
+    """
+    games_result = await db.execute(_games_stmt(current_user))
+    games = list(games_result.scalars().all())
+
+    historical: list[_HistoricalMatch] = []
+    extras_by_game: dict[str, dict[int, int]] = {}
+    for game in games:
+        scanned = _scan_game(game)
+        if scanned is None:
+            continue
+        historical.append(scanned)
+        extras_by_game[game.id] = _extras_by_inning(game.deliveries)
+
+    batch_lookup = await _load_batches(db, historical)
+    final_candidates, excluded = _select_candidates(historical, batch_lookup, request.filters)
+
+    rows = _build_rows(final_candidates, extras_by_game)
+    included_match_ids = sorted({candidate.game.id for candidate in final_candidates})
+
+    artifact, fingerprint_payload = _artifact_header(request, included_match_ids, excluded)
+    fingerprint_payload["rows"] = rows
+
+    return {
+        **artifact,
+        "build_fingerprint": _deterministic_fingerprint(fingerprint_payload),
         "row_count": len(rows),
         "rows": rows,
     }
+
+
+async def stream_model_training_dataset(
+    db: AsyncSession,
+    request: DatasetBuildRequest,
+    write_rows: Callable[[list[dict[str, Any]]], None],
+    current_user: Any | None = None,
+    *,
+    batch_size: int = _DEFAULT_STREAM_BATCH_SIZE,
+) -> dict[str, Any]:
+    """Build the dataset with flat memory, handing rows to ``write_rows`` in batches.
+
+    Games are scanned with a server-side cursor (``yield_per``) without their
+    deliveries ledger; deliveries are then fetched ``batch_size`` games at a
+    time for the included matches only. Rows arrive in the same order as the
+    in-memory builder's ``rows`` and ``build_fingerprint`` is identical.
+
+    Returns the artifact without ``rows``, plus ``rows_sha256``: the SHA-256 of
+    the rows serialized one per line with ``serialize_dataset_row``.
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+    stmt = (
+        _games_stmt(current_user)
+        .options(
+            load_only(Game.id, Game.match_type, Game.result, Game.team_a, Game.team_b, Game.phases)
+        )
+        .execution_options(yield_per=batch_size)
+    )
+
+    historical: list[_HistoricalMatch] = []
+    stream = await db.stream(stmt)
+    async for partition in stream.scalars().partitions():
+        historical.extend(item for item in map(_scan_game, partition) if item is not None)
+
+    batch_lookup = await _load_batches(db, historical)
+    final_candidates, excluded = _select_candidates(historical, batch_lookup, request.filters)
+    del historical
+
+    ordered = sorted(final_candidates, key=lambda item: str(item.game.id))
+    included_match_ids = sorted({candidate.game.id for candidate in ordered})
+    artifact, fingerprint_header = _artifact_header(request, included_match_ids, excluded)
+
+    fingerprint = _StreamingFingerprint(fingerprint_header)
+    content_digest = hashlib.sha256()
+    row_count = 0
+    for chunk in _chunked(ordered, batch_size):
+        deliveries_result = await db.execute(
+            select(Game.id, Game.deliveries).where(Game.id.in_([c.game.id for c in chunk]))
+        )
+        extras_by_game = {
+            game_id: _extras_by_inning(deliveries) for game_id, deliveries in deliveries_result
+        }
+
+        rows: list[dict[str, Any]] = []
+        for candidate in chunk:
+            rows.extend(_candidate_rows(candidate, extras_by_game.get(candidate.game.id, {})))
+        for row in rows:
+            row_json = serialize_dataset_row(row)
+            fingerprint.update(row_json)
+            content_digest.update(row_json.encode("utf-8") + b"\n")
+        row_count += len(rows)
+        if rows:
+            write_rows(rows)
+
+    return {
+        **artifact,
+        "build_fingerprint": fingerprint.hexdigest(),
+        "row_count": row_count,
+        "rows_sha256": content_digest.hexdigest(),
+    }
+
+
+def _chunked(items: list[_EligibleMatch], size: int) -> Iterable[list[_EligibleMatch]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
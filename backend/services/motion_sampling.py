@@ -0,0 +1,231 @@
+"""
+Motion Sampling - spend pose inference where the player is moving.
+
+Batting and bowling clips are mostly an idle stance followed by a short burst of
+action (backlift to follow-through, run-up stride to release). A fixed
+``sample_fps`` spends most of its inference budget on the stance and still
+samples the action coarsely. Motion-adaptive sampling runs in two steps:
+
+1. ``scan_motion`` decodes the clip at a low probe rate, downsizes each probe to
+   a small grayscale image and scores the mean absolute difference to the
+   previous probe (no inference, a few milliseconds per probe).
+2. ``plan_motion_frames`` keeps the pass's regular grid (``frame_interval``)
+   across the whole range and adds every ``dense_interval``-th frame inside the
+   high-motion windows, most intense window first, until ``frame_budget`` is
+   reached.
+
+Planned frames are absolute frame numbers on the same grids uniform sampling
+uses, so timestamps, evidence frame numbers and cached results line up with
+uniform runs; the regular grid is what a uniform pass at ``sample_fps`` would
+have sampled.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from backend.services.frame_sampler import FrameSampler
+
+logger = logging.getLogger(__name__)
+
+# Frames are compared after downsizing to this width (keeps the scan cheap and
+# insensitive to compression noise)
+MOTION_SCAN_WIDTH = 96
+
+
+@dataclass(frozen=True)
+class MotionSampling:
+    """Motion-adaptive sampling settings for one ``SamplingPass``."""
+
+    dense_fps: float = 30.0  # sampling rate inside high-motion windows
+    frame_budget: int | None = None  # max frames run through inference (None: no cap)
+    scan_fps: float = 10.0  # probe rate of the motion scan
+    padding_sec: float = 0.3  # widen each high-motion window by this much on each side
+    motion_sigma: float = 3.0  # threshold: median + sigma * robust std of probe scores
+    min_motion: float = 2.0  # ... but never below this mean grey-level difference
+
+
+@dataclass
+class MotionProfile:
+    """Probe frame numbers and their frame-difference scores over a range."""
+
+    frame_nums: np.ndarray  # (probes,) int64
+    scores: np.ndarray  # (probes,) mean absolute grey-level difference to the previous probe
+    end_frame: int  # exclusive end of the scanned range
+    scan_s: float = 0.0
+
+    def until(self, end_frame: int) -> MotionProfile:
+        """The part of the profile before ``end_frame`` (exclusive)."""
+        keep = self.frame_nums < end_frame
+        return MotionProfile(
+            frame_nums=self.frame_nums[keep],
+            scores=self.scores[keep],
+            end_frame=min(self.end_frame, end_frame),
+            scan_s=self.scan_s,
+        )
+
+    def threshold(self, motion: MotionSampling) -> float:
+        if self.scores.size < 2:
+            return math.inf
+        scores = self.scores[1:]  # the first probe has nothing to compare with
+        median = float(np.median(scores))
+        robust_std = 1.4826 * float(np.median(np.abs(scores - median)))
+        return max(motion.min_motion, median + motion.motion_sigma * robust_std)
+
+
+@dataclass
+class MotionPlan:
+    """Frames one pass runs inference on, and why."""
+
+    frames: list[int]
+    windows: list[tuple[int, int]] = field(default_factory=list)  # inclusive frame ranges
+
+    def describe(
+        self, *, frame_interval: int, dense_interval: int, motion: MotionSampling
+    ) -> dict[str, Any]:
+        """JSON-safe summary stored with the pose result as ``sampling``."""
+        return {
+            "mode": "motion",
+            "frame_interval": frame_interval,
+            "dense_interval": dense_interval,
+            "frame_budget": motion.frame_budget,
+            "planned_frames": len(self.frames),
+            "windows": [list(window) for window in self.windows],
+        }
+
+
+def scan_motion(
+    cv2: Any,
+    source: str,
+    *,
+    start_frame: int,
+    end_frame: int | None,
+    frame_interval: int,
+    width: int = MOTION_SCAN_WIDTH,
+) -> MotionProfile:
+    """Score frame-to-frame motion of ``source`` every ``frame_interval`` frames.
+
+    Opens its own capture, so the caller's capture position is not disturbed.
+
+    Raises:
+        ValueError: If the video cannot be opened
+    """
+    started = time.perf_counter()
+    cap = cv2.VideoCapture(source)
+    if not cap.isOpened():
+        raise ValueError(f"Cannot open video for motion scan: {source}")
+
+    frame_nums: list[int] = []
+    scores: list[float] = []
+    previous = None
+    try:
+        sampler = FrameSampler(
+            cv2, cap, frame_interval=frame_interval, start_frame=start_frame, end_frame=end_frame
+        )
+        for frame_num, frame in sampler:
+            height = max(1, round(frame.shape[0] * width / max(1, frame.shape[1])))
+            small = cv2.resize(frame, (width, height), interpolation=cv2.INTER_AREA)
+            gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+            scores.append(0.0 if previous is None else float(cv2.absdiff(gray, previous).mean()))
+            frame_nums.append(frame_num)
+            previous = gray
+        scanned_to = sampler.position
+    finally:
+        cap.release()
+
+    return MotionProfile(
+        frame_nums=np.array(frame_nums, dtype=np.int64),
+        scores=np.array(scores, dtype=np.float64),
+        end_frame=scanned_to if end_frame is None else min(end_frame, scanned_to),
+        scan_s=time.perf_counter() - started,
+    )
+
+
+def _motion_windows(
+    profile: MotionProfile, threshold: float, padding: int, start_frame: int
+) -> list[tuple[int, int, float]]:
+    """Merged ``(first, last, peak score)`` frame ranges whose motion exceeds ``threshold``."""
+    windows: list[tuple[int, int, float]] = []
+    frame_nums = profile.frame_nums
+    last_frame = profile.end_frame - 1
+    for i in np.flatnonzero(profile.scores > threshold):
+        # A probe's score is the change since the previous probe
+        first = int(frame_nums[i - 1]) if i > 0 else int(frame_nums[i])
+        first = max(start_frame, first - padding)
+        last = min(last_frame, int(frame_nums[i]) + padding)
+        score = float(profile.scores[i])
+        if windows and first <= windows[-1][1] + 1:
+            prev_first, prev_last, prev_score = windows[-1]
+            windows[-1] = (prev_first, max(prev_last, last), max(prev_score, score))
+        else:
+            windows.append((first, last, score))
+    return windows
+
+
+def plan_motion_frames(
+    profile: MotionProfile,
+    motion: MotionSampling,
+    *,
+    frame_interval: int,
+    dense_interval: int,
+    start_frame: int,
+    fps: float,
+) -> MotionPlan:
+    """Choose inference frames: the regular grid plus dense frames where motion is high.
+
+    Args:
+        profile: Motion scan of the pass's range (``start_frame`` to ``profile.end_frame``)
+        motion: Adaptive sampling settings
+        frame_interval: The pass's regular sampling interval (frames)
+        dense_interval: Sampling interval inside high-motion windows (frames)
+        start_frame: First frame of the range
+        fps: Video frame rate
+
+    Returns:
+        MotionPlan with sorted absolute frame numbers and the windows sampled densely
+    """
+    end = profile.end_frame
+    first_regular = -(-start_frame // frame_interval) * frame_interval
+    regular = list(range(first_regular, end, frame_interval))
+    budget = motion.frame_budget if motion.frame_budget is not None else math.inf
+
+    if len(regular) > budget:
+        # The regular grid alone is over budget: thin it evenly and skip dense frames
+        stride = math.ceil(len(regular) / max(1, int(budget)))
+        return MotionPlan(frames=regular[::stride])
+
+    chosen = set(regular)
+    padding = round(motion.padding_sec * fps)
+    windows = _motion_windows(profile, profile.threshold(motion), padding, start_frame)
+    sampled: list[tuple[int, int]] = []
+    # Most intense action first, so a tight budget still covers the main event densely
+    for first, last, _score in sorted(windows, key=lambda w: w[2], reverse=True):
+        if len(chosen) >= budget:
+            break
+        candidates = [
+            f
+            for f in range(-(-first // dense_interval) * dense_interval, last + 1, dense_interval)
+            if f not in chosen
+        ]
+        if not candidates:
+            continue
+        room = budget - len(chosen)
+        if len(candidates) > room:
+            # Keep the frames around the window's most intense probe
+            probes = (profile.frame_nums >= first) & (profile.frame_nums <= last)
+            peak = (
+                int(profile.frame_nums[probes][np.argmax(profile.scores[probes])])
+                if probes.any()
+                else (first + last) // 2
+            )
+            candidates = sorted(candidates, key=lambda f: abs(f - peak))[: int(room)]
+        chosen.update(candidates)
+        sampled.append((min(candidates), max(candidates)))
+
+    return MotionPlan(frames=sorted(chosen), windows=sorted(sampled))
@@ -0,0 +1,252 @@
+"""
+Pose Artifact - compact columnar storage for pose landmark timelines.
+
+Pose frames as produced by ``pose_service`` are JSON dicts carrying 33 landmarks
+twice over (``landmarks`` list plus named ``keypoints``), i.e. several KB per
+sampled frame that must be serialised, uploaded, downloaded and parsed again for
+every chunk. ``PoseArrays`` holds the same timeline as a handful of arrays:
+
+- ``landmarks``: ``(frames, 33, 4)`` float32/float16 of x, y, z, visibility
+  (NaN for frames without a detected pose),
+- ``frame_num`` / ``timestamp`` / ``timestamp_ms`` / ``detected`` vectors.
+
+``dumps_pose_npz`` stores them as an uncompressed ``.npz`` (readable with plain
+``np.load``); ``loads_pose_npz`` maps the arrays straight out of the downloaded
+bytes without copying or parsing. JSON stays available through ``to_frames()``
+for exports and for consumers that still expect frame dicts.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import struct
+import zipfile
+from dataclasses import dataclass, field
+from typing import Any, cast
+
+import numpy as np
+
+POSE_NPZ_CONTENT_TYPE = "application/x-npz"
+POSE_ARTIFACT_VERSION = 1
+
+LANDMARK_COUNT = 33
+LANDMARK_CHANNELS = ("x", "y", "z", "visibility")
+
+# Zip local file header: fixed 30 bytes, then file name and extra field
+_ZIP_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+
+
+@dataclass
+class PoseArrays:
+    """A pose timeline in columnar form (one row per sampled frame)."""
+
+    landmarks: np.ndarray  # (frames, 33, 4) x, y, z, visibility; NaN where not detected
+    frame_num: np.ndarray  # (frames,) int32
+    timestamp: np.ndarray  # (frames,) float64 seconds
+    timestamp_ms: np.ndarray  # (frames,) int64 detector timestamps
+    detected: np.ndarray  # (frames,) bool
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return int(self.frame_num.shape[0])
+
+    @classmethod
+    def from_frames(
+        cls,
+        frames: list[dict[str, Any]],
+        *,
+        metadata: dict[str, Any] | None = None,
+        dtype: Any = np.float32,
+    ) -> PoseArrays:
+        """Pack ``pose_service`` frame dicts into arrays."""
+        count = len(frames)
+        landmarks = np.full((count, LANDMARK_COUNT, len(LANDMARK_CHANNELS)), np.nan, dtype=dtype)
+        frame_num = np.zeros(count, dtype=np.int32)
+        timestamp = np.zeros(count, dtype=np.float64)
+        timestamp_ms = np.zeros(count, dtype=np.int64)
+        detected = np.zeros(count, dtype=bool)
+
+        for row, frame in enumerate(frames):
+            frame_num[row] = int(frame.get("frame_num", frame.get("frame_index", row)) or 0)
+            ts = float(frame.get("timestamp", frame.get("t", 0.0)) or 0.0)
+            timestamp[row] = ts
+            timestamp_ms[row] = int(frame.get("timestamp_ms", round(ts * 1000)))
+            points = frame.get("landmarks")
+            if points:
+                detected[row] = bool(frame.get("detected", True))
+                landmarks[row, : len(points)] = [
+                    [p.get(channel, np.nan) for channel in LANDMARK_CHANNELS]
+                    for p in points[:LANDMARK_COUNT]
+                ]
+
+        return cls(
+            landmarks=landmarks,
+            frame_num=frame_num,
+            timestamp=timestamp,
+            timestamp_ms=timestamp_ms,
+            detected=detected,
+            metadata=dict(metadata or {}),
+        )
+
+    @classmethod
+    def concatenate(cls, parts: list[PoseArrays]) -> PoseArrays:
+        """Join timelines end to end (e.g. chunks in index order)."""
+        if not parts:
+            return cls.from_frames([])
+        return cls(
+            landmarks=np.concatenate([p.landmarks for p in parts]),
+            frame_num=np.concatenate([p.frame_num for p in parts]),
+            timestamp=np.concatenate([p.timestamp for p in parts]),
+            timestamp_ms=np.concatenate([p.timestamp_ms for p in parts]),
+            detected=np.concatenate([p.detected for p in parts]),
+        )
+
+    def to_frames(self) -> list[dict[str, Any]]:
+        """Expand back into ``pose_service`` frame dicts (JSON export, legacy consumers)."""
+        from backend.services.pose_service import KEYPOINT_NAMES
+
+        values = self.landmarks.astype(np.float64).tolist()
+        frames: list[dict[str, Any]] = []
+        for row in range(len(self)):
+            frame_num = int(self.frame_num[row])
+            ts = round(float(self.timestamp[row]), 3)
+            landmarks = None
+            keypoints: dict[str, Any] = {}
+            if self.detected[row]:
+                landmarks = [
+                    dict(zip(LANDMARK_CHANNELS, point, strict=True)) for point in values[row]
+                ]
+                keypoints = dict(zip(KEYPOINT_NAMES, landmarks, strict=False))
+            frames.append(
+                {
+                    "frame_num": frame_num,
+                    "timestamp": ts,
+                    "t": ts,
+                    "timestamp_ms": int(self.timestamp_ms[row]),
+                    "frame_index": frame_num,
+                    "detected": bool(self.detected[row]),
+                    "landmarks": landmarks,
+                    "keypoints": keypoints,
+                }
+            )
+        return frames
+
+
+_TIMELINE_FIELDS = ("landmarks", "frame_num", "timestamp", "timestamp_ms", "detected")
+
+
+class PoseArraysBuffer:
+    """Builds one timeline from parts appended in order (e.g. chunks as they download).
+
+    Parts are copied into preallocated arrays that grow by doubling, so the part
+    (and the artifact bytes it views) can be released as soon as it is appended.
+    """
+
+    def __init__(self, capacity: int = 0) -> None:
+        self.capacity = max(0, int(capacity))
+        self.parts = 0
+        self._size = 0
+        self._arrays: dict[str, np.ndarray] | None = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _resize(self, capacity: int, template: PoseArrays) -> None:
+        landmarks = template.landmarks
+        if self._arrays is not None:
+            landmarks_dtype = np.promote_types(self._arrays["landmarks"].dtype, landmarks.dtype)
+        else:
+            landmarks_dtype = landmarks.dtype
+        resized = {}
+        for name in _TIMELINE_FIELDS:
+            source = getattr(template, name)
+            dtype = landmarks_dtype if name == "landmarks" else source.dtype
+            resized[name] = np.empty((capacity, *source.shape[1:]), dtype=dtype)
+            if self._arrays is not None:
+                resized[name][: self._size] = self._arrays[name][: self._size]
+        self._arrays = resized
+        self.capacity = capacity
+
+    def _widens_landmarks(self, poses: PoseArrays) -> bool:
+        current = cast(dict[str, np.ndarray], self._arrays)["landmarks"].dtype
+        return np.promote_types(current, poses.landmarks.dtype) != current
+
+    def append(self, poses: PoseArrays) -> None:
+        """Copy ``poses`` onto the end of the timeline."""
+        end = self._size + len(poses)
+        if self._arrays is None:
+            self._resize(max(end, self.capacity), poses)
+        elif end > self.capacity or self._widens_landmarks(poses):
+            self._resize(max(end, 2 * self.capacity), poses)
+        arrays = cast(dict[str, np.ndarray], self._arrays)
+        for name in _TIMELINE_FIELDS:
+            arrays[name][self._size : end] = getattr(poses, name)
+        self._size = end
+        self.parts += 1
+
+    def build(self) -> PoseArrays:
+        """The timeline so far (views into the buffer, trimmed to the appended frames)."""
+        if self._arrays is None:
+            return PoseArrays.from_frames([])
+        return PoseArrays(**{name: self._arrays[name][: self._size] for name in _TIMELINE_FIELDS})
+
+
+def dumps_pose_npz(poses: PoseArrays) -> bytes:
+    """Serialise to an uncompressed ``.npz`` (stored members, so reads are zero-copy)."""
+    meta = {"version": POSE_ARTIFACT_VERSION, **poses.metadata}
+    buffer = io.BytesIO()
+    np.savez(
+        buffer,
+        landmarks=poses.landmarks,
+        frame_num=poses.frame_num,
+        timestamp=poses.timestamp,
+        timestamp_ms=poses.timestamp_ms,
+        detected=poses.detected,
+        metadata=np.frombuffer(json.dumps(meta).encode("utf-8"), dtype=np.uint8),
+    )
+    return buffer.getvalue()
+
+
+def _read_member(data: bytes, info: zipfile.ZipInfo, zf: zipfile.ZipFile) -> np.ndarray:
+    if info.compress_type != zipfile.ZIP_STORED:
+        with zf.open(info) as member:
+            return np.lib.format.read_array(member, allow_pickle=False)
+
+    header = _ZIP_LOCAL_HEADER.unpack_from(data, info.header_offset)
+    name_len, extra_len = header[-2], header[-1]
+    start = info.header_offset + _ZIP_LOCAL_HEADER.size + name_len + extra_len
+    npy = io.BytesIO(data[start : start + 65536 + 10])
+    version = np.lib.format.read_magic(npy)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(npy)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(npy)
+    if dtype.hasobject:
+        raise ValueError(f"Object arrays are not allowed in pose artifacts ({info.filename})")
+    count = int(np.prod(shape)) if shape else 1
+    array = np.frombuffer(data, dtype=dtype, count=count, offset=start + npy.tell())
+    return array.reshape(shape, order="F" if fortran_order else "C")
+
+
+def loads_pose_npz(data: bytes) -> PoseArrays:
+    """Read a ``.npz`` pose artifact; arrays are read-only views into ``data``."""
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        arrays = {
+            info.filename.removesuffix(".npy"): _read_member(data, info, zf)
+            for info in zf.infolist()
+        }
+    meta = (
+        json.loads(arrays.pop("metadata").tobytes().decode("utf-8")) if "metadata" in arrays else {}
+    )
+    version = meta.pop("version", POSE_ARTIFACT_VERSION)
+    if version > POSE_ARTIFACT_VERSION:
+        raise ValueError(f"Unsupported pose artifact version {version}")
+    return PoseArrays(
+        landmarks=arrays["landmarks"],
+        frame_num=arrays["frame_num"],
+        timestamp=arrays["timestamp"],
+        timestamp_ms=arrays["timestamp_ms"],
+        detected=arrays["detected"],
+        metadata=meta,
+    )
@@ -0,0 +1,156 @@
+"""
+Pose Cache - content-addressed pose extraction results.
+
+Retries and re-analysis (another analysis mode, updated findings or report
+templates) run over the same video bytes, so their MediaPipe output is
+identical. Each sampling pass's pose result is stored as a ``.npz`` pose
+artifact (see ``pose_artifact``) under a key derived from:
+
+- the video's content id (S3 ETag + size: identical bytes, identical id),
+- the pass's ``sample_fps``, ``max_width``, ``max_seconds`` and motion sampling settings,
+- the pose model version (model file, running mode, ``COACH_PLUS_POSE_MODEL_VERSION``).
+
+A hit skips decoding and inference; metrics, findings and the report are
+recomputed from the cached landmarks. Cache failures never fail a job: lookups
+that error are treated as misses and failed stores are only logged.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from botocore.exceptions import ClientError
+
+from backend.config import settings
+from backend.services.motion_sampling import MotionSampling
+from backend.services.pose_artifact import (
+    POSE_NPZ_CONTENT_TYPE,
+    PoseArrays,
+    dumps_pose_npz,
+    loads_pose_npz,
+)
+from backend.services.video_source import worker_s3_client
+
+logger = logging.getLogger(__name__)
+
+# Bump when pose_service output changes in a way cached results would not reflect
+POSE_CACHE_VERSION = 1
+
+# Per-frame lists that are rebuilt from the landmark arrays instead of stored as JSON
+_FRAME_KEYS = ("frames", "frames_data")
+
+
+def pose_model_version() -> str:
+    """Identity of the pose model the cached landmarks came from."""
+    from backend.mediapipe_init import DEFAULT_MODEL_PATH, DEFAULT_RUNNING_MODE
+
+    model = Path(os.getenv("MEDIAPIPE_POSE_MODEL_PATH", DEFAULT_MODEL_PATH)).name
+    running_mode = os.getenv("MEDIAPIPE_RUNNING_MODE", DEFAULT_RUNNING_MODE).upper()
+    return f"{model}:{running_mode}:{settings.COACH_PLUS_POSE_MODEL_VERSION}"
+
+
+@dataclass(frozen=True)
+class PoseCacheKey:
+    """Everything a pose extraction result depends on."""
+
+    content_id: str
+    sample_fps: float
+    max_width: int
+    model_version: str
+    max_seconds: float | None = None
+    motion: MotionSampling | None = None
+
+    def digest(self) -> str:
+        fields = {"version": POSE_CACHE_VERSION, **asdict(self)}
+        if self.motion is None:
+            del fields["motion"]  # uniform-pass keys predate motion sampling
+        return hashlib.sha256(json.dumps(fields, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def s3_key(self) -> str:
+        return f"{settings.COACH_PLUS_S3_PREFIX}/pose_cache/{self.digest()}.npz"
+
+
+def pack_pose_result(pose_data: dict[str, Any]) -> bytes:
+    """Serialise a ``pose_service`` result: landmarks as arrays, the rest as metadata."""
+    frames = pose_data.get("frames") or pose_data.get("frames_data") or []
+    metadata = {k: v for k, v in pose_data.items() if k not in _FRAME_KEYS}
+    return dumps_pose_npz(PoseArrays.from_frames(frames, metadata=metadata))
+
+
+def unpack_pose_result(data: bytes) -> dict[str, Any]:
+    """Inverse of ``pack_pose_result``.
+
+    Frames are attached as ``pose_arrays`` (what the metrics read); callers that
+    need frame dicts expand them with ``PoseArrays.to_frames()``.
+    """
+    poses = loads_pose_npz(data)
+    return {
+        **poses.metadata,
+        "frames": [],
+        "frames_data": [],
+        "pose_arrays": poses,
+        # Decode/inference timings of the original run do not apply to this one
+        "timings": {"pose_cache_hit": True},
+    }
+
+
+def _error_code(error: ClientError) -> str:
+    return str(error.response.get("Error", {}).get("Code", "Unknown"))
+
+
+async def video_content_id(bucket: str, key: str) -> str | None:
+    """Content id of ``s3://bucket/key`` (ETag + size), or None if it cannot be read."""
+    loop = asyncio.get_running_loop()
+
+    def _head() -> str:
+        head = worker_s3_client().head_object(Bucket=bucket, Key=key)
+        return f"etag:{str(head['ETag']).strip(chr(34))}:size:{head['ContentLength']}"
+
+    try:
+        return await loop.run_in_executor(None, _head)
+    except Exception as e:
+        logger.warning(f"Pose cache disabled for s3://{bucket}/{key}: cannot read ETag: {e}")
+        return None
+
+
+async def load_pose_result(bucket: str, cache_key: str) -> bytes | None:
+    """Return the cached pose artifact, or None on a miss (or an unreadable cache)."""
+    loop = asyncio.get_running_loop()
+
+    def _get() -> bytes | None:
+        try:
+            response = worker_s3_client().get_object(Bucket=bucket, Key=cache_key)
+        except ClientError as e:
+            if _error_code(e) in ("NoSuchKey", "404"):
+                return None
+            raise
+        return response["Body"].read()
+
+    try:
+        return await loop.run_in_executor(None, _get)
+    except Exception as e:
+        logger.warning(f"Pose cache lookup failed: key={cache_key} error={e}")
+        return None
+
+
+async def store_pose_result(bucket: str, cache_key: str, body: bytes) -> None:
+    """Store a packed pose result; failures are logged, never raised."""
+    loop = asyncio.get_running_loop()
+
+    def _put() -> None:
+        worker_s3_client().put_object(
+            Bucket=bucket, Key=cache_key, Body=body, ContentType=POSE_NPZ_CONTENT_TYPE
+        )
+
+    try:
+        await loop.run_in_executor(None, _put)
+        logger.info(f"Stored pose cache entry: key={cache_key} size={len(body)}")
+    except Exception as e:
+        logger.warning(f"Pose cache store failed: key={cache_key} error={e}")
@@ -0,0 +1,162 @@
+"""
+Pose Detector Pool - reuse warmed MediaPipe PoseLandmarkers within a process.
+
+Building a PoseLandmarker loads the ``.task`` model and its first inference
+initialises the graph; doing both per video (or per GPU chunk) adds seconds to
+every extraction. ``DetectorPool`` hands each video exclusive use of a detector
+through a ``DetectorLease``:
+
+- IMAGE mode (``detect``) is stateless, so idle detectors are reused as is,
+- VIDEO mode (``detect_for_video``) tracks and smooths landmarks across frames,
+  so state from one video would leak into the next. Every lease gets a freshly
+  built detector, closed on release; the model bytes stay loaded in the process
+  (``mediapipe_init.load_model_asset``), so a rebuild does not touch the disk,
+- reusable detectors that served ``MAX_VIDEOS_PER_DETECTOR`` videos, or that
+  would exceed ``MAX_IDLE_DETECTORS`` idle ones, are closed on release.
+
+``COACH_PLUS_POSE_DETECTOR_REUSE=false`` closes every detector on release
+(one fresh detector per video, the previous behaviour).
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Idle detectors kept per pool (concurrent extractions build more on demand)
+MAX_IDLE_DETECTORS = 2
+# Videos a detector serves before it is closed and rebuilt
+MAX_VIDEOS_PER_DETECTOR = 500
+# Detection methods whose detectors carry no state between calls
+STATELESS_METHODS = ("detect",)
+
+
+@dataclass
+class _PooledDetector:
+    detector: Any
+    videos: int = 0
+
+
+class DetectorLease:
+    """Exclusive use of a pooled detector for one video; release it when done."""
+
+    def __init__(self, pool: DetectorPool, entry: _PooledDetector) -> None:
+        self._pool = pool
+        self._entry = entry
+        self._released = False
+
+    @property
+    def detector(self) -> Any:
+        return self._entry.detector
+
+    def detect(self, image: Any, timestamp_ms: int) -> Any:
+        """Run the pool's detection method; ``timestamp_ms`` is relative to this video."""
+        if self._pool.method == "detect":
+            return self._entry.detector.detect(image)
+        if self._pool.method != "detect_for_video":
+            raise RuntimeError(f"Unsupported detection method: {self._pool.method}")
+        return self._entry.detector.detect_for_video(image, int(timestamp_ms))
+
+    def release(self, *, discard: bool = False) -> None:
+        """Return the detector to the pool (or close it if ``discard``); idempotent."""
+        if not self._released:
+            self._released = True
+            self._pool._release(self._entry, discard=discard)
+
+
+class DetectorPool:
+    """Detectors built by ``factory`` for one detection method; stateless ones are reused."""
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        *,
+        method: str,
+        max_idle: int = MAX_IDLE_DETECTORS,
+        max_videos: int = MAX_VIDEOS_PER_DETECTOR,
+    ) -> None:
+        self.method = method
+        self.max_idle = max_idle
+        self.max_videos = max_videos
+        self.created = 0
+        self._factory = factory
+        self._idle: list[_PooledDetector] = []
+        self._lock = threading.Lock()
+
+    @property
+    def idle(self) -> int:
+        return len(self._idle)
+
+    @property
+    def reusable(self) -> bool:
+        """Whether detectors may serve more than one video."""
+        return self.method in STATELESS_METHODS
+
+    def checkout(self) -> DetectorLease:
+        """Lease an idle detector, building one if none is idle (or the method is stateful).
+
+        Raises:
+            Whatever ``factory`` raises when a detector has to be built
+        """
+        with self._lock:
+            entry = self._idle.pop() if self._idle else None
+        if entry is None:
+            entry = _PooledDetector(self._factory())
+            with self._lock:
+                self.created += 1
+            logger.info(f"Built pose detector #{self.created} (method={self.method})")
+        entry.videos += 1
+        return DetectorLease(self, entry)
+
+    def warm(self, image: Any) -> None:
+        """Build a detector and run one inference on ``image``.
+
+        The detector is kept idle when it is reusable; otherwise only the loaded
+        model and the process's initialised inference runtime remain.
+        """
+        lease = self.checkout()
+        try:
+            lease.detect(image, 0)
+        finally:
+            lease.release()
+
+    def _release(self, entry: _PooledDetector, *, discard: bool) -> None:
+        keep = (
+            not discard
+            and self.reusable
+            and settings.COACH_PLUS_POSE_DETECTOR_REUSE
+            and entry.videos < self.max_videos
+        )
+        if keep:
+            with self._lock:
+                if len(self._idle) < self.max_idle:
+                    self._idle.append(entry)
+                    return
+        entry.detector.close()
+
+    def close(self) -> None:
+        """Close every idle detector."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for entry in idle:
+            entry.detector.close()
+
+
+_pools: dict[tuple[Callable[[], Any], str], DetectorPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_detector_pool(factory: Callable[[], Any], method: str) -> DetectorPool:
+    """The process-wide pool for detectors built by ``factory`` with ``method``."""
+    with _pools_lock:
+        pool = _pools.get((factory, method))
+        if pool is None:
+            pool = _pools[(factory, method)] = DetectorPool(factory, method=method)
+        return pool
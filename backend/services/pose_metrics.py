@@ -2,7 +2,11 @@
 Cricket Coaching Metrics from Pose Keypoints
 
 Computes biomechanical metrics (head stability, balance, knee brace, etc.)
-from 2D pose keypoint sequences using pure Python/numpy.
+from 2D pose keypoint sequences using numpy.
+
+Frames are unpacked once into a (frames, 33, 4) landmark array (PoseTimeline)
+and every metric and per-frame series is computed from it with vectorised
+angle/distance operations.
 
 No external ML libs required. Handles missing keypoints gracefully.
 """
@@ -11,8 +15,14 @@ from __future__ import annotations
 
 import logging
 import math
+import operator
+from dataclasses import dataclass
 from typing import Any, cast
 
+import numpy as np
+
+from backend.services.pose_artifact import PoseArrays
+
 logger = logging.getLogger(__name__)
 
 
@@ -87,37 +97,291 @@ def _looks_detected(frame: dict[str, Any]) -> bool:
     return isinstance(landmarks, list) and len(landmarks) > 0
 
 
-def _clamp01(value: float) -> float:
-    return max(0.0, min(1.0, value))
+def _clamp01(value: Any) -> Any:
+    # Scalars or arrays (the per-frame series score whole columns at once)
+    return np.clip(value, 0.0, 1.0)
 
 
-def _score_from_head_movement(movement: float) -> float:
+def _score_from_head_movement(movement: Any) -> Any:
     # Match compute_head_stability_score scale (movement ~0.3 => 0)
     return _clamp01(1.0 - (movement / 0.3))
 
 
-def _score_from_balance_drift(drift: float) -> float:
+def _score_from_balance_drift(drift: Any) -> Any:
     # Match compute_balance_drift_score scale (drift ~0.2 => 0)
     return _clamp01(1.0 - (drift / 0.2))
 
 
-def _score_from_knee_angle(angle_deg: float) -> float:
+def _score_from_knee_angle(angle_deg: Any) -> Any:
     # Match compute_front_knee_brace_score scale (80 => 0, 180 => 1)
     return _clamp01((angle_deg - 80.0) / 100.0)
 
 
-def _score_from_elbow_drop(drop: float) -> float:
+def _score_from_elbow_drop(drop: Any) -> Any:
     # Match compute_elbow_drop_score scale
     return _clamp01((drop - 0.05) / 0.25)
 
 
-def _score_from_separation_angle(separation_deg: float) -> float:
+def _score_from_separation_angle(separation_deg: Any) -> Any:
     # Per-frame proxy: larger hip/shoulder separation angle is better.
     # 0..90 degrees mapped to 0..1.
-    return _clamp01(abs(separation_deg) / 90.0)
+    return _clamp01(np.abs(separation_deg) / 90.0)
+
+
+# =========================================================================
+# Landmark Timeline (vectorised metrics)
+# =========================================================================
+
+# MediaPipe Pose Landmarker layout, as in pose_service.KEYPOINT_NAMES and the
+# pose artifacts: (frames, 33, 4) of x, y, z, visibility
+LANDMARK_COUNT = 33
+METRIC_LANDMARK_INDEX: dict[str, int] = {
+    "nose": 0,
+    "left_shoulder": 11,
+    "right_shoulder": 12,
+    "left_elbow": 13,
+    "right_elbow": 14,
+    "left_hip": 23,
+    "right_hip": 24,
+    "left_knee": 25,
+    "right_knee": 26,
+    "left_ankle": 27,
+    "right_ankle": 28,
+}
+_METRIC_NAMES = tuple(METRIC_LANDMARK_INDEX)
+_metric_getter = operator.itemgetter(*_METRIC_NAMES)
+_MISSING_POINT = (math.nan, math.nan, math.nan)
+
+# Same cut-off as get_keypoint_value
+_MIN_CONFIDENCE = 0.5
+
+
+def _point_values(kp: Any) -> tuple[float, float, float] | None:
+    """(x, y, confidence) of a keypoint in dict or list form; NaN confidence if absent."""
+    if isinstance(kp, dict):
+        x = kp.get("x")
+        y = kp.get("y")
+        if x is None or y is None:
+            return None
+        visibility = kp.get("visibility")
+        return float(x), float(y), math.nan if visibility is None else float(visibility)
+    if isinstance(kp, (list, tuple)) and len(kp) >= 2:
+        confidence = kp[2] if len(kp) > 2 else None
+        return float(kp[0]), float(kp[1]), math.nan if confidence is None else float(confidence)
+    return None
+
+
+@dataclass
+class PoseTimeline:
+    """Pose frames unpacked once into arrays for the vectorised metrics.
+
+    Frame dicts are resolved exactly as ``ensure_keypoints_dict`` and
+    ``get_keypoint_value`` would (named keypoints first, else the landmarks list),
+    but only the landmarks the metrics read are unpacked.
+    """
+
+    landmarks: np.ndarray  # (frames, 33, 4) x, y, z, visibility; NaN where missing
+    detected: np.ndarray  # (frames,) pose_detected/detected flag (aggregate metrics)
+    has_pose: np.ndarray  # (frames,) detected flag or any keypoints (per-frame series)
+    t: np.ndarray  # (frames,) "t" seconds, 0.0 when absent
+    frame_nums: np.ndarray  # (frames,) int64
+    timestamps_s: list[float | None]
+    # Frame gap one movement step stands for when sampling is non-uniform (motion-adaptive
+    # results); None counts every pair of consecutive frames as one step
+    movement_interval: int | None = None
+
+    def __len__(self) -> int:
+        return int(self.detected.shape[0])
+
+    @classmethod
+    def from_frames(cls, frames: list[dict[str, Any]]) -> PoseTimeline:
+        count = len(frames)
+        detected = np.zeros(count, dtype=bool)
+        has_pose = np.zeros(count, dtype=bool)
+        t = np.zeros(count, dtype=np.float64)
+        frame_nums = np.arange(count, dtype=np.int64)
+        timestamps_s: list[float | None] = [None] * count
+        legacy_indices = _legacy_landmark_indices()
+
+        # x, y, confidence of each metric keypoint, frame after frame
+        values: list[Any] = []
+        for row, frame in enumerate(frames):
+            detected[row] = bool(frame.get("pose_detected") or frame.get("detected"))
+            t[row] = _to_float(frame.get("t", 0.0)) or 0.0
+            if _looks_detected(frame):
+                has_pose[row] = True
+                frame_nums[row], timestamps_s[row] = _frame_identity(frame, row)
+
+            keypoints = frame.get("keypoints")
+            landmarks = frame.get("landmarks")
+            if isinstance(keypoints, dict):
+                try:
+                    found = _metric_getter(keypoints)
+                except KeyError:
+                    found = [keypoints.get(name) for name in _METRIC_NAMES]
+            elif isinstance(landmarks, list) and landmarks:
+                found = [
+                    landmarks[i] if i is not None and i < len(landmarks) else None
+                    for i in legacy_indices
+                ]
+            else:
+                found = []
+            if not found:
+                values.extend(_MISSING_POINT * len(_METRIC_NAMES))
+                continue
+            try:
+                # pose_service layout ({"x", "y", "visibility"} dicts); None becomes NaN below
+                for kp in found:
+                    values.extend((kp["x"], kp["y"], kp.get("visibility")))
+            except (KeyError, TypeError, AttributeError):
+                del values[row * 3 * len(_METRIC_NAMES) :]
+                for kp in found:
+                    values.extend(_point_values(kp) or _MISSING_POINT)
+
+        landmarks_array = np.full((count, LANDMARK_COUNT, 4), np.nan)
+        if count:
+            unpacked = np.array(values, dtype=np.float64).reshape(count, len(_METRIC_NAMES), 3)
+            columns = list(METRIC_LANDMARK_INDEX.values())
+            landmarks_array[:, columns, 0] = unpacked[:, :, 0]
+            landmarks_array[:, columns, 1] = unpacked[:, :, 1]
+            landmarks_array[:, columns, 3] = unpacked[:, :, 2]
+
+        return cls(
+            landmarks=landmarks_array,
+            detected=detected,
+            has_pose=has_pose,
+            t=t,
+            frame_nums=frame_nums,
+            timestamps_s=timestamps_s,
+        )
+
+    @classmethod
+    def from_pose_arrays(cls, poses: PoseArrays) -> PoseTimeline:
+        """Timeline of a pose artifact, as its ``to_frames()`` dicts would unpack."""
+        timestamps = [round(ts, 3) for ts in poses.timestamp.tolist()]
+        return cls(
+            landmarks=np.asarray(poses.landmarks, dtype=np.float64),
+            detected=np.asarray(poses.detected, dtype=bool),
+            has_pose=np.asarray(poses.detected, dtype=bool),
+            t=np.array(timestamps, dtype=np.float64),
+            frame_nums=np.asarray(poses.frame_num, dtype=np.int64),
+            timestamps_s=list(timestamps),
+        )
+
+    @classmethod
+    def from_pose_data(
+        cls, pose_data: dict[str, Any], frames: list[dict[str, Any]]
+    ) -> PoseTimeline:
+        """Prefer the ``pose_arrays`` a caller attached over unpacking ``frames``."""
+        poses = pose_data.get("pose_arrays")
+        if isinstance(poses, PoseArrays):
+            return cls.from_pose_arrays(poses)
+        return cls.from_frames(frames)
+
+    def raw_point(self, name: str) -> np.ndarray:
+        """(frames, 2) x, y of a landmark regardless of confidence; NaN where missing."""
+        return self.landmarks[:, METRIC_LANDMARK_INDEX[name], :2]
+
+    def point(self, name: str) -> np.ndarray:
+        """(frames, 2) x, y of a confident landmark; NaN where missing or below 0.5."""
+        values = self.landmarks[:, METRIC_LANDMARK_INDEX[name]]
+        low_confidence = values[:, 3] < _MIN_CONFIDENCE
+        return np.where(low_confidence[:, None], np.nan, values[:, :2])
+
+    def shoulder_width(self) -> np.ndarray:
+        """Per-frame ``normalize_by_shoulder_width`` (at least 0.1)."""
+        width = _distances(self.raw_point("left_shoulder"), self.raw_point("right_shoulder"))
+        return np.where(np.isnan(width), 0.1, np.maximum(width, 0.1))
+
+
+def _as_timeline(frames: list[dict[str, Any]] | PoseTimeline) -> PoseTimeline:
+    return frames if isinstance(frames, PoseTimeline) else PoseTimeline.from_frames(frames)
+
+
+def _valid(*points: np.ndarray) -> np.ndarray:
+    """Rows where every (frames, 2) point is present."""
+    mask = np.ones(points[0].shape[0], dtype=bool)
+    for point in points:
+        mask &= ~np.isnan(point).any(axis=1)
+    return mask
+
+
+def _nose_movements(timeline: PoseTimeline, rows: np.ndarray) -> np.ndarray:
+    """Nose movement between consecutive ``rows``, in shoulder widths.
+
+    With ``movement_interval`` set, each movement is scaled to that frame gap so
+    densely and sparsely sampled stretches of a clip are comparable.
+    """
+    noses = timeline.point("nose")[rows]
+    movements = _distances(noses[:-1], noses[1:]) / timeline.shoulder_width()[rows][1:]
+    if timeline.movement_interval:
+        gaps = np.diff(timeline.frame_nums[rows]).astype(np.float64)
+        with np.errstate(divide="ignore"):
+            movements *= np.where(gaps > 0, timeline.movement_interval / gaps, 1.0)
+    return movements
+
+
+def _distances(p1: np.ndarray, p2: np.ndarray) -> np.ndarray:
+    """Row-wise ``distance``."""
+    dx = p2[:, 0] - p1[:, 0]
+    dy = p2[:, 1] - p1[:, 1]
+    return np.sqrt(dx * dx + dy * dy)
+
+
+def _line_angles(p1: np.ndarray, p2: np.ndarray) -> np.ndarray:
+    """Row-wise ``line_angle`` in degrees."""
+    return np.degrees(np.arctan2(p2[:, 1] - p1[:, 1], p2[:, 0] - p1[:, 0]))
+
+
+def _angles(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+    """Row-wise ``angle`` ABC in degrees (0.0 for degenerate rows, NaN if missing)."""
+    ba = a - b
+    bc = c - b
+    dot = ba[:, 0] * bc[:, 0] + ba[:, 1] * bc[:, 1]
+    mag_ba = np.sqrt(ba[:, 0] * ba[:, 0] + ba[:, 1] * ba[:, 1])
+    mag_bc = np.sqrt(bc[:, 0] * bc[:, 0] + bc[:, 1] * bc[:, 1])
+    degenerate = (mag_ba == 0) | (mag_bc == 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cos_angle = np.clip(dot / (mag_ba * mag_bc), -1.0, 1.0)
+    return np.where(degenerate, 0.0, np.degrees(np.arccos(cos_angle)))
+
+
+def _knee_angles(timeline: PoseTimeline) -> np.ndarray:
+    """(frames, 2) left/right hip-knee-ankle angles; NaN where a side is missing."""
+    return np.stack(
+        [
+            _angles(
+                timeline.point(f"{side}_hip"),
+                timeline.point(f"{side}_knee"),
+                timeline.point(f"{side}_ankle"),
+            )
+            for side in ("left", "right")
+        ],
+        axis=1,
+    )
+
+
+def _elbow_drops(timeline: PoseTimeline) -> np.ndarray:
+    """(frames, 2) left/right elbow y minus shoulder y; NaN where a side is missing."""
+    return np.stack(
+        [
+            timeline.point(f"{side}_elbow")[:, 1] - timeline.point(f"{side}_shoulder")[:, 1]
+            for side in ("left", "right")
+        ],
+        axis=1,
+    )
 
 
-def _compute_per_frame_series(frames: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+def _hip_mid_drift(timeline: PoseTimeline) -> np.ndarray:
+    """Horizontal offset between hip and ankle midpoints; NaN where any is missing."""
+    hip_mid = (timeline.point("left_hip")[:, 0] + timeline.point("right_hip")[:, 0]) / 2
+    ankle_mid = (timeline.point("left_ankle")[:, 0] + timeline.point("right_ankle")[:, 0]) / 2
+    return np.abs(hip_mid - ankle_mid)
+
+
+def _compute_per_frame_series(
+    frames: list[dict[str, Any]] | PoseTimeline,
+) -> dict[str, dict[str, Any]]:
     """Compute per-frame score series for each metric.
 
     Returns per metric:
@@ -129,143 +393,75 @@ def _compute_per_frame_series(frames: list[dict[str, Any]]) -> dict[str, dict[st
 
     Series includes only frames where pose is detected and required keypoints exist.
     """
+    timeline = _as_timeline(frames)
 
-    series: dict[str, dict[str, Any]] = {
-        k: {"scores": [], "frame_nums": [], "timestamps_s": []} for k in EVIDENCE_BAD_THRESHOLDS
-    }
+    def _series(rows: np.ndarray, scores: np.ndarray) -> dict[str, Any]:
+        # scores are already restricted to ``rows``
+        index = np.flatnonzero(rows)
+        return {
+            "scores": scores.tolist(),
+            "frame_nums": timeline.frame_nums[index].tolist(),
+            "timestamps_s": [timeline.timestamps_s[i] for i in index],
+        }
+
+    has_pose = timeline.has_pose
 
     # Head stability (movement between consecutive valid nose frames)
-    prev_nose: list[float] | None = None
-    for idx, frame in enumerate(frames):
-        if not _looks_detected(frame):
-            continue
-
-        frame = ensure_keypoints_dict(frame)
-        keypoints = frame.get("keypoints", {})
-        shoulder_width = normalize_by_shoulder_width(keypoints)
-        nose = get_keypoint_value(keypoints, "nose")
-        if nose is None or shoulder_width < 0.01:
-            continue
-
-        movement = 0.0
-        if prev_nose is not None:
-            movement = distance(prev_nose, nose) / shoulder_width
-        prev_nose = nose
-
-        score = _score_from_head_movement(movement)
-        frame_num, ts = _frame_identity(frame, idx)
-        series["head_stability_score"]["scores"].append(score)
-        series["head_stability_score"]["frame_nums"].append(frame_num)
-        series["head_stability_score"]["timestamps_s"].append(ts)
-
-    # Balance drift
-    for idx, frame in enumerate(frames):
-        if not _looks_detected(frame):
-            continue
-        frame = ensure_keypoints_dict(frame)
-        keypoints = frame.get("keypoints", {})
-
-        left_hip = get_keypoint_value(keypoints, "left_hip")
-        right_hip = get_keypoint_value(keypoints, "right_hip")
-        left_ankle = get_keypoint_value(keypoints, "left_ankle")
-        right_ankle = get_keypoint_value(keypoints, "right_ankle")
-        if not (left_hip and right_hip and left_ankle and right_ankle):
-            continue
-
-        hip_mid = [(left_hip[0] + right_hip[0]) / 2, (left_hip[1] + right_hip[1]) / 2]
-        ankle_mid = [(left_ankle[0] + right_ankle[0]) / 2, (left_ankle[1] + right_ankle[1]) / 2]
-        drift = abs(hip_mid[0] - ankle_mid[0])
-
-        score = _score_from_balance_drift(drift)
-        frame_num, ts = _frame_identity(frame, idx)
-        series["balance_drift_score"]["scores"].append(score)
-        series["balance_drift_score"]["frame_nums"].append(frame_num)
-        series["balance_drift_score"]["timestamps_s"].append(ts)
-
-    # Front knee brace
-    for idx, frame in enumerate(frames):
-        if not _looks_detected(frame):
-            continue
-        frame = ensure_keypoints_dict(frame)
-        keypoints = frame.get("keypoints", {})
-
-        angles: list[float] = []
-
-        left_hip = get_keypoint_value(keypoints, "left_hip")
-        left_knee = get_keypoint_value(keypoints, "left_knee")
-        left_ankle = get_keypoint_value(keypoints, "left_ankle")
-        if left_hip and left_knee and left_ankle:
-            angles.append(angle(left_hip, left_knee, left_ankle))
-
-        right_hip = get_keypoint_value(keypoints, "right_hip")
-        right_knee = get_keypoint_value(keypoints, "right_knee")
-        right_ankle = get_keypoint_value(keypoints, "right_ankle")
-        if right_hip and right_knee and right_ankle:
-            angles.append(angle(right_hip, right_knee, right_ankle))
-
-        if not angles:
-            continue
-
-        # Use the worst (minimum) angle for the frame
-        min_angle = min(angles)
-        score = _score_from_knee_angle(min_angle)
-        frame_num, ts = _frame_identity(frame, idx)
-        series["front_knee_brace_score"]["scores"].append(score)
-        series["front_knee_brace_score"]["frame_nums"].append(frame_num)
-        series["front_knee_brace_score"]["timestamps_s"].append(ts)
-
-    # Hip/shoulder separation timing (per-frame proxy score)
-    for idx, frame in enumerate(frames):
-        if not _looks_detected(frame):
-            continue
-        frame = ensure_keypoints_dict(frame)
-        keypoints = frame.get("keypoints", {})
-
-        left_hip = get_keypoint_value(keypoints, "left_hip")
-        right_hip = get_keypoint_value(keypoints, "right_hip")
-        left_shoulder = get_keypoint_value(keypoints, "left_shoulder")
-        right_shoulder = get_keypoint_value(keypoints, "right_shoulder")
-        if not (left_hip and right_hip and left_shoulder and right_shoulder):
-            continue
-
-        hip_ang = line_angle(left_hip, right_hip)
-        shoulder_ang = line_angle(left_shoulder, right_shoulder)
-        sep = shoulder_ang - hip_ang
-        score = _score_from_separation_angle(sep)
-        frame_num, ts = _frame_identity(frame, idx)
-        series["hip_shoulder_separation_timing"]["scores"].append(score)
-        series["hip_shoulder_separation_timing"]["frame_nums"].append(frame_num)
-        series["hip_shoulder_separation_timing"]["timestamps_s"].append(ts)
-
-    # Elbow drop
-    for idx, frame in enumerate(frames):
-        if not _looks_detected(frame):
-            continue
-        frame = ensure_keypoints_dict(frame)
-        keypoints = frame.get("keypoints", {})
-
-        drops: list[float] = []
-
-        left_shoulder = get_keypoint_value(keypoints, "left_shoulder")
-        left_elbow = get_keypoint_value(keypoints, "left_elbow")
-        if left_shoulder and left_elbow:
-            drops.append(left_elbow[1] - left_shoulder[1])
-
-        right_shoulder = get_keypoint_value(keypoints, "right_shoulder")
-        right_elbow = get_keypoint_value(keypoints, "right_elbow")
-        if right_shoulder and right_elbow:
-            drops.append(right_elbow[1] - right_shoulder[1])
-
-        if not drops:
-            continue
-
-        avg_drop = sum(drops) / len(drops)
-        score = _score_from_elbow_drop(avg_drop)
-        frame_num, ts = _frame_identity(frame, idx)
-        series["elbow_drop_score"]["scores"].append(score)
-        series["elbow_drop_score"]["frame_nums"].append(frame_num)
-        series["elbow_drop_score"]["timestamps_s"].append(ts)
+    head_rows = has_pose & _valid(timeline.point("nose"))
+    movements = np.zeros(np.count_nonzero(head_rows))
+    if movements.shape[0] > 1:
+        movements[1:] = _nose_movements(timeline, head_rows)
+
+    # Front knee brace: worst (minimum) angle of the frame
+    knee_angles = _knee_angles(timeline)
+    knee_rows = has_pose & ~np.isnan(knee_angles).all(axis=1)
+
+    # Hip/shoulder separation (per-frame proxy score)
+    hips = (timeline.point("left_hip"), timeline.point("right_hip"))
+    shoulders = (timeline.point("left_shoulder"), timeline.point("right_shoulder"))
+    separation_rows = has_pose & _valid(*hips, *shoulders)
+    separation = _line_angles(*shoulders) - _line_angles(*hips)
+
+    drift = _hip_mid_drift(timeline)
+    balance_rows = has_pose & ~np.isnan(drift)
+
+    elbow_drops = _elbow_drops(timeline)
+    elbow_rows = has_pose & ~np.isnan(elbow_drops).all(axis=1)
+
+    return {
+        "head_stability_score": _series(head_rows, _score_from_head_movement(movements)),
+        "balance_drift_score": _series(
+            balance_rows, _score_from_balance_drift(drift[balance_rows])
+        ),
+        "front_knee_brace_score": _series(
+            knee_rows, _score_from_knee_angle(np.nanmin(knee_angles[knee_rows], axis=1))
+        ),
+        "hip_shoulder_separation_timing": _series(
+            separation_rows, _score_from_separation_angle(separation[separation_rows])
+        ),
+        "elbow_drop_score": _series(
+            elbow_rows, _score_from_elbow_drop(np.nanmean(elbow_drops[elbow_rows], axis=1))
+        ),
+    }
+
 
+def _attached_per_frame_series(metrics_block: Any) -> dict[str, dict[str, Any]] | None:
+    """Per-frame series already attached to every metric, if present."""
+    if not isinstance(metrics_block, dict):
+        return None
+    series: dict[str, dict[str, Any]] = {}
+    for metric_key in EVIDENCE_BAD_THRESHOLDS:
+        metric_obj = metrics_block.get(metric_key)
+        if not isinstance(metric_obj, dict) or not all(
+            isinstance(metric_obj.get(key), list)
+            for key in ("per_frame_scores", "per_frame_frame_nums", "per_frame_timestamps_s")
+        ):
+            return None
+        series[metric_key] = {
+            "scores": metric_obj["per_frame_scores"],
+            "frame_nums": metric_obj["per_frame_frame_nums"],
+            "timestamps_s": metric_obj["per_frame_timestamps_s"],
+        }
     return series
 
 
@@ -289,10 +485,13 @@ def build_pose_metric_evidence(
     elif isinstance(pose_data.get("frames_data"), list):
         frames = cast(list[dict[str, Any]], pose_data.get("frames_data"))
 
-    per_frame = _compute_per_frame_series(frames)
+    # compute_pose_metrics already attached the series; only recompute if missing
+    metrics_block = metrics_result.get("metrics")
+    per_frame = _attached_per_frame_series(metrics_block) or _compute_per_frame_series(
+        PoseTimeline.from_pose_data(pose_data, frames)
+    )
 
     # Attach per-frame series to metrics_result (extend only, do not remove)
-    metrics_block = metrics_result.get("metrics")
     if isinstance(metrics_block, dict):
         for metric_key, data in per_frame.items():
             metric_obj = metrics_block.get(metric_key)
@@ -488,16 +687,14 @@ def smooth_series(values: list[float], window: int = 3) -> list[float]:
     if window < 1:
         window = 1
 
-    result = []
+    # Centered window of 2 * (window // 2) + 1, truncated at the edges
     half_window = window // 2
+    series = np.asarray(values, dtype=np.float64)
+    kernel = np.ones(2 * half_window + 1)
+    sums = np.convolve(series, kernel)[half_window : half_window + len(series)]
+    counts = np.convolve(np.ones(len(series)), kernel)[half_window : half_window + len(series)]
 
-    for i in range(len(values)):
-        start = max(0, i - half_window)
-        end = min(len(values), i + half_window + 1)
-        avg = sum(values[start:end]) / (end - start)
-        result.append(avg)
-
-    return result
+    return cast(list[float], (sums / counts).tolist())
 
 
 def normalize_by_shoulder_width(keypoints: dict[str, list[float]]) -> float:
@@ -581,6 +778,57 @@ def get_keypoint_value(keypoints: dict[str, Any], name: str) -> list[float] | No
     return None
 
 
+def _landmark_list_names() -> list[str]:
+    """Keypoint names ``ensure_keypoints_dict`` gives a bare landmarks list, by index."""
+    try:
+        from backend.mediapipe_init import KEYPOINT_NAMES
+    except ImportError:
+        # Fallback if import not available
+        KEYPOINT_NAMES = [
+            "nose",
+            "left_eye",
+            "right_eye",
+            "left_ear",
+            "right_ear",
+            "left_shoulder",
+            "right_shoulder",
+            "left_elbow",
+            "right_elbow",
+            "left_wrist",
+            "right_wrist",
+            "left_hip",
+            "right_hip",
+            "left_knee",
+            "right_knee",
+            "left_ankle",
+            "right_ankle",
+            "left_heel",
+            "right_heel",
+            "left_foot_index",
+            "right_foot_index",
+            "left_eye_inner",
+            "right_eye_inner",
+            "left_eye_outer",
+            "right_eye_outer",
+            "left_mouth_corner",
+            "right_mouth_corner",
+            "left_mouth_center",
+            "right_mouth_center",
+            "left_pinky",
+            "right_pinky",
+            "left_index",
+            "right_index",
+        ]
+
+    return KEYPOINT_NAMES
+
+
+def _legacy_landmark_indices() -> tuple[int | None, ...]:
+    """Landmarks-list index of each metric keypoint, as ``ensure_keypoints_dict`` maps it."""
+    names = _landmark_list_names()
+    return tuple(names.index(name) if name in names else None for name in _METRIC_NAMES)
+
+
 def ensure_keypoints_dict(frame: dict[str, Any]) -> dict[str, Any]:
     """
     Ensure frame has keypoints dict; convert from landmarks list if needed.
@@ -604,53 +852,14 @@ def ensure_keypoints_dict(frame: dict[str, Any]) -> dict[str, Any]:
     # If landmarks list exists but keypoints doesn't, convert
     landmarks = frame.get("landmarks")
     if isinstance(landmarks, list) and landmarks:
-        # Import KEYPOINT_NAMES from mediapipe_init if available
-        try:
-            from backend.mediapipe_init import KEYPOINT_NAMES
-        except ImportError:
-            # Fallback if import not available
-            KEYPOINT_NAMES = [
-                "nose",
-                "left_eye",
-                "right_eye",
-                "left_ear",
-                "right_ear",
-                "left_shoulder",
-                "right_shoulder",
-                "left_elbow",
-                "right_elbow",
-                "left_wrist",
-                "right_wrist",
-                "left_hip",
-                "right_hip",
-                "left_knee",
-                "right_knee",
-                "left_ankle",
-                "right_ankle",
-                "left_heel",
-                "right_heel",
-                "left_foot_index",
-                "right_foot_index",
-                "left_eye_inner",
-                "right_eye_inner",
-                "left_eye_outer",
-                "right_eye_outer",
-                "left_mouth_corner",
-                "right_mouth_corner",
-                "left_mouth_center",
-                "right_mouth_center",
-                "left_pinky",
-                "right_pinky",
-                "left_index",
-                "right_index",
-            ]
+        keypoint_names = _landmark_list_names()
 
         # Convert landmarks list to keypoints dict
         # Landmarks can be list of dicts ({"x": ..., "y": ...}) or list of lists/tuples
         keypoints_dict = {}
         for i, landmark in enumerate(landmarks):
-            if i < len(KEYPOINT_NAMES):
-                keypoints_dict[KEYPOINT_NAMES[i]] = landmark
+            if i < len(keypoint_names):
+                keypoints_dict[keypoint_names[i]] = landmark
 
         frame["keypoints"] = keypoints_dict
 
@@ -662,7 +871,9 @@ def ensure_keypoints_dict(frame: dict[str, Any]) -> dict[str, Any]:
 # ============================================================================
 
 
-def compute_head_stability_score(frames: list[dict[str, Any]]) -> dict[str, Any]:
+def compute_head_stability_score(
+    frames: list[dict[str, Any]] | PoseTimeline,
+) -> dict[str, Any]:
     """
     Compute head stability score [0,1] based on nose movement over time.
 
@@ -670,6 +881,7 @@ def compute_head_stability_score(frames: list[dict[str, Any]]) -> dict[str, Any]
 
     Args:
         frames: List of frame dicts with 't', 'keypoints', 'pose_detected'
+            (or a PoseTimeline already built from them)
 
     Returns:
         {
@@ -679,31 +891,13 @@ def compute_head_stability_score(frames: list[dict[str, Any]]) -> dict[str, Any]
             "debug": {...}
         }
     """
-    nose_movements: list[float] = []
-    prev_nose = None
-
-    for _i, frame in enumerate(frames):
-        # Handle both 'pose_detected' and 'detected' field names
-        if not (frame.get("pose_detected") or frame.get("detected")):
-            continue
+    timeline = _as_timeline(frames)
+    rows = timeline.detected & _valid(timeline.point("nose"))
 
-        # Ensure frame has keypoints dict (convert from landmarks if needed)
-        frame = ensure_keypoints_dict(frame)
-        keypoints = frame.get("keypoints", {})
-        shoulder_width = normalize_by_shoulder_width(keypoints)
-        nose = get_keypoint_value(keypoints, "nose")
-
-        if nose is None or shoulder_width < 0.01:
-            continue
-
-        if prev_nose is None:
-            prev_nose = nose
-            continue
-
-        # Movement normalized by shoulder width
-        movement = distance(prev_nose, nose) / shoulder_width
-        nose_movements.append(movement)
-        prev_nose = nose
+    # Movement between consecutive valid frames, normalized by shoulder width
+    nose_movements: list[float] = []
+    if np.count_nonzero(rows) > 1:
+        nose_movements = _nose_movements(timeline, rows).tolist()
 
     if not nose_movements:
         return {
@@ -728,14 +922,14 @@ def compute_head_stability_score(frames: list[dict[str, Any]]) -> dict[str, Any]
     }
 
 
-def compute_balance_drift_score(frames: list[dict[str, Any]]) -> dict[str, Any]:
+def compute_balance_drift_score(frames: list[dict[str, Any]] | PoseTimeline) -> dict[str, Any]:
     """
     Compute balance drift score [0,1] based on hip-ankle alignment over time.
 
     Compare midpoint of hips vs midpoint of ankles, normalized by frame scale.
 
     Args:
-        frames: List of frame dicts
+        frames: List of frame dicts (or a PoseTimeline)
 
     Returns:
         {
@@ -745,33 +939,11 @@ def compute_balance_drift_score(frames: list[dict[str, Any]]) -> dict[str, Any]:
             "debug": {...}
         }
     """
-    drifts = []
-
-    for frame in frames:
-        # Handle both 'pose_detected' and 'detected' field names
-        if not (frame.get("pose_detected") or frame.get("detected")):
-            continue
+    timeline = _as_timeline(frames)
 
-        # Ensure frame has keypoints dict (convert from landmarks if needed)
-        frame = ensure_keypoints_dict(frame)
-        keypoints = frame.get("keypoints", {})
-
-        # Get hip and ankle positions
-        left_hip = get_keypoint_value(keypoints, "left_hip")
-        right_hip = get_keypoint_value(keypoints, "right_hip")
-        left_ankle = get_keypoint_value(keypoints, "left_ankle")
-        right_ankle = get_keypoint_value(keypoints, "right_ankle")
-
-        if not (left_hip and right_hip and left_ankle and right_ankle):
-            continue
-
-        # Compute midpoints
-        hip_mid = [(left_hip[0] + right_hip[0]) / 2, (left_hip[1] + right_hip[1]) / 2]
-        ankle_mid = [(left_ankle[0] + right_ankle[0]) / 2, (left_ankle[1] + right_ankle[1]) / 2]
-
-        # Horizontal drift (x-direction)
-        drift = abs(hip_mid[0] - ankle_mid[0])
-        drifts.append(drift)
+    # Horizontal (x-direction) drift of the hip midpoint from the ankle midpoint
+    drift = _hip_mid_drift(timeline)
+    drifts: list[float] = drift[timeline.detected & ~np.isnan(drift)].tolist()
 
     if not drifts:
         return {
@@ -795,7 +967,9 @@ def compute_balance_drift_score(frames: list[dict[str, Any]]) -> dict[str, Any]:
     }
 
 
-def compute_front_knee_brace_score(frames: list[dict[str, Any]]) -> dict[str, Any]:
+def compute_front_knee_brace_score(
+    frames: list[dict[str, Any]] | PoseTimeline,
+) -> dict[str, Any]:
     """
     Compute front knee brace score [0,1] based on knee angle during motion.
 
@@ -803,7 +977,7 @@ def compute_front_knee_brace_score(frames: list[dict[str, Any]]) -> dict[str, An
     Use minimum knee angle observed (most collapsed state).
 
     Args:
-        frames: List of frame dicts
+        frames: List of frame dicts (or a PoseTimeline)
 
     Returns:
         {
@@ -813,34 +987,11 @@ def compute_front_knee_brace_score(frames: list[dict[str, Any]]) -> dict[str, An
             "debug": {...}
         }
     """
-    knee_angles = []
-
-    for frame in frames:
-        # Handle both 'pose_detected' and 'detected' field names
-        if not (frame.get("pose_detected") or frame.get("detected")):
-            continue
+    timeline = _as_timeline(frames)
 
-        # Ensure frame has keypoints dict (convert from landmarks if needed)
-        frame = ensure_keypoints_dict(frame)
-        keypoints = frame.get("keypoints", {})
-
-        # Left knee angle: hip-knee-ankle
-        left_hip = get_keypoint_value(keypoints, "left_hip")
-        left_knee = get_keypoint_value(keypoints, "left_knee")
-        left_ankle = get_keypoint_value(keypoints, "left_ankle")
-
-        if left_hip and left_knee and left_ankle:
-            l_angle = angle(left_hip, left_knee, left_ankle)
-            knee_angles.append(l_angle)
-
-        # Right knee angle: hip-knee-ankle
-        right_hip = get_keypoint_value(keypoints, "right_hip")
-        right_knee = get_keypoint_value(keypoints, "right_knee")
-        right_ankle = get_keypoint_value(keypoints, "right_ankle")
-
-        if right_hip and right_knee and right_ankle:
-            r_angle = angle(right_hip, right_knee, right_ankle)
-            knee_angles.append(r_angle)
+    # Left then right hip-knee-ankle angle of each frame, skipping missing sides
+    angles = _knee_angles(timeline)[timeline.detected].ravel()
+    knee_angles: list[float] = angles[~np.isnan(angles)].tolist()
 
     if not knee_angles:
         return {
@@ -868,14 +1019,26 @@ def compute_front_knee_brace_score(frames: list[dict[str, Any]]) -> dict[str, An
     }
 
 
-def compute_hip_shoulder_separation_timing(frames: list[dict[str, Any]]) -> dict[str, Any]:
+def _peak_velocity_times(angles: np.ndarray, times: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """(times, |angular velocity|) between consecutive frames where both angles exist."""
+    pairs = ~np.isnan(angles[1:]) & ~np.isnan(angles[:-1])
+    dt = (times[1:] - times[:-1])[pairs]
+    change = (angles[1:] - angles[:-1])[pairs]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        velocities = np.where(dt > 0, np.abs(change / dt), 0.0)
+    return times[1:][pairs], velocities
+
+
+def compute_hip_shoulder_separation_timing(
+    frames: list[dict[str, Any]] | PoseTimeline,
+) -> dict[str, Any]:
     """
     Compute lag (seconds) between peak hip rotation velocity and peak shoulder rotation velocity.
 
     Higher lag = more separation = better cricket technique.
 
     Args:
-        frames: List of frame dicts with 't' (timestamp) and keypoints
+        frames: List of frame dicts with 't' (timestamp) and keypoints (or a PoseTimeline)
 
     Returns:
         {
@@ -886,43 +1049,17 @@ def compute_hip_shoulder_separation_timing(frames: list[dict[str, Any]]) -> dict
             "debug": {...}
         }
     """
-    hip_angles: list[float | None] = []
-    shoulder_angles: list[float | None] = []
-    times: list[float] = []
-
-    for frame in frames:
-        # Handle both 'pose_detected' and 'detected' field names
-        if not (frame.get("pose_detected") or frame.get("detected")):
-            continue
-
-        # Ensure frame has keypoints dict (convert from landmarks if needed)
-        frame = ensure_keypoints_dict(frame)
-        keypoints = frame.get("keypoints", {})
-        t = frame.get("t", 0.0)
-
-        times.append(t)
-
-        # Hip angle: line from left_hip to right_hip
-        left_hip = get_keypoint_value(keypoints, "left_hip")
-        right_hip = get_keypoint_value(keypoints, "right_hip")
-
-        if left_hip and right_hip:
-            h_angle = line_angle(left_hip, right_hip)
-            hip_angles.append(h_angle)
-        else:
-            hip_angles.append(None)
-
-        # Shoulder angle: line from left_shoulder to right_shoulder
-        left_shoulder = get_keypoint_value(keypoints, "left_shoulder")
-        right_shoulder = get_keypoint_value(keypoints, "right_shoulder")
-
-        if left_shoulder and right_shoulder:
-            s_angle = line_angle(left_shoulder, right_shoulder)
-            shoulder_angles.append(s_angle)
-        else:
-            shoulder_angles.append(None)
-
-    if not times or len([x for x in hip_angles if x is not None]) < 3:
+    timeline = _as_timeline(frames)
+    rows = timeline.detected
+    times = timeline.t[rows]
+
+    # Hip / shoulder line angles (NaN where either end is missing)
+    hip_angles = _line_angles(timeline.point("left_hip"), timeline.point("right_hip"))[rows]
+    shoulder_angles = _line_angles(
+        timeline.point("left_shoulder"), timeline.point("right_shoulder")
+    )[rows]
+
+    if not times.size or np.count_nonzero(~np.isnan(hip_angles)) < 3:
         return {
             "score": 0.0,
             "hip_peak_time": 0.0,
@@ -932,42 +1069,21 @@ def compute_hip_shoulder_separation_timing(frames: list[dict[str, Any]]) -> dict
         }
 
     # Compute velocities (simple derivative)
-    hip_velocities: list[tuple[float, float]] = []
-    for i in range(1, len(hip_angles)):
-        if hip_angles[i] is not None and hip_angles[i - 1] is not None:
-            dt = times[i] - times[i - 1]
-            if dt > 0:
-                hip_a = cast(float, hip_angles[i])
-                hip_b = cast(float, hip_angles[i - 1])
-                vel = (hip_a - hip_b) / dt
-                hip_velocities.append((times[i], abs(vel)))
-            else:
-                hip_velocities.append((times[i], 0.0))
-
-    shoulder_velocities: list[tuple[float, float]] = []
-    for i in range(1, len(shoulder_angles)):
-        if shoulder_angles[i] is not None and shoulder_angles[i - 1] is not None:
-            dt = times[i] - times[i - 1]
-            if dt > 0:
-                shoulder_a = cast(float, shoulder_angles[i])
-                shoulder_b = cast(float, shoulder_angles[i - 1])
-                vel = (shoulder_a - shoulder_b) / dt
-                shoulder_velocities.append((times[i], abs(vel)))
-            else:
-                shoulder_velocities.append((times[i], 0.0))
+    hip_times, hip_velocities = _peak_velocity_times(hip_angles, times)
+    shoulder_times, shoulder_velocities = _peak_velocity_times(shoulder_angles, times)
 
-    if not hip_velocities or not shoulder_velocities:
+    if not hip_velocities.size or not shoulder_velocities.size:
         return {
             "score": 0.0,
             "hip_peak_time": 0.0,
             "shoulder_peak_time": 0.0,
-            "num_frames": len(times),
+            "num_frames": int(times.size),
             "debug": {"reason": "Cannot compute velocities"},
         }
 
-    # Find peak velocities
-    hip_peak_t = max(hip_velocities, key=lambda x: x[1])[0]
-    shoulder_peak_t = max(shoulder_velocities, key=lambda x: x[1])[0]
+    # Find peak velocities (first frame reaching the maximum)
+    hip_peak_t = float(hip_times[np.argmax(hip_velocities)])
+    shoulder_peak_t = float(shoulder_times[np.argmax(shoulder_velocities)])
 
     # Lag: hip should peak before shoulder (positive lag is good)
     lag = shoulder_peak_t - hip_peak_t
@@ -976,15 +1092,15 @@ def compute_hip_shoulder_separation_timing(frames: list[dict[str, Any]]) -> dict
         "score": lag,
         "hip_peak_time": hip_peak_t,
         "shoulder_peak_time": shoulder_peak_t,
-        "num_frames": len(times),
+        "num_frames": int(times.size),
         "debug": {
-            "hip_velocities_sample": [v for t, v in hip_velocities[:3]],
-            "shoulder_velocities_sample": [v for t, v in shoulder_velocities[:3]],
+            "hip_velocities_sample": hip_velocities[:3].tolist(),
+            "shoulder_velocities_sample": shoulder_velocities[:3].tolist(),
         },
     }
 
 
-def compute_elbow_drop_score(frames: list[dict[str, Any]]) -> dict[str, Any]:
+def compute_elbow_drop_score(frames: list[dict[str, Any]] | PoseTimeline) -> dict[str, Any]:
     """
     Compute elbow drop score [0,1] based on elbow y-position relative to shoulder.
 
@@ -992,7 +1108,7 @@ def compute_elbow_drop_score(frames: list[dict[str, Any]]) -> dict[str, Any]:
     Compare average elbow height to shoulder height.
 
     Args:
-        frames: List of frame dicts
+        frames: List of frame dicts (or a PoseTimeline)
 
     Returns:
         {
@@ -1002,33 +1118,11 @@ def compute_elbow_drop_score(frames: list[dict[str, Any]]) -> dict[str, Any]:
             "debug": {...}
         }
     """
-    elbow_drops = []
-
-    for frame in frames:
-        # Handle both 'pose_detected' and 'detected' field names
-        if not (frame.get("pose_detected") or frame.get("detected")):
-            continue
-
-        # Ensure frame has keypoints dict (convert from landmarks if needed)
-        frame = ensure_keypoints_dict(frame)
-        keypoints = frame.get("keypoints", {})
-
-        # Left side
-        left_shoulder = get_keypoint_value(keypoints, "left_shoulder")
-        left_elbow = get_keypoint_value(keypoints, "left_elbow")
-
-        if left_shoulder and left_elbow:
-            # Drop is positive y difference (elbow below shoulder)
-            drop = left_elbow[1] - left_shoulder[1]
-            elbow_drops.append(drop)
-
-        # Right side
-        right_shoulder = get_keypoint_value(keypoints, "right_shoulder")
-        right_elbow = get_keypoint_value(keypoints, "right_elbow")
+    timeline = _as_timeline(frames)
 
-        if right_shoulder and right_elbow:
-            drop = right_elbow[1] - right_shoulder[1]
-            elbow_drops.append(drop)
+    # Left then right drop of each frame (positive y difference = elbow below shoulder)
+    drops = _elbow_drops(timeline)[timeline.detected].ravel()
+    elbow_drops: list[float] = drops[~np.isnan(drops)].tolist()
 
     if not elbow_drops:
         return {
@@ -1063,7 +1157,8 @@ def compute_pose_metrics(pose_data: dict[str, Any]) -> dict[str, Any]:
     Compute all cricket coaching metrics from pose data.
 
     Args:
-        pose_data: Output from pose_service.extract_pose_keypoints_from_video()
+        pose_data: Output from pose_service.extract_pose_keypoints_from_video(); a
+            ``pose_arrays`` entry (PoseArrays) is used instead of unpacking ``frames``
 
     Returns:
         {
@@ -1081,22 +1176,27 @@ def compute_pose_metrics(pose_data: dict[str, Any]) -> dict[str, Any]:
             "computed_at": str (ISO timestamp)
         }
     """
-    frames = pose_data.get("frames", [])
+    # Unpack the frames once; every metric reads the same landmark arrays
+    timeline = PoseTimeline.from_pose_data(pose_data, pose_data.get("frames", []))
+    sampling = pose_data.get("sampling")
+    if isinstance(sampling, dict) and sampling.get("mode") == "motion":
+        # Motion-adaptive frames are unevenly spaced (see pose_service.SamplingPass.motion)
+        timeline.movement_interval = int(sampling["frame_interval"])
 
-    logger.info(f"Computing metrics for {len(frames)} frames")
+    logger.info(f"Computing metrics for {len(timeline)} frames")
 
     # Compute all metrics
     metrics = {
-        "head_stability_score": compute_head_stability_score(frames),
-        "balance_drift_score": compute_balance_drift_score(frames),
-        "front_knee_brace_score": compute_front_knee_brace_score(frames),
-        "hip_shoulder_separation_timing": compute_hip_shoulder_separation_timing(frames),
-        "elbow_drop_score": compute_elbow_drop_score(frames),
+        "head_stability_score": compute_head_stability_score(timeline),
+        "balance_drift_score": compute_balance_drift_score(timeline),
+        "front_knee_brace_score": compute_front_knee_brace_score(timeline),
+        "hip_shoulder_separation_timing": compute_hip_shoulder_separation_timing(timeline),
+        "elbow_drop_score": compute_elbow_drop_score(timeline),
     }
 
     # Extend metric objects with per-frame score series (do not change existing keys)
     try:
-        per_frame = _compute_per_frame_series(frames)
+        per_frame = _compute_per_frame_series(timeline)
         for metric_key, data in per_frame.items():
             metric_obj = metrics.get(metric_key)
             if isinstance(metric_obj, dict):
@@ -1108,12 +1208,12 @@ def compute_pose_metrics(pose_data: dict[str, Any]) -> dict[str, Any]:
         logger.exception("Failed to compute per-frame metric series")
 
     # Summary stats
-    frames_with_pose = sum(1 for f in frames if f.get("pose_detected") or f.get("detected", False))
+    frames_with_pose = int(timeline.detected.sum())
 
     result = {
         "metrics": metrics,
         "summary": {
-            "total_frames": len(frames),
+            "total_frames": len(timeline),
             "frames_with_pose": frames_with_pose,
         },
         "computed_at": "2025-12-21T00:00:00Z",  # Timestamp added by caller if needed
@@ -10,10 +10,27 @@ No fallbacks, no stubs - raises clear errors if MediaPipe is not properly initia
 from __future__ import annotations
 
 import logging
+import time
 import numpy as np
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from backend.services.frame_sampler import (
+    DecodePipeline,
+    FrameSampler,
+    is_video_url,
+    video_source_label,
+)
+from backend.services.motion_sampling import (
+    MotionPlan,
+    MotionSampling,
+    plan_motion_frames,
+    scan_motion,
+)
+from backend.services.pose_detector_pool import get_detector_pool
+
 logger = logging.getLogger(__name__)
 
 
@@ -78,11 +95,31 @@ KEYPOINT_NAMES = [
 ]
 
 
+def warm_pose_detector() -> bool:
+    """Load the pose model and run one inference so the first extraction does not pay for it.
+
+    Meant for worker process start-up. Failures are logged, not raised: the first
+    extraction then builds the detector itself and reports the error properly.
+    """
+    try:
+        _, mp, get_pose_landmarker, _, get_detection_method_name = _import_cv2_and_mediapipe()
+        pool = get_detector_pool(get_pose_landmarker, get_detection_method_name())
+        blank = np.zeros((256, 256, 3), dtype=np.uint8)
+        pool.warm(mp.Image(image_format=mp.ImageFormat.SRGB, data=blank))
+    except Exception as e:
+        logger.warning(f"Pose detector warm-up failed: {e}")
+        return False
+    logger.info("Pose detector warmed up")
+    return True
+
+
 def extract_pose_keypoints_from_video(
     video_path: str,
     sample_fps: float = 2.0,
     max_width: int = 640,
     max_seconds: float | None = None,
+    start_sec: float | None = None,
+    end_sec: float | None = None,
 ) -> dict[str, Any]:
     """Extract pose keypoints from a video file using MediaPipe Tasks Vision API.
 
@@ -91,16 +128,24 @@ def extract_pose_keypoints_from_video(
     has x, y, z coordinates and visibility score.
 
     Args:
-        video_path: Path to video file (e.g., "/videos/coaching_angle.mp4")
+        video_path: Path to video file (e.g., "/videos/coaching_angle.mp4") or HTTP(S) URL
         sample_fps: Target frames per second for sampling (default 2.0 = 1 frame every 0.5 sec)
         max_width: Maximum frame width for processing (default 640 for efficiency)
         max_seconds: Optional cap on analyzed duration (seconds). If set, only frames up to this
-            timestamp are processed.
+            many seconds after the start of the analyzed range are processed.
+        start_sec: Optional start of the analyzed range (seconds). The capture seeks here once;
+            frame numbers and timestamps in the output stay absolute to the whole video.
+        end_sec: Optional end of the analyzed range (seconds, exclusive).
+
+        Sampling is aligned to absolute frame numbers, so splitting a video into adjacent
+        ranges samples exactly the frames a single full-range call would.
 
     Returns:
         dict with keys:
             - "pose_summary": {frame_count, sampled_frame_count, detection_rate}
             - "frames": [{"frame_num", "timestamp", "landmarks": [...], "detected": bool}]
+            - "segment": {start_sec, end_sec, start_frame, end_frame} - analyzed range
+            - "timings": {decode_s, preprocess_s, queue_wait_s, inference_s, total_s, ...}
             - "metrics": {mean_visibility, max_visibility, min_visibility}
             - "findings": [str] - list of pose quality findings
             - "report": str - human-readable summary
@@ -110,22 +155,140 @@ def extract_pose_keypoints_from_video(
         ValueError: If video cannot be read or has no frames
         RuntimeError: If MediaPipe model is not initialized or available
     """
-    video_path_obj = Path(video_path) if isinstance(video_path, str) else video_path
+    results = extract_pose_keypoints_multi_rate(
+        video_path,
+        [SamplingPass("pose", sample_fps=sample_fps, max_seconds=max_seconds)],
+        max_width=max_width,
+        start_sec=start_sec,
+        end_sec=end_sec,
+    )
+    return results["pose"]
+
+
+@dataclass(frozen=True)
+class SamplingPass:
+    """One sampling rate served by ``extract_pose_keypoints_multi_rate``."""
+
+    name: str
+    sample_fps: float
+    max_seconds: float | None = None  # Relative to the start of the analyzed range
+    motion: MotionSampling | None = None  # Sample densely around motion (motion_sampling)
+
+
+@dataclass
+class _PassState:
+    """Accumulated output of one ``SamplingPass`` during a shared decode."""
+
+    spec: SamplingPass
+    frame_interval: int
+    end_frame: int | None  # Exclusive; first own frame past max_seconds, or range end
+    frames: list[dict[str, Any]] = field(default_factory=list)
+    detected_count: int = 0
+    visibility_scores: list[float] = field(default_factory=list)
+    done: bool = False
+    planned: frozenset[int] | None = None  # Motion-adaptive passes sample exactly these
+    sampling: dict[str, Any] | None = None  # Motion plan summary for the result
+
+    def wants(self, frame_num: int) -> bool:
+        if self.planned is not None:
+            return frame_num in self.planned
+        return frame_num % self.frame_interval == 0 and (
+            self.end_frame is None or frame_num < self.end_frame
+        )
+
+
+def _pass_end_frame(
+    frame_interval: int,
+    start_frame: int,
+    fps: float,
+    max_seconds: float | None,
+    range_end: int | None,
+) -> int | None:
+    """First frame this pass would sample beyond ``max_seconds`` (its exclusive end)."""
+    if max_seconds is None:
+        return range_end
+    range_start_sec = start_frame / fps
+    frame = int(start_frame + max_seconds * fps) // frame_interval * frame_interval
+    while frame < start_frame or frame / fps - range_start_sec <= max_seconds:
+        frame += frame_interval
+    return frame if range_end is None else min(frame, range_end)
+
+
+def _pass_fraction(state: _PassState, frame_num: int, start_frame: int, total_frames: int) -> float:
+    end = state.end_frame if state.end_frame is not None else total_frames
+    if end <= start_frame:
+        return 1.0
+    return min(1.0, max(0.0, (frame_num + 1 - start_frame) / (end - start_frame)))
+
+
+def extract_pose_keypoints_multi_rate(
+    video_path: str,
+    passes: Sequence[SamplingPass],
+    *,
+    max_width: int = 640,
+    start_sec: float | None = None,
+    end_sec: float | None = None,
+    on_pass_complete: Callable[[str, dict[str, Any]], None] | None = None,
+    on_progress: Callable[[dict[str, float]], None] | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Serve several sampling rates from a single decode + inference pass.
+
+    Frames sampled by more than one pass are decoded and run through MediaPipe once.
+    Each pass gets the same result shape as ``extract_pose_keypoints_from_video``
+    (restricted to its own frames), keyed by ``SamplingPass.name``.
+
+    Args:
+        video_path: Path to video file or HTTP(S) URL (e.g. presigned S3 URL)
+        passes: Sampling rates (and optional duration caps) to serve; names must be unique
+        max_width: Maximum frame width for processing
+        start_sec: Optional start of the analyzed range (seconds)
+        end_sec: Optional end of the analyzed range (seconds, exclusive)
+        on_pass_complete: Called with ``(name, result)`` as soon as a pass has all of its
+            frames, e.g. a short QUICK pass finishes while a DEEP pass keeps decoding.
+        on_progress: Called after every analysed frame with each pass's completed
+            fraction (0-1); it may raise to abort the extraction.
+
+    Returns:
+        dict mapping pass name to its pose extraction result
+
+    Raises:
+        FileNotFoundError: If video file doesn't exist
+        ValueError: If video cannot be read, has no frames, or pass names repeat
+        RuntimeError: If MediaPipe model is not initialized or available
+    """
+    if not passes or len({p.name for p in passes}) != len(passes):
+        raise ValueError(f"Sampling passes must be non-empty with unique names: {passes}")
 
-    if not video_path_obj.exists():
-        raise FileNotFoundError(f"Video file not found: {video_path_obj}")
+    # Local files and HTTP(S) URLs (streamed with ranged reads) are both accepted
+    source = str(video_path)
+    label = video_source_label(source)
 
-    logger.info(f"Extracting pose from video: {video_path_obj}")
+    if not is_video_url(source) and not Path(source).exists():
+        raise FileNotFoundError(f"Video file not found: {label}")
+
+    logger.info(f"Extracting pose from video: {label}")
 
     # Lazy import of heavy dependencies
     cv2, mp, get_pose_landmarker, get_model_path, get_detection_method_name = (
         _import_cv2_and_mediapipe()
     )
 
-    # Get MediaPipe detector - fails loudly if model is missing
-    # Factory returns NEW instance per call to avoid timestamp monotonicity bugs
+    # Determine detection method based on running mode
+    detection_method = get_detection_method_name()
+    logger.info(f"Using MediaPipe detection method: {detection_method}")
+
+    # Check for unsupported modes
+    if detection_method == "detect_async":
+        raise RuntimeError(
+            "LIVE_STREAM mode is not supported for offline video file processing. "
+            "LIVE_STREAM requires a callback pipeline for real-time streaming. "
+            "Set MEDIAPIPE_RUNNING_MODE to 'VIDEO' or 'IMAGE' for video file analysis."
+        )
+
+    # Lease a MediaPipe detector from the process pool - fails loudly if model is missing.
+    # VIDEO-mode leases always hold a freshly built detector (no state from earlier videos).
     try:
-        detector = get_pose_landmarker()
+        detector = get_detector_pool(get_pose_landmarker, detection_method).checkout()
     except Exception as e:
         logger.error(f"Failed to get MediaPipe detector: {e}")
         raise RuntimeError(
@@ -133,10 +296,10 @@ def extract_pose_keypoints_from_video(
         ) from e
 
     # Open video
-    cap = cv2.VideoCapture(str(video_path_obj))
+    cap = cv2.VideoCapture(source)
     if not cap.isOpened():
-        detector.close()
-        raise ValueError(f"Cannot open video file: {video_path_obj}")
+        detector.release()
+        raise ValueError(f"Cannot open video file: {label}")
 
     total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
     fps = cap.get(cv2.CAP_PROP_FPS)
@@ -155,63 +318,126 @@ def extract_pose_keypoints_from_video(
 
     if total_frames == 0:
         cap.release()
-        detector.close()
+        detector.release()
         raise ValueError(f"Invalid video: {total_frames} frames, {fps} fps")
 
     logger.info(f"Video: {total_frames} frames @ {fps}fps, {width}x{height}")
 
-    # Determine detection method based on running mode
-    detection_method = get_detection_method_name()
-    logger.info(f"Using MediaPipe detection method: {detection_method}")
-
-    # Check for unsupported modes
-    if detection_method == "detect_async":
-        cap.release()
-        raise RuntimeError(
-            "LIVE_STREAM mode is not supported for offline video file processing. "
-            "LIVE_STREAM requires a callback pipeline for real-time streaming. "
-            "Set MEDIAPIPE_RUNNING_MODE to 'VIDEO' or 'IMAGE' for video file analysis."
-        )
-
     # Calculate frame sampling
-    frame_interval = max(1, int(fps / sample_fps))
     target_width = min(width, max_width)
     scale = target_width / width if width > 0 else 1.0
     target_height = int(height * scale)
 
-    frames_data: list[dict[str, Any]] = []
-    detected_count = 0
-    visibility_scores = []
-
-    frame_num = 0
+    # Analyzed range in absolute frame numbers (end is exclusive; None = until EOF)
+    start_frame = max(0, round(start_sec * fps)) if start_sec else 0
+    end_frame = round(end_sec * fps) if end_sec is not None else None
+    range_start_sec = start_frame / fps
+
+    states = []
+    for spec in passes:
+        frame_interval = max(1, int(fps / spec.sample_fps))
+        states.append(
+            _PassState(
+                spec=spec,
+                frame_interval=frame_interval,
+                end_frame=_pass_end_frame(
+                    frame_interval, start_frame, fps, spec.max_seconds, end_frame
+                ),
+            )
+        )
+    results: dict[str, dict[str, Any]] = {}
+
+    # Motion-adaptive passes get their frames from a cheap frame-differencing scan
+    motion_states = [state for state in states if state.spec.motion is not None]
+    motion_scan_s = 0.0
+    if motion_states:
+        try:
+            motion_scan_s = _plan_motion_passes(
+                cv2, source, motion_states, start_frame=start_frame, fps=fps
+            )
+        except Exception:
+            cap.release()
+            detector.release()
+            raise
+
+    def _prepare(frame: Any) -> Any:
+        # Resize for efficiency
+        if scale < 1.0:
+            frame = cv2.resize(frame, (target_width, target_height))
+
+        # Convert BGR to RGB for MediaPipe
+        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+        # Ensure uint8 and contiguous
+        if rgb_frame.dtype != np.uint8:
+            rgb_frame = rgb_frame.astype(np.uint8)
+        return np.ascontiguousarray(rgb_frame)
+
+    # Skipped frames are only grabbed; sampled frames (the union of all passes) are
+    # retrieved, resized and converted on a decode thread that runs ahead of inference.
+    uniform = [state for state in states if state.planned is None]
+    planned: set[int] = set()
+    for state in motion_states:
+        planned.update(state.planned or ())
+    # Without a uniform pass the interval schedule is empty (ends where it starts)
+    primary_interval, primary_end = (
+        (uniform[0].frame_interval, uniform[0].end_frame) if uniform else (1, start_frame)
+    )
+    sampler = FrameSampler(
+        cv2,
+        cap,
+        frame_interval=primary_interval,
+        start_frame=start_frame,
+        end_frame=primary_end,
+        extra_schedules=[(state.frame_interval, state.end_frame) for state in uniform[1:]],
+        frames=sorted(planned),
+    )
+    pipeline = DecodePipeline(sampler, _prepare)
     last_timestamp_ms: int | None = None  # Track last timestamp for monotonic guard
+    inference_s = 0.0
+    started_at = time.perf_counter()
+
+    def _finish(state: _PassState, pass_end_frame: int) -> None:
+        state.done = True
+        timings = {
+            **pipeline.timings.as_dict(),
+            "inference_s": round(inference_s, 4),
+            "total_s": round(time.perf_counter() - started_at, 4),
+            "frames_retrieved": sampler.stats.retrieved,
+            "frames_grabbed": sampler.stats.grabbed,
+        }
+        if state.planned is not None:
+            timings["motion_scan_s"] = round(motion_scan_s, 4)
+        result = _build_pose_result(
+            state,
+            video_name=Path(label).name,
+            total_frames=total_frames,
+            fps=fps,
+            segment={
+                "start_sec": round(range_start_sec, 3),
+                "end_sec": round(pass_end_frame / fps, 3),
+                "start_frame": start_frame,
+                "end_frame": pass_end_frame,
+            },
+            timings=timings,
+        )
+        results[state.spec.name] = result
+        if on_pass_complete is not None:
+            on_pass_complete(state.spec.name, result)
 
     try:
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                break
-
-            # Sample frames at specified interval
-            if frame_num % frame_interval == 0:
+        with pipeline:
+            for frame_num, rgb_frame in pipeline:
+                # A frame past a pass's end means that pass has everything it needs
+                for state in states:
+                    end = state.end_frame
+                    if not state.done and end is not None and frame_num >= end:
+                        _finish(state, end)
+                owners = [state for state in states if state.wants(frame_num)]
+                if not owners:
+                    continue
                 timestamp = frame_num / fps
 
-                # Optional duration cap for quick analysis
-                if max_seconds is not None and timestamp > max_seconds:
-                    break
-
-                # Resize for efficiency
-                if scale < 1.0:
-                    frame = cv2.resize(frame, (target_width, target_height))
-
-                # Convert BGR to RGB for MediaPipe
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-                # Ensure uint8 and contiguous
-                if rgb_frame.dtype != np.uint8:
-                    rgb_frame = rgb_frame.astype(np.uint8)
-                rgb_frame = np.ascontiguousarray(rgb_frame)
-
                 # Create MediaPipe Image
                 try:
                     mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame)
@@ -225,31 +451,28 @@ def extract_pose_keypoints_from_video(
                         )
                     last_timestamp_ms = timestamp_ms
 
-                    # Call appropriate detection method based on running mode
-                    if detection_method == "detect_for_video":
-                        detection_result = detector.detect_for_video(mp_image, timestamp_ms)
-                    elif detection_method == "detect":
-                        detection_result = detector.detect(mp_image)
-                    else:
-                        # Should not reach here (checked earlier), but be defensive
-                        raise RuntimeError(f"Unsupported detection method: {detection_method}")
+                    # The lease calls detect / detect_for_video based on the running mode
+                    inference_started = time.perf_counter()
+                    detection_result = detector.detect(mp_image, timestamp_ms)
+                    inference_s += time.perf_counter() - inference_started
                 except Exception as e:
                     logger.warning(f"Detection failed for frame {frame_num}: {e}")
-                    frames_data.append(
-                        {
-                            "frame_num": frame_num,
-                            "timestamp": round(timestamp, 3),
-                            "detected": False,
-                            "landmarks": None,
-                            "keypoints": None,
-                        }
-                    )
-                    frame_num += 1
+                    for state in owners:
+                        state.frames.append(
+                            {
+                                "frame_num": frame_num,
+                                "timestamp": round(timestamp, 3),
+                                "detected": False,
+                                "landmarks": None,
+                                "keypoints": None,
+                            }
+                        )
                     continue
 
                 frame_detected = False
                 frame_landmarks = None
                 frame_keypoints: dict | None = None
+                frame_visibility: list[float] = []
 
                 # Extract landmarks from first detected pose
                 if (
@@ -277,9 +500,7 @@ def extract_pose_keypoints_from_video(
                             if i < len(KEYPOINT_NAMES):
                                 frame_keypoints[KEYPOINT_NAMES[i]] = landmark_dict
 
-                            visibility_scores.append(landmark.visibility)
-
-                        detected_count += 1
+                            frame_visibility.append(landmark.visibility)
 
                 # Normalize nulls to safe defaults
                 if frame_keypoints is None:
@@ -295,13 +516,90 @@ def extract_pose_keypoints_from_video(
                     "landmarks": frame_landmarks,
                     "keypoints": frame_keypoints,
                 }
-                frames_data.append(frame_data)
+                for state in owners:
+                    state.frames.append(frame_data)
+                    state.visibility_scores.extend(frame_visibility)
+                    if frame_detected:
+                        state.detected_count += 1
+
+                if on_progress is not None:
+                    on_progress(
+                        {
+                            state.spec.name: 1.0
+                            if state.done
+                            else _pass_fraction(state, frame_num, start_frame, total_frames)
+                            for state in states
+                        }
+                    )
 
-            frame_num += 1
+        # End of stream (or of the analyzed range) completes every remaining pass
+        for state in states:
+            if not state.done:
+                pass_end = sampler.position
+                if state.end_frame is not None:
+                    pass_end = min(state.end_frame, pass_end)
+                _finish(state, pass_end)
 
     finally:
         cap.release()
-        detector.close()
+        detector.release()
+
+    return {spec.name: results[spec.name] for spec in passes}
+
+
+def _plan_motion_passes(
+    cv2: Any, source: str, states: list[_PassState], *, start_frame: int, fps: float
+) -> float:
+    """Scan the range once and give every motion-adaptive pass its planned frames.
+
+    Returns:
+        Seconds spent scanning
+    """
+    ends = [state.end_frame for state in states]
+    scan_end = None if None in ends else max(end for end in ends if end is not None)
+    scan_interval = min(
+        max(1, int(fps / state.spec.motion.scan_fps)) for state in states if state.spec.motion
+    )
+    profile = scan_motion(
+        cv2, source, start_frame=start_frame, end_frame=scan_end, frame_interval=scan_interval
+    )
+    for state in states:
+        motion = state.spec.motion
+        if motion is None:
+            continue
+        dense_interval = max(1, min(state.frame_interval, int(fps / motion.dense_fps)))
+        plan: MotionPlan = plan_motion_frames(
+            profile if state.end_frame is None else profile.until(state.end_frame),
+            motion,
+            frame_interval=state.frame_interval,
+            dense_interval=dense_interval,
+            start_frame=start_frame,
+            fps=fps,
+        )
+        state.planned = frozenset(plan.frames)
+        state.sampling = plan.describe(
+            frame_interval=state.frame_interval, dense_interval=dense_interval, motion=motion
+        )
+        logger.info(
+            f"Motion sampling ({state.spec.name}): {len(plan.frames)} frames planned, "
+            f"dense windows={plan.windows} scan_s={profile.scan_s:.3f}"
+        )
+    return profile.scan_s
+
+
+def _build_pose_result(
+    state: _PassState,
+    *,
+    video_name: str,
+    total_frames: int,
+    fps: float,
+    segment: dict[str, Any],
+    timings: dict[str, Any],
+) -> dict[str, Any]:
+    """Assemble the public result dict for one sampling pass."""
+    frames_data = state.frames
+    detected_count = state.detected_count
+    visibility_scores = state.visibility_scores
 
     # Calculate metrics
     sampled_count = len(frames_data)
@@ -341,17 +639,18 @@ def extract_pose_keypoints_from_video(
 
     report = (
         f"Analyzed {total_frames} frames ({sampled_count} sampled) from "
-        f"{video_path_obj.name}. Detected pose in {detected_count} frames "
+        f"{video_name}. Detected pose in {detected_count} frames "
         f"({detection_rate:.1f}% detection rate)."
     )
     if findings:
         report += f" Notes: {'; '.join(findings)}"
 
     logger.info(
-        f"Pose extraction complete: {sampled_count} frames, {detection_rate:.1f}% detection rate"
+        f"Pose extraction complete ({state.spec.name}): {sampled_count} frames, "
+        f"{detection_rate:.1f}% detection rate"
     )
 
-    return {
+    result: dict[str, Any] = {
         # Primary response structure
         "pose_summary": metrics,
         "frames": frames_data,
@@ -359,9 +658,16 @@ def extract_pose_keypoints_from_video(
         "metrics": metrics,
         "findings": findings,
         "report": report,
+        "segment": segment,
+        # Per-stage wall-clock seconds (decode/preprocess run on the decode thread)
+        "timings": timings,
         # Backwards-compatible alias keys for API clients
         "total_frames": total_frames,
         "fps": fps,
         "sampled_frames": sampled_count,
         "detected_frames": detected_count,
     }
+    if state.sampling is not None:
+        # Non-uniform frame spacing; pose_metrics normalises movement by frame gap
+        result["sampling"] = state.sampling
+    return result
@@ -1,9 +1,16 @@
 """
 S3 Service - Handles presigned URL generation and S3 operations.
+
+``cached_presigned_get_url`` mints a GET URL once per object and reuses it
+until shortly before it expires, so polled endpoints return a stable URL
+(which browsers and the CDN can cache) instead of signing on every request.
 """
 
 from __future__ import annotations
 
+import threading
+import time
+from collections import OrderedDict
 from typing import Any
 
 from backend.config import settings
@@ -193,6 +200,52 @@ def _get_s3_service() -> S3Service:
     return _s3_service_instance
 
 
+# Presigned GET URLs kept for reuse (least recently used evicted first)
+PRESIGNED_URL_CACHE_SIZE = 1024
+
+# Never hand out a cached URL with less than this much validity left
+PRESIGNED_URL_MAX_REFRESH_MARGIN_SECONDS = 300
+
+_presigned_url_cache: OrderedDict[tuple[str, str, int], tuple[Any, str, float]] = OrderedDict()
+_presigned_url_lock = threading.Lock()
+
+
+def _refresh_margin(expires_in: int) -> int:
+    return max(1, min(PRESIGNED_URL_MAX_REFRESH_MARGIN_SECONDS, expires_in // 5))
+
+
+def cached_presigned_get_url(
+    bucket: str, key: str, expires_in: int | None = None
+) -> tuple[str, int]:
+    """
+    Presigned GET URL for ``bucket``/``key``, reused until close to its expiry.
+
+    Returns:
+        ``(url, seconds_remaining)`` - the URL and how long it stays valid
+    """
+    if expires_in is None:
+        expires_in = settings.S3_STREAM_URL_EXPIRES_SECONDS
+    service = _get_s3_service()
+    cache_key = (bucket, key, expires_in)
+    now = time.monotonic()
+
+    with _presigned_url_lock:
+        entry = _presigned_url_cache.get(cache_key)
+        if entry is not None:
+            owner, url, expires_at = entry
+            if owner is service and expires_at - now > _refresh_margin(expires_in):
+                _presigned_url_cache.move_to_end(cache_key)
+                return url, int(expires_at - now)
+
+    url = service.generate_presigned_get_url(bucket=bucket, key=key, expires_in=expires_in)
+    with _presigned_url_lock:
+        _presigned_url_cache[cache_key] = (service, url, now + expires_in)
+        _presigned_url_cache.move_to_end(cache_key)
+        while len(_presigned_url_cache) > PRESIGNED_URL_CACHE_SIZE:
+            _presigned_url_cache.popitem(last=False)
+    return url, expires_in
+
+
 class _LazyProxy:
     """Lazy proxy that creates S3Service on first access."""
 
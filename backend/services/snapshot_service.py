@@ -31,6 +31,7 @@ from typing import TYPE_CHECKING, Any, Literal, cast
 from pydantic import BaseModel
 
 from backend import dls as dlsmod
+from backend.services import dls_par_timeline
 from backend.sql_app import models, schemas
 
 UTC = getattr(dt, "UTC", dt.UTC)
@@ -407,6 +408,22 @@ def _dls_panel_for(g: GameState, base_dir: str | Path | None = None) -> dict[str
     try:
         if not getattr(g, "dls_enabled", False):
             return {}
+        game_id = getattr(g, "id", None)
+        if game_id is not None and int(getattr(g, "current_inning", 1) or 1) >= 2:
+            timeline = dls_par_timeline.sync(
+                str(game_id), g, str(base_dir) if base_dir is not None else ""
+            )
+            if timeline is not None:
+                balls_now = int(getattr(g, "overs_completed", 0) or 0) * 6 + int(
+                    getattr(g, "balls_this_over", 0) or 0
+                )
+                par_now = timeline.par_now(balls_now, int(getattr(g, "total_wickets", 0) or 0))
+                return {
+                    "method": "DLS",
+                    "target": timeline.target,
+                    "par": par_now,
+                    "ahead_by": int(getattr(g, "total_runs", 0)) - par_now,
+                }
         overs_limit_opt = cast(int | None, getattr(g, "overs_limit", None))
         if overs_limit_opt not in (20, 50):
             return {}
@@ -0,0 +1,305 @@
+"""
+Cached, parallel feature engineering for predictor retraining
+==============================================================
+
+`train_win_predictors.py` and `train_score_predictors.py` read one CSV per
+match from ``backend/snapshots/{format}/``. This module engineers features for
+each match independently in a process pool and stores the result as a
+per-match columnar cache (Parquet when ``pyarrow`` is available, pickle
+otherwise) keyed by a hash of the source file.
+
+On a rerun only matches whose CSV changed (or whose feature definition
+changed, see ``FEATURE_SET_VERSIONS``) are recomputed; everything else is read
+back from the cache. Wall time for every stage is reported on the result.
+
+Feature definitions mirror the ones the training scripts used with a
+``groupby("match_id").apply`` and are expressed as vectorised pandas
+operations over a single match frame.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+
+# pyarrow is optional; without it the cache falls back to pickled frames.
+try:
+    import pyarrow  # noqa: F401
+
+    _PARQUET_AVAILABLE = True
+except ImportError:
+    _PARQUET_AVAILABLE = False
+
+FeatureKind = Literal["win", "score"]
+
+# Bump a version whenever the corresponding feature definition changes so
+# existing cache entries are invalidated.
+FEATURE_SET_VERSIONS: dict[str, str] = {
+    "win": "win_features_v1",
+    "score": "score_features_v1",
+}
+
+_BACKEND_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_SNAPSHOTS_DIR = _BACKEND_DIR / "snapshots"
+DEFAULT_CACHE_DIR = _BACKEND_DIR / "feature_cache"
+
+_MANIFEST_NAME = "manifest.json"
+_HASH_BLOCK_SIZE = 1 << 20
+
+
+def _total_overs(match_format: str) -> int:
+    return 20 if match_format == "t20" else 50
+
+
+def engineer_win_features(df: pd.DataFrame, match_format: str) -> pd.DataFrame:
+    """Win-predictor features for the snapshots of a single match."""
+    df = df.copy()
+    total_overs = _total_overs(match_format)
+
+    df["over_progress"] = df["completed_overs"] / total_overs
+    df["balls_left"] = df["balls_remaining"]
+    df["wickets_left"] = 10 - df["wickets"]
+    df["run_rate"] = df["total_runs"] / df["completed_overs"].replace(0, 0.1)
+
+    runs = df["total_runs"]
+    delta = runs.diff().fillna(0)
+    df["run_rate_last_3"] = runs.diff(periods=min(3, len(df))).fillna(0) / 3
+    df["acceleration"] = df["run_rate"] - df["run_rate_last_3"]
+    df["dot_ratio_last_6"] = (delta == 0).rolling(6, min_periods=1).mean()
+    df["boundary_density_last_3"] = (delta >= 4).rolling(3, min_periods=1).mean()
+
+    df["runs_needed"] = df["final_score"] - df["total_runs"]
+    df["required_run_rate"] = df["runs_needed"] / (df["balls_remaining"] / 6).replace(0, 0.1)
+    df["wickets_per_over"] = df["wickets"] / df["completed_overs"].replace(0, 0.1)
+    df["runs_per_wicket"] = df["total_runs"] / df["wickets"].replace(0, 1)
+
+    return df.fillna(0)
+
+
+def engineer_score_features(df: pd.DataFrame, match_format: str) -> pd.DataFrame:
+    """Score-predictor features for the snapshots of a single match."""
+    df = df.copy()
+    total_overs = _total_overs(match_format)
+    phase_bins = [0, 6, 15, total_overs] if match_format == "t20" else [0, 10, 40, total_overs]
+
+    df["runs"] = df["total_runs"]
+    df["overs"] = df["completed_overs"]
+    df["run_rate"] = df["total_runs"] / df["completed_overs"].replace(0, 0.1)
+    df["balls_left"] = df["balls_remaining"]
+    df["wickets_left"] = 10 - df["wickets"]
+    df["match_phase_id"] = (
+        pd.cut(df["completed_overs"], bins=phase_bins, labels=[0, 1, 2], include_lowest=True)
+        .cat.codes.fillna(0)
+        .astype(int)
+    )
+
+    runs = df["total_runs"]
+    delta = runs.diff().fillna(0)
+    window_5 = min(5, len(df))
+    df["last_5_runs"] = runs.diff(periods=window_5).fillna(0)
+    df["dot_ratio_last_over"] = (delta == 0).rolling(6, min_periods=1).mean()
+
+    # Share of the last six snapshots' runs that came from singles and twos.
+    rotation_runs = delta.where(delta.between(1, 2), 0).rolling(6, min_periods=1).sum()
+    window_runs = delta.rolling(6, min_periods=1).sum()
+    df["strike_rotation_last_6"] = np.where(
+        window_runs > 0, rotation_runs / window_runs.where(window_runs > 0, 1), 0.0
+    )
+
+    df["run_rate_last_5"] = runs.diff(periods=window_5).fillna(0) / 5
+    df["boundary_ratio"] = (delta >= 4).rolling(10, min_periods=1).mean()
+    df["momentum"] = df["run_rate"].diff().fillna(0).rolling(3, min_periods=1).mean()
+    df["wickets_last_5"] = df["wickets"].diff(periods=window_5).fillna(0)
+    df["run_rate_variance"] = df["run_rate"].rolling(5, min_periods=1).std().fillna(0)
+
+    df["overs_remaining"] = df["balls_remaining"] / 6
+    df["wickets_per_over"] = df["wickets"] / df["completed_overs"].replace(0, 0.1)
+    df["runs_per_wicket"] = df["total_runs"] / df["wickets"].replace(0, 1)
+    df["balls_per_wicket"] = (df["completed_overs"] * 6) / df["wickets"].replace(0, 1)
+    df["in_powerplay"] = df["is_powerplay"]
+    df["projected_score_simple"] = df["total_runs"] + (df["run_rate"] * df["overs_remaining"])
+
+    return df.fillna(0)
+
+
+_FEATURE_BUILDERS: dict[str, Callable[[pd.DataFrame, str], pd.DataFrame]] = {
+    "win": engineer_win_features,
+    "score": engineer_score_features,
+}
+
+
+@dataclass
+class FeaturePipelineResult:
+    """Engineered features for one format plus cache and timing statistics."""
+
+    frame: pd.DataFrame
+    timings: dict[str, float] = field(default_factory=dict)
+    matches_total: int = 0
+    matches_computed: int = 0
+    matches_cached: int = 0
+    failed: dict[str, str] = field(default_factory=dict)
+
+    def report(self) -> str:
+        lines = [
+            f"  Matches: {self.matches_total} "
+            f"(computed {self.matches_computed}, cached {self.matches_cached}, "
+            f"failed {len(self.failed)})"
+        ]
+        for stage, seconds in self.timings.items():
+            lines.append(f"  {stage:.<30} {seconds:.2f}s")
+        return "\n".join(lines)
+
+
+def file_digest(path: Path, *, kind: FeatureKind) -> str:
+    """Cache key for one snapshot file: source bytes plus feature-set version."""
+    digest = hashlib.sha256(FEATURE_SET_VERSIONS[kind].encode("utf-8"))
+    with path.open("rb") as fh:
+        for block in iter(lambda: fh.read(_HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _cache_suffix() -> str:
+    return ".parquet" if _PARQUET_AVAILABLE else ".pkl"
+
+
+def _write_frame(df: pd.DataFrame, path: Path) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    if path.suffix == ".parquet":
+        df.to_parquet(tmp_path, index=False)
+    else:
+        df.to_pickle(tmp_path)
+    os.replace(tmp_path, path)
+
+
+def _read_frame(path: Path) -> pd.DataFrame:
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path)
+    return pd.read_pickle(path)
+
+
+def _engineer_match_file(
+    source: str, cache_path: str, kind: FeatureKind, match_format: str
+) -> tuple[str, int]:
+    """Process-pool task: read one match CSV, engineer features, write cache."""
+    df = pd.read_csv(source)
+    df["match_id"] = Path(source).stem
+    features = _FEATURE_BUILDERS[kind](df, match_format)
+    _write_frame(features, Path(cache_path))
+    return cache_path, len(features)
+
+
+def _load_manifest(path: Path) -> dict[str, dict[str, str]]:
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def build_feature_frame(
+    match_format: str,
+    kind: FeatureKind,
+    *,
+    snapshots_dir: Path | None = None,
+    cache_dir: Path | None = None,
+    max_workers: int | None = None,
+) -> FeaturePipelineResult:
+    """
+    Engineer features for every snapshot CSV of ``match_format``.
+
+    Args:
+        match_format: Snapshot sub-directory, e.g. 't20' or 'odi'
+        kind: Which feature set to build ('win' or 'score')
+        snapshots_dir: Root containing ``{match_format}/*.csv`` files
+        cache_dir: Root for cached feature files
+        max_workers: Process pool size; ``1`` runs inline (default: CPU count)
+
+    Returns:
+        FeaturePipelineResult with the concatenated frame (one row per snapshot,
+        ``match_id`` set to the CSV stem) and per-stage wall times
+
+    Raises:
+        ValueError: If no CSV files exist or no match could be processed
+    """
+    source_dir = (snapshots_dir or DEFAULT_SNAPSHOTS_DIR) / match_format
+    target_dir = (cache_dir or DEFAULT_CACHE_DIR) / kind / match_format
+    result = FeaturePipelineResult(frame=pd.DataFrame())
+
+    started = time.perf_counter()
+    csv_files = sorted(source_dir.glob("*.csv"))
+    if not csv_files:
+        raise ValueError(f"No CSV files found in {source_dir}")
+    target_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = target_dir / _MANIFEST_NAME
+    manifest = _load_manifest(manifest_path)
+
+    suffix = _cache_suffix()
+    current: dict[str, dict[str, str]] = {}
+    pending: list[tuple[str, Path, Path]] = []
+    for csv_path in csv_files:
+        digest = file_digest(csv_path, kind=kind)
+        cache_name = f"{csv_path.stem}.{digest[:16]}{suffix}"
+        entry = {"digest": digest, "file": cache_name}
+        current[csv_path.stem] = entry
+        cached = manifest.get(csv_path.stem)
+        if cached == entry and (target_dir / cache_name).exists():
+            continue
+        pending.append((csv_path.stem, csv_path, target_dir / cache_name))
+    result.timings["hash"] = time.perf_counter() - started
+    result.matches_total = len(csv_files)
+    result.matches_cached = len(csv_files) - len(pending)
+
+    started = time.perf_counter()
+    workers = max_workers or os.cpu_count() or 1
+    if pending and workers > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(pending))) as pool:
+            futures = {
+                stem: pool.submit(
+                    _engineer_match_file, str(csv_path), str(cache_path), kind, match_format
+                )
+                for stem, csv_path, cache_path in pending
+            }
+            for stem, future in futures.items():
+                try:
+                    future.result()
+                except Exception as exc:
+                    result.failed[stem] = str(exc)
+    else:
+        for stem, csv_path, cache_path in pending:
+            try:
+                _engineer_match_file(str(csv_path), str(cache_path), kind, match_format)
+            except Exception as exc:
+                result.failed[stem] = str(exc)
+    result.matches_computed = len(pending) - len(result.failed)
+    result.timings["engineer"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for stem in result.failed:
+        current.pop(stem, None)
+    # Drop cache files that no longer belong to any current source file.
+    live_files = {entry["file"] for entry in current.values()}
+    for stale in target_dir.glob(f"*{suffix}"):
+        if stale.name not in live_files:
+            stale.unlink(missing_ok=True)
+    manifest_path.write_text(json.dumps(current, indent=2, sort_keys=True), encoding="utf-8")
+
+    frames = [_read_frame(target_dir / current[stem]["file"]) for stem in sorted(current)]
+    if not frames:
+        raise ValueError(f"No match in {source_dir} could be processed")
+    result.frame = pd.concat(frames, ignore_index=True)
+    result.timings["load_cache"] = time.perf_counter() - started
+
+    return result
@@ -1,9 +1,22 @@
-"""Video chunking utilities for parallel GPU processing."""
+"""Video chunking utilities for parallel GPU processing.
+
+Chunk boundaries are aligned to keyframes when the container's keyframe index
+can be read (``probe_keyframes``). A chunk worker seeks to its start frame; when
+that frame is a keyframe the decoder starts there directly instead of decoding
+forward from the previous keyframe. Chunks are also sized evenly (the video is
+split into the fewest chunks of at most ``chunk_seconds``), so no worker is left
+with a short remainder while others process full chunks.
+"""
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import math
+import time
+from bisect import bisect_left
+from dataclasses import dataclass
+from itertools import pairwise
 from typing import Any
 
 import boto3
@@ -117,6 +130,189 @@ def create_chunk_specs(duration_seconds: float, chunk_seconds: int = 30) -> list
     return chunks
 
 
+# A boundary moves at most this fraction of the target chunk length to reach a keyframe
+KEYFRAME_MAX_SHIFT_FRACTION = 0.25
+
+
+@dataclass
+class KeyframeIndex:
+    """Keyframe frame numbers of a video's first video stream."""
+
+    fps: float
+    frame_count: int
+    keyframes: list[int]
+    probe_s: float = 0.0
+
+
+@dataclass
+class ChunkPlan:
+    """Chunk specs for a job and how they were planned."""
+
+    specs: list[dict[str, Any]]
+    method: str  # "keyframes" or "fixed"
+    chunk_seconds: int
+    fps: float | None = None
+    keyframes: int | None = None
+    probe_s: float = 0.0
+
+    def describe(self) -> dict[str, Any]:
+        """JSON-safe summary stored on the job as ``chunk_plan``."""
+        plan: dict[str, Any] = {
+            "method": self.method,
+            "chunk_seconds": self.chunk_seconds,
+            "chunks": len(self.specs),
+        }
+        if self.method == "keyframes":
+            plan.update(
+                {
+                    "fps": self.fps,
+                    "keyframes": self.keyframes,
+                    "aligned_starts": sum(1 for spec in self.specs if spec["keyframe_start"]),
+                    "start_frames": [spec["start_frame"] for spec in self.specs],
+                    "probe_s": round(self.probe_s, 3),
+                }
+            )
+        return plan
+
+
+def probe_keyframes(video_path: str) -> KeyframeIndex:
+    """Read the container's packets once, without decoding, and list its keyframes.
+
+    Packets are counted in decode order, which matches frame numbers for streams
+    without B-frame reordering (and for the keyframes of closed-GOP streams).
+
+    Raises:
+        ValueError: If the video cannot be opened or has no readable packets
+    """
+    started = time.perf_counter()
+    cap = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG, [cv2.CAP_PROP_FORMAT, -1])
+    try:
+        if not cap.isOpened():
+            raise ValueError(f"Could not open video: {video_path}")
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        keyframes: list[int] = []
+        frame_count = 0
+        while cap.grab():
+            if cap.get(cv2.CAP_PROP_LRF_HAS_KEY_FRAME):
+                keyframes.append(frame_count)
+            frame_count += 1
+    finally:
+        cap.release()
+
+    if fps <= 0 or frame_count <= 0:
+        raise ValueError(
+            f"Invalid video packets: fps={fps} frame_count={frame_count} path={video_path}"
+        )
+    return KeyframeIndex(
+        fps=fps,
+        frame_count=frame_count,
+        keyframes=keyframes,
+        probe_s=time.perf_counter() - started,
+    )
+
+
+def _nearest_keyframe(keyframes: list[int], frame: int) -> int | None:
+    i = bisect_left(keyframes, frame)
+    candidates = keyframes[max(0, i - 1) : i + 1]
+    return min(candidates, key=lambda k: abs(k - frame)) if candidates else None
+
+
+def plan_keyframe_chunks(
+    index: KeyframeIndex, chunk_seconds: int = 30, duration_seconds: float | None = None
+) -> ChunkPlan:
+    """Split a video into evenly sized chunks whose starts are keyframes where possible.
+
+    The video is cut into the fewest chunks of at most ``chunk_seconds``, with
+    boundaries spaced evenly; each boundary then moves to the nearest keyframe if
+    that is within ``KEYFRAME_MAX_SHIFT_FRACTION`` of a chunk. Boundaries without
+    a keyframe nearby stay where they are (the chunk's seek decodes forward from
+    the previous keyframe, as before).
+
+    Args:
+        index: Keyframe index from ``probe_keyframes``
+        chunk_seconds: Maximum target chunk duration
+        duration_seconds: Container duration; extends the last chunk if longer than
+            the probed frames
+
+    Returns:
+        ChunkPlan whose specs carry ``start_frame``/``end_frame`` and
+        ``keyframe_start`` next to the usual index/start_sec/end_sec
+    """
+    if chunk_seconds <= 0:
+        raise ValueError(f"Invalid chunk_seconds: {chunk_seconds}")
+
+    fps = index.fps
+    total = index.frame_count
+    chunk_count = max(1, math.ceil(total / (chunk_seconds * fps)))
+    max_shift = KEYFRAME_MAX_SHIFT_FRACTION * total / chunk_count
+    keyframes = sorted(set(index.keyframes))
+
+    boundaries = [0]
+    for i in range(1, chunk_count):
+        ideal = round(i * total / chunk_count)
+        keyframe = _nearest_keyframe(keyframes, ideal)
+        boundary = (
+            keyframe if keyframe is not None and abs(keyframe - ideal) <= max_shift else ideal
+        )
+        if boundaries[-1] < boundary < total:
+            boundaries.append(boundary)
+    boundaries.append(total)
+
+    keyframe_set = set(keyframes)
+    end_sec = max(total / fps, duration_seconds or 0.0)
+    specs = [
+        {
+            "index": i,
+            "start_sec": start / fps,
+            "end_sec": end / fps if i < len(boundaries) - 2 else end_sec,
+            "start_frame": start,
+            "end_frame": end,
+            "keyframe_start": start in keyframe_set,
+        }
+        for i, (start, end) in enumerate(pairwise(boundaries))
+    ]
+    return ChunkPlan(
+        specs=specs,
+        method="keyframes",
+        chunk_seconds=chunk_seconds,
+        fps=fps,
+        keyframes=len(keyframes),
+        probe_s=index.probe_s,
+    )
+
+
+def plan_video_chunks(
+    video_path: str, duration_seconds: float, chunk_seconds: int = 30
+) -> ChunkPlan:
+    """Plan a job's chunks: keyframe-aligned if possible, fixed windows otherwise.
+
+    ``CHUNK_KEYFRAME_ALIGN=false`` or a failed keyframe probe falls back to
+    ``create_chunk_specs``.
+    """
+    if settings.CHUNK_KEYFRAME_ALIGN:
+        try:
+            index = probe_keyframes(video_path)
+        except Exception as e:
+            logger.warning(
+                f"Keyframe probe failed, using fixed chunks: path={video_path} error={e}"
+            )
+        else:
+            if index.keyframes:
+                plan = plan_keyframe_chunks(index, chunk_seconds, duration_seconds)
+                logger.info(
+                    f"Planned {len(plan.specs)} keyframe-aligned chunks: "
+                    f"duration={duration_seconds:.2f}s keyframes={len(index.keyframes)} "
+                    f"probe_s={index.probe_s:.3f}"
+                )
+                return plan
+            logger.warning(f"No keyframes found, using fixed chunks: path={video_path}")
+    return ChunkPlan(
+        specs=create_chunk_specs(duration_seconds, chunk_seconds),
+        method="fixed",
+        chunk_seconds=chunk_seconds,
+    )
+
+
 async def check_chunk_artifact_exists(bucket: str, key: str) -> bool:
     """Check if chunk artifact exists in S3 (for idempotency).
 
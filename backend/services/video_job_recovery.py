@@ -57,7 +57,13 @@ def _job_reference_time(job: VideoAnalysisJob) -> datetime:
     if ts is None:
         return _now_utc()
     if ts.tzinfo is None:
-        return ts.replace(tzinfo=UTC)
+        ts = ts.replace(tzinfo=UTC)
+    # A live worker heartbeats while a long analysis runs; that counts as activity
+    heartbeat = job.heartbeat_at
+    if heartbeat is not None:
+        if heartbeat.tzinfo is None:
+            heartbeat = heartbeat.replace(tzinfo=UTC)
+        ts = max(ts, heartbeat)
     return ts
 
 
@@ -136,6 +142,10 @@ async def retry_video_analysis_job(
     job.status = VideoAnalysisJobStatus.queued
     job.stage = "QUEUED"
     job.progress_pct = 0
+    job.queued_at = current_time
+    job.queue_wait_seconds = None
+    job.pose_cache_hits = None
+    job.pose_cache_misses = None
     job.error_message = None
     job.sqs_message_id = None
     job.started_at = None
@@ -0,0 +1,118 @@
+"""
+Video Job Summary - per-session job summaries for video session listings.
+
+A session listing only shows how many analysis jobs a session has and the
+status/artifact flags of the latest one. Loading the jobs themselves pulls every
+results/findings/report JSON column (often megabytes per job), so summaries are
+computed in one windowed query that selects the summary columns and tests the
+JSON columns for content in SQL; no JSON document leaves the database.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from sqlalchemy import String, Text, and_, cast, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.sql_app.models import VideoAnalysisJob, VideoAnalysisJobStatus
+
+# Job columns whose content means analysis results exist
+JOB_RESULT_FIELDS = (
+    "results",
+    "quick_results",
+    "deep_results",
+    "quick_findings",
+    "deep_findings",
+    "quick_results_s3_key",
+    "deep_results_s3_key",
+)
+JOB_REPORT_FIELDS = ("quick_report", "deep_report")
+
+# Serialised JSON values Python treats as empty (the API's ``bool(value)`` check)
+_EMPTY_JSON_TEXTS = ("null", "{}", "[]", '""', "0", "false")
+
+
+@dataclass(frozen=True)
+class LatestJobSummary:
+    """Summary columns of a session's latest analysis job."""
+
+    id: str
+    status: VideoAnalysisJobStatus
+    created_at: dt.datetime | None
+    completed_at: dt.datetime | None
+    results_available: bool
+    report_available: bool
+    pdf_available: bool
+
+
+@dataclass(frozen=True)
+class SessionJobSummary:
+    """How many analysis jobs a session has, and its latest one."""
+
+    job_count: int
+    latest_job: LatestJobSummary
+
+
+def _has_content(field: str):
+    column = getattr(VideoAnalysisJob, field)
+    if isinstance(column.type, String):
+        return and_(column.is_not(None), column != "")
+    return and_(column.is_not(None), cast(column, Text).not_in(_EMPTY_JSON_TEXTS))
+
+
+async def load_session_job_summaries(
+    db: AsyncSession, session_ids: Iterable[str]
+) -> dict[str, SessionJobSummary]:
+    """Job count and latest-job summary for each session that has jobs."""
+    session_ids = list(session_ids)
+    if not session_ids:
+        return {}
+
+    rank = (
+        func.row_number()
+        .over(
+            partition_by=VideoAnalysisJob.session_id,
+            order_by=(
+                VideoAnalysisJob.created_at.desc().nulls_last(),
+                VideoAnalysisJob.updated_at.desc(),
+                VideoAnalysisJob.id,
+            ),
+        )
+        .label("rank")
+    )
+    ranked = (
+        select(
+            VideoAnalysisJob.session_id,
+            VideoAnalysisJob.id,
+            VideoAnalysisJob.status,
+            VideoAnalysisJob.created_at,
+            VideoAnalysisJob.completed_at,
+            or_(*(_has_content(field) for field in JOB_RESULT_FIELDS)).label("results_available"),
+            or_(*(_has_content(field) for field in JOB_REPORT_FIELDS)).label("report_available"),
+            _has_content("pdf_s3_key").label("pdf_available"),
+            func.count().over(partition_by=VideoAnalysisJob.session_id).label("job_count"),
+            rank,
+        )
+        .where(VideoAnalysisJob.session_id.in_(session_ids))
+        .subquery()
+    )
+    result = await db.execute(select(ranked).where(ranked.c.rank == 1))
+
+    return {
+        row.session_id: SessionJobSummary(
+            job_count=row.job_count,
+            latest_job=LatestJobSummary(
+                id=row.id,
+                status=row.status,
+                created_at=row.created_at,
+                completed_at=row.completed_at,
+                results_available=bool(row.results_available),
+                report_available=bool(row.report_available),
+                pdf_available=bool(row.pdf_available),
+            ),
+        )
+        for row in result
+    }
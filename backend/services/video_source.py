@@ -0,0 +1,89 @@
+"""
+Video Source - let workers decode S3 videos without downloading them first.
+
+``s3.download_file`` has to finish before the first frame is decoded, and every
+chunk worker used to fetch the whole video even though it analyses one slice.
+``presign_video_stream`` instead returns a presigned GET URL that OpenCV's
+FFmpeg backend opens directly. FFmpeg reads it with HTTP range requests:
+
+- decoding starts after the container header/index has been fetched,
+- a seek (e.g. a chunk worker jumping to ``start_sec``) starts a new ranged read
+  at the target offset, so bytes before the window are never transferred,
+- the read stops when the capture is released at the end of the window.
+
+``S3_ENDPOINT_URL`` points the client at an S3-compatible endpoint (MinIO, a
+local stand-in in tests) instead of AWS.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, cast
+
+import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def worker_s3_client() -> Any:
+    """S3 client for worker reads of job videos and their derived artifacts."""
+    endpoint_url = settings.S3_ENDPOINT_URL or None
+    # SigV4 presigns work with temporary credentials (see S3Service); custom
+    # endpoints are addressed path-style since they rarely have bucket subdomains
+    config = Config(
+        signature_version="s3v4",
+        s3={"addressing_style": "path"} if endpoint_url else None,
+    )
+    return cast(
+        Any,
+        boto3.client(
+            "s3", region_name=settings.AWS_REGION, endpoint_url=endpoint_url, config=config
+        ),
+    )
+
+
+async def presign_video_stream(*, bucket: str, key: str, context: str = "") -> str:
+    """Return a presigned URL the decoder can stream ``s3://bucket/key`` from.
+
+    The object is checked with a HEAD request first, so a missing video fails
+    here with the S3 error instead of later as an unreadable capture.
+
+    Args:
+        bucket: S3 bucket name
+        key: S3 object key
+        context: Extra ``name=value`` text for log lines (job/chunk id)
+
+    Raises:
+        ClientError: S3 operation failed (re-raised after logging)
+    """
+    loop = asyncio.get_running_loop()
+
+    def _presign() -> str:
+        s3 = worker_s3_client()
+        try:
+            head = s3.head_object(Bucket=bucket, Key=key)
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "Unknown")
+            request_id = e.response.get("ResponseMetadata", {}).get("RequestId", "N/A")
+            logger.error(
+                f"S3 stream setup failed: bucket={bucket} key={key} "
+                f"error_code={error_code} request_id={request_id} {context}"
+            )
+            raise
+        logger.info(
+            f"Streaming video from S3: bucket={bucket} key={key} "
+            f"file_size_bytes={head.get('ContentLength')} {context}"
+        )
+        return s3.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": bucket, "Key": key},
+            ExpiresIn=int(settings.COACH_PLUS_VIDEO_STREAM_URL_EXPIRES_SECONDS),
+            HttpMethod="GET",
+        )
+
+    return await loop.run_in_executor(None, _presign)
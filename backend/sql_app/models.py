@@ -2380,6 +2380,11 @@ class VideoSession(Base):
         nullable=True,
         comment="4 corner points for pitch homography: [{x, y}, {x, y}, {x, y}, {x, y}]",
     )
+    pitch_homography: Mapped[list[list[float]] | None] = mapped_column(
+        JSON,
+        nullable=True,
+        comment="3x3 pixel-to-pitch homography computed from pitch_corners when saved",
+    )
 
     # Status tracking
     status: Mapped[VideoSessionStatus] = mapped_column(
@@ -2493,6 +2498,11 @@ class VideoAnalysisJob(Base):
         nullable=True,
         comment="Video duration in seconds",
     )
+    chunk_plan: Mapped[dict[str, Any] | None] = mapped_column(
+        JSON,
+        nullable=True,
+        comment="How GPU chunks were planned (method, keyframe-aligned start frames)",
+    )
 
     # Analysis configuration
     analysis_mode: Mapped[str | None] = mapped_column(
@@ -2601,6 +2611,18 @@ class VideoAnalysisJob(Base):
     created_at: Mapped[dt.datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
+    queued_at: Mapped[dt.datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True, comment="When the job last entered the queue"
+    )
+    queue_wait_seconds: Mapped[float | None] = mapped_column(
+        Float, nullable=True, comment="Seconds spent queued before a worker claimed the job"
+    )
+    pose_cache_hits: Mapped[int | None] = mapped_column(
+        Integer, nullable=True, comment="Analysis passes served from the pose cache (last run)"
+    )
+    pose_cache_misses: Mapped[int | None] = mapped_column(
+        Integer, nullable=True, comment="Analysis passes that ran pose extraction (last run)"
+    )
     started_at: Mapped[dt.datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True, comment="When processing started"
     )
@@ -2621,6 +2643,11 @@ class VideoAnalysisJob(Base):
     deep_completed_at: Mapped[dt.datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True, comment="When deep stage completed"
     )
+    heartbeat_at: Mapped[dt.datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Last worker heartbeat while the job was running",
+    )
     updated_at: Mapped[dt.datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
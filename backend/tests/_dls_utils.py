@@ -0,0 +1,22 @@
+"""DLS test helpers: write resource CSVs where ``dls.load_env`` looks for them."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from backend.services.dls import resources as dls_resources
+
+
+def write_icc_tables(base_dir: Path) -> Path:
+    """Write the bundled ICC grids as ``{base_dir}/static/dls/{t20,odi}.csv``."""
+    dls_dir = base_dir / "static" / "dls"
+    dls_dir.mkdir(parents=True, exist_ok=True)
+    header = "overs_remaining," + ",".join(f"w{w}" for w in range(dls_resources.WICKET_COLUMNS))
+    for kind, overs in (("t20", 20), ("odi", 50)):
+        rows = dls_resources.international_grid(overs).over_rows()
+        lines = [header] + [
+            f"{overs_left}," + ",".join(repr(value) for value in row)
+            for overs_left, row in enumerate(rows)
+        ]
+        (dls_dir / f"{kind}.csv").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return base_dir
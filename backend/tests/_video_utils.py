@@ -0,0 +1,138 @@
+"""Synthetic clips and a stand-in MediaPipe detector for video pipeline tests."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import numpy as np
+import pytest
+
+
+def real_cv2() -> Any:
+    """The real OpenCV module, even if another test module stubbed ``sys.modules["cv2"]``."""
+    current = sys.modules.get("cv2")
+    if current is None or getattr(current, "__file__", None):
+        import cv2
+
+        return cv2
+    # The stub replaced an already-imported package; its submodules still hold the real one.
+    for name in ("cv2.typing", "cv2.mat_wrapper"):
+        package = getattr(sys.modules.get(name), "cv2", None)
+        if getattr(package, "__file__", None):
+            return package
+    if any(name.startswith("cv2.") for name in sys.modules):
+        pytest.skip("cv2 is stubbed and the real OpenCV package is unreachable")
+    # Never imported for real: load it without disturbing the stub other tests rely on.
+    del sys.modules["cv2"]
+    try:
+        import cv2
+
+        return cv2
+    finally:
+        sys.modules["cv2"] = current
+
+
+def frame_value(index: int) -> int:
+    """Grey level painted into frame ``index`` (recoverable after MJPG encoding)."""
+    return (index % 100) * 2 + 20
+
+
+def write_test_video(
+    path: Path, *, seconds: float, fps: float = 30.0, size: tuple[int, int] = (64, 48)
+) -> Path:
+    """Write an MJPG clip whose frame ``i`` is a flat image of ``frame_value(i)``."""
+    cv2 = real_cv2()
+
+    width, height = size
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), fps, (width, height))
+    try:
+        for i in range(round(seconds * fps)):
+            writer.write(np.full((height, width, 3), frame_value(i), dtype=np.uint8))
+    finally:
+        writer.release()
+    return path
+
+
+def delivery_position(t: float, size: tuple[int, int] = (1280, 720)) -> tuple[float, float]:
+    """Ball centre at ``t`` seconds: rises briefly, drops under gravity, bounces once."""
+    width, height = size
+    ground = height * 0.8
+    x = width * 0.08 + width * 0.35 * t
+    y = height * 0.3 - 150.0 * t + 0.5 * 900.0 * t * t
+    if y > ground:
+        # Reflect about the ground with 60% restitution
+        y = ground - (y - ground) * 0.6
+    return x, y
+
+
+def write_delivery_clip(
+    path: Path,
+    *,
+    seconds: float = 2.0,
+    fps: float = 30.0,
+    size: tuple[int, int] = (1280, 720),
+    radius: int = 10,
+) -> Path:
+    """Write an MJPG clip of a red ball on a green field following ``delivery_position``."""
+    cv2 = real_cv2()
+
+    width, height = size
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), fps, (width, height))
+    try:
+        for i in range(round(seconds * fps)):
+            frame = np.empty((height, width, 3), dtype=np.uint8)
+            frame[:] = (40, 140, 40)
+            x, y = delivery_position(i / fps, size)
+            cv2.circle(frame, (round(x), round(y)), radius, (0, 0, 230), -1)
+            writer.write(frame)
+    finally:
+        writer.release()
+    return path
+
+
+class FakeDetector:
+    """Records every detect call and returns one synthetic pose per frame."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[int | None, float]] = []
+        self.closed = False
+
+    def _result(self, image: Any, timestamp_ms: int | None) -> Any:
+        level = float(np.asarray(image.data).mean())
+        self.calls.append((timestamp_ms, level))
+        landmark = SimpleNamespace(x=level / 255.0, y=0.5, z=0.0, visibility=0.9)
+        return SimpleNamespace(pose_landmarks=[[landmark] * 33])
+
+    def detect_for_video(self, image: Any, timestamp_ms: int) -> Any:
+        return self._result(image, timestamp_ms)
+
+    def detect(self, image: Any) -> Any:
+        return self._result(image, None)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def fake_pose_dependencies(detectors: list[FakeDetector] | None = None):
+    """Return a replacement for ``pose_service._import_cv2_and_mediapipe`` (real cv2)."""
+    cv2 = real_cv2()
+
+    created = detectors if detectors is not None else []
+
+    def _factory() -> FakeDetector:
+        detector = FakeDetector()
+        created.append(detector)
+        return detector
+
+    mp = SimpleNamespace(
+        Image=lambda image_format, data: SimpleNamespace(data=data),
+        ImageFormat=SimpleNamespace(SRGB=1),
+    )
+
+    def _import():
+        return cv2, mp, _factory, lambda: "/fake/model.task", lambda: "detect_for_video"
+
+    return _import
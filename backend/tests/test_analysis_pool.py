@@ -0,0 +1,160 @@
+"""Off-loop analysis execution: progress marshalling, cancellation, heartbeat."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from backend.workers.analysis_pool import AnalysisCancelled, AnalysisPool, Reporter
+
+
+def _count(reporter, *, n):
+    for i in range(n):
+        reporter.send("progress", i)
+    return n * 10
+
+
+def _fail(reporter):
+    reporter.send("progress", 0)
+    raise ValueError("decode failed")
+
+
+def _spin(reporter, *, started, stopped):
+    started.set()
+    try:
+        while True:
+            reporter.check()
+            time.sleep(0.01)
+    except AnalysisCancelled:
+        stopped.set()
+        raise
+
+
+@pytest.mark.asyncio
+async def test_events_are_delivered_on_the_loop_in_order():
+    pool = AnalysisPool(processes=0)
+    loop_thread = threading.get_ident()
+    events = []
+
+    def _on_event(kind, value):
+        assert threading.get_ident() == loop_thread
+        events.append((kind, value))
+
+    result = await pool.run(_count, on_event=_on_event, n=50)
+
+    assert result == 500
+    assert events == [("progress", i) for i in range(50)]
+
+
+@pytest.mark.asyncio
+async def test_process_pool_runs_and_reports():
+    pool = AnalysisPool(processes=1)
+    events = []
+    try:
+        result = await pool.run(_count, on_event=lambda kind, i: events.append(i), n=5)
+    finally:
+        await asyncio.to_thread(pool.shutdown)
+
+    assert result == 50
+    assert events == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_errors_propagate_to_the_caller():
+    pool = AnalysisPool(processes=0)
+
+    with pytest.raises(ValueError, match="decode failed"):
+        await pool.run(_fail)
+
+
+@pytest.mark.asyncio
+async def test_cancelling_the_caller_stops_the_analysis():
+    pool = AnalysisPool(processes=0)
+    started, stopped = threading.Event(), threading.Event()
+
+    task = asyncio.create_task(pool.run(_spin, started=started, stopped=stopped))
+    assert await asyncio.to_thread(started.wait, 5)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert stopped.is_set()
+
+
+class _CancelAfter:
+    """Cancel flag that turns on at its ``checks``-th poll."""
+
+    def __init__(self, checks):
+        self.checks = checks
+        self.polls = 0
+
+    def is_set(self):
+        self.polls += 1
+        return self.polls >= self.checks
+
+
+def test_ball_tracking_stops_mid_video_once_cancelled(monkeypatch, tmp_path):
+    from backend.services import ball_tracking_service
+    from backend.tests._video_utils import real_cv2, write_delivery_clip
+    from backend.workers import analysis_worker
+
+    monkeypatch.setattr(ball_tracking_service, "_import_cv2", real_cv2)
+    clip = str(write_delivery_clip(tmp_path / "delivery.avi", seconds=2.0, fps=30.0))
+    sampled = []
+    track = ball_tracking_service.BallTracker.track_ball_in_video
+
+    def _track(self, *args, on_frame, **kwargs):
+        def _counting(count):
+            sampled.append(count)
+            on_frame(count)
+
+        return track(self, *args, on_frame=_counting, **kwargs)
+
+    monkeypatch.setattr(ball_tracking_service.BallTracker, "track_ball_in_video", _track)
+    cancel = _CancelAfter(checks=3)
+
+    with pytest.raises(AnalysisCancelled):
+        analysis_worker._track_ball(Reporter(None, cancel), video_path=clip, sample_fps=30.0)
+
+    # Checked before starting, then every BALL_TRACKING_CHECK_FRAMES sampled frames
+    assert cancel.polls == 3
+    assert sampled[-1] == 2 * analysis_worker.BALL_TRACKING_CHECK_FRAMES < 60
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_stamps_job_and_forwards_progress(db_session, test_video_session):
+    from backend.services.video_job_recovery import mark_stale_video_analysis_jobs
+    from backend.sql_app.models import VideoAnalysisJob, VideoAnalysisJobStatus
+    from backend.workers import analysis_worker
+
+    job = VideoAnalysisJob(
+        session_id=test_video_session.id,
+        status=VideoAnalysisJobStatus.deep_running,
+        stage="DEEP_RUNNING",
+        progress_pct=50,
+        sample_fps=10,
+        include_frames=False,
+        deep_started_at=datetime.now(UTC) - timedelta(hours=2),
+    )
+    db_session.add(job)
+    await db_session.commit()
+    job_id = job.id
+
+    await analysis_worker._beat(job_id, analysis_worker._JobRun(progress_pct=73, quick_done=True))
+    # Progress never moves backwards
+    await analysis_worker._beat(job_id, analysis_worker._JobRun(progress_pct=60, quick_done=True))
+
+    db_session.expire_all()
+    job = await db_session.get(VideoAnalysisJob, job_id)
+    assert job.heartbeat_at is not None
+    assert job.progress_pct == 73
+
+    # The stage started long ago, but the live heartbeat keeps the job from going stale
+    assert await mark_stale_video_analysis_jobs(db_session, stale_after_seconds=1800) == []
+    db_session.expire_all()
+    job = await db_session.get(VideoAnalysisJob, job_id)
+    assert job.status == VideoAnalysisJobStatus.deep_running
@@ -461,17 +461,18 @@ class TestBallTrackerIntegration:
             mock_cv2.CAP_PROP_FPS: 30.0,
         }.get(prop, 0)
 
-        # Mock frame reading (simulate 5 frames)
+        # Mock frame decoding (simulate 5 frames; sampled frames are grabbed then retrieved)
         frame_count = [0]
 
-        def read_side_effect():
+        def grab_side_effect():
             if frame_count[0] < 5:
                 frame_count[0] += 1
-                # Return mock frame (numpy array)
-                return True, np.zeros((480, 640, 3), dtype=np.uint8)
-            return False, None
+                return True
+            return False
 
-        mock_cap.read.side_effect = read_side_effect
+        mock_cap.grab.side_effect = grab_side_effect
+        # Return mock frame (numpy array)
+        mock_cap.retrieve.return_value = (True, np.zeros((480, 640, 3), dtype=np.uint8))
 
         # Mock contour detection (simulate ball found in some frames)
         mock_cv2.findContours.return_value = ([], None)
@@ -549,3 +550,92 @@ class TestEdgeCases:
         bounce_idx = tracker._find_bounce_point(positions)
 
         assert bounce_idx is None
+
+
+# ============================================================================
+# Kalman (predicted-window) tracking
+# ============================================================================
+
+
+class TestKalmanTracking:
+    """Kalman mode follows the ball in a predicted window and agrees with detect mode."""
+
+    @pytest.fixture
+    def cv2(self, monkeypatch):
+        from backend.services import ball_tracking_service
+        from backend.tests._video_utils import real_cv2
+
+        cv2 = real_cv2()
+        monkeypatch.setattr(ball_tracking_service, "_import_cv2", lambda: cv2)
+        return cv2
+
+    def test_filter_converges_under_constant_acceleration(self):
+        from backend.services.ball_tracking_service import BallKalmanFilter
+
+        dt = 1 / 30
+
+        def position(t):
+            return 100.0 + 400.0 * t, 200.0 - 150.0 * t + 450.0 * t * t
+
+        kalman = BallKalmanFilter(*position(0.0))
+        for i in range(1, 20):
+            kalman.predict(dt)
+            kalman.update(*position(i * dt))
+
+        predicted = kalman.predict(dt)
+        expected = position(20 * dt)
+        assert predicted[0] == pytest.approx(expected[0], abs=1.0)
+        assert predicted[1] == pytest.approx(expected[1], abs=1.0)
+        assert kalman.velocity[0] == pytest.approx(400.0, rel=0.05)
+
+    def test_rejects_invalid_tracking_mode(self):
+        with pytest.raises(ValueError, match="Unsupported tracking mode"):
+            BallTracker(tracking_mode="optical-flow")
+
+    def test_matches_detect_mode_release_and_bounce(self, cv2, tmp_path):
+        from backend.tests._video_utils import write_delivery_clip
+
+        clip = str(write_delivery_clip(tmp_path / "delivery.avi"))
+
+        detect = BallTracker(tracking_mode="detect").track_ball_in_video(clip, sample_fps=30.0)
+        kalman = BallTracker(tracking_mode="kalman").track_ball_in_video(clip, sample_fps=30.0)
+
+        assert kalman.tracking_mode == "kalman"
+        assert kalman.processing_fps > 0
+        assert kalman.detected_frames == detect.detected_frames
+        assert kalman.release_point.frame_num == detect.release_point.frame_num
+        assert kalman.bounce_point is not None
+        assert kalman.bounce_point.frame_num == detect.bounce_point.frame_num
+        for a, b in zip(kalman.positions, detect.positions, strict=True):
+            assert a.x == pytest.approx(b.x, abs=1.0)
+            assert a.y == pytest.approx(b.y, abs=1.0)
+
+    def test_searches_full_frames_only_to_acquire(self, cv2):
+        from backend.services.ball_tracking_service import _PredictiveSearch
+        from backend.tests._video_utils import delivery_position
+
+        size = (1280, 720)
+        search = _PredictiveSearch(BallTracker(tracking_mode="kalman"), max_width=None)
+        found = []
+        for i in range(30):
+            frame = np.empty((size[1], size[0], 3), dtype=np.uint8)
+            frame[:] = (40, 140, 40)
+            x, y = delivery_position(i / 30, size)
+            cv2.circle(frame, (round(x), round(y)), 10, (0, 0, 230), -1)
+            found.append(search.step(frame, i, i / 30))
+
+        assert all(position is not None for position in found)
+        assert search.full_searches == 1
+        assert search.window_searches == 29
+
+    def test_downscaled_search_reports_video_pixels(self, cv2):
+        frame = np.empty((1080, 1920, 3), dtype=np.uint8)
+        frame[:] = (40, 140, 40)
+        cv2.circle(frame, (1500, 600), 12, (0, 0, 230), -1)
+
+        position = BallTracker()._detect_ball_in_frame(frame, 0, 0.0, max_width=640)
+
+        assert position is not None
+        assert position.x == pytest.approx(1500, abs=3)
+        assert position.y == pytest.approx(600, abs=3)
+        assert position.radius == pytest.approx(12, abs=3)
@@ -0,0 +1,93 @@
+"""Batch ball tracking: concurrent clips, streamed results, incremental consistency."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from backend.services import ball_tracking_service
+from backend.services.ball_tracking_batch import track_deliveries
+from backend.services.ball_tracking_service import (
+    BallPosition,
+    BallTrajectory,
+    DeliveryConsistency,
+    analyze_multiple_deliveries,
+)
+from backend.tests._video_utils import real_cv2, write_delivery_clip
+
+
+@pytest.fixture
+def clips(tmp_path, monkeypatch):
+    cv2 = real_cv2()
+    monkeypatch.setattr(ball_tracking_service, "_import_cv2", lambda: cv2)
+    return [
+        write_delivery_clip(tmp_path / f"delivery_{i}.avi", seconds=1.5 + 0.1 * i, size=(640, 360))
+        for i in range(3)
+    ]
+
+
+def _trajectory(release_x, release_y, velocity):
+    trajectory = BallTrajectory(positions=[])
+    trajectory.release_point = BallPosition(0, 0.0, release_x, release_y, 0.9, 10.0)
+    trajectory.avg_velocity = velocity
+    return trajectory
+
+
+def test_incremental_consistency_matches_batch_statistics():
+    rng = np.random.default_rng(3)
+    trajectories = [
+        _trajectory(*rng.normal([300, 200], 4), float(rng.normal(900, 40))) for _ in range(12)
+    ]
+    trajectories.append(BallTrajectory(positions=[]))  # no release point detected
+
+    consistency = DeliveryConsistency()
+    for trajectory in trajectories:
+        consistency.add(trajectory)
+    summary = consistency.summary()
+
+    released = trajectories[:-1]
+    assert summary["delivery_count"] == 13
+    assert summary["release_variance_x"] == pytest.approx(
+        np.var([t.release_point.x for t in released])
+    )
+    assert summary["avg_release_y"] == pytest.approx(np.mean([t.release_point.y for t in released]))
+    assert summary["velocity_variance"] == pytest.approx(
+        np.var([t.avg_velocity for t in trajectories])
+    )
+    assert analyze_multiple_deliveries(trajectories) == summary
+
+
+def test_inline_batch_streams_results_and_reports_failures(clips, tmp_path):
+    consistency = DeliveryConsistency()
+    paths = [*clips, tmp_path / "missing.avi"]
+
+    results = list(track_deliveries(paths, max_workers=0, consistency=consistency))
+
+    assert [r.index for r in results] == [0, 1, 2, 3]
+    assert results[3].trajectory is None
+    assert results[3].error
+    for result in results[:3]:
+        assert result.error is None
+        assert result.trajectory.release_point is not None
+        assert result.metrics is not None
+    assert consistency.summary()["delivery_count"] == 3
+
+
+def test_process_pool_batch_matches_inline_tracking(clips):
+    inline = {r.index: r for r in track_deliveries(clips, max_workers=0)}
+
+    consistency = DeliveryConsistency()
+    pooled = list(
+        track_deliveries(clips, max_workers=2, tasks_per_worker=1, consistency=consistency)
+    )
+
+    assert sorted(r.index for r in pooled) == [0, 1, 2]
+    for result in pooled:
+        expected = inline[result.index].trajectory
+        assert result.error is None
+        assert result.trajectory.detected_frames == expected.detected_frames
+        assert result.trajectory.release_point.frame_num == expected.release_point.frame_num
+        assert result.trajectory.bounce_point.frame_num == expected.bounce_point.frame_num
+    assert consistency.summary() == pytest.approx(
+        analyze_multiple_deliveries([inline[i].trajectory for i in range(3)])
+    )
@@ -0,0 +1,102 @@
+"""Chunk aggregation: concurrent artifact downloads merged in chunk order."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from backend.services import chunk_aggregation
+from backend.services.pose_artifact import PoseArrays, PoseArraysBuffer, dumps_pose_npz
+
+
+def _chunk(index):
+    frame = {"frame_num": index, "timestamp": index / 30, "detected": False, "landmarks": None}
+    return (
+        SimpleNamespace(
+            id=f"c{index}",
+            artifact_s3_key=f"chunks/chunk_{index:04d}.npz",
+            start_sec=index * 30.0,
+            end_sec=(index + 1) * 30.0,
+        ),
+        dumps_pose_npz(PoseArrays.from_frames([frame])),
+    )
+
+
+@pytest.mark.asyncio
+async def test_downloads_overlap_but_chunks_arrive_in_order(monkeypatch):
+    chunks, bodies = zip(*[_chunk(i) for i in range(6)], strict=True)
+    objects = {c.artifact_s3_key: body for c, body in zip(chunks, bodies, strict=True)}
+    in_flight = peak = 0
+
+    async def _download(bucket, key):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Earlier chunks are slower, so completion order is the reverse of chunk order
+        await asyncio.sleep(0.05 * (6 - int(key[-8:-4])) / 6)
+        in_flight -= 1
+        return objects[key]
+
+    monkeypatch.setattr(chunk_aggregation, "_download_bytes_from_s3", _download)
+
+    started = time.perf_counter()
+    order = [
+        int(poses.frame_num[0])
+        async for poses in chunk_aggregation._iter_chunk_poses("bucket", chunks, 3)
+    ]
+
+    assert order == list(range(6))
+    assert peak == 3
+    # Two overlapping windows, not six sequential downloads (~0.175 s)
+    assert time.perf_counter() - started < 0.15
+
+
+@pytest.mark.asyncio
+async def test_missing_artifact_fails_before_downloading(monkeypatch):
+    chunk, _ = _chunk(0)
+    missing = SimpleNamespace(id="c1", artifact_s3_key=None, status=SimpleNamespace(value="failed"))
+    downloads = []
+
+    async def _download(bucket, key):
+        downloads.append(key)
+        return b""
+
+    monkeypatch.setattr(chunk_aggregation, "_download_bytes_from_s3", _download)
+
+    with pytest.raises(ValueError, match="missing artifact_s3_key"):
+        async for _ in chunk_aggregation._iter_chunk_poses("bucket", [chunk, missing], 4):
+            pass
+    assert downloads == []
+
+
+@pytest.mark.asyncio
+async def test_chunks_are_merged_while_later_ones_download(monkeypatch):
+    chunks, bodies = zip(*[_chunk(i) for i in range(6)], strict=True)
+    objects = {c.artifact_s3_key: body for c, body in zip(chunks, bodies, strict=True)}
+    in_flight = 0
+    appended_while = []
+
+    async def _download(bucket, key):
+        nonlocal in_flight
+        in_flight += 1
+        await asyncio.sleep(0.01 * (1 + int(key[-8:-4])))
+        in_flight -= 1
+        return objects[key]
+
+    append = PoseArraysBuffer.append
+
+    def _append(self, poses):
+        appended_while.append(in_flight)
+        append(self, poses)
+
+    monkeypatch.setattr(chunk_aggregation, "_download_bytes_from_s3", _download)
+    monkeypatch.setattr(PoseArraysBuffer, "append", _append)
+
+    merged = await chunk_aggregation._merge_chunk_poses("bucket", chunks, 3)
+
+    assert merged.frame_num.tolist() == list(range(6))
+    # The first chunks were merged with the following downloads still running
+    assert appended_while[0] > 0
@@ -0,0 +1,133 @@
+"""Tests for the incrementally maintained DLS par timeline."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from backend import dls as dlsmod
+from backend.services import dls_par_timeline
+from backend.tests._dls_utils import write_icc_tables
+
+
+@pytest.fixture
+def base_dir(tmp_path):
+    return str(write_icc_tables(tmp_path))
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    dls_par_timeline.clear_cache()
+    yield
+    dls_par_timeline.clear_cache()
+
+
+def _ball(runs=1, extra=None, wicket=False):
+    return {
+        "inning": 2,
+        "runs_off_bat": 0 if extra else runs,
+        "extra_runs": runs if extra else 0,
+        "extra_type": extra,
+        "is_wicket": wicket,
+        "dismissal_type": "bowled" if wicket else None,
+    }
+
+
+def _game():
+    first = [{"inning": 1, "runs_scored": 1, "runs_off_bat": 1} for _ in range(120)]
+    return SimpleNamespace(
+        id="g1",
+        overs_limit=20,
+        current_inning=2,
+        first_inning_summary={"runs": 160},
+        deliveries=first,
+        interruptions=[],
+    )
+
+
+def _reference_par(g, balls, wickets, base_dir):
+    """The snapshot's original full recomputation."""
+    env = dlsmod.load_env("t20", base_dir)
+    R1 = dlsmod.total_resources_team1(
+        env=env, max_overs_initial=20, deliveries=g.deliveries, interruptions=[]
+    )
+    left = max(0.0, 20 - (balls // 6 + (balls % 6) / 6.0))
+    used = max(0.0, env.table.R(20, 0) - env.table.R(left, wickets))
+    return dlsmod.par_score_now(S1=160, R1_total=R1, R2_used_so_far=used)
+
+
+def test_timeline_extends_incrementally_and_matches_full_recompute(base_dir):
+    g = _game()
+    script = [_ball(4), _ball(0, wicket=True), _ball(1, extra="wd"), _ball(6)] * 9
+    runs = wickets = balls = 0
+    for i, d in enumerate(script):
+        g.deliveries.append(d)
+        tl = dls_par_timeline.sync("g1", g, base_dir)
+        if d["extra_type"] != "wd":
+            balls += 1
+        runs += d["runs_off_bat"] + d["extra_runs"]
+        wickets += int(d["is_wicket"])
+
+        assert tl.processed == len(g.deliveries), i
+        assert tl.balls_bowled == balls
+        assert tl.runs[-1] == runs
+        assert tl.par_now() == _reference_par(g, balls, wickets, base_dir)
+
+    assert dls_par_timeline.sync("g1", g, base_dir) is tl
+    chart = tl.chart()
+    assert len(chart["par"]) == len(chart["runs"]) == balls + 1
+    assert chart["ahead_by"][-1] == runs - chart["par"][-1]
+
+
+def test_chase_reduction_only_changes_par_from_its_ball_onward(base_dir):
+    g = _game()
+    for _ in range(30):
+        g.deliveries.append(_ball(1))
+    tl = dls_par_timeline.sync("g1", g, base_dir)
+    before = list(tl.par)
+    target_before = tl.target
+
+    g.overs_limit = 15
+    g.interruptions = [
+        {"at_delivery_index": 135, "new_overs_limit": 15, "previous_overs_limit": 20}
+    ]
+    tl = dls_par_timeline.sync("g1", g, base_dir)
+
+    assert tl.format_overs == 20
+    assert tl.par[:16] == before[:16]
+    assert tl.target < target_before
+    # At the reduction itself par is continuous; it changes for balls bowled after.
+    for _ in range(6):
+        g.deliveries.append(_ball(1))
+    tl = dls_par_timeline.sync("g1", g, base_dir)
+    assert tl.par[15] == before[15]
+    assert tl.par[-1] != _reference_par(g, 21, 0, base_dir)
+
+
+def test_rewritten_tail_triggers_rebuild(base_dir):
+    g = _game()
+    g.deliveries.extend([_ball(1), _ball(1)])
+    dls_par_timeline.sync("g1", g, base_dir)
+
+    g.deliveries[-1] = _ball(0, wicket=True)
+    tl = dls_par_timeline.sync("g1", g, base_dir)
+    assert tl.wickets[-1] == 1
+    assert tl.par_now() == _reference_par(g, 2, 1, base_dir)
+
+    g.deliveries.pop()
+    tl = dls_par_timeline.sync("g1", g, base_dir)
+    assert tl.balls_bowled == 1
+
+
+def test_missing_table_means_no_timeline(tmp_path):
+    g = _game()
+    g.deliveries.append(_ball(4))
+
+    assert dls_par_timeline.sync("g1", g, str(tmp_path)) is None
+
+
+def test_first_innings_has_no_timeline(base_dir):
+    g = _game()
+    g.current_inning = 1
+    assert dls_par_timeline.sync("g1", g, base_dir) is None
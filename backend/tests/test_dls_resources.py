@@ -0,0 +1,108 @@
+"""Tests for the process-wide DLS resource grids."""
+
+from __future__ import annotations
+
+import dataclasses
+
+import numpy as np
+import pytest
+
+import dls as dlsmod
+from backend.services.dls import DLSTable, load_international_table
+from backend.services.dls import resources as dls_resources
+from backend.tests._dls_utils import write_icc_tables
+
+
+def test_international_grid_is_loaded_once_per_process():
+    first = dls_resources.international_grid(20)
+    second = dls_resources.international_grid(20)
+
+    assert first is second
+    assert first.values.shape == (121, 10)
+    assert not first.values.flags.writeable
+
+
+def test_vectorised_lookup_matches_scalar_lookup():
+    grid = dls_resources.international_grid(50)
+    overs = np.array([50.0, 37.5, 20.0, 10.0 + 1 / 6, 0.0])
+    wickets = np.array([0, 2, 5, 9, 3])
+
+    vector = grid.R(overs, wickets)
+
+    assert isinstance(vector, np.ndarray)
+    assert vector.tolist() == [grid.R(o, w) for o, w in zip(overs, wickets, strict=True)]
+
+
+def test_lookup_broadcasts_to_scenario_grid():
+    grid = dls_resources.international_grid(20)
+    overs = np.arange(21, dtype=float)[:, None]
+    wickets = np.arange(10)[None, :]
+
+    table = grid.R(overs, wickets)
+
+    assert table.shape == (21, 10)
+    assert np.all(np.diff(table, axis=0) >= 0)  # more overs left -> more resources
+    assert np.all(np.diff(table, axis=1) <= 0)  # more wickets down -> fewer resources
+
+
+def test_ball_lookup_clamps_inputs():
+    grid = dls_resources.international_grid(20)
+
+    assert grid.R_balls(500, 0) == grid.R_balls(120, 0)
+    assert grid.R_balls(-3, 12) == grid.R_balls(0, 9)
+
+
+def test_env_is_loaded_from_the_csv_once_and_shared_read_only(tmp_path):
+    base_dir = str(write_icc_tables(tmp_path))
+    env = dlsmod.load_env("t20", base_dir)
+    table = load_international_table(20)
+
+    assert dlsmod.load_env("t20", base_dir) is env
+    assert env.table.grid is dls_resources.csv_grid(
+        str((tmp_path / "static" / "dls" / "t20.csv").resolve())
+    )
+    assert table.resource(balls_left=60, wickets_lost=3) == pytest.approx(env.table.R(10, 3))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        env.G = 1.0  # type: ignore[misc]
+    with pytest.raises(AttributeError):
+        env.table.grid = dls_resources.international_grid(50)  # type: ignore[misc]
+
+
+def test_missing_csv_still_raises():
+    with pytest.raises(dlsmod.DLSMissingTable):
+        dlsmod.load_env("t20", "/nonexistent-base-dir")
+    with pytest.raises(FileNotFoundError):
+        dlsmod.load_env("odi", "/nonexistent-base-dir")
+
+
+def test_over_rows_are_interpolated_to_ball_resolution():
+    rows = [[0.0] * 10, [60.0] * 10, [100.0] * 10]
+    grid = dls_resources.grid_from_over_rows(rows)
+
+    assert grid.max_balls == 12
+    assert grid.R_balls(3, 0) == pytest.approx(30.0)
+    assert grid.R(1.5, 4) == pytest.approx(80.0)
+    assert grid.R(0.0, 0) == 0.0
+
+
+def test_csv_table_is_cached(tmp_path):
+    header = "overs_remaining," + ",".join(f"w{w}" for w in range(10))
+    lines = [header] + [f"{o}," + ",".join([str(o * 10.0)] * 10) for o in range(3)]
+    csv_path = tmp_path / "t20.csv"
+    csv_path.write_text("\n".join(lines), encoding="utf-8")
+
+    first = dlsmod.ResourceTable.from_csv(str(csv_path))
+    second = dlsmod.ResourceTable.from_csv(str(csv_path))
+
+    assert first.grid is second.grid
+    assert first.max_overs == 2
+    assert first.R(1.5, 0) == pytest.approx(15.0)
+
+
+def test_missing_wicket_column_still_rejected():
+    columns = {w: [float(b) for b in range(121)] for w in range(9)}
+    partial = DLSTable(20, columns)
+
+    assert partial.resource(balls_left=10, wickets_lost=0) == 10.0
+    with pytest.raises(ValueError):
+        partial.resource(balls_left=10, wickets_lost=9)
@@ -0,0 +1,142 @@
+"""Tests for the cached DLS what-if scenario tables."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from backend import dls as dlsmod
+from backend.services import dls_scenarios, live_bus
+from backend.tests._dls_utils import write_icc_tables
+
+
+@pytest.fixture
+def base_dir(tmp_path):
+    return str(write_icc_tables(tmp_path))
+
+
+class _RecordingSio:
+    def __init__(self):
+        self.events = []
+
+    async def emit(self, event, data, *, room=None, namespace=None):
+        self.events.append((event, data, room))
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    dls_scenarios.clear_cache()
+    yield
+    dls_scenarios.clear_cache()
+
+
+def _chase(overs_completed=7, balls_this_over=3, wickets=2, overs_limit=20):
+    first = [{"inning": 1, "runs_scored": 1, "is_wicket": False} for _ in range(120)]
+    second = [{"inning": 2, "runs_scored": 1, "is_wicket": False} for _ in range(45)]
+    return SimpleNamespace(
+        overs_limit=overs_limit,
+        current_inning=2,
+        first_inning_summary={"runs": 168},
+        deliveries=first + second,
+        interruptions=[],
+        overs_completed=overs_completed,
+        balls_this_over=balls_this_over,
+        total_wickets=wickets,
+    )
+
+
+def test_table_matches_scalar_revised_target(base_dir):
+    g = _chase()
+    payload, changed = dls_scenarios.get_scenarios("g1", g, base_dir)
+    assert changed
+
+    env = dlsmod.load_env("t20", base_dir)
+    state = dls_scenarios.chase_state(g, env)
+    R = env.table.R
+
+    assert payload["interruption_points"][0] == {"balls": 45, "over": "7.3"}
+    assert payload["interruption_points"][1]["balls"] == 48
+    assert payload["wickets"] == list(range(2, 10))
+    assert payload["overs_lost"] == list(range(1, 13))
+
+    for p_idx, point in enumerate(payload["interruption_points"]):
+        left = 20 - point["balls"] / 6.0
+        for w_idx, w in enumerate(payload["wickets"]):
+            used = R(20, 0) - R(left, w)
+            assert payload["par"][p_idx][w_idx] == dlsmod.par_score_now(
+                S1=168, R1_total=state.R1_total, R2_used_so_far=used
+            )
+            for l_idx, lost in enumerate(payload["overs_lost"]):
+                cell = payload["targets"][p_idx][l_idx][w_idx]
+                if lost >= left:
+                    assert cell is None
+                    continue
+                r2 = used + R(left - lost, w)
+                assert cell == dlsmod.revised_target(S1=168, R1_total=state.R1_total, R2_total=r2)
+
+
+def test_table_is_cached_per_ledger_version(base_dir):
+    g = _chase()
+    first, _ = dls_scenarios.get_scenarios("g1", g, base_dir)
+    again, changed = dls_scenarios.get_scenarios("g1", g, base_dir)
+    assert again is first
+    assert not changed
+
+    g.deliveries.append({"inning": 2, "runs_scored": 4, "is_wicket": False})
+    g.balls_this_over = 4
+    updated, changed = dls_scenarios.get_scenarios("g1", g, base_dir)
+    assert changed
+    assert updated["version"] != first["version"]
+    assert updated["interruption_points"][0]["balls"] == 46
+
+
+def test_corrections_before_the_ledger_tip_need_invalidate(base_dir):
+    g = _chase()
+    g.first_inning_summary = None  # S1 is summed from the ledger
+    first, _ = dls_scenarios.get_scenarios("g1", g, base_dir)
+
+    g.deliveries[10] = {"inning": 1, "runs_scored": 6, "is_wicket": False}
+    assert dls_scenarios.ledger_version(g) == first["version"]
+
+    dls_scenarios.invalidate("g1")
+    corrected, changed = dls_scenarios.get_scenarios("g1", g, base_dir)
+    assert changed
+    assert corrected["par"] != first["par"]
+
+
+def test_missing_table_is_unavailable(tmp_path):
+    with pytest.raises(dls_scenarios.ScenarioUnavailable):
+        dls_scenarios.get_scenarios("g1", _chase(), str(tmp_path))
+
+
+def test_first_innings_is_rejected(base_dir):
+    g = _chase()
+    g.current_inning = 1
+    with pytest.raises(dls_scenarios.ScenarioUnavailable):
+        dls_scenarios.get_scenarios("g1", g, base_dir)
+
+
+async def test_changes_are_pushed_only_for_tracked_games(base_dir):
+    sio = _RecordingSio()
+    live_bus.set_socketio_server(sio)
+    try:
+        g = _chase()
+        await dls_scenarios.publish_scenarios_if_tracked("g1", g, base_dir)
+        assert sio.events == []
+
+        dls_scenarios.get_scenarios("g1", g, base_dir)
+        await dls_scenarios.publish_scenarios_if_tracked("g1", g, base_dir)
+        assert sio.events == []  # unchanged ledger
+
+        g.deliveries.append({"inning": 2, "runs_scored": 0, "is_wicket": True})
+        g.balls_this_over = 4
+        g.total_wickets = 3
+        await dls_scenarios.publish_scenarios_if_tracked("g1", g, base_dir)
+
+        assert len(sio.events) == 1
+        event, data, room = sio.events[0]
+        assert (event, room) == ("dls:scenarios", "g1")
+        assert data["scenarios"]["wickets"][0] == 3
+    finally:
+        live_bus._sio_server = None
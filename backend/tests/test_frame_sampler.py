@@ -0,0 +1,125 @@
+"""Decode-skipping frame sampler shared by pose extraction and ball tracking."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("cv2")
+
+from backend.services.frame_sampler import DecodePipeline, FrameSampler
+from backend.tests._video_utils import frame_value, real_cv2, write_test_video
+
+
+@pytest.fixture
+def clip(tmp_path):
+    return write_test_video(tmp_path / "clip.avi", seconds=10.0, fps=30.0)
+
+
+def _sample(clip, **kwargs):
+    cv2 = real_cv2()
+    cap = cv2.VideoCapture(str(clip))
+    try:
+        sampler = FrameSampler(cv2, cap, **kwargs)
+        frames = [(n, float(frame.mean())) for n, frame in sampler]
+    finally:
+        cap.release()
+    return sampler, frames
+
+
+def test_only_sampled_frames_are_retrieved(clip):
+    sampler, frames = _sample(clip, frame_interval=6, seek_gap=None)
+
+    assert [n for n, _ in frames] == list(range(0, 300, 6))
+    for frame_num, level in frames:
+        assert level == pytest.approx(frame_value(frame_num), abs=2)
+    assert sampler.stats.retrieved == 50
+    assert sampler.stats.grabbed == 49 * 5 + 5  # gaps between samples + tail grabbed to EOF
+    assert sampler.stats.seeks == 0
+    assert sampler.position == 300
+
+
+def test_range_end_stops_without_decoding_the_tail(clip):
+    sampler, frames = _sample(clip, frame_interval=10, start_frame=95, end_frame=151, seek_gap=None)
+
+    assert [n for n, _ in frames] == [100, 110, 120, 130, 140, 150]
+    assert sampler.stats.grabbed == 5 + 5 * 9
+    assert sampler.position == 151
+
+
+def test_sparse_sampling_seeks_to_the_same_frames(clip):
+    _, grabbed = _sample(clip, frame_interval=60, seek_gap=None)
+    sampler, seeked = _sample(clip, frame_interval=60, seek_gap=30)
+
+    assert [n for n, _ in seeked] == [0, 60, 120, 180, 240]
+    for (n, level), (m, expected) in zip(seeked, grabbed, strict=True):
+        assert n == m
+        assert level == pytest.approx(expected, abs=1)
+    assert sampler.stats.seeks >= 4
+    assert sampler.stats.grabbed < 10
+
+
+def test_ball_tracker_retrieves_only_sampled_frames(clip, monkeypatch):
+    from backend.services import ball_tracking_service
+
+    cv2 = real_cv2()
+    monkeypatch.setattr(ball_tracking_service, "_import_cv2", lambda: cv2)
+    seen = []
+    tracker = ball_tracking_service.BallTracker()
+    monkeypatch.setattr(
+        tracker, "_detect_ball_in_frame", lambda frame, n, t, **kw: seen.append((n, t)) and None
+    )
+
+    trajectory = tracker.track_ball_in_video(str(clip), sample_fps=5.0)
+
+    assert [n for n, _ in seen] == list(range(0, 300, 6))
+    assert seen[1][1] == pytest.approx(0.2)
+    assert trajectory.total_frames == 300
+
+
+def test_pipeline_yields_prepared_frames_in_order(clip):
+    cv2 = real_cv2()
+    cap = cv2.VideoCapture(str(clip))
+    try:
+        sampler = FrameSampler(cv2, cap, frame_interval=15)
+        with DecodePipeline(sampler, lambda f: float(f.mean()), maxsize=2) as pipeline:
+            frames = list(pipeline)
+    finally:
+        cap.release()
+
+    assert [n for n, _ in frames] == list(range(0, 300, 15))
+    for frame_num, level in frames:
+        assert level == pytest.approx(frame_value(frame_num), abs=2)
+    assert pipeline.timings.decode_s > 0
+    assert pipeline.timings.preprocess_s > 0
+
+
+def test_pipeline_reraises_producer_errors(clip):
+    cv2 = real_cv2()
+    cap = cv2.VideoCapture(str(clip))
+
+    def _prepare(frame):
+        raise RuntimeError("bad frame")
+
+    try:
+        with (
+            pytest.raises(RuntimeError, match="bad frame"),
+            DecodePipeline(FrameSampler(cv2, cap, frame_interval=30), _prepare) as pipeline,
+        ):
+            list(pipeline)
+    finally:
+        cap.release()
+
+
+def test_leaving_the_pipeline_early_joins_the_decode_thread(clip):
+    cv2 = real_cv2()
+    cap = cv2.VideoCapture(str(clip))
+    try:
+        sampler = FrameSampler(cv2, cap, frame_interval=1)
+        with DecodePipeline(sampler, lambda f: f, maxsize=1) as pipeline:
+            for frame_num, _ in pipeline:
+                if frame_num == 3:
+                    break
+        assert not pipeline._thread.is_alive()
+        assert sampler.position < 10
+    finally:
+        cap.release()
@@ -0,0 +1,235 @@
+"""Job progress push: hub fan-out, the job event stream, cached presigned URLs."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections import OrderedDict
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from backend.services import job_progress, job_wakeup
+from backend.services import s3_service as s3_service_mod
+from backend.services.job_progress import JobProgressHub, publish_job_progress
+from backend.services.job_wakeup import JOB_PROGRESS_TOPIC, WakeupChannel
+from backend.sql_app.models import VideoAnalysisJob, VideoAnalysisJobStatus
+
+
+@pytest.fixture
+def hub(monkeypatch):
+    monkeypatch.setattr(job_wakeup, "_channel", WakeupChannel())
+    hub = JobProgressHub()
+    monkeypatch.setattr(job_progress, "_hub", hub)
+    return hub
+
+
+def _events(body: str) -> list[dict]:
+    return [
+        json.loads(line.removeprefix("data: "))
+        for line in body.splitlines()
+        if line.startswith("data: ")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_published_snapshots_reach_only_their_jobs_subscribers(hub):
+    await hub.ensure_started()
+    await hub.ensure_started()  # one listener per channel
+    first, other = hub.subscribe("job-1"), hub.subscribe("job-2")
+
+    await publish_job_progress({"job_id": "job-1", "status": "deep_running", "progress_pct": 40})
+    job_wakeup.get_wakeup_channel()._deliver(JOB_PROGRESS_TOPIC, "not json")
+
+    assert first.get_nowait()["progress_pct"] == 40
+    assert first.empty() and other.empty()
+
+    hub.unsubscribe("job-1", first)
+    hub.unsubscribe("job-2", other)
+    assert hub._subscribers == {}
+
+
+@pytest.mark.asyncio
+async def test_slow_subscribers_keep_the_latest_snapshots(hub):
+    queue = hub.subscribe("job-1")
+    for pct in range(job_progress.SUBSCRIBER_QUEUE_SIZE + 5):
+        hub.dispatch(json.dumps({"job_id": "job-1", "progress_pct": pct}))
+
+    assert queue.qsize() == job_progress.SUBSCRIBER_QUEUE_SIZE
+    assert queue.get_nowait()["progress_pct"] == 5
+
+
+@pytest.mark.asyncio
+async def test_publishing_is_skipped_when_disabled_or_not_broadcast(hub, monkeypatch):
+    from backend.config import settings
+
+    await hub.ensure_started()
+    queue = hub.subscribe("job-1")
+
+    monkeypatch.setattr(settings, "COACH_PLUS_JOB_PROGRESS_PUSH", False)
+    await publish_job_progress({"job_id": "job-1"})
+    monkeypatch.setattr(settings, "COACH_PLUS_JOB_PROGRESS_PUSH", True)
+    monkeypatch.setattr(job_wakeup.get_wakeup_channel(), "broadcasts", False)
+    await publish_job_progress({"job_id": "job-1"})
+
+    assert queue.empty()
+
+
+async def _job(db_session, session_id, status, **fields):
+    job = VideoAnalysisJob(
+        session_id=session_id, status=status, sample_fps=10, include_frames=False, **fields
+    )
+    db_session.add(job)
+    await db_session.commit()
+    return job.id
+
+
+@pytest.mark.asyncio
+async def test_event_stream_ends_after_the_snapshot_of_a_finished_job(
+    hub, async_client, db_session, auth_headers, other_auth_headers, test_video_session
+):
+    job_id = await _job(
+        db_session, test_video_session.id, VideoAnalysisJobStatus.done, progress_pct=100
+    )
+
+    resp = await async_client.get(
+        f"/api/coaches/plus/analysis-jobs/{job_id}/events", headers=auth_headers
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    assert _events(resp.text) == [
+        {
+            "job_id": job_id,
+            "status": "done",
+            "stage": None,
+            "progress_pct": 100,
+            "completed_chunks": 0,
+            "total_chunks": None,
+        }
+    ]
+    assert hub._subscribers == {}
+
+    resp = await async_client.get(
+        f"/api/coaches/plus/analysis-jobs/{job_id}/events", headers=other_auth_headers
+    )
+    assert resp.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_event_stream_relays_worker_progress_until_done(
+    hub, async_client, db_session, auth_headers, test_video_session
+):
+    job_id = await _job(
+        db_session,
+        test_video_session.id,
+        VideoAnalysisJobStatus.deep_running,
+        stage="DEEP",
+        progress_pct=40,
+    )
+
+    request = asyncio.create_task(
+        async_client.get(f"/api/coaches/plus/analysis-jobs/{job_id}/events", headers=auth_headers)
+    )
+    for _ in range(100):
+        if job_id in hub._subscribers:
+            break
+        await asyncio.sleep(0.01)
+    await publish_job_progress({"job_id": job_id, "progress_pct": 70})
+    await publish_job_progress({"job_id": job_id, "status": "done", "progress_pct": 100})
+    resp = await asyncio.wait_for(request, 5)
+
+    events = _events(resp.text)
+    assert [e["progress_pct"] for e in events] == [40, 70, 100]
+    assert events[0]["stage"] == "DEEP" and events[-1]["status"] == "done"
+
+
+@pytest.mark.asyncio
+async def test_event_stream_of_a_stale_job_ends_as_failed(
+    hub, async_client, db_session, auth_headers, test_video_session
+):
+    long_ago = datetime.now(UTC) - timedelta(hours=3)
+    job_id = await _job(
+        db_session,
+        test_video_session.id,
+        VideoAnalysisJobStatus.deep_running,
+        deep_started_at=long_ago,
+        heartbeat_at=long_ago,
+    )
+
+    resp = await async_client.get(
+        f"/api/coaches/plus/analysis-jobs/{job_id}/events", headers=auth_headers
+    )
+
+    (event,) = _events(resp.text)
+    assert event["status"] == "failed" and event["stage"] == "STALE_ORPHANED"
+    assert hub._subscribers == {}
+
+
+@pytest.mark.asyncio
+async def test_event_stream_releases_its_session_and_notices_a_dead_worker(
+    hub, async_client, db_session, auth_headers, test_video_session, monkeypatch
+):
+    from backend.config import settings
+
+    monkeypatch.setattr(settings, "COACH_PLUS_JOB_PROGRESS_KEEPALIVE_SECONDS", 0.05)
+    job_id = await _job(
+        db_session,
+        test_video_session.id,
+        VideoAnalysisJobStatus.deep_running,
+        deep_started_at=datetime.now(UTC),
+        heartbeat_at=datetime.now(UTC),
+        progress_pct=40,
+    )
+
+    request = asyncio.create_task(
+        async_client.get(f"/api/coaches/plus/analysis-jobs/{job_id}/events", headers=auth_headers)
+    )
+    for _ in range(100):
+        if job_id in hub._subscribers:
+            break
+        await asyncio.sleep(0.01)
+    # The request's session was closed before streaming started
+    assert not db_session.in_transaction()
+    await asyncio.sleep(0.2)  # keepalives: the heartbeat is fresh, the stream stays open
+    assert not request.done()
+
+    # The worker stops heartbeating long enough for the job to go stale
+    job = await db_session.get(VideoAnalysisJob, job_id)
+    job.deep_started_at = job.heartbeat_at = datetime.now(UTC) - timedelta(hours=3)
+    await db_session.commit()
+    resp = await asyncio.wait_for(request, 5)
+
+    events = _events(resp.text)
+    assert [e["status"] for e in events] == ["deep_running", "failed"]
+    assert ": keepalive" in resp.text
+    assert hub._subscribers == {}
+
+
+def test_presigned_urls_are_reused_until_close_to_expiry(monkeypatch):
+    calls = []
+
+    class _FakeS3Service:
+        def generate_presigned_get_url(self, bucket, key, expires_in=None):
+            calls.append((bucket, key, expires_in))
+            return f"https://example.invalid/{key}?n={len(calls)}"
+
+    service = _FakeS3Service()
+    clock = [1000.0]
+    monkeypatch.setattr(s3_service_mod, "_get_s3_service", lambda: service)
+    monkeypatch.setattr(s3_service_mod, "_presigned_url_cache", OrderedDict())
+    monkeypatch.setattr(s3_service_mod.time, "monotonic", lambda: clock[0])
+
+    url, remaining = s3_service_mod.cached_presigned_get_url("bucket", "a.mp4", 3600)
+    assert remaining == 3600
+
+    clock[0] += 1000
+    assert s3_service_mod.cached_presigned_get_url("bucket", "a.mp4", 3600) == (url, 2600)
+    assert len(calls) == 1
+
+    # Inside the refresh margin (300 s here) a new URL is minted
+    clock[0] += 2400
+    refreshed, remaining = s3_service_mod.cached_presigned_get_url("bucket", "a.mp4", 3600)
+    assert refreshed != url and remaining == 3600
+
+    s3_service_mod.cached_presigned_get_url("bucket", "b.mp4", 3600)
+    assert calls == [("bucket", "a.mp4", 3600)] * 2 + [("bucket", "b.mp4", 3600)]
@@ -0,0 +1,138 @@
+"""Concurrent job slots: fast lane for short clips, in-flight video budget, queue wait."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import os
+import signal
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from backend.workers.job_scheduler import UNKNOWN_DURATION_ESTIMATE_SECONDS, JobScheduler
+
+
+def test_fast_lane_slot_is_kept_for_short_clips():
+    scheduler = JobScheduler(slots=3, fast_lane_seconds=120, max_inflight_seconds=math.inf)
+
+    assert scheduler.claim_limit() == math.inf
+    scheduler.start("long-1", 2400)
+    assert scheduler.claim_limit() == math.inf
+    scheduler.start("long-2", 1800)
+    # Two long sessions fill the regular slots; the last one only takes short clips
+    assert scheduler.claim_limit() == 120
+    scheduler.start("short", 30)
+    assert scheduler.claim_limit() is None
+
+    scheduler.finish("long-1")
+    assert scheduler.claim_limit() == math.inf
+
+
+def test_inflight_budget_bounds_the_next_claim():
+    scheduler = JobScheduler(slots=4, fast_lane_seconds=60, max_inflight_seconds=3000)
+
+    scheduler.start("a", 2000)
+    assert scheduler.claim_limit() == 1000
+    scheduler.start("b", None)  # unknown duration is costed conservatively
+    assert scheduler.inflight["b"] == UNKNOWN_DURATION_ESTIMATE_SECONDS
+    assert scheduler.claim_limit() == 1000 - UNKNOWN_DURATION_ESTIMATE_SECONDS
+
+
+def test_single_job_is_always_admitted():
+    scheduler = JobScheduler(slots=1, fast_lane_seconds=60, max_inflight_seconds=100)
+
+    assert scheduler.fast_lane_slots == 0
+    assert scheduler.claim_limit() == math.inf
+    scheduler.start("huge", 10_000)
+    assert scheduler.claim_limit() is None
+
+
+async def _add_job(db, session, *, duration, age_minutes):
+    from backend.sql_app.models import VideoAnalysisJob, VideoAnalysisJobStatus
+
+    job = VideoAnalysisJob(
+        session_id=session.id,
+        status=VideoAnalysisJobStatus.queued,
+        stage="QUEUED",
+        sample_fps=10,
+        include_frames=False,
+        video_duration_seconds=duration,
+        created_at=datetime.now(UTC) - timedelta(minutes=age_minutes),
+        queued_at=datetime.now(UTC) - timedelta(minutes=age_minutes),
+    )
+    db.add(job)
+    await db.commit()
+    return job.id
+
+
+@pytest.mark.asyncio
+async def test_claim_respects_duration_limit_and_records_queue_wait(db_session, test_video_session):
+    from backend.sql_app.models import VideoAnalysisJob
+    from backend.workers.analysis_worker import _claim_one_job
+
+    long_id = await _add_job(db_session, test_video_session, duration=2400, age_minutes=10)
+    short_id = await _add_job(db_session, test_video_session, duration=30, age_minutes=5)
+
+    assert await _claim_one_job(max_duration_seconds=120) == short_id
+    assert await _claim_one_job(max_duration_seconds=120) is None
+    assert await _claim_one_job(max_duration_seconds=math.inf) == long_id
+
+    db_session.expire_all()
+    job = await db_session.get(VideoAnalysisJob, long_id)
+    assert job.queue_wait_seconds == pytest.approx(600, abs=30)
+
+
+@pytest.mark.asyncio
+async def test_worker_runs_short_clip_alongside_long_session(
+    monkeypatch, db_session, test_video_session
+):
+    from backend.workers import analysis_worker
+
+    long_1 = await _add_job(db_session, test_video_session, duration=2400, age_minutes=3)
+    long_2 = await _add_job(db_session, test_video_session, duration=2400, age_minutes=2)
+    short = await _add_job(db_session, test_video_session, duration=30, age_minutes=1)
+
+    started: list[str] = []
+    release = asyncio.Event()
+
+    async def _process(job_id):
+        started.append(job_id)
+        await release.wait()
+
+    async def _no_aggregation():
+        return None
+
+    class _Engine:
+        async def dispose(self):
+            pass
+
+    def _no_aws(*args, **kwargs):
+        raise RuntimeError("no AWS in tests")
+
+    monkeypatch.setattr(analysis_worker, "_process_job", _process)
+    monkeypatch.setattr(analysis_worker, "_check_and_aggregate_chunks", _no_aggregation)
+    monkeypatch.setattr(analysis_worker, "get_engine", _Engine)
+    monkeypatch.setattr(analysis_worker.boto3, "client", _no_aws)
+    monkeypatch.setattr(analysis_worker.settings, "COACH_PLUS_WORKER_SLOTS", 2)
+    monkeypatch.setattr(analysis_worker.settings, "COACH_PLUS_FAST_LANE_SECONDS", 120.0)
+
+    async def _wait_for_starts(n):
+        for _ in range(500):
+            if len(started) >= n:
+                return
+            await asyncio.sleep(0.01)
+
+    worker = asyncio.create_task(analysis_worker.run_worker_loop(poll_seconds=0.01))
+    try:
+        await _wait_for_starts(2)
+        await asyncio.sleep(0.1)
+        # The second long session waits; the short clip takes the fast-lane slot
+        assert started == [long_1, short]
+
+        release.set()
+        await _wait_for_starts(3)
+        assert started == [long_1, short, long_2]
+    finally:
+        os.kill(os.getpid(), signal.SIGTERM)
+        await asyncio.wait_for(worker, 10)
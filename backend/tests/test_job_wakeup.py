@@ -0,0 +1,108 @@
+"""Event-driven job claiming: wake-up channel, idle back-off, worker wake-ups."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import signal
+import threading
+import time
+
+import pytest
+
+from backend.services.job_wakeup import JOBS_TOPIC, IdleBackoff, WakeupChannel, publish_wakeup
+
+
+def test_idle_backoff_doubles_up_to_the_cap_and_resets():
+    backoff = IdleBackoff(1.0, 5.0)
+
+    assert [backoff.next_delay() for _ in range(5)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+    backoff.reset()
+    assert backoff.next_delay() == 1.0
+
+
+@pytest.mark.asyncio
+async def test_wait_times_out_without_a_wakeup():
+    channel = WakeupChannel()
+
+    assert await channel.wait(JOBS_TOPIC, 0.01) is False
+
+
+@pytest.mark.asyncio
+async def test_publish_wakes_a_waiter_immediately():
+    channel = WakeupChannel()
+    await channel.start([JOBS_TOPIC])
+
+    waiter = asyncio.create_task(channel.wait(JOBS_TOPIC, 30))
+    await asyncio.sleep(0)
+    started = time.perf_counter()
+    await channel.publish(JOBS_TOPIC, "job-1")
+
+    assert await waiter is True
+    assert time.perf_counter() - started < 1
+    # The wake-up is consumed
+    assert await channel.wait(JOBS_TOPIC, 0.01) is False
+
+
+@pytest.mark.asyncio
+async def test_publish_from_another_event_loop_wakes_the_waiter():
+    channel = WakeupChannel()
+    await channel.start([JOBS_TOPIC])
+
+    waiter = asyncio.create_task(channel.wait(JOBS_TOPIC, 30))
+    await asyncio.sleep(0)
+    # e.g. the API running on the test client's loop in another thread
+    publisher = threading.Thread(target=asyncio.run, args=(channel.publish(JOBS_TOPIC),))
+    publisher.start()
+    publisher.join()
+
+    assert await asyncio.wait_for(waiter, 5) is True
+
+
+@pytest.mark.asyncio
+async def test_worker_claims_as_soon_as_a_job_is_published(
+    monkeypatch, db_session, test_video_session
+):
+    from backend.sql_app.models import VideoAnalysisJob, VideoAnalysisJobStatus
+    from backend.workers import analysis_worker
+
+    claimed = asyncio.Event()
+
+    async def _process(job_id):
+        claimed.set()
+
+    async def _no_aggregation():
+        return None
+
+    class _Engine:
+        async def dispose(self):
+            pass
+
+    def _no_aws(*args, **kwargs):
+        raise RuntimeError("no AWS in tests")
+
+    monkeypatch.setattr(analysis_worker, "_process_job", _process)
+    monkeypatch.setattr(analysis_worker, "_check_and_aggregate_chunks", _no_aggregation)
+    monkeypatch.setattr(analysis_worker, "get_engine", _Engine)
+    monkeypatch.setattr(analysis_worker.boto3, "client", _no_aws)
+
+    # The safety-net poll is far longer than the test: only a wake-up can trigger the claim
+    worker = asyncio.create_task(analysis_worker.run_worker_loop(poll_seconds=60))
+    try:
+        await asyncio.sleep(0.2)  # idle and waiting
+        db_session.add(
+            VideoAnalysisJob(
+                session_id=test_video_session.id,
+                status=VideoAnalysisJobStatus.queued,
+                stage="QUEUED",
+                sample_fps=10,
+                include_frames=False,
+            )
+        )
+        await db_session.commit()
+        await publish_wakeup(JOBS_TOPIC)
+
+        await asyncio.wait_for(claimed.wait(), 5)
+    finally:
+        os.kill(os.getpid(), signal.SIGTERM)
+        await asyncio.wait_for(worker, 10)
@@ -18,6 +18,7 @@ def test_get_pose_landmarker_returns_new_instance():
     with (
         patch("backend.mediapipe_init.get_model_path") as mock_path,
         patch("backend.mediapipe_init.get_running_mode") as mock_mode,
+        patch("backend.mediapipe_init.load_model_asset", return_value=b"model"),
         patch("mediapipe.tasks.python.vision.PoseLandmarker") as mock_landmarker_class,
     ):
         mock_path.return_value = "/fake/model.task"
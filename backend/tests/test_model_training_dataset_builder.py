@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import datetime as dt
+import hashlib
 import json
 import os
 from pathlib import Path
@@ -22,6 +23,8 @@ from backend.main import fastapi_app
 from backend.services.model_training_dataset_builder import (
     DatasetBuildRequest,
     build_model_training_dataset,
+    serialize_dataset_row,
+    stream_model_training_dataset,
 )
 from backend.sql_app import models
 from backend.sql_app.database import get_db
@@ -294,3 +297,75 @@ def test_empty_case_returns_valid_empty_artifact(client: TestClient) -> None:
     assert artifact["row_count"] == 0
     assert artifact["rows"] == []
     assert artifact["exclusion_reasons"] == {}
+
+
+async def _stream(
+    session_maker: async_sessionmaker,
+    *,
+    generated_at: dt.datetime | None = None,
+    batch_size: int = 1,
+) -> tuple[dict[str, Any], list[list[dict[str, Any]]]]:
+    batches: list[list[dict[str, Any]]] = []
+    async with session_maker() as session:
+        manifest = await stream_model_training_dataset(
+            session,
+            DatasetBuildRequest(generated_at=generated_at),
+            batches.append,
+            batch_size=batch_size,
+        )
+    return manifest, batches
+
+
+def test_streaming_build_matches_in_memory_artifact(client: TestClient) -> None:
+    token = _register_analyst(client)
+    _apply_historical_fixture(client, token)
+    _apply_historical_fixture(client, token)
+    dup_batch, _dup_game = _apply_historical_fixture(client, token)
+    _run_async(
+        _update_batch_status(
+            client.session_maker,  # type: ignore[attr-defined]
+            dup_batch,
+            status="valid",
+            source_hash_sha256="e" * 64,
+            semantic_key="phase5p-streaming-unique",
+        )
+    )
+
+    fixed_time = dt.datetime(2026, 5, 14, 12, 0, 0, tzinfo=dt.UTC)
+    artifact = _run_async(
+        _build(client.session_maker, generated_at=fixed_time)  # type: ignore[attr-defined]
+    )
+    manifest, batches = _run_async(
+        _stream(client.session_maker, generated_at=fixed_time)  # type: ignore[attr-defined]
+    )
+
+    streamed_rows = [row for batch in batches for row in batch]
+    assert artifact["included_match_count"] == 2
+    assert len(batches) == 2
+    assert streamed_rows == artifact["rows"]
+    assert manifest["build_fingerprint"] == artifact["build_fingerprint"]
+    assert manifest["row_count"] == artifact["row_count"]
+    assert "rows" not in manifest
+
+    expected_sha = hashlib.sha256(
+        "".join(serialize_dataset_row(row) + "\n" for row in artifact["rows"]).encode("utf-8")
+    ).hexdigest()
+    assert manifest["rows_sha256"] == expected_sha
+
+
+def test_streaming_build_empty_case(client: TestClient) -> None:
+    manifest, batches = _run_async(_stream(client.session_maker))  # type: ignore[attr-defined]
+
+    assert batches == []
+    assert manifest["row_count"] == 0
+    assert manifest["included_match_ids"] == []
+    assert manifest["rows_sha256"] == hashlib.sha256(b"").hexdigest()
+
+
+def test_streaming_build_rejects_non_positive_batch_size(client: TestClient) -> None:
+    from backend.scripts.build_model_training_dataset import _build_parser
+
+    with pytest.raises(ValueError, match="batch_size"):
+        _run_async(_stream(client.session_maker, batch_size=0))  # type: ignore[attr-defined]
+    with pytest.raises(SystemExit):
+        _build_parser().parse_args(["--format", "jsonl", "--batch-size", "0"])
@@ -0,0 +1,161 @@
+"""Motion-adaptive sampling: frame-difference scan, budgeted plans, consistent metrics."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+pytest.importorskip("cv2")
+
+from backend.services import pose_service
+from backend.services.frame_sampler import FrameSampler
+from backend.services.motion_sampling import MotionSampling, plan_motion_frames, scan_motion
+from backend.services.pose_metrics import PoseTimeline, compute_head_stability_score
+from backend.services.pose_service import SamplingPass
+from backend.tests._video_utils import fake_pose_dependencies, real_cv2
+
+FPS = 30.0
+
+
+def _write_action_clip(path, *, seconds=6.0, action=(2.0, 3.0), size=(160, 120)):
+    """Static scene with a block that only moves between ``action`` seconds."""
+    cv2 = real_cv2()
+    width, height = size
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), FPS, (width, height))
+    try:
+        for i in range(round(seconds * FPS)):
+            t = min(max(i / FPS, action[0]), action[1])
+            x = int(10 + (t - action[0]) / (action[1] - action[0]) * (width - 50))
+            frame = np.full((height, width, 3), 60, dtype=np.uint8)
+            frame[40:80, x : x + 30] = 220
+            writer.write(frame)
+    finally:
+        writer.release()
+    return path
+
+
+@pytest.fixture
+def clip(tmp_path):
+    return _write_action_clip(tmp_path / "action.avi")
+
+
+def _plan(clip, motion, *, frame_interval=15, dense_interval=1):
+    cv2 = real_cv2()
+    profile = scan_motion(cv2, str(clip), start_frame=0, end_frame=None, frame_interval=3)
+    return profile, plan_motion_frames(
+        profile,
+        motion,
+        frame_interval=frame_interval,
+        dense_interval=dense_interval,
+        start_frame=0,
+        fps=FPS,
+    )
+
+
+def test_dense_frames_cover_the_action_and_the_grid_covers_the_rest(clip):
+    profile, plan = _plan(clip, MotionSampling(padding_sec=0.1))
+
+    assert profile.end_frame == 180
+    ((first, last),) = plan.windows
+    assert 54 <= first <= 60 and 90 <= last <= 96  # action runs from frame 60 to 90
+    assert set(range(0, 180, 15)) <= set(plan.frames)  # the 2 fps grid everywhere
+    assert set(range(first, last + 1)) <= set(plan.frames)
+    assert len(plan.frames) < 180 / 3
+
+
+def test_budget_keeps_the_frames_around_the_peak(clip):
+    _, unlimited = _plan(clip, MotionSampling(padding_sec=0.1))
+    _, budgeted = _plan(clip, MotionSampling(padding_sec=0.1, frame_budget=30))
+    _, thinned = _plan(clip, MotionSampling(frame_budget=5))
+
+    assert len(budgeted.frames) == 30 < len(unlimited.frames)
+    assert set(budgeted.frames) <= set(unlimited.frames)
+    dense = sorted(set(budgeted.frames) - set(range(0, 180, 15)))
+    assert set(range(dense[0], dense[-1] + 1)) <= set(budgeted.frames)  # one contiguous run
+    assert dense[0] >= 60 and dense[-1] <= 96
+    # Over budget on the grid alone: the grid is thinned evenly, nothing dense
+    assert thinned.frames == [0, 45, 90, 135] and thinned.windows == []
+
+
+def test_static_clip_has_no_dense_windows(tmp_path):
+    clip = _write_action_clip(tmp_path / "static.avi", action=(10.0, 11.0))
+    _, plan = _plan(clip, MotionSampling())
+
+    assert plan.windows == []
+    assert plan.frames == list(range(0, 180, 15))
+
+
+def test_sampler_yields_explicit_frames_alongside_schedules(clip):
+    cv2 = real_cv2()
+    cap = cv2.VideoCapture(str(clip))
+    try:
+        sampler = FrameSampler(
+            cv2, cap, frame_interval=50, start_frame=10, end_frame=None, frames=[3, 11, 12, 77]
+        )
+        frame_nums = [frame_num for frame_num, _ in sampler]
+    finally:
+        cap.release()
+
+    assert frame_nums == [11, 12, 50, 77, 100, 150]
+
+
+def test_motion_pass_runs_inference_on_its_plan_only(clip, monkeypatch):
+    detectors = []
+    monkeypatch.setattr(
+        pose_service, "_import_cv2_and_mediapipe", fake_pose_dependencies(detectors)
+    )
+    motion = MotionSampling(padding_sec=0.1, frame_budget=40)
+
+    uniform = pose_service.extract_pose_keypoints_from_video(str(clip), sample_fps=2.0)
+    results = pose_service.extract_pose_keypoints_multi_rate(
+        str(clip),
+        [SamplingPass("quick", 2.0), SamplingPass("adaptive", 2.0, motion=motion)],
+    )
+
+    adaptive = results["adaptive"]
+    frame_nums = [f["frame_num"] for f in adaptive["frames"]]
+    assert adaptive["sampling"]["mode"] == "motion"
+    assert adaptive["sampling"]["planned_frames"] == len(frame_nums) == 40
+    assert [f["timestamp"] for f in adaptive["frames"]] == [round(n / FPS, 3) for n in frame_nums]
+    assert {f["frame_num"] for f in uniform["frames"]} <= set(frame_nums)
+    # The uniform pass served from the same decode is unaffected
+    assert [f["frame_num"] for f in results["quick"]["frames"]] == [
+        f["frame_num"] for f in uniform["frames"]
+    ]
+    assert "sampling" not in results["quick"]
+    assert len(detectors[1].calls) == len(frame_nums)
+    assert adaptive["segment"] == uniform["segment"]
+
+
+def _nose_frames(frame_nums):
+    """Nose moving at a constant speed along x (0.001 per video frame)."""
+    frames = []
+    for n in frame_nums:
+        point = {"x": 0.2 + 0.001 * n, "y": 0.3, "visibility": 0.9}
+        shoulder = {"y": 0.5, "visibility": 0.9}
+        frames.append(
+            {
+                "frame_num": n,
+                "t": n / FPS,
+                "detected": True,
+                "keypoints": {
+                    "nose": point,
+                    "left_shoulder": {"x": 0.4, **shoulder},
+                    "right_shoulder": {"x": 0.6, **shoulder},
+                },
+            }
+        )
+    return frames
+
+
+def test_head_movement_is_normalised_to_the_regular_interval():
+    uniform = compute_head_stability_score(_nose_frames(range(0, 180, 15)))
+    adaptive_frames = sorted({*range(0, 180, 15), *range(60, 91)})
+    unscaled = compute_head_stability_score(_nose_frames(adaptive_frames))
+    timeline = PoseTimeline.from_frames(_nose_frames(adaptive_frames))
+    timeline.movement_interval = 15
+    scaled = compute_head_stability_score(timeline)
+
+    assert scaled["avg_movement"] == pytest.approx(uniform["avg_movement"])
+    assert scaled["score"] == pytest.approx(uniform["score"])
+    assert unscaled["avg_movement"] < uniform["avg_movement"] / 2
@@ -0,0 +1,110 @@
+"""Single-pass QUICK + DEEP analysis: shared decode/inference, early QUICK hand-off."""
+
+from __future__ import annotations
+
+import shutil
+
+import pytest
+
+pytest.importorskip("cv2")
+
+from backend.services import pose_service
+from backend.services.pose_service import SamplingPass
+from backend.tests._video_utils import fake_pose_dependencies, write_test_video
+
+
+@pytest.fixture
+def detectors(monkeypatch):
+    created = []
+    monkeypatch.setattr(pose_service, "_import_cv2_and_mediapipe", fake_pose_dependencies(created))
+    return created
+
+
+@pytest.mark.parametrize("deep_fps", [10.0, 4.0])
+def test_shared_pass_matches_separate_runs(tmp_path, detectors, deep_fps):
+    clip = write_test_video(tmp_path / "clip.avi", seconds=10.0, fps=30.0)
+    quick = pose_service.extract_pose_keypoints_from_video(str(clip), sample_fps=5.0, max_seconds=3)
+    deep = pose_service.extract_pose_keypoints_from_video(str(clip), sample_fps=deep_fps)
+    separate_calls = len(detectors[0].calls) + len(detectors[1].calls)
+
+    completed = []
+    results = pose_service.extract_pose_keypoints_multi_rate(
+        str(clip),
+        [SamplingPass("quick", 5.0, max_seconds=3), SamplingPass("deep", deep_fps)],
+        on_pass_complete=lambda name, r: completed.append((name, len(detectors[2].calls))),
+    )
+
+    for name, expected in (("quick", quick), ("deep", deep)):
+        got = results[name]
+        assert [f["frame_num"] for f in got["frames"]] == [
+            f["frame_num"] for f in expected["frames"]
+        ]
+        assert got["segment"] == expected["segment"]
+        assert got["sampled_frames"] == expected["sampled_frames"]
+
+    union = {f["frame_num"] for f in quick["frames"]} | {f["frame_num"] for f in deep["frames"]}
+    assert len(detectors) == 3
+    assert len(detectors[2].calls) == len(union) < separate_calls
+    # QUICK is handed over right after its 3 s window, long before DEEP finishes
+    assert [name for name, _ in completed] == ["quick", "deep"]
+    assert completed[0][1] < len(union) / 2
+
+
+def test_duplicate_pass_names_are_rejected(tmp_path, detectors):
+    with pytest.raises(ValueError, match="unique names"):
+        pose_service.extract_pose_keypoints_multi_rate(
+            str(tmp_path / "missing.avi"), [SamplingPass("a", 5.0), SamplingPass("a", 2.0)]
+        )
+
+
+@pytest.mark.asyncio
+async def test_worker_runs_quick_and_deep_from_one_decode(
+    tmp_path, monkeypatch, detectors, db_session, test_video_session
+):
+    from backend.sql_app.models import VideoAnalysisJob, VideoAnalysisJobStatus
+    from backend.workers import analysis_worker
+    from backend.workers.analysis_pool import AnalysisPool
+
+    clip = write_test_video(tmp_path / "clip.avi", seconds=40.0, fps=10.0)
+    uploads: list[str] = []
+
+    async def _download(*, bucket, key, dst_path, job_id):
+        shutil.copyfile(clip, dst_path)
+
+    async def _upload(*, bucket, key, payload):
+        uploads.append(key.rsplit("/", 1)[-1])
+
+    monkeypatch.setattr(analysis_worker, "_download_from_s3", _download)
+    monkeypatch.setattr(analysis_worker, "_upload_json_to_s3", _upload)
+    monkeypatch.setattr(analysis_worker.settings, "COACH_PLUS_DEEP_ANALYSIS_ENABLED", True)
+    monkeypatch.setattr(analysis_worker.settings, "COACH_PLUS_STREAM_VIDEO_INPUT", False)
+    monkeypatch.setattr(analysis_worker.settings, "COACH_PLUS_POSE_CACHE_ENABLED", False)
+    # Run analysis in a thread so the fake detector installed above is used
+    monkeypatch.setattr(analysis_worker, "_analysis_pool", AnalysisPool(processes=0))
+
+    test_video_session.s3_bucket = "test-bucket"
+    test_video_session.s3_key = "coach_plus/coach/test/session/original.mp4"
+    job = VideoAnalysisJob(
+        session_id=test_video_session.id,
+        status=VideoAnalysisJobStatus.queued,
+        sample_fps=10,
+        include_frames=False,
+        analysis_mode="batting",
+        s3_bucket=test_video_session.s3_bucket,
+        s3_key=test_video_session.s3_key,
+    )
+    db_session.add(job)
+    await db_session.commit()
+    job_id = job.id
+
+    await analysis_worker._process_job(job_id)
+
+    db_session.expire_all()
+    job = await db_session.get(VideoAnalysisJob, job_id)
+    assert job.status == VideoAnalysisJobStatus.done
+    assert uploads == ["quick_results.json", "deep_results.json"]
+    assert job.quick_results["pose_summary"]["sampled_frames"] == 151  # 0.0 s .. 30.0 s
+    assert job.deep_results["pose_summary"]["sampled_frames"] == 400
+    # Quick frames are a subset of the deep schedule, so they cost no extra inference
+    (detector,) = detectors
+    assert len(detector.calls) == 400
@@ -0,0 +1,193 @@
+"""Pitch mapping: stored calibration homography, vectorised projection and classification."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+pytest.importorskip("cv2")
+
+from backend.services import ball_tracking_service
+from backend.services.ball_tracking_service import (
+    BallPosition,
+    BallTrajectory,
+    classify_length,
+    classify_lengths,
+    classify_line,
+    classify_lines,
+    compute_homography,
+    homography_to_json,
+    load_homography,
+    project_point_to_pitch,
+    project_points_to_pitch,
+    project_trajectory_to_pitch,
+)
+from backend.sql_app.models import (
+    OwnerTypeEnum,
+    TargetZone,
+    VideoAnalysisJob,
+    VideoAnalysisJobStatus,
+    VideoSession,
+    VideoSessionStatus,
+)
+from backend.tests._video_utils import real_cv2
+
+# Broadcast-style trapezoid: far (bowler's) end narrower than the batsman's end
+CORNERS = [
+    {"x": 560.0, "y": 200.0},
+    {"x": 720.0, "y": 200.0},
+    {"x": 420.0, "y": 680.0},
+    {"x": 860.0, "y": 680.0},
+]
+
+
+@pytest.fixture(autouse=True)
+def _opencv(monkeypatch):
+    # Other modules stub sys.modules["cv2"]; compute_homography needs the real one
+    monkeypatch.setattr(ball_tracking_service, "_import_cv2", real_cv2)
+
+
+def test_batch_projection_matches_per_point_opencv():
+    H = compute_homography(CORNERS)
+    rng = np.random.default_rng(7)
+    points = rng.uniform((400, 180), (880, 700), size=(2000, 2))
+
+    projected = project_points_to_pitch(points, H)
+    reference = real_cv2().perspectiveTransform(points.reshape(-1, 1, 2), H).reshape(-1, 2)
+
+    assert projected.shape == (2000, 2)
+    np.testing.assert_allclose(projected, reference, atol=1e-6)
+    np.testing.assert_allclose(
+        project_points_to_pitch([(c["x"], c["y"]) for c in CORNERS], H),
+        [(0, 0), (100, 0), (0, 100), (100, 100)],
+        atol=1e-6,
+    )
+    assert project_point_to_pitch({"x": 640.0, "y": 200.0}, H) == pytest.approx((50.0, 0.0))
+    assert project_points_to_pitch([], H).shape == (0, 2)
+
+
+def test_trajectory_is_projected_in_one_call():
+    H = compute_homography(CORNERS)
+    trajectory = BallTrajectory(
+        positions=[
+            BallPosition(
+                frame_num=i, timestamp=i / 30, x=640.0, y=200.0 + 40 * i, confidence=0.9, radius=5.0
+            )
+            for i in range(12)
+        ]
+    )
+
+    projected = project_trajectory_to_pitch(trajectory, H)
+
+    assert projected[:, 0] == pytest.approx([50.0] * 12)
+    assert np.all(np.diff(projected[:, 1]) > 0)  # travelling towards the batsman
+
+
+def test_vectorised_classification_matches_scalar():
+    values = [-5, 0, 19.9, 20, 39.9, 40, 50, 60, 60.1, 64.9, 65, 80, 80.1, 84.9, 85, 100, np.nan]
+
+    assert classify_lengths(values) == [classify_length(v) for v in values]
+    assert classify_lines(values) == [classify_line(v) for v in values]
+    assert classify_lengths([]) == []
+
+
+def test_homography_round_trips_through_json():
+    H = compute_homography(CORNERS)
+
+    np.testing.assert_allclose(load_homography(homography_to_json(H)), H)
+    assert load_homography(None) is None
+    assert load_homography([[1, 2], [3, 4]]) is None
+
+
+async def _session_with_job(db_session, test_user, deep_results, **session_fields):
+    session = VideoSession(
+        owner_type=OwnerTypeEnum.coach,
+        owner_id=test_user.id,
+        title="Pitch Map Session",
+        status=VideoSessionStatus.ready,
+        **session_fields,
+    )
+    db_session.add(session)
+    await db_session.commit()
+    await db_session.refresh(session)
+    db_session.add(
+        VideoAnalysisJob(
+            session_id=session.id, status=VideoAnalysisJobStatus.done, deep_results=deep_results
+        )
+    )
+    await db_session.commit()
+    return session.id
+
+
+@pytest.mark.asyncio
+async def test_calibration_stores_homography_used_by_pitch_map(
+    async_client, db_session, auth_headers, test_user
+):
+    bounce = {"x": 640.0, "y": 584.0, "timestamp": 1.2}
+    session_id = await _session_with_job(
+        db_session, test_user, {"ball_tracking": {"trajectory": {"bounce_point": bounce}}}
+    )
+
+    resp = await async_client.post(
+        f"/api/coaches/plus/sessions/{session_id}/pitch-calibration",
+        json={"corners": CORNERS},
+        headers=auth_headers,
+    )
+    assert resp.status_code == 200, resp.text
+
+    db_session.expire_all()
+    session = await db_session.get(VideoSession, session_id)
+    np.testing.assert_allclose(
+        load_homography(session.pitch_homography), compute_homography(CORNERS)
+    )
+
+    resp = await async_client.get(
+        f"/api/coaches/plus/sessions/{session_id}/pitch-map", headers=auth_headers
+    )
+    assert resp.status_code == 200, resp.text
+    payload = resp.json()
+    assert payload["calibrated"] is True
+    (point,) = payload["points"]
+    expected_x, expected_y = project_point_to_pitch(bounce, compute_homography(CORNERS))
+    assert point["x_coordinate"] == pytest.approx(expected_x)
+    assert point["y_coordinate"] == pytest.approx(expected_y)
+    assert point["length"] == classify_length(expected_y)
+    assert point["line"] == classify_line(expected_x)
+    assert point["timestamp"] == 1.2
+
+
+@pytest.mark.asyncio
+async def test_zone_report_counts_stored_pitch_map(
+    async_client, db_session, auth_headers, test_user
+):
+    pitch_map = [
+        {"x": 50, "y": 60},  # hit
+        {"x": 45, "y": 55},  # hit (edge)
+        {"x": 50, "y": 30},  # above
+        {"x": 80, "y": 60},  # right
+        {"x": 20, "y": 90},  # below + left
+    ]
+    session_id = await _session_with_job(db_session, test_user, {"pitch_map": pitch_map})
+    zone = TargetZone(
+        owner_id=test_user.id,
+        name="Good length",
+        definition_json={"x": 45, "y": 55, "width": 10, "height": 10},
+    )
+    db_session.add(zone)
+    await db_session.commit()
+    zone_id = zone.id
+
+    resp = await async_client.post(
+        f"/api/coaches/plus/sessions/{session_id}/zone-report",
+        json={"zone_id": zone_id},
+        headers=auth_headers,
+    )
+    assert resp.status_code == 200, resp.text
+    report = resp.json()
+
+    assert (report["hits"], report["misses"], report["total_deliveries"]) == (2, 3, 5)
+    assert report["hit_rate"] == pytest.approx(40.0)
+    assert report["miss_breakdown"] == {"above": 1, "below": 1, "left": 1, "right": 1}
+    assert report["nearest_miss_distance"] == pytest.approx(30.0)
+    distances = [30.0, 30.0, float(np.hypot(30, 30))]
+    assert report["avg_miss_distance"] == pytest.approx(sum(distances) / 3)
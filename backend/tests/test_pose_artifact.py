@@ -0,0 +1,193 @@
+"""Columnar .npz pose artifacts: round trip, zero-copy reads, chunk aggregation."""
+
+from __future__ import annotations
+
+import io
+import json
+
+import numpy as np
+import pytest
+
+from backend.services.pose_artifact import (
+    PoseArrays,
+    PoseArraysBuffer,
+    dumps_pose_npz,
+    loads_pose_npz,
+)
+
+
+def _frames(count, *, start=0, seed=0):
+    rng = np.random.default_rng(seed)
+    frames = []
+    for frame_num in range(start, start + count):
+        ts = round(frame_num / 30, 3)
+        if frame_num % 4 == 0:
+            frames.append(
+                {
+                    "frame_num": frame_num,
+                    "timestamp": ts,
+                    "detected": False,
+                    "landmarks": None,
+                    "keypoints": None,
+                }
+            )
+            continue
+        landmarks = [
+            {
+                "x": float(rng.random()),
+                "y": float(rng.random()),
+                "z": float(rng.uniform(-1, 1)),
+                "visibility": 0.9,
+            }
+            for _ in range(33)
+        ]
+        frames.append(
+            {
+                "frame_num": frame_num,
+                "timestamp": ts,
+                "t": ts,
+                "timestamp_ms": int(ts * 1000),
+                "frame_index": frame_num,
+                "detected": True,
+                "landmarks": landmarks,
+            }
+        )
+    return frames
+
+
+def test_round_trip_preserves_the_timeline():
+    frames = _frames(40)
+
+    poses = loads_pose_npz(dumps_pose_npz(PoseArrays.from_frames(frames, metadata={"fps": 30})))
+    restored = poses.to_frames()
+
+    assert poses.metadata == {"fps": 30}
+    assert poses.landmarks.shape == (40, 33, 4)
+    assert [f["frame_num"] for f in restored] == [f["frame_num"] for f in frames]
+    assert [f["timestamp"] for f in restored] == [f["timestamp"] for f in frames]
+    for original, back in zip(frames, restored, strict=True):
+        assert back["detected"] == original["detected"]
+        if original["landmarks"] is None:
+            assert back["landmarks"] is None
+            continue
+        assert back["keypoints"]["nose"] == back["landmarks"][0]
+        for a, b in zip(original["landmarks"], back["landmarks"], strict=True):
+            assert b["x"] == pytest.approx(a["x"], abs=1e-6)
+            assert b["visibility"] == pytest.approx(a["visibility"], abs=1e-6)
+
+
+def test_reads_are_zero_copy_views_and_plain_npz():
+    data = dumps_pose_npz(PoseArrays.from_frames(_frames(10)))
+
+    poses = loads_pose_npz(data)
+    assert not poses.landmarks.flags.owndata
+    assert not poses.landmarks.flags.writeable
+    assert np.shares_memory(poses.landmarks, np.frombuffer(data, dtype=np.uint8))
+
+    with np.load(io.BytesIO(data)) as npz:
+        np.testing.assert_array_equal(npz["frame_num"], poses.frame_num)
+
+
+def test_buffer_grows_and_matches_concatenate():
+    parts = [
+        PoseArrays.from_frames(_frames(5, start=0, seed=1), dtype=np.float16),
+        PoseArrays.from_frames(_frames(0, start=5)),
+        PoseArrays.from_frames(_frames(12, start=5, seed=2)),
+        PoseArrays.from_frames(_frames(7, start=17, seed=3), dtype=np.float16),
+    ]
+    buffer = PoseArraysBuffer(capacity=4)
+    for part in parts:
+        buffer.append(part)
+    built, expected = buffer.build(), PoseArrays.concatenate(parts)
+
+    assert len(buffer) == 24 and buffer.parts == 4 and buffer.capacity >= 24
+    # float16 parts are widened once a float32 part arrives
+    assert built.landmarks.dtype == np.float32
+    for name in ("landmarks", "frame_num", "timestamp", "timestamp_ms", "detected"):
+        np.testing.assert_array_equal(getattr(built, name), getattr(expected, name))
+    assert len(PoseArraysBuffer().build()) == 0
+
+
+def test_float16_halves_the_artifact_and_both_beat_json():
+    frames = _frames(300)
+    as_json = json.dumps({"poses": frames}, separators=(",", ":")).encode()
+    full = dumps_pose_npz(PoseArrays.from_frames(frames))
+    half = dumps_pose_npz(PoseArrays.from_frames(frames, dtype=np.float16))
+
+    assert len(full) * 4 < len(as_json)
+    assert len(half) < 0.6 * len(full)
+    assert loads_pose_npz(half).landmarks.dtype == np.float16
+
+
+@pytest.mark.asyncio
+async def test_aggregation_merges_npz_and_legacy_json_chunks(
+    monkeypatch, db_session, test_video_session
+):
+    from sqlalchemy import select
+    from sqlalchemy.orm import selectinload
+
+    from backend.services import chunk_aggregation
+    from backend.sql_app.models import (
+        VideoAnalysisChunk,
+        VideoAnalysisChunkStatus,
+        VideoAnalysisJob,
+        VideoAnalysisJobStatus,
+    )
+
+    first, second = _frames(30, start=0, seed=1), _frames(30, start=30, seed=2)
+    objects = {
+        "jobs/j/chunks/chunk_0000.npz": dumps_pose_npz(PoseArrays.from_frames(first)),
+        "jobs/j/chunks/chunk_0001.json": json.dumps({"poses": second}).encode(),
+    }
+    uploads = {}
+
+    async def _download(bucket, key):
+        return objects[key]
+
+    async def _upload(*, bucket, key, body, content_type="application/x-npz"):
+        uploads[key] = body
+
+    monkeypatch.setattr(chunk_aggregation, "_download_bytes_from_s3", _download)
+    monkeypatch.setattr(chunk_aggregation, "_upload_bytes_to_s3", _upload)
+
+    job = VideoAnalysisJob(
+        session_id=test_video_session.id,
+        status=VideoAnalysisJobStatus.deep_running,
+        sample_fps=10,
+        include_frames=False,
+        analysis_mode="batting",
+        deep_mode="gpu",
+        total_chunks=2,
+        completed_chunks=2,
+        s3_bucket="bucket",
+    )
+    db_session.add(job)
+    await db_session.flush()
+    for index, key in enumerate(objects):
+        db_session.add(
+            VideoAnalysisChunk(
+                job_id=job.id,
+                chunk_index=index,
+                start_sec=index,
+                end_sec=index + 1,
+                status=VideoAnalysisChunkStatus.completed,
+                artifact_s3_key=key,
+            )
+        )
+    await db_session.commit()
+    job = (
+        await db_session.execute(
+            select(VideoAnalysisJob)
+            .options(selectinload(VideoAnalysisJob.session))
+            .where(VideoAnalysisJob.id == job.id)
+        )
+    ).scalar_one()
+
+    await chunk_aggregation.aggregate_chunks_and_finalize(db_session, job)
+
+    summary = job.deep_results["pose_summary"]
+    assert summary["sampled_frames"] == 60
+    assert summary["frames_with_pose"] == sum(1 for f in first + second if f["landmarks"])
+    pose_key = job.deep_results["outputs"]["deep_pose_s3_key"]
+    merged = loads_pose_npz(uploads[pose_key])
+    assert merged.frame_num.tolist() == list(range(60))
@@ -0,0 +1,182 @@
+"""Pose cache: content-addressed pose results reused across retries and re-analysis."""
+
+from __future__ import annotations
+
+import shutil
+
+import pytest
+
+pytest.importorskip("cv2")
+
+from backend.services import pose_service
+from backend.services.coach_plus_analysis import AnalysisPass, run_multi_rate_analysis
+from backend.services.motion_sampling import MotionSampling
+from backend.services.pose_cache import PoseCacheKey, pack_pose_result, unpack_pose_result
+from backend.tests._video_utils import fake_pose_dependencies, write_test_video
+
+
+@pytest.fixture
+def detectors(monkeypatch):
+    created = []
+    monkeypatch.setattr(pose_service, "_import_cv2_and_mediapipe", fake_pose_dependencies(created))
+    return created
+
+
+def _scores(results):
+    # Landmarks are cached as float32, so scores match to float32 precision
+    return {name: m["score"] for name, m in results["metrics"]["metrics"].items()}
+
+
+def _findings(results):
+    return [(f["code"], f["severity"]) for f in results["findings"]["findings"]]
+
+
+def test_cache_key_covers_every_extraction_input():
+    base = PoseCacheKey("etag:abc:size:10", sample_fps=5.0, max_width=640, model_version="m:1")
+    variants = [
+        PoseCacheKey("etag:abd:size:10", sample_fps=5.0, max_width=640, model_version="m:1"),
+        PoseCacheKey("etag:abc:size:10", sample_fps=10.0, max_width=640, model_version="m:1"),
+        PoseCacheKey("etag:abc:size:10", sample_fps=5.0, max_width=1280, model_version="m:1"),
+        PoseCacheKey("etag:abc:size:10", sample_fps=5.0, max_width=640, model_version="m:2"),
+        PoseCacheKey(
+            "etag:abc:size:10", sample_fps=5.0, max_width=640, model_version="m:1", max_seconds=3
+        ),
+        PoseCacheKey(
+            "etag:abc:size:10",
+            sample_fps=5.0,
+            max_width=640,
+            model_version="m:1",
+            motion=MotionSampling(frame_budget=300),
+        ),
+    ]
+
+    assert base.digest() == PoseCacheKey(**vars(base)).digest()
+    assert len({base.digest(), *(v.digest() for v in variants)}) == len(variants) + 1
+    assert base.s3_key().endswith(f"/pose_cache/{base.digest()}.npz")
+
+
+def test_cached_passes_skip_extraction_and_give_the_same_findings(tmp_path, detectors):
+    clip = write_test_video(tmp_path / "clip.avi", seconds=6.0, fps=10.0)
+    passes = [AnalysisPass("quick", sample_fps=5.0, max_seconds=3), AnalysisPass("deep", 10.0)]
+    extracted: dict[str, bytes] = {}
+
+    fresh = run_multi_rate_analysis(
+        video_path=str(clip),
+        passes=passes,
+        analysis_mode="batting",
+        on_pose=lambda name, pose_data: extracted.__setitem__(name, pack_pose_result(pose_data)),
+    )
+    calls = len(detectors[0].calls)
+
+    cached = run_multi_rate_analysis(
+        video_path=str(tmp_path / "not-read.avi"),
+        passes=passes,
+        analysis_mode="batting",
+        cached_poses={name: unpack_pose_result(body) for name, body in extracted.items()},
+    )
+
+    assert sorted(extracted) == ["deep", "quick"]
+    assert len(detectors) == 1 and len(detectors[0].calls) == calls  # nothing re-extracted
+    assert list(cached) == ["quick", "deep"]
+    for name in ("quick", "deep"):
+        assert _scores(cached[name].results) == pytest.approx(_scores(fresh[name].results))
+        assert _findings(cached[name].results) == _findings(fresh[name].results)
+
+
+def test_partial_hit_extracts_only_the_missing_pass(tmp_path, detectors):
+    clip = write_test_video(tmp_path / "clip.avi", seconds=6.0, fps=10.0)
+    quick = AnalysisPass("quick", sample_fps=5.0, max_seconds=3)
+    extracted: dict[str, bytes] = {}
+    run_multi_rate_analysis(
+        video_path=str(clip),
+        passes=[quick],
+        analysis_mode="batting",
+        on_pose=lambda name, pose_data: extracted.__setitem__(name, pack_pose_result(pose_data)),
+    )
+
+    stored: list[str] = []
+    results = run_multi_rate_analysis(
+        video_path=str(clip),
+        passes=[quick, AnalysisPass("deep", 10.0)],
+        analysis_mode="batting",
+        cached_poses={"quick": unpack_pose_result(extracted["quick"])},
+        on_pose=lambda name, pose_data: stored.append(name),
+    )
+
+    assert list(results) == ["quick", "deep"]
+    assert stored == ["deep"]
+    assert results["deep"].results["pose_summary"]["sampled_frames"] == 60
+
+
+@pytest.mark.asyncio
+async def test_worker_retry_is_served_from_the_cache(
+    tmp_path, monkeypatch, detectors, db_session, test_video_session
+):
+    from backend.sql_app.models import VideoAnalysisJob, VideoAnalysisJobStatus
+    from backend.workers import analysis_worker
+    from backend.workers.analysis_pool import AnalysisPool
+
+    clip = write_test_video(tmp_path / "clip.avi", seconds=12.0, fps=10.0)
+    cache: dict[str, bytes] = {}
+    downloads: list[str] = []
+
+    async def _download(*, bucket, key, dst_path, job_id):
+        downloads.append(job_id)
+        shutil.copyfile(clip, dst_path)
+
+    async def _upload(*, bucket, key, payload):
+        pass
+
+    async def _content_id(bucket, key):
+        return "etag:test:size:1"
+
+    async def _load(bucket, cache_key):
+        return cache.get(cache_key)
+
+    async def _store(bucket, cache_key, body):
+        cache[cache_key] = body
+
+    monkeypatch.setattr(analysis_worker, "_download_from_s3", _download)
+    monkeypatch.setattr(analysis_worker, "_upload_json_to_s3", _upload)
+    monkeypatch.setattr(analysis_worker, "video_content_id", _content_id)
+    monkeypatch.setattr(analysis_worker, "load_pose_result", _load)
+    monkeypatch.setattr(analysis_worker, "store_pose_result", _store)
+    monkeypatch.setattr(analysis_worker.settings, "COACH_PLUS_DEEP_ANALYSIS_ENABLED", True)
+    monkeypatch.setattr(analysis_worker.settings, "COACH_PLUS_STREAM_VIDEO_INPUT", False)
+    monkeypatch.setattr(analysis_worker, "_analysis_pool", AnalysisPool(processes=0))
+
+    test_video_session.s3_bucket = "test-bucket"
+    test_video_session.s3_key = "coach_plus/coach/test/session/original.mp4"
+    await db_session.commit()
+    session_id = test_video_session.id
+
+    async def _run_job():
+        job = VideoAnalysisJob(
+            session_id=session_id,
+            status=VideoAnalysisJobStatus.queued,
+            sample_fps=10,
+            include_frames=False,
+            analysis_mode="batting",
+            s3_bucket="test-bucket",
+            s3_key="coach_plus/coach/test/session/original.mp4",
+        )
+        db_session.add(job)
+        await db_session.commit()
+        job_id = job.id
+        await analysis_worker._process_job(job_id)
+        db_session.expire_all()
+        job = await db_session.get(VideoAnalysisJob, job_id)
+        assert job.status == VideoAnalysisJobStatus.done
+        return job_id, (job.pose_cache_hits, job.pose_cache_misses), job.deep_results
+
+    first_id, first_counts, first_deep = await _run_job()
+    calls = sum(len(d.calls) for d in detectors)
+    _, second_counts, second_deep = await _run_job()
+
+    assert first_counts == (0, 2)
+    assert second_counts == (2, 0)
+    assert len(cache) == 2
+    assert downloads == [first_id]  # the retry never fetched the video
+    assert sum(len(d.calls) for d in detectors) == calls
+    assert _scores(second_deep) == pytest.approx(_scores(first_deep))
+    assert _findings(second_deep) == _findings(first_deep)
@@ -0,0 +1,201 @@
+"""Pose detector pool: stateless detectors reused across videos, VIDEO-mode ones rebuilt."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("cv2")
+
+from backend.services import pose_service
+from backend.services.pose_detector_pool import DetectorPool, get_detector_pool
+from backend.tests._video_utils import FakeDetector, real_cv2, write_test_video
+
+
+class _StrictVideoDetector(FakeDetector):
+    """Rejects non-increasing timestamps, like MediaPipe's VIDEO running mode."""
+
+    def detect_for_video(self, image, timestamp_ms):
+        if self.calls and timestamp_ms <= self.calls[-1][0]:
+            raise ValueError("Input timestamp must be monotonically increasing")
+        return super().detect_for_video(image, timestamp_ms)
+
+
+class _SmoothingDetector(_StrictVideoDetector):
+    """Smooths landmarks across calls, like VIDEO mode's tracking across frames."""
+
+    def __init__(self):
+        super().__init__()
+        self._smoothed = None
+
+    def detect_for_video(self, image, timestamp_ms):
+        result = super().detect_for_video(image, timestamp_ms)
+        x = result.pose_landmarks[0][0].x
+        self._smoothed = x if self._smoothed is None else 0.5 * (self._smoothed + x)
+        landmark = SimpleNamespace(x=self._smoothed, y=0.5, z=0.0, visibility=0.9)
+        return SimpleNamespace(pose_landmarks=[[landmark] * 33])
+
+
+def _dependencies(created, method="detect_for_video", detector_class=_StrictVideoDetector):
+    def _factory():
+        detector = detector_class()
+        created.append(detector)
+        return detector
+
+    mp = SimpleNamespace(
+        Image=lambda image_format, data: SimpleNamespace(data=data),
+        ImageFormat=SimpleNamespace(SRGB=1),
+    )
+    return lambda: (real_cv2(), mp, _factory, lambda: "/fake/model.task", lambda: method)
+
+
+@pytest.fixture
+def clip(tmp_path):
+    return write_test_video(tmp_path / "clip.avi", seconds=3.0, fps=10.0)
+
+
+def test_video_mode_builds_a_fresh_detector_per_video(clip, monkeypatch):
+    created = []
+    monkeypatch.setattr(pose_service, "_import_cv2_and_mediapipe", _dependencies(created))
+
+    first = pose_service.extract_pose_keypoints_from_video(str(clip), sample_fps=5.0)
+    second = pose_service.extract_pose_keypoints_from_video(str(clip), sample_fps=5.0)
+
+    assert len(created) == 2
+    assert all(detector.closed for detector in created)
+    assert all(f["detected"] for f in first["frames"] + second["frames"])
+    # Each detector saw exactly one video, from its own timestamps
+    for detector, result in zip(created, (first, second), strict=True):
+        assert [timestamp for timestamp, _ in detector.calls] == [
+            f["timestamp_ms"] for f in result["frames"]
+        ]
+
+
+def test_video_mode_landmarks_do_not_depend_on_earlier_videos(clip, tmp_path, monkeypatch):
+    other = write_test_video(tmp_path / "other.avi", seconds=5.0, fps=10.0)
+
+    monkeypatch.setattr(
+        pose_service,
+        "_import_cv2_and_mediapipe",
+        _dependencies([], detector_class=_SmoothingDetector),
+    )
+    alone = pose_service.extract_pose_keypoints_from_video(str(clip), sample_fps=5.0)
+
+    monkeypatch.setattr(
+        pose_service,
+        "_import_cv2_and_mediapipe",
+        _dependencies([], detector_class=_SmoothingDetector),
+    )
+    assert pose_service.warm_pose_detector()
+    pose_service.extract_pose_keypoints_from_video(str(other), sample_fps=5.0)
+    after_other = pose_service.extract_pose_keypoints_from_video(str(clip), sample_fps=5.0)
+
+    assert after_other["frames"] == alone["frames"]
+
+
+def test_image_mode_reuses_detectors_without_timestamps(clip, monkeypatch):
+    created = []
+    monkeypatch.setattr(
+        pose_service, "_import_cv2_and_mediapipe", _dependencies(created, method="detect")
+    )
+
+    for _ in range(3):
+        pose_service.extract_pose_keypoints_from_video(str(clip), sample_fps=5.0)
+
+    (detector,) = created
+    assert len(detector.calls) == 3 * 15
+    assert {timestamp for timestamp, _ in detector.calls} == {None}
+
+
+@pytest.mark.parametrize(
+    ("method", "detectors"), [("detect_for_video", 2), ("detect", 1)], ids=["video", "image"]
+)
+def test_warm_up_builds_and_runs_a_detector_once(clip, monkeypatch, method, detectors):
+    created = []
+    monkeypatch.setattr(
+        pose_service, "_import_cv2_and_mediapipe", _dependencies(created, method=method)
+    )
+
+    assert pose_service.warm_pose_detector()
+    pose_service.extract_pose_keypoints_from_video(str(clip), sample_fps=5.0)
+
+    # VIDEO mode closes the warmed detector; IMAGE mode keeps using it
+    assert len(created) == detectors
+    assert created[0].calls[0][1] == 0.0  # blank warm-up frame
+    assert sum(len(detector.calls) for detector in created) == 1 + 15
+
+
+def test_warm_up_failure_is_not_raised(monkeypatch):
+    def _broken():
+        raise ImportError("mediapipe missing")
+
+    monkeypatch.setattr(pose_service, "_import_cv2_and_mediapipe", _broken)
+
+    assert pose_service.warm_pose_detector() is False
+
+
+def test_concurrent_leases_get_their_own_detectors():
+    created = []
+    pool = DetectorPool(lambda: created.append(FakeDetector()) or created[-1], method="detect")
+
+    leases = [pool.checkout() for _ in range(3)]
+    assert len({id(lease.detector) for lease in leases}) == 3
+    for lease in leases:
+        lease.release()
+        lease.release()  # idempotent
+
+    # Only max_idle detectors are kept; the rest are closed
+    assert pool.idle == 2
+    assert [d.closed for d in created].count(True) == 1
+    pool.checkout().release()
+    assert pool.created == 3
+
+
+def test_detectors_are_recycled_or_discarded(monkeypatch):
+    from backend.config import settings
+
+    created = []
+    pool = DetectorPool(
+        lambda: created.append(FakeDetector()) or created[-1], method="detect", max_videos=2
+    )
+
+    pool.checkout().release()
+    pool.checkout().release()  # second video: limit reached
+    assert created[0].closed and pool.idle == 0
+
+    pool.checkout().release(discard=True)
+    assert created[1].closed
+
+    monkeypatch.setattr(settings, "COACH_PLUS_POSE_DETECTOR_REUSE", False)
+    pool.checkout().release()
+    assert created[2].closed and pool.idle == 0
+
+
+def test_pools_are_shared_per_factory_and_method():
+    def factory():
+        return FakeDetector()
+
+    assert get_detector_pool(factory, "detect") is get_detector_pool(factory, "detect")
+    assert get_detector_pool(factory, "detect") is not get_detector_pool(
+        factory, "detect_for_video"
+    )
+
+
+def test_model_bytes_are_read_once_until_the_file_changes(tmp_path):
+    import os
+
+    from backend.mediapipe_init import load_model_asset
+
+    model = tmp_path / "pose.task"
+    model.write_bytes(b"first")
+    mtime_ns = model.stat().st_mtime_ns
+    assert load_model_asset(str(model)) == b"first"
+
+    # Same modification time: the loaded bytes are reused, the file is not read
+    model.write_bytes(b"other")
+    os.utime(model, ns=(mtime_ns, mtime_ns))
+    assert load_model_asset(str(model)) == b"first"
+
+    os.utime(model, ns=(mtime_ns, mtime_ns + 1_000_000_000))
+    assert load_model_asset(str(model)) == b"other"
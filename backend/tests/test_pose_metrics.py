@@ -10,9 +10,10 @@ Tests verify:
 
 from __future__ import annotations
 
-import pytest
 from typing import Any
 
+import pytest
+
 from backend.services.pose_metrics import (
     angle,
     compute_balance_drift_score,
@@ -642,5 +643,111 @@ class TestIntegration:
         assert 0 <= knee_score <= 1
 
 
+# ============================================================================
+# Vectorised Engine (PoseTimeline)
+# ============================================================================
+
+
+def _random_frames(count: int, seed: int = 0) -> list[dict[str, Any]]:
+    """pose_service-style frames with dropped poses and low-confidence keypoints."""
+    import numpy as np
+
+    from backend.services.pose_service import KEYPOINT_NAMES
+
+    rng = np.random.default_rng(seed)
+    frames: list[dict[str, Any]] = []
+    for i in range(count):
+        t = round(i / 30, 3)
+        if i % 7 == 0:
+            frames.append({"frame_num": i, "t": t, "detected": False, "keypoints": {}})
+            continue
+        landmarks = [
+            {
+                "x": float(rng.random()),
+                "y": float(rng.random()),
+                "z": 0.0,
+                "visibility": float(rng.choice([0.3, 0.9])),
+            }
+            for _ in KEYPOINT_NAMES
+        ]
+        frames.append(
+            {
+                "frame_num": i,
+                "timestamp": t,
+                "t": t,
+                "detected": True,
+                "landmarks": landmarks,
+                "keypoints": dict(zip(KEYPOINT_NAMES, landmarks, strict=True)),
+            }
+        )
+    return frames
+
+
+class TestVectorisedEngine:
+    """The array engine agrees with the scalar helpers and across input forms."""
+
+    def test_per_frame_knee_scores_match_scalar_angle(self) -> None:
+        frames = _random_frames(200)
+
+        knee = compute_pose_metrics({"frames": frames})["metrics"]["front_knee_brace_score"]
+
+        expected: list[float] = []
+        for frame in frames:
+            keypoints = frame["keypoints"]
+            angles = [
+                angle(*points)
+                for side in ("left", "right")
+                if all(
+                    points := [
+                        get_keypoint_value(keypoints, f"{side}_{joint}")
+                        for joint in ("hip", "knee", "ankle")
+                    ]
+                )
+            ]
+            if frame["detected"] and angles:
+                expected.append(max(0.0, min(1.0, (min(angles) - 80.0) / 100.0)))
+        assert knee["per_frame_scores"] == pytest.approx(expected, abs=1e-12)
+
+    def test_list_and_dict_keypoints_agree(self) -> None:
+        frames = _random_frames(120, seed=3)
+        as_lists = [
+            {
+                **frame,
+                "keypoints": {
+                    name: [kp["x"], kp["y"], kp["visibility"]]
+                    for name, kp in frame["keypoints"].items()
+                },
+            }
+            for frame in frames
+        ]
+
+        from_dicts = compute_pose_metrics({"frames": frames})
+        from_lists = compute_pose_metrics({"frames": as_lists})
+
+        assert from_dicts == from_lists
+
+    def test_pose_arrays_match_their_frames(self) -> None:
+        from backend.services.pose_artifact import PoseArrays
+
+        poses = PoseArrays.from_frames(_random_frames(150, seed=5))
+
+        from_frames = compute_pose_metrics({"frames": poses.to_frames()})
+        from_arrays = compute_pose_metrics({"frames": [], "pose_arrays": poses})
+
+        assert from_arrays == from_frames
+
+    def test_evidence_reuses_the_attached_series(self) -> None:
+        from backend.services.pose_metrics import build_pose_metric_evidence
+
+        frames = _random_frames(90, seed=7)
+        metrics = compute_pose_metrics({"frames": frames})
+
+        # No frames given: the series compute_pose_metrics attached are used
+        reused = build_pose_metric_evidence({"frames": []}, metrics)
+        fresh = build_pose_metric_evidence({"frames": frames}, {"metrics": {}})
+
+        assert reused == fresh
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,94 @@
+"""Range-aware pose extraction: seek once, analyse only the slice, absolute timestamps."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("cv2")
+
+from backend.services import pose_service
+from backend.tests._video_utils import (
+    fake_pose_dependencies,
+    frame_value,
+    write_test_video,
+)
+
+
+@pytest.fixture
+def clip(tmp_path):
+    return write_test_video(tmp_path / "clip.avi", seconds=10.0, fps=30.0)
+
+
+@pytest.fixture
+def detectors(monkeypatch):
+    created = []
+    monkeypatch.setattr(pose_service, "_import_cv2_and_mediapipe", fake_pose_dependencies(created))
+    return created
+
+
+def test_range_processes_only_its_slice_with_absolute_timestamps(clip, detectors):
+    result = pose_service.extract_pose_keypoints_from_video(
+        str(clip), sample_fps=5.0, start_sec=4.0, end_sec=7.0
+    )
+
+    frame_nums = [f["frame_num"] for f in result["frames"]]
+    assert frame_nums == list(range(120, 210, 6))
+    assert result["frames"][0]["timestamp"] == pytest.approx(4.0)
+    assert result["segment"] == {
+        "start_sec": 4.0,
+        "end_sec": 7.0,
+        "start_frame": 120,
+        "end_frame": 210,
+    }
+
+    (detector,) = detectors
+    assert len(detector.calls) == len(frame_nums)
+    # The decoded pixels belong to the stamped frame, i.e. the seek landed exactly.
+    for (timestamp_ms, level), frame_num in zip(detector.calls, frame_nums, strict=True):
+        assert timestamp_ms == int(frame_num / 30.0 * 1000)
+        assert level == pytest.approx(frame_value(frame_num), abs=2)
+
+
+def test_adjacent_ranges_cover_the_full_run_exactly(clip, detectors):
+    full = pose_service.extract_pose_keypoints_from_video(str(clip), sample_fps=4.0)
+    chunked = []
+    for start, end in [(0.0, 3.5), (3.5, 7.0), (7.0, 10.0)]:
+        part = pose_service.extract_pose_keypoints_from_video(
+            str(clip), sample_fps=4.0, start_sec=start, end_sec=end
+        )
+        chunked.extend(part["frames"])
+
+    assert [f["frame_num"] for f in chunked] == [f["frame_num"] for f in full["frames"]]
+    assert [f["timestamp"] for f in chunked] == [f["timestamp"] for f in full["frames"]]
+    assert sum(len(d.calls) for d in detectors[1:]) == len(detectors[0].calls)
+
+
+def test_max_seconds_is_relative_to_range_start(clip, detectors):
+    result = pose_service.extract_pose_keypoints_from_video(
+        str(clip), sample_fps=2.0, start_sec=5.0, max_seconds=2.0
+    )
+
+    assert [f["timestamp"] for f in result["frames"]] == [5.0, 5.5, 6.0, 6.5, 7.0]
+
+
+def test_gpu_chunk_poses_use_the_chunk_range(clip, detectors):
+    from backend.workers.gpu_chunk_worker import extract_chunk_poses
+
+    data = extract_chunk_poses(
+        video_path=str(clip), start_sec=6.0, end_sec=8.0, sample_fps=2.0, max_width=640
+    )
+
+    assert [p["timestamp"] for p in data["poses"]] == [6.0, 6.5, 7.0, 7.5]
+    assert data["metadata"]["start_frame"] == 180
+    assert data["metadata"]["end_frame"] == 240
+    assert data["metadata"]["video_fps"] == pytest.approx(30.0)
+
+
+def test_results_report_per_stage_timings(clip, detectors):
+    result = pose_service.extract_pose_keypoints_from_video(str(clip), sample_fps=5.0)
+
+    timings = result["timings"]
+    assert set(timings) >= {"decode_s", "preprocess_s", "queue_wait_s", "inference_s", "total_s"}
+    assert timings["frames_retrieved"] == len(result["frames"]) == 50
+    assert timings["frames_grabbed"] == 250
+    assert 0 < timings["decode_s"] <= timings["total_s"]
@@ -0,0 +1,134 @@
+"""Tests for the cached, parallel training feature pipeline."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.services.training_feature_pipeline import (
+    build_feature_frame,
+    engineer_score_features,
+    engineer_win_features,
+)
+
+
+def _match_frame(seed: int, n: int = 24) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    runs = np.cumsum(rng.choice([0, 0, 1, 1, 2, 4, 6], size=n))
+    wickets = np.minimum(np.cumsum(rng.random(n) < 0.08), 10)
+    completed = np.arange(n) // 6
+    return pd.DataFrame(
+        {
+            "completed_overs": completed,
+            "balls_remaining": 120 - np.arange(n),
+            "wickets": wickets,
+            "total_runs": runs,
+            "final_score": int(runs[-1]) + 20,
+            "is_powerplay": (completed < 6).astype(int),
+        }
+    )
+
+
+def _write_snapshots(root: Path, count: int = 3) -> Path:
+    fmt_dir = root / "t20"
+    fmt_dir.mkdir(parents=True)
+    for i in range(count):
+        _match_frame(i).to_csv(fmt_dir / f"match_{i}.csv", index=False)
+    return root
+
+
+def _reference_score_rolling(group: pd.DataFrame) -> pd.DataFrame:
+    """The groupby-apply formulation the training script used before."""
+    group = group.copy()
+    group["strike_rotation_last_6"] = (
+        group["total_runs"]
+        .diff()
+        .fillna(0)
+        .rolling(6, min_periods=1)
+        .apply(lambda x: x[x.between(1, 2)].sum() / x.sum() if x.sum() > 0 else 0)
+    )
+    group["last_5_runs"] = group["total_runs"].diff(periods=min(5, len(group))).fillna(0)
+    return group
+
+
+def test_score_features_match_groupby_reference():
+    df = _match_frame(7)
+    df["match_id"] = "m"
+    features = engineer_score_features(df, "t20")
+    reference = _reference_score_rolling(df)
+
+    np.testing.assert_allclose(
+        features["strike_rotation_last_6"], reference["strike_rotation_last_6"], atol=1e-12
+    )
+    np.testing.assert_allclose(features["last_5_runs"], reference["last_5_runs"])
+
+
+def test_win_features_have_no_nans():
+    df = _match_frame(3)
+    features = engineer_win_features(df, "t20")
+
+    assert not features.isna().any().any()
+    assert features["wickets_left"].iloc[0] == 10 - df["wickets"].iloc[0]
+
+
+def test_pipeline_caches_and_recomputes_only_changed_matches(tmp_path):
+    snapshots = _write_snapshots(tmp_path / "snapshots")
+    cache = tmp_path / "cache"
+
+    first = build_feature_frame(
+        "t20", "win", snapshots_dir=snapshots, cache_dir=cache, max_workers=1
+    )
+    assert first.matches_computed == 3
+    assert first.matches_cached == 0
+    assert set(first.frame["match_id"]) == {"match_0", "match_1", "match_2"}
+    assert set(first.timings) == {"hash", "engineer", "load_cache"}
+
+    second = build_feature_frame(
+        "t20", "win", snapshots_dir=snapshots, cache_dir=cache, max_workers=1
+    )
+    assert second.matches_computed == 0
+    assert second.matches_cached == 3
+    pd.testing.assert_frame_equal(first.frame, second.frame)
+
+    _match_frame(99).to_csv(snapshots / "t20" / "match_1.csv", index=False)
+    third = build_feature_frame(
+        "t20", "win", snapshots_dir=snapshots, cache_dir=cache, max_workers=1
+    )
+    assert third.matches_computed == 1
+    assert third.matches_cached == 2
+    # The superseded cache entry for match_1 is removed.
+    assert len(list((cache / "win" / "t20").glob("match_1.*"))) == 1
+
+
+def test_pipeline_process_pool_matches_inline(tmp_path):
+    snapshots = _write_snapshots(tmp_path / "snapshots", count=4)
+
+    inline = build_feature_frame(
+        "t20", "score", snapshots_dir=snapshots, cache_dir=tmp_path / "a", max_workers=1
+    )
+    pooled = build_feature_frame(
+        "t20", "score", snapshots_dir=snapshots, cache_dir=tmp_path / "b", max_workers=2
+    )
+
+    pd.testing.assert_frame_equal(inline.frame, pooled.frame)
+
+
+def test_pipeline_reports_failed_matches(tmp_path):
+    snapshots = _write_snapshots(tmp_path / "snapshots", count=2)
+    (snapshots / "t20" / "broken.csv").write_text("completed_overs\n1\n", encoding="utf-8")
+
+    result = build_feature_frame(
+        "t20", "win", snapshots_dir=snapshots, cache_dir=tmp_path / "cache", max_workers=1
+    )
+
+    assert "broken" in result.failed
+    assert result.matches_computed == 2
+    assert "broken" not in set(result.frame["match_id"])
+
+
+def test_pipeline_requires_snapshots(tmp_path):
+    with pytest.raises(ValueError):
+        build_feature_frame("t20", "win", snapshots_dir=tmp_path, cache_dir=tmp_path / "c")
@@ -0,0 +1,124 @@
+"""Chunk planning: keyframe probe, balanced keyframe-aligned boundaries, fixed fallback."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+pytest.importorskip("cv2")
+
+from backend.services import pose_service
+from backend.services.video_chunking import (
+    KeyframeIndex,
+    plan_keyframe_chunks,
+    plan_video_chunks,
+    probe_keyframes,
+)
+from backend.tests._video_utils import fake_pose_dependencies, real_cv2
+
+FPS = 30.0
+
+
+def _write_gop_clip(path, *, seconds=10.0, size=(160, 120)):
+    """MPEG-4 clip with a moving block (the encoder puts a keyframe every 12 frames)."""
+    cv2 = real_cv2()
+    width, height = size
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"mp4v"), FPS, (width, height))
+    try:
+        for i in range(round(seconds * FPS)):
+            frame = np.full((height, width, 3), 60, dtype=np.uint8)
+            x = i % (width - 30)
+            frame[40:80, x : x + 30] = 220
+            writer.write(frame)
+    finally:
+        writer.release()
+    return path
+
+
+@pytest.fixture
+def clip(tmp_path):
+    return _write_gop_clip(tmp_path / "gop.mp4")
+
+
+def _sizes(plan):
+    return [spec["end_frame"] - spec["start_frame"] for spec in plan.specs]
+
+
+def test_probe_lists_keyframes_without_decoding(clip):
+    index = probe_keyframes(str(clip))
+
+    assert index.fps == FPS
+    assert index.frame_count == 300
+    assert index.keyframes[0] == 0
+    assert len(index.keyframes) > 1
+    assert index.keyframes == sorted(index.keyframes)
+
+
+def test_boundaries_are_balanced_and_start_on_keyframes():
+    keyframes = list(range(0, 1950, 48))
+    index = KeyframeIndex(fps=FPS, frame_count=1950, keyframes=keyframes)  # 65 s
+
+    plan = plan_keyframe_chunks(index, chunk_seconds=30)
+
+    # Three ~21.7 s chunks instead of 30 + 30 + 5
+    assert len(plan.specs) == 3
+    assert all(spec["keyframe_start"] for spec in plan.specs)
+    assert {spec["start_frame"] for spec in plan.specs} <= set(keyframes)
+    assert max(_sizes(plan)) - min(_sizes(plan)) <= 2 * 48
+    assert plan.specs[0]["start_frame"] == 0 and plan.specs[-1]["end_frame"] == 1950
+    for previous, spec in zip(plan.specs, plan.specs[1:], strict=False):
+        assert spec["start_frame"] == previous["end_frame"]
+        assert spec["start_sec"] == previous["end_sec"]
+    # Seconds map back onto the exact frames the pose service seeks to
+    assert [round(spec["start_sec"] * FPS) for spec in plan.specs] == [
+        spec["start_frame"] for spec in plan.specs
+    ]
+
+    described = plan.describe()
+    assert described["method"] == "keyframes"
+    assert described["aligned_starts"] == 3
+    assert described["start_frames"] == [spec["start_frame"] for spec in plan.specs]
+
+
+def test_boundaries_without_a_nearby_keyframe_stay_even():
+    index = KeyframeIndex(fps=FPS, frame_count=1800, keyframes=[0, 10])
+
+    plan = plan_keyframe_chunks(index, chunk_seconds=20, duration_seconds=60.5)
+
+    assert [spec["start_frame"] for spec in plan.specs] == [0, 600, 1200]
+    assert [spec["keyframe_start"] for spec in plan.specs] == [True, False, False]
+    assert plan.specs[-1]["end_sec"] == 60.5  # container duration covers trailing frames
+
+
+def test_fixed_chunks_when_alignment_is_off_or_the_probe_fails(clip, tmp_path, monkeypatch):
+    from backend.config import settings
+
+    assert plan_video_chunks(str(tmp_path / "missing.mp4"), 65.0, 30).method == "fixed"
+
+    monkeypatch.setattr(settings, "CHUNK_KEYFRAME_ALIGN", False)
+    plan = plan_video_chunks(str(clip), 10.0, 4)
+
+    assert plan.method == "fixed"
+    assert [(s["start_sec"], s["end_sec"]) for s in plan.specs] == [(0, 4), (4, 8), (8, 10)]
+    assert plan.describe() == {"method": "fixed", "chunk_seconds": 4, "chunks": 3}
+
+
+def test_chunk_extractions_reassemble_the_full_run(clip, monkeypatch):
+    monkeypatch.setattr(pose_service, "_import_cv2_and_mediapipe", fake_pose_dependencies([]))
+
+    plan = plan_video_chunks(str(clip), 10.0, 4)
+    full = pose_service.extract_pose_keypoints_from_video(str(clip), sample_fps=10.0)
+    chunked = [
+        pose_service.extract_pose_keypoints_from_video(
+            str(clip), sample_fps=10.0, start_sec=spec["start_sec"], end_sec=spec["end_sec"]
+        )
+        for spec in plan.specs
+    ]
+
+    assert plan.method == "keyframes" and len(plan.specs) == 3
+    assert [result["segment"]["start_frame"] for result in chunked] == [
+        spec["start_frame"] for spec in plan.specs
+    ]
+    assert [f["frame_num"] for result in chunked for f in result["frames"]] == [
+        f["frame_num"] for f in full["frames"]
+    ]
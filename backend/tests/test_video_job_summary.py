@@ -0,0 +1,114 @@
+"""Session job summaries: latest-job projection used by video session listings."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from backend.services.video_job_summary import load_session_job_summaries
+from backend.sql_app.models import (
+    OwnerTypeEnum,
+    VideoAnalysisJob,
+    VideoAnalysisJobStatus,
+    VideoSession,
+    VideoSessionStatus,
+)
+
+
+async def _session(db_session, owner_id, title):
+    session = VideoSession(
+        owner_type=OwnerTypeEnum.coach,
+        owner_id=owner_id,
+        title=title,
+        player_ids=[],
+        status=VideoSessionStatus.ready,
+    )
+    db_session.add(session)
+    await db_session.commit()
+    return session.id
+
+
+def _job(session_id, minutes_ago, status=VideoAnalysisJobStatus.done, **fields):
+    return VideoAnalysisJob(
+        session_id=session_id,
+        status=status,
+        created_at=datetime.now(UTC) - timedelta(minutes=minutes_ago),
+        **fields,
+    )
+
+
+@pytest.mark.asyncio
+async def test_summaries_report_the_latest_job_per_session(db_session, test_user):
+    first = await _session(db_session, test_user.id, "First")
+    second = await _session(db_session, test_user.id, "Second")
+    empty = await _session(db_session, test_user.id, "No jobs")
+    latest = _job(first, 1, deep_results={"metrics": {"score": 7}}, deep_report={"text": "ok"})
+    db_session.add_all(
+        [
+            _job(first, 30, VideoAnalysisJobStatus.failed, quick_results={"frames": []}),
+            latest,
+            _job(first, 10, pdf_s3_key="reports/older.pdf"),
+            _job(second, 5, VideoAnalysisJobStatus.queued),
+        ]
+    )
+    await db_session.commit()
+
+    summaries = await load_session_job_summaries(db_session, [first, second, empty])
+
+    assert set(summaries) == {first, second}
+    assert summaries[first].job_count == 3
+    assert summaries[first].latest_job.id == latest.id
+    assert summaries[first].latest_job.results_available is True
+    assert summaries[first].latest_job.report_available is True
+    assert summaries[first].latest_job.pdf_available is False
+    assert summaries[second].job_count == 1
+    assert summaries[second].latest_job.status == VideoAnalysisJobStatus.queued
+    assert await load_session_job_summaries(db_session, []) == {}
+
+
+@pytest.mark.asyncio
+async def test_empty_artifacts_do_not_count_as_available(db_session, test_user):
+    session_id = await _session(db_session, test_user.id, "Empty artifacts")
+    db_session.add(
+        _job(
+            session_id,
+            1,
+            results={},
+            quick_findings=[],
+            quick_report={},
+            deep_results_s3_key="",
+            pdf_s3_key="",
+        )
+    )
+    await db_session.commit()
+
+    (summary,) = (await load_session_job_summaries(db_session, [session_id])).values()
+
+    assert not summary.latest_job.results_available
+    assert not summary.latest_job.report_available
+    assert not summary.latest_job.pdf_available
+
+    db_session.add(_job(session_id, 0, deep_results_s3_key="jobs/x/deep.json"))
+    await db_session.commit()
+
+    (summary,) = (await load_session_job_summaries(db_session, [session_id])).values()
+    assert summary.job_count == 2
+    assert summary.latest_job.results_available
+
+
+@pytest.mark.asyncio
+async def test_session_detail_uses_the_summary(async_client, db_session, auth_headers, test_user):
+    session_id = await _session(db_session, test_user.id, "Detail")
+    job = _job(session_id, 1, quick_results={"frames": [1]}, pdf_s3_key="reports/r.pdf")
+    db_session.add(job)
+    await db_session.commit()
+
+    resp = await async_client.get(f"/api/coaches/plus/sessions/{session_id}", headers=auth_headers)
+    assert resp.status_code == 200, resp.text
+    body = resp.json()
+    assert body["analysis_job_count"] == 1
+    assert body["latest_job_id"] == job.id
+    assert body["latest_job_results_available"] is True
+    assert body["latest_job_pdf_available"] is True
+    assert body["missing_artifacts"] == ["analysis_report"]
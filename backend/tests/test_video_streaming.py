@@ -0,0 +1,156 @@
+"""Streaming video input: presigned URLs read with ranged requests from an S3 stand-in."""
+
+from __future__ import annotations
+
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from botocore.exceptions import ClientError
+
+pytest.importorskip("cv2")
+
+from backend.services import pose_service
+from backend.services.frame_sampler import is_video_url, video_source_label
+from backend.tests._video_utils import fake_pose_dependencies, write_test_video
+
+
+class _S3StandIn(ThreadingHTTPServer):
+    """Path-style S3 GetObject/HeadObject with Range support (signatures are not checked)."""
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _S3Handler)
+        self.objects: dict[str, bytes] = {}
+        self.requests: list[tuple[str, str, int | None]] = []  # method, key, range start
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _S3Handler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_HEAD(self):
+        self._respond(send_body=False)
+
+    def do_GET(self):
+        self._respond(send_body=True)
+
+    def _respond(self, *, send_body):
+        key = self.path.split("?", 1)[0].lstrip("/")
+        body = self.server.objects.get(key)
+        match = re.match(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+        self.server.requests.append((self.command, key, int(match[1]) if match else None))
+        if body is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        start, end = 0, len(body) - 1
+        if match:
+            start, end = int(match[1]), min(int(match[2] or end), end)
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(body)}")
+        else:
+            self.send_response(200)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(end - start + 1))
+        self.end_headers()
+        if not send_body:
+            return
+        try:
+            for offset in range(start, end + 1, 65536):
+                self.wfile.write(body[offset : min(offset + 65536, end + 1)])
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # the decoder closes open-ended reads once it has what it needs
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    from backend.config import settings
+
+    server = _S3StandIn()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(settings, "S3_ENDPOINT_URL", server.url)
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "test")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "test")
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def detectors(monkeypatch):
+    created = []
+    monkeypatch.setattr(pose_service, "_import_cv2_and_mediapipe", fake_pose_dependencies(created))
+    return created
+
+
+def test_url_sources_are_recognised_and_logged_without_signatures():
+    url = "https://bucket.s3.amazonaws.com/videos/original.mp4?X-Amz-Signature=secret"
+
+    assert is_video_url(url)
+    assert not is_video_url("/tmp/original.mp4")
+    assert video_source_label(url) == "https://bucket.s3.amazonaws.com/videos/original.mp4"
+
+
+@pytest.mark.asyncio
+async def test_chunk_streams_only_its_window(tmp_path, s3, detectors):
+    from backend.workers import gpu_chunk_worker
+
+    clip = write_test_video(tmp_path / "clip.avi", seconds=20.0, fps=30.0, size=(320, 240))
+    s3.objects["videos/session/original.avi"] = clip.read_bytes()
+    size = len(s3.objects["videos/session/original.avi"])
+
+    source = await gpu_chunk_worker._open_video_source(
+        bucket="videos", key="session/original.avi", tmpdir=str(tmp_path), chunk_id="c1"
+    )
+    streamed = gpu_chunk_worker.extract_chunk_poses(source, 12.0, 16.0, 10.0, 640)
+    local = gpu_chunk_worker.extract_chunk_poses(str(clip), 12.0, 16.0, 10.0, 640)
+
+    assert is_video_url(source)
+    assert not list(tmp_path.glob("video.*"))  # nothing was downloaded
+    assert streamed["metadata"] == local["metadata"]
+    assert [f["frame_num"] for f in streamed["poses"]] == [f["frame_num"] for f in local["poses"]]
+    assert [c[1] for c in detectors[0].calls] == [c[1] for c in detectors[1].calls]
+    # The seek to 12 s became a ranged read starting inside the chunk's window
+    starts = [start for method, _, start in s3.requests if method == "GET" and start]
+    assert any(0.5 * size < start < 0.8 * size for start in starts)
+
+
+@pytest.mark.asyncio
+async def test_missing_object_fails_before_decoding(tmp_path, s3):
+    from backend.workers import analysis_worker
+
+    with pytest.raises(ClientError):
+        await analysis_worker._open_video_source(
+            bucket="videos", key="missing.mp4", tmpdir=str(tmp_path), job_id="j1"
+        )
+    assert [method for method, _, _ in s3.requests] == ["HEAD"]
+
+
+@pytest.mark.asyncio
+async def test_streaming_can_be_disabled(tmp_path, monkeypatch):
+    from backend.workers import analysis_worker
+
+    downloads = []
+
+    async def _download(*, bucket, key, dst_path, job_id):
+        downloads.append((bucket, key))
+
+    monkeypatch.setattr(analysis_worker.settings, "COACH_PLUS_STREAM_VIDEO_INPUT", False)
+    monkeypatch.setattr(analysis_worker, "_download_from_s3", _download)
+
+    source = await analysis_worker._open_video_source(
+        bucket="videos", key="a.mp4", tmpdir=str(tmp_path), job_id="j1"
+    )
+
+    assert source == str(tmp_path / "original.mp4")
+    assert downloads == [("videos", "a.mp4")]
@@ -16,149 +16,29 @@ import xgboost as xgb
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
 from sklearn.model_selection import train_test_split
 
+from backend.services.training_feature_pipeline import build_feature_frame
 
-def load_match_data(match_format: Literal["t20", "odi"]) -> pd.DataFrame:
-    """Load all CSV files for a specific match format."""
-    print(f"\n{'=' * 60}")
-    print(f"Loading {match_format.upper()} match data...")
-    print(f"{'=' * 60}")
-
-    snapshots_dir = Path(__file__).parent / "snapshots" / match_format
-    csv_files = list(snapshots_dir.glob("*.csv"))
-
-    print(f"Found {len(csv_files)} match files")
-
-    if len(csv_files) == 0:
-        raise ValueError(f"No CSV files found in {snapshots_dir}")
-
-    # Load all files
-    dfs = []
-    for i, file in enumerate(csv_files):
-        try:
-            df = pd.read_csv(file)
-            df["match_id"] = file.stem
-            dfs.append(df)
-
-            if (i + 1) % 500 == 0:
-                print(f"  Loaded {i + 1}/{len(csv_files)} files...")
-        except Exception as e:
-            print(f"  [WARN] Error loading {file.name}: {e}")
 
-    combined_df = pd.concat(dfs, ignore_index=True)
-    print(f"\n[OK] Loaded {len(combined_df):,} total match states from {len(dfs)} matches")
-    print(f"  Columns: {list(combined_df.columns)}")
-
-    return combined_df
-
-
-def engineer_features(df: pd.DataFrame, match_format: str) -> pd.DataFrame:
+def load_features(match_format: Literal["t20", "odi"]) -> pd.DataFrame:
     """
-    Create features for score prediction.
+    Load engineered score-predictor features for every match of a format.
 
-    Features needed (from T20 score predictor):
-    - runs, overs, wickets, run_rate, balls_left, wickets_left
-    - last_5_runs, match_phase_id, dot_ratio_last_over, strike_rotation_last_6
-    - etc.
+    Features are computed per match in a process pool and cached by source-file
+    hash (see backend.services.training_feature_pipeline), so reruns only
+    recompute matches whose snapshot CSV changed.
     """
-    print(f"\nEngineering features for {match_format.upper()}...")
-
-    df = df.copy()
-
-    # Basic features
-    total_overs = 20 if match_format == "t20" else 50
-
-    df["runs"] = df["total_runs"]
-    df["overs"] = df["completed_overs"]
-    df["wickets"] = df["wickets"]
-    df["run_rate"] = df["total_runs"] / df["completed_overs"].replace(0, 0.1)
-    df["balls_left"] = df["balls_remaining"]
-    df["wickets_left"] = 10 - df["wickets"]
-
-    # Match phase (early/middle/death)
-    if match_format == "t20":
-        df["match_phase_id"] = (
-            pd.cut(
-                df["completed_overs"],
-                bins=[0, 6, 15, total_overs],
-                labels=[0, 1, 2],
-                include_lowest=True,
-            )
-            .cat.codes.fillna(0)
-            .astype(int)
-        )
-    else:  # ODI
-        df["match_phase_id"] = (
-            pd.cut(
-                df["completed_overs"],
-                bins=[0, 10, 40, total_overs],
-                labels=[0, 1, 2],
-                include_lowest=True,
-            )
-            .cat.codes.fillna(0)
-            .astype(int)
-        )
-
-    # Group by match to calculate rolling features
-    def calc_rolling_features(group):
-        # Last 5 runs
-        group["last_5_runs"] = group["total_runs"].diff(periods=min(5, len(group))).fillna(0)
-
-        # Dot ratio last over (simplified)
-        group["dot_ratio_last_over"] = (
-            (group["total_runs"].diff().fillna(0) == 0).rolling(6, min_periods=1).mean()
-        )
-
-        # Strike rotation (runs scored in singles/twos)
-        group["strike_rotation_last_6"] = (
-            group["total_runs"]
-            .diff()
-            .fillna(0)
-            .rolling(6, min_periods=1)
-            .apply(lambda x: (x[x.between(1, 2)].sum() / x.sum() if x.sum() > 0 else 0))
-        )
-
-        # Run rate last 5 overs
-        group["run_rate_last_5"] = (
-            group["total_runs"].diff(periods=min(5, len(group))).fillna(0) / 5
-        )
-
-        # Boundaries ratio
-        group["boundary_ratio"] = (
-            (group["total_runs"].diff().fillna(0) >= 4).rolling(10, min_periods=1).mean()
-        )
-
-        # Momentum (acceleration)
-        group["momentum"] = group["run_rate"].diff().fillna(0).rolling(3, min_periods=1).mean()
-
-        # Wickets fallen recently
-        group["wickets_last_5"] = group["wickets"].diff(periods=min(5, len(group))).fillna(0)
-
-        # Run rate variance (consistency)
-        group["run_rate_variance"] = group["run_rate"].rolling(5, min_periods=1).std().fillna(0)
-
-        return group
-
-    df = df.groupby("match_id", group_keys=False).apply(calc_rolling_features)
-
-    # Additional context features
-    df["overs_remaining"] = df["balls_remaining"] / 6
-    df["wickets_per_over"] = df["wickets"] / df["completed_overs"].replace(0, 0.1)
-    df["runs_per_wicket"] = df["total_runs"] / df["wickets"].replace(0, 1)
-    df["balls_per_wicket"] = (df["completed_overs"] * 6) / df["wickets"].replace(0, 1)
-
-    # Powerplay flag
-    df["in_powerplay"] = df["is_powerplay"]
-
-    # Projected score based on current RR
-    df["projected_score_simple"] = df["total_runs"] + (df["run_rate"] * df["overs_remaining"])
+    print(f"\n{'=' * 60}")
+    print(f"Loading {match_format.upper()} match features...")
+    print(f"{'=' * 60}")
 
-    # Fill any remaining NaNs
-    df = df.fillna(0)
+    result = build_feature_frame(match_format, "score")
+    for stem, error in result.failed.items():
+        print(f"  [WARN] Error processing {stem}: {error}")
 
-    print("[OK] Feature engineering complete")
-    print(f"  Total features: {df.shape[1]}")
+    print(f"\n[OK] Loaded {len(result.frame):,} total match states")
+    print(result.report())
 
-    return df
+    return result.frame
 
 
 def train_score_predictor(match_format: Literal["t20", "odi"]) -> None:
@@ -168,11 +48,8 @@ def train_score_predictor(match_format: Literal["t20", "odi"]) -> None:
     print(f"TRAINING {match_format.upper()} SCORE PREDICTOR")
     print(f"{'=' * 70}")
 
-    # Load data
-    df = load_match_data(match_format)
-
-    # Engineer features
-    df = engineer_features(df, match_format)
+    # Load engineered features
+    df = load_features(match_format)
 
     # Target is the final score
     y = df["final_score"]
@@ -15,115 +15,29 @@ import xgboost as xgb
 from sklearn.metrics import accuracy_score, classification_report, roc_auc_score
 from sklearn.model_selection import train_test_split
 
+from backend.services.training_feature_pipeline import build_feature_frame
 
-def load_match_data(match_format: Literal["t20", "odi"]) -> pd.DataFrame:
-    """
-    Load all CSV files for a specific match format.
 
-    Args:
-        match_format: Either 't20' or 'odi'
+def load_features(match_format: Literal["t20", "odi"]) -> pd.DataFrame:
+    """
+    Load engineered win-predictor features for every match of a format.
 
-    Returns:
-        DataFrame with all match data
+    Features are computed per match in a process pool and cached by source-file
+    hash (see backend.services.training_feature_pipeline), so reruns only
+    recompute matches whose snapshot CSV changed.
     """
     print(f"\n{'=' * 60}")
-    print(f"Loading {match_format.upper()} match data...")
+    print(f"Loading {match_format.upper()} match features...")
     print(f"{'=' * 60}")
 
-    snapshots_dir = Path(__file__).parent / "snapshots" / match_format
-    csv_files = list(snapshots_dir.glob("*.csv"))
-
-    print(f"Found {len(csv_files)} match files")
-
-    if len(csv_files) == 0:
-        raise ValueError(f"No CSV files found in {snapshots_dir}")
-
-    # Load all files
-    dfs = []
-    for i, file in enumerate(csv_files):
-        try:
-            df = pd.read_csv(file)
-            df["match_id"] = file.stem  # Use filename as match ID
-            dfs.append(df)
-
-            if (i + 1) % 500 == 0:
-                print(f"  Loaded {i + 1}/{len(csv_files)} files...")
-        except Exception as e:
-            print(f"  [WARN] Error loading {file.name}: {e}")
-
-    combined_df = pd.concat(dfs, ignore_index=True)
-    print(f"\n[OK] Loaded {len(combined_df):,} total match states from {len(dfs)} matches")
-    print(f"  Columns: {list(combined_df.columns)}")
-
-    return combined_df
-
-
-def engineer_features(df: pd.DataFrame, match_format: str) -> pd.DataFrame:
-    """
-    Create features for win probability prediction.
-
-    Features needed for ODI win predictor (from your model):
-    - over_progress
-    - balls_left
-    - wickets_left
-    - run_rate
-    - run_rate_last_3
-    - acceleration
-    - dot_ratio_last_6
-    - boundary_density_last_3
-    - required_run_rate
-    - runs_needed
-    - + 2 more
-    """
-    print(f"\nEngineering features for {match_format.upper()}...")
+    result = build_feature_frame(match_format, "win")
+    for stem, error in result.failed.items():
+        print(f"  [WARN] Error processing {stem}: {error}")
 
-    df = df.copy()
+    print(f"\n[OK] Loaded {len(result.frame):,} total match states")
+    print(result.report())
 
-    # Basic features
-    total_overs = 20 if match_format == "t20" else 50
-
-    df["over_progress"] = df["completed_overs"] / total_overs
-    df["balls_left"] = df["balls_remaining"]
-    df["wickets_left"] = 10 - df["wickets"]
-    df["run_rate"] = df["total_runs"] / df["completed_overs"].replace(0, 0.1)
-
-    # Group by match to calculate rolling features
-    def calc_rolling_features(group):
-        # Run rate last 3 overs
-        group["run_rate_last_3"] = (
-            group["total_runs"].diff(periods=min(3, len(group))).fillna(0) / 3
-        )
-
-        # Acceleration (difference between current RR and last 3 overs RR)
-        group["acceleration"] = group["run_rate"] - group["run_rate_last_3"]
-
-        # Dots and boundaries (simplified - using run patterns)
-        group["dot_ratio_last_6"] = (
-            (group["total_runs"].diff().fillna(0) == 0).rolling(6, min_periods=1).mean()
-        )
-        group["boundary_density_last_3"] = (
-            (group["total_runs"].diff().fillna(0) >= 4).rolling(3, min_periods=1).mean()
-        )
-
-        return group
-
-    df = df.groupby("match_id", group_keys=False).apply(calc_rolling_features)
-
-    # Target-based features
-    df["runs_needed"] = df["final_score"] - df["total_runs"]
-    df["required_run_rate"] = df["runs_needed"] / (df["balls_remaining"] / 6).replace(0, 0.1)
-
-    # Additional features
-    df["wickets_per_over"] = df["wickets"] / df["completed_overs"].replace(0, 0.1)
-    df["runs_per_wicket"] = df["total_runs"] / df["wickets"].replace(0, 1)
-
-    # Fill any remaining NaNs
-    df = df.fillna(0)
-
-    print("[OK] Feature engineering complete")
-    print(f"  Total features: {df.shape[1]}")
-
-    return df
+    return result.frame
 
 
 def create_target_variable(df: pd.DataFrame) -> pd.DataFrame:
@@ -157,11 +71,8 @@ def train_win_predictor(match_format: Literal["t20", "odi"]) -> None:
     print(f"TRAINING {match_format.upper()} WIN PROBABILITY PREDICTOR")
     print(f"{'=' * 70}")
 
-    # Load data
-    df = load_match_data(match_format)
-
-    # Engineer features
-    df = engineer_features(df, match_format)
+    # Load engineered features
+    df = load_features(match_format)
 
     # Create target
     df = create_target_variable(df)
@@ -0,0 +1,142 @@
+"""
+Analysis Pool - run CPU-bound video analysis off the worker's event loop.
+
+Pose extraction and ball tracking can take minutes per video. Running them on
+the asyncio loop (or even in a thread, where the GIL-bound parts compete with
+the loop) stalls progress updates, heartbeats and signal handling. The pool
+runs them in worker processes instead (or in a thread when configured with
+``processes=0``) and marshals events back to the loop:
+
+- the analysis function receives a ``Reporter`` and calls ``reporter.send(...)``
+  for progress/intermediate results; the loop-side ``on_event`` callback is
+  invoked with the same arguments on the event loop,
+- ``reporter.check()`` raises ``AnalysisCancelled`` once the awaiting task has
+  been cancelled, so long loops stop at the next frame.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import multiprocessing
+import queue
+import threading
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# How long a cancelled analysis may take to notice and unwind before we give up waiting
+CANCEL_GRACE_SECONDS = 30.0
+
+_STOP = None  # Channel sentinel (must survive pickling through a Manager queue)
+
+
+class AnalysisCancelled(Exception):
+    """Raised inside an analysis once its job has been cancelled."""
+
+
+class Reporter:
+    """Handed to analysis functions: cancellation checks plus an event channel."""
+
+    def __init__(self, channel: Any, cancel: Any) -> None:
+        self._channel = channel
+        self._cancel = cancel
+
+    def check(self) -> None:
+        if self._cancel.is_set():
+            raise AnalysisCancelled("Analysis cancelled")
+
+    def send(self, kind: str, *payload: Any) -> None:
+        self.check()
+        self._channel.put((kind, *payload))
+
+
+def _run_reporting(fn: Callable[..., Any], kwargs: dict[str, Any], channel: Any, cancel: Any):
+    return fn(Reporter(channel, cancel), **kwargs)
+
+
+def _pump(
+    channel: Any,
+    loop: asyncio.AbstractEventLoop,
+    on_event: Callable[..., None] | None,
+) -> None:
+    while True:
+        item = channel.get()
+        if item is _STOP:
+            return
+        if on_event is not None:
+            loop.call_soon_threadsafe(on_event, *item)
+
+
+class AnalysisPool:
+    """Runs analysis functions in a process pool (``processes > 0``) or a thread.
+
+    Functions must be importable module-level callables taking a ``Reporter`` as
+    their first argument; keyword arguments and return values must be picklable
+    when a process pool is used. Worker processes are started lazily with the
+    ``spawn`` method (safe alongside threads and MediaPipe) and reused across jobs;
+    ``initializer`` (e.g. loading a model) runs once in each worker process.
+    """
+
+    def __init__(self, processes: int = 1, *, initializer: Callable[[], Any] | None = None) -> None:
+        self.processes = max(0, int(processes))
+        self.initializer = initializer
+        self._executor: ProcessPoolExecutor | None = None
+        self._manager: Any = None
+
+    def _ensure_started(self) -> None:
+        if self.processes and self._executor is None:
+            ctx = multiprocessing.get_context("spawn")
+            self._manager = ctx.Manager()
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.processes, mp_context=ctx, initializer=self.initializer
+            )
+            logger.info(f"Started analysis process pool: processes={self.processes}")
+
+    async def run(
+        self,
+        fn: Callable[..., Any],
+        /,
+        *,
+        on_event: Callable[..., None] | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Run ``fn(reporter, **kwargs)`` off the loop and return its result.
+
+        Cancelling the awaiting task signals the analysis to stop (it raises
+        ``AnalysisCancelled`` at its next ``check``/``send``), waits up to
+        ``CANCEL_GRACE_SECONDS`` for it to unwind and then re-raises.
+        """
+        loop = asyncio.get_running_loop()
+        self._ensure_started()
+        if self._executor is not None:
+            channel, cancel = self._manager.Queue(), self._manager.Event()
+        else:
+            channel, cancel = queue.Queue(), threading.Event()
+
+        future = loop.run_in_executor(self._executor, _run_reporting, fn, kwargs, channel, cancel)
+        pump = asyncio.ensure_future(asyncio.to_thread(_pump, channel, loop, on_event))
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            cancel.set()
+            with contextlib.suppress(BaseException):
+                await asyncio.wait_for(future, CANCEL_GRACE_SECONDS)
+            raise
+        finally:
+            # Everything the analysis sent was queued before its result, so the pump
+            # delivers all events before it sees the sentinel.
+            channel.put(_STOP)
+            with contextlib.suppress(BaseException):
+                await pump
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
@@ -4,26 +4,56 @@ import asyncio
 import contextlib
 import json
 import logging
+import math
 import os
 import signal
 import tempfile
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any, cast
 
 import boto3
 from botocore.exceptions import ClientError
-from sqlalchemy import select
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from backend.config import settings
 from backend.services.chunk_aggregation import aggregate_chunks_and_finalize
-from backend.services.coach_plus_analysis import run_pose_metrics_findings_report
+from backend.services.coach_plus_analysis import (
+    AnalysisArtifacts,
+    AnalysisPass,
+    run_multi_rate_analysis,
+)
+from backend.services.job_progress import job_progress_event, publish_job_progress
+from backend.services.job_wakeup import JOBS_TOPIC, IdleBackoff, get_wakeup_channel
+from backend.services.motion_sampling import MotionSampling
+from backend.services.pose_artifact import POSE_NPZ_CONTENT_TYPE, PoseArrays, dumps_pose_npz
+from backend.services.pose_cache import (
+    PoseCacheKey,
+    load_pose_result,
+    pack_pose_result,
+    pose_model_version,
+    store_pose_result,
+    unpack_pose_result,
+    video_content_id,
+)
+from backend.services.pose_service import warm_pose_detector
+from backend.services.video_source import presign_video_stream
 from backend.sql_app.database import get_engine, get_session_local
 from backend.sql_app.models import VideoAnalysisJob, VideoAnalysisJobStatus, VideoSessionStatus
+from backend.workers.analysis_pool import AnalysisPool, Reporter
+from backend.workers.job_scheduler import UNKNOWN_DURATION_ESTIMATE_SECONDS, JobScheduler
 
 logger = logging.getLogger(__name__)
 
 
+# Frame width pose extraction runs at (part of the pose cache key)
+ANALYSIS_MAX_WIDTH = 640
+# Sampled frames between cancellation checks while tracking the ball
+BALL_TRACKING_CHECK_FRAMES = 10
+
+
 def _now_utc() -> datetime:
     # Keep consistent with DB timezone-aware columns
     return datetime.now(UTC)
@@ -76,9 +106,22 @@ async def _download_from_s3(
     await loop.run_in_executor(None, _dl)
 
 
-async def _upload_json_to_s3(*, bucket: str, key: str, payload: dict[str, Any]) -> None:
+async def _open_video_source(*, bucket: str, key: str, tmpdir: str, job_id: str) -> str:
+    """Return what the decoders read the job's video from.
+
+    A presigned URL streamed with ranged reads, so analysis starts without waiting
+    for the whole object; with ``COACH_PLUS_STREAM_VIDEO_INPUT`` off, a local copy
+    downloaded into ``tmpdir``.
+    """
+    if settings.COACH_PLUS_STREAM_VIDEO_INPUT:
+        return await presign_video_stream(bucket=bucket, key=key, context=f"job_id={job_id}")
+    local_video_path = os.path.join(tmpdir, "original.mp4")
+    await _download_from_s3(bucket=bucket, key=key, dst_path=local_video_path, job_id=job_id)
+    return local_video_path
+
+
+async def _upload_bytes_to_s3(*, bucket: str, key: str, body: bytes, content_type: str) -> None:
     s3 = cast(Any, boto3.client("s3", region_name=settings.AWS_REGION))  # pyright: ignore[reportUnknownMemberType]
-    body = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
     loop = asyncio.get_running_loop()
 
     def _put() -> None:
@@ -86,19 +129,279 @@ async def _upload_json_to_s3(*, bucket: str, key: str, payload: dict[str, Any])
             Bucket=bucket,
             Key=key,
             Body=body,
-            ContentType="application/json",
+            ContentType=content_type,
         )
 
     await loop.run_in_executor(None, _put)
 
 
+async def _upload_json_to_s3(*, bucket: str, key: str, payload: dict[str, Any]) -> None:
+    body = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    await _upload_bytes_to_s3(bucket=bucket, key=key, body=body, content_type="application/json")
+
+
 def _derive_output_key(input_key: str, leaf_name: str) -> str:
     # input_key ends with /original.mp4; keep same subtree
     base = input_key.rsplit("/", 1)[0]
     return f"{base}/analysis/{leaf_name}"
 
 
+_analysis_pool: AnalysisPool | None = None
+
+
+def _get_analysis_pool() -> AnalysisPool:
+    global _analysis_pool
+    if _analysis_pool is None:
+        processes = int(settings.COACH_PLUS_ANALYSIS_PROCESSES)
+        if processes > 0:
+            # One process per job slot, or the fast lane would queue behind long jobs
+            processes = max(processes, int(settings.COACH_PLUS_WORKER_SLOTS))
+        # Each worker process loads the pose model once, at start-up
+        _analysis_pool = AnalysisPool(processes, initializer=warm_pose_detector)
+    return _analysis_pool
+
+
+def _build_scheduler() -> JobScheduler:
+    return JobScheduler(
+        slots=int(settings.COACH_PLUS_WORKER_SLOTS),
+        fast_lane_seconds=float(settings.COACH_PLUS_FAST_LANE_SECONDS),
+        max_inflight_seconds=float(settings.COACH_PLUS_MAX_INFLIGHT_VIDEO_SECONDS),
+    )
+
+
+def _analyse_video(
+    reporter: Reporter,
+    *,
+    video_path: str,
+    passes: list[AnalysisPass],
+    analysis_mode: str | None,
+    cached_poses: dict[str, bytes] | None = None,
+    send_poses: bool = False,
+) -> dict[str, AnalysisArtifacts]:
+    """Pool entry point: multi-rate pose analysis reporting progress and early QUICK.
+
+    Passes in ``cached_poses`` (packed pose cache entries) are not extracted again;
+    with ``send_poses`` each freshly extracted pass is sent back packed for the cache.
+    """
+    last_pct: dict[str, int] = {}
+
+    def _on_progress(fractions: dict[str, float]) -> None:
+        pct = {name: int(fraction * 100) for name, fraction in fractions.items()}
+        if pct == last_pct:
+            reporter.check()
+            return
+        last_pct.update(pct)
+        reporter.send("progress", fractions)
+
+    def _on_pose(name: str, pose_data: dict[str, Any]) -> None:
+        reporter.send("pose", name, pack_pose_result(pose_data))
+
+    return run_multi_rate_analysis(
+        video_path=video_path,
+        passes=passes,
+        max_width=ANALYSIS_MAX_WIDTH,
+        player_context=None,
+        analysis_mode=analysis_mode,
+        on_artifacts=lambda name, artifacts: reporter.send("artifacts", name, artifacts),
+        on_progress=_on_progress,
+        cached_poses={
+            name: unpack_pose_result(body) for name, body in (cached_poses or {}).items()
+        },
+        on_pose=_on_pose if send_poses else None,
+    )
+
+
+def _track_ball(
+    reporter: Reporter, *, video_path: str, sample_fps: float, tracking_mode: str = "detect"
+) -> tuple[Any, Any]:
+    """Pool entry point: ball tracking + trajectory metrics for bowling analysis."""
+    from backend.services.ball_tracking_service import BallTracker, analyze_ball_trajectory
+
+    def _on_frame(sampled: int) -> None:
+        if sampled % BALL_TRACKING_CHECK_FRAMES == 0:
+            reporter.check()
+
+    reporter.check()
+    # TODO: make ball color configurable
+    tracker = BallTracker(ball_color="red", tracking_mode=tracking_mode)
+    trajectory = tracker.track_ball_in_video(
+        video_path=video_path, sample_fps=sample_fps, on_frame=_on_frame
+    )
+    return trajectory, analyze_ball_trajectory(trajectory)
+
+
+@dataclass
+class _JobRun:
+    """Loop-side state of the job being processed (shared with its heartbeat)."""
+
+    progress_pct: int = 0
+    quick_done: bool = False
+    analysis_task: asyncio.Future[dict[str, AnalysisArtifacts]] | None = None
+    cache_writes: list[asyncio.Future[None]] = field(default_factory=list)
+
+    def on_progress(self, fractions: dict[str, float]) -> None:
+        # QUICK fills 5-50%, DEEP 50-99%; never move backwards
+        if self.quick_done:
+            pct = 50 + int(49 * fractions.get("deep", 1.0))
+        else:
+            pct = 5 + int(45 * fractions.get("quick", 0.0))
+        self.progress_pct = max(self.progress_pct, pct)
+
+
+@dataclass
+class _PoseCacheLookup:
+    """Pose cache state for one job: entry key per pass and the entries already cached."""
+
+    bucket: str = ""
+    keys: dict[str, str] = field(default_factory=dict)  # empty: caching unavailable
+    cached: dict[str, bytes] = field(default_factory=dict)
+
+    @property
+    def hits(self) -> int:
+        return len(self.cached)
+
+    @property
+    def misses(self) -> int:
+        return len(self.keys) - len(self.cached)
+
+
+def _start_multi_rate_analysis(
+    run: _JobRun,
+    *,
+    video_path: str,
+    passes: list[AnalysisPass],
+    analysis_mode: str | None,
+    pose_cache: _PoseCacheLookup | None = None,
+) -> tuple[asyncio.Future[dict[str, AnalysisArtifacts]], asyncio.Future[AnalysisArtifacts]]:
+    """Submit ``_analyse_video`` to the pool; also return a future for QUICK alone."""
+    loop = asyncio.get_running_loop()
+    quick_ready: asyncio.Future[AnalysisArtifacts] = loop.create_future()
+    pose_cache = pose_cache or _PoseCacheLookup()
+
+    def _on_event(kind: str, *payload: Any) -> None:
+        if kind == "progress":
+            run.on_progress(payload[0])
+        elif kind == "artifacts" and payload[0] == "quick" and not quick_ready.done():
+            quick_ready.set_result(payload[1])
+        elif kind == "pose" and payload[0] in pose_cache.keys:
+            name, body = payload
+            run.cache_writes.append(
+                asyncio.ensure_future(
+                    store_pose_result(pose_cache.bucket, pose_cache.keys[name], body)
+                )
+            )
+
+    run.analysis_task = asyncio.ensure_future(
+        _get_analysis_pool().run(
+            _analyse_video,
+            on_event=_on_event,
+            video_path=video_path,
+            passes=passes,
+            analysis_mode=analysis_mode,
+            cached_poses=pose_cache.cached,
+            send_poses=bool(pose_cache.keys),
+        )
+    )
+    return run.analysis_task, quick_ready
+
+
+def _deep_motion_sampling() -> MotionSampling | None:
+    """Motion-adaptive sampling for the DEEP pass, if enabled."""
+    if not settings.COACH_PLUS_MOTION_SAMPLING_ENABLED:
+        return None
+    return MotionSampling(
+        dense_fps=float(settings.COACH_PLUS_MOTION_DENSE_FPS),
+        frame_budget=int(settings.COACH_PLUS_MOTION_FRAME_BUDGET) or None,
+    )
+
+
+async def _lookup_pose_cache(
+    *, bucket: str, key: str, passes: list[AnalysisPass]
+) -> _PoseCacheLookup:
+    """Look up every pass of the job in the content-addressed pose cache."""
+    if not settings.COACH_PLUS_POSE_CACHE_ENABLED:
+        return _PoseCacheLookup()
+    content_id = await video_content_id(bucket, key)
+    if content_id is None:
+        return _PoseCacheLookup()
+
+    model_version = pose_model_version()
+    keys = {
+        p.name: PoseCacheKey(
+            content_id=content_id,
+            sample_fps=float(p.sample_fps),
+            max_width=ANALYSIS_MAX_WIDTH,
+            model_version=model_version,
+            max_seconds=p.max_seconds,
+            motion=p.motion,
+        ).s3_key()
+        for p in passes
+    }
+    bodies = await asyncio.gather(*(load_pose_result(bucket, k) for k in keys.values()))
+    cached = {name: body for name, body in zip(keys, bodies, strict=True) if body is not None}
+    return _PoseCacheLookup(bucket=bucket, keys=keys, cached=cached)
+
+
+async def _commit_progress(db: AsyncSession, job: VideoAnalysisJob) -> None:
+    """Commit a stage/progress change and push it to the job's event stream."""
+    await db.commit()
+    await publish_job_progress(job_progress_event(job))
+
+
+async def _beat(job_id: str, run: _JobRun) -> None:
+    """Stamp ``heartbeat_at`` and forward progress made since the last beat."""
+    session_local = get_session_local()
+    async with session_local() as db:
+        await db.execute(
+            update(VideoAnalysisJob)
+            .where(VideoAnalysisJob.id == job_id)
+            .values(heartbeat_at=_now_utc())
+        )
+        advanced = False
+        if run.progress_pct:
+            result = await db.execute(
+                update(VideoAnalysisJob)
+                .where(
+                    VideoAnalysisJob.id == job_id,
+                    VideoAnalysisJob.progress_pct < run.progress_pct,
+                )
+                .values(progress_pct=run.progress_pct)
+            )
+            advanced = bool(result.rowcount)
+        await db.commit()
+    if advanced:
+        await publish_job_progress({"job_id": job_id, "progress_pct": run.progress_pct})
+
+
+async def _heartbeat(job_id: str, run: _JobRun, interval: float) -> None:
+    """Beat every ``interval`` seconds while the job is being processed."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await _beat(job_id, run)
+        except Exception as e:
+            logger.warning(f"Heartbeat failed: job_id={job_id} error={e}")
+
+
 async def _process_job(job_id: str) -> None:
+    run = _JobRun()
+    heartbeat = asyncio.create_task(
+        _heartbeat(job_id, run, float(settings.COACH_PLUS_HEARTBEAT_SECONDS))
+    )
+    try:
+        await _run_job(job_id, run)
+    finally:
+        heartbeat.cancel()
+        # Pose cache stores never raise; let them finish even if the job failed later on
+        pending = [heartbeat, *run.cache_writes]
+        if run.analysis_task is not None and not run.analysis_task.done():
+            # The job failed or was cancelled mid-analysis: stop the analysis too
+            run.analysis_task.cancel()
+            pending.append(run.analysis_task)
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def _run_job(job_id: str, run: _JobRun) -> None:
     session_local = get_session_local()
 
     async with session_local() as db:
@@ -153,7 +456,7 @@ async def _process_job(job_id: str) -> None:
                 f"session.s3_bucket={video_session.s3_bucket} session.s3_key={video_session.s3_key}"
             )
             job.completed_at = _now_utc()
-            await db.commit()
+            await _commit_progress(db, job)
             logger.error(f"Job failed - missing S3 location: job_id={job_id} {job.error_message}")
             return
 
@@ -162,10 +465,8 @@ async def _process_job(job_id: str) -> None:
             f"session_id={video_session.id} using_snapshot={'yes' if job.s3_bucket else 'no'}"
         )
 
-        # Download to temp file
+        # Stream from S3 (or download to a temp file when streaming is disabled)
         with tempfile.TemporaryDirectory(prefix="coach_plus_video_") as tmpdir:
-            local_video_path = os.path.join(tmpdir, "original.mp4")
-
             # Stage: QUICK
             job.status = VideoAnalysisJobStatus.quick_running
             job.stage = "QUICK"
@@ -173,15 +474,7 @@ async def _process_job(job_id: str) -> None:
             job.started_at = job.started_at or _now_utc()
             job.quick_started_at = _now_utc()
             video_session.status = VideoSessionStatus.processing
-            await db.commit()
-
-            await _download_from_s3(
-                bucket=bucket, key=key, dst_path=local_video_path, job_id=job_id
-            )
-
-            # Best-effort progress bump
-            job.progress_pct = 5
-            await db.commit()
+            await _commit_progress(db, job)
 
             # CRITICAL: Enforce analysis_mode is set (fail fast instead of defaulting to batting)
             if not job.analysis_mode:
@@ -192,19 +485,57 @@ async def _process_job(job_id: str) -> None:
                 job.error_message = error_msg
                 job.completed_at = _now_utc()
                 video_session.status = VideoSessionStatus.failed
-                await db.commit()
+                await _commit_progress(db, job)
                 raise ValueError(error_msg)
 
-            # Pass analysis_mode from job to analysis pipeline
-            quick_artifacts = run_pose_metrics_findings_report(
-                video_path=local_video_path,
-                sample_fps=5.0,
-                include_frames=False,
-                max_width=640,
-                max_seconds=30.0,
-                player_context=None,
+            # One decode + inference pass serves both QUICK (5 fps over the first 30 s) and
+            # DEEP (job fps over the whole video); frames on both schedules are inferred
+            # once. QUICK artifacts are handed back as soon as its window is complete while
+            # the DEEP pass keeps running in the background thread.
+            passes = [AnalysisPass("quick", sample_fps=5.0, max_seconds=30.0)]
+            if deep_enabled:
+                passes.append(
+                    AnalysisPass(
+                        "deep",
+                        sample_fps=deep_fps,
+                        include_frames=include_frames,
+                        motion=_deep_motion_sampling(),
+                    )
+                )
+
+            # Retries and re-analysis of the same video reuse cached pose results
+            pose_cache = await _lookup_pose_cache(bucket=bucket, key=key, passes=passes)
+            if pose_cache.keys:
+                job.pose_cache_hits = pose_cache.hits
+                job.pose_cache_misses = pose_cache.misses
+                logger.info(
+                    f"Pose cache: job_id={job.id} hits={pose_cache.hits} misses={pose_cache.misses}"
+                )
+
+            # The video is only needed for passes that miss and for ball tracking
+            video_source = ""
+            if pose_cache.misses or not pose_cache.keys or job.analysis_mode == "bowling":
+                video_source = await _open_video_source(
+                    bucket=bucket, key=key, tmpdir=tmpdir, job_id=job_id
+                )
+
+            # Best-effort progress bump
+            job.progress_pct = 5
+            await _commit_progress(db, job)
+
+            analysis_task, quick_ready = _start_multi_rate_analysis(
+                run,
+                video_path=video_source,
+                passes=passes,
                 analysis_mode=job.analysis_mode,
+                pose_cache=pose_cache,
             )
+            await asyncio.wait({quick_ready, analysis_task}, return_when=asyncio.FIRST_COMPLETED)
+            if quick_ready.done():
+                quick_artifacts = quick_ready.result()
+            else:
+                # Analysis finished (or failed) without reporting QUICK separately
+                quick_artifacts = analysis_task.result()["quick"]
 
             quick_payload = quick_artifacts.results
             quick_out_key = _derive_output_key(key, "quick_results.json")
@@ -231,8 +562,10 @@ async def _process_job(job_id: str) -> None:
             job.status = VideoAnalysisJobStatus.quick_done
             job.stage = "QUICK_DONE"
             job.progress_pct = 50
+            run.quick_done = True
+            run.progress_pct = max(run.progress_pct, 50)
             job.quick_completed_at = _now_utc()
-            await db.commit()
+            await _commit_progress(db, job)
 
             logger.info(
                 f"Persisted quick artifacts: job_id={job.id} "
@@ -259,7 +592,7 @@ async def _process_job(job_id: str) -> None:
                     job.error_message = error_msg
                     job.completed_at = _now_utc()
                     video_session.status = VideoSessionStatus.failed
-                    await db.commit()
+                    await _commit_progress(db, job)
                     raise ValueError(error_msg)
 
                 logger.info(
@@ -273,8 +606,9 @@ async def _process_job(job_id: str) -> None:
                 video_session.status = VideoSessionStatus.ready
                 # Keep legacy results populated for older clients
                 job.results = {"quick": quick_payload}
-                await db.commit()
+                await _commit_progress(db, job)
                 await db.refresh(job)
+                await analysis_task
                 logger.info(
                     f"[PERSISTED] Quick-only job completed: job_id={job.id} "
                     f"status_after={job.status.value} stage={job.stage} "
@@ -298,7 +632,7 @@ async def _process_job(job_id: str) -> None:
             job.stage = "DEEP"
             job.progress_pct = 50
             job.deep_started_at = _now_utc()
-            await db.commit()
+            await _commit_progress(db, job)
 
             # CRITICAL: Re-validate analysis_mode before deep pass (defensive)
             if not job.analysis_mode:
@@ -308,19 +642,11 @@ async def _process_job(job_id: str) -> None:
                 job.stage = "FAILED"
                 job.error_message = error_msg
                 job.completed_at = _now_utc()
-                await db.commit()
+                await _commit_progress(db, job)
                 raise ValueError(error_msg)
 
-            # Deep pass uses job-configured FPS; keep a sane default
-            deep_artifacts = run_pose_metrics_findings_report(
-                video_path=local_video_path,
-                sample_fps=deep_fps,
-                include_frames=include_frames,
-                max_width=640,
-                max_seconds=None,
-                player_context=None,
-                analysis_mode=job.analysis_mode,
-            )
+            # Deep pass uses job-configured FPS; it shares the decode started for QUICK
+            deep_artifacts = (await analysis_task)["deep"]
 
             deep_payload = deep_artifacts.results
 
@@ -328,17 +654,12 @@ async def _process_job(job_id: str) -> None:
             if job.analysis_mode == "bowling":
                 try:
                     logger.info(f"Running ball tracking for bowling analysis: job_id={job.id}")
-                    from backend.services.ball_tracking_service import (
-                        BallTracker,
-                        analyze_ball_trajectory,
-                    )
-
-                    tracker = BallTracker(ball_color="red")  # TODO: make configurable
-                    trajectory = tracker.track_ball_in_video(
-                        video_path=local_video_path,
+                    trajectory, ball_metrics = await _get_analysis_pool().run(
+                        _track_ball,
+                        video_path=video_source,
                         sample_fps=deep_fps,
+                        tracking_mode=settings.COACH_PLUS_BALL_TRACKING_MODE,
                     )
-                    ball_metrics = analyze_ball_trajectory(trajectory)
 
                     ball_tracking_payload = {
                         "trajectory": {
@@ -348,6 +669,8 @@ async def _process_job(job_id: str) -> None:
                             "avg_velocity": trajectory.avg_velocity,
                             "max_velocity": trajectory.max_velocity,
                             "trajectory_length": trajectory.trajectory_length,
+                            "tracking_mode": trajectory.tracking_mode,
+                            "processing_fps": trajectory.processing_fps,
                             "release_point": {
                                 "x": trajectory.release_point.x,
                                 "y": trajectory.release_point.y,
@@ -415,20 +738,31 @@ async def _process_job(job_id: str) -> None:
                 "outputs": {"deep_results_s3_key": deep_out_key},
             }
 
-            # If frames were requested, upload them separately (can be large)
+            # If frames were requested, upload them separately as columnar pose
+            # arrays; the JSON form is only written as an opt-in export
             if deep_artifacts.frames is not None:
-                frames_key = _derive_output_key(key, "deep_frames.json")
+                pose_key = _derive_output_key(key, "deep_pose.npz")
                 logger.info(
-                    f"Saving deep frames to S3: job_id={job.id} bucket={bucket} key={frames_key} "
-                    f"frames_count={len(deep_artifacts.frames)}"
+                    f"Saving deep pose arrays to S3: job_id={job.id} bucket={bucket} "
+                    f"key={pose_key} frames_count={len(deep_artifacts.frames)}"
                 )
-                await _upload_json_to_s3(
+                await _upload_bytes_to_s3(
                     bucket=bucket,
-                    key=frames_key,
-                    payload={"frames": deep_artifacts.frames},
+                    key=pose_key,
+                    body=dumps_pose_npz(PoseArrays.from_frames(deep_artifacts.frames)),
+                    content_type=POSE_NPZ_CONTENT_TYPE,
                 )
                 deep_payload.setdefault("outputs", {})
-                deep_payload["outputs"]["deep_frames_s3_key"] = frames_key
+                deep_payload["outputs"]["deep_pose_s3_key"] = pose_key
+
+                if settings.COACH_PLUS_POSE_JSON_EXPORT:
+                    frames_key = _derive_output_key(key, "deep_frames.json")
+                    await _upload_json_to_s3(
+                        bucket=bucket,
+                        key=frames_key,
+                        payload={"frames": deep_artifacts.frames},
+                    )
+                    deep_payload["outputs"]["deep_frames_s3_key"] = frames_key
 
             # Extract findings and report for frontend
             deep_findings = deep_payload.get("findings")
@@ -447,7 +781,7 @@ async def _process_job(job_id: str) -> None:
                 job.error_message = error_msg
                 job.completed_at = _now_utc()
                 video_session.status = VideoSessionStatus.failed
-                await db.commit()
+                await _commit_progress(db, job)
                 raise ValueError(error_msg)
 
             # Persist results and extracted artifacts
@@ -470,7 +804,7 @@ async def _process_job(job_id: str) -> None:
             # Keep legacy results populated for older clients
             job.results = {"quick": quick_payload, "deep": deep_payload}
 
-            await db.commit()
+            await _commit_progress(db, job)
             await db.refresh(job)
 
             # Verify persisted data after refresh
@@ -490,40 +824,105 @@ async def _process_job(job_id: str) -> None:
             )
 
 
-async def _claim_one_job() -> str | None:
+async def _claim_one_job(*, max_duration_seconds: float | None = None) -> str | None:
     """Claim a single queued job for processing.
 
     Only jobs with status=queued are eligible for claiming.
     Jobs in awaiting_upload status are NOT claimed (upload not yet confirmed).
 
+    Args:
+        max_duration_seconds: Only claim jobs whose (estimated) video duration is
+            at most this long; ``None`` claims the oldest queued job.
+
     Returns:
         job_id if claimed, None if no jobs available
     """
     session_local = get_session_local()
 
     async with session_local() as db, db.begin():
-        stmt = (
-            select(VideoAnalysisJob)
-            .where(VideoAnalysisJob.status == VideoAnalysisJobStatus.queued)
-            .order_by(VideoAnalysisJob.created_at)
-            .with_for_update(skip_locked=True)
-            .limit(1)
+        stmt = select(VideoAnalysisJob).where(
+            VideoAnalysisJob.status == VideoAnalysisJobStatus.queued
         )
+        if max_duration_seconds is not None and math.isfinite(max_duration_seconds):
+            cost = func.coalesce(
+                VideoAnalysisJob.video_duration_seconds, UNKNOWN_DURATION_ESTIMATE_SECONDS
+            )
+            stmt = stmt.where(cost <= max_duration_seconds)
+        stmt = stmt.order_by(VideoAnalysisJob.created_at).with_for_update(skip_locked=True).limit(1)
         result = await db.execute(stmt)
         job = result.scalars().first()
         if job is None:
             return None
 
         # Claim by moving to QUICK_RUNNING (prevents other workers)
+        now = _now_utc()
         job.status = VideoAnalysisJobStatus.quick_running
         job.stage = "QUICK"
         job.progress_pct = 0
-        job.started_at = job.started_at or _now_utc()
-        job.quick_started_at = _now_utc()
+        job.started_at = job.started_at or now
+        job.quick_started_at = now
+
+        queued_at = job.queued_at or job.created_at
+        if queued_at is not None:
+            if queued_at.tzinfo is None:
+                queued_at = queued_at.replace(tzinfo=UTC)
+            job.queue_wait_seconds = max(0.0, (now - queued_at).total_seconds())
+        logger.info(
+            f"Claimed job_id={job.id} queue_wait_s={job.queue_wait_seconds} "
+            f"duration_s={job.video_duration_seconds}"
+        )
 
         return job.id
 
 
+async def _job_duration_seconds(job_id: str) -> float | None:
+    session_local = get_session_local()
+    async with session_local() as db:
+        result = await db.execute(
+            select(VideoAnalysisJob.video_duration_seconds).where(VideoAnalysisJob.id == job_id)
+        )
+        return result.scalar_one_or_none()
+
+
+async def _mark_job_failed(job_id: str, error: Exception) -> None:
+    """Best-effort mark a job (and its session) failed after an unhandled error."""
+    session_local = get_session_local()
+    async with session_local() as db:
+        result = await db.execute(
+            select(VideoAnalysisJob)
+            .options(selectinload(VideoAnalysisJob.session))
+            .where(VideoAnalysisJob.id == job_id)
+        )
+        job = result.scalar_one_or_none()
+        if job is not None:
+            job.status = VideoAnalysisJobStatus.failed
+            job.stage = "FAILED"
+            job.error_message = str(error)
+            job.progress_pct = min(int(job.progress_pct or 0), 99)
+            job.completed_at = _now_utc()
+            job.session.status = VideoSessionStatus.failed
+            await _commit_progress(db, job)
+
+
+async def _requeue_job(job_id: str) -> None:
+    """Hand a job interrupted by worker shutdown back to the queue."""
+    session_local = get_session_local()
+    async with session_local() as db:
+        job = await db.get(VideoAnalysisJob, job_id)
+        if job is None or job.status in (
+            VideoAnalysisJobStatus.done,
+            VideoAnalysisJobStatus.completed,
+            VideoAnalysisJobStatus.failed,
+        ):
+            return
+        job.status = VideoAnalysisJobStatus.queued
+        job.stage = "QUEUED"
+        job.progress_pct = 0
+        job.heartbeat_at = None
+        job.queued_at = _now_utc()
+        await _commit_progress(db, job)
+
+
 async def _check_and_aggregate_chunks() -> str | None:
     """Check for jobs with all chunks completed and aggregate them.
 
@@ -567,7 +966,7 @@ async def _check_and_aggregate_chunks() -> str | None:
             job.status = VideoAnalysisJobStatus.deep_running
             job.stage = "AGGREGATING"
             job.progress_pct = 99
-            await db.commit()
+            await _commit_progress(db, job)
 
             # Reload with session relationship
             await db.refresh(job, ["session"])
@@ -582,7 +981,7 @@ async def _check_and_aggregate_chunks() -> str | None:
             job.completed_at = _now_utc()
             job.session.status = VideoSessionStatus.ready
 
-            await db.commit()
+            await _commit_progress(db, job)
 
             logger.info(f"Chunk aggregation successful: job_id={job_id}")
             return job_id
@@ -593,7 +992,7 @@ async def _check_and_aggregate_chunks() -> str | None:
             job.stage = "FAILED"
             job.error_message = f"Aggregation failed: {e!s}"
             job.session.status = VideoSessionStatus.failed
-            await db.commit()
+            await _commit_progress(db, job)
             raise
 
 
@@ -636,49 +1035,75 @@ async def run_worker_loop(*, poll_seconds: float = 1.0) -> None:
 
             signal.signal(sig, _handler)
 
+    scheduler = _build_scheduler()
+    running: dict[asyncio.Task[None], str] = {}
+
+    wakeup = get_wakeup_channel()
+    try:
+        await wakeup.start([JOBS_TOPIC])
+    except Exception as e:
+        logger.warning(f"Wake-up channel unavailable, polling only: {e}")
+    backoff = IdleBackoff(poll_seconds, settings.COACH_PLUS_IDLE_POLL_MAX_SECONDS)
+
     while not stop_event.is_set():
         try:
             # First check for chunk aggregation (higher priority)
             agg_job_id = await _check_and_aggregate_chunks()
             if agg_job_id:
                 logger.info(f"Aggregated chunks for job_id={agg_job_id}")
+                backoff.reset()
                 continue  # Check again immediately
 
-            # Then claim regular jobs
-            job_id = await _claim_one_job()
-            if job_id is None:
-                await asyncio.sleep(poll_seconds)
-                continue
-
-            logger.info("Claimed job_id=%s", job_id)
-
-            try:
-                await _process_job(job_id)
-                logger.info("Completed job_id=%s", job_id)
-            except Exception as e:
-                logger.exception("Job failed job_id=%s", job_id)
-                # Best-effort mark failed
-                session_local = get_session_local()
-                async with session_local() as db:
-                    result = await db.execute(
-                        select(VideoAnalysisJob)
-                        .options(selectinload(VideoAnalysisJob.session))
-                        .where(VideoAnalysisJob.id == job_id)
-                    )
-                    job = result.scalar_one_or_none()
-                    if job is not None:
-                        job.status = VideoAnalysisJobStatus.failed
-                        job.stage = "FAILED"
-                        job.error_message = str(e)
-                        job.progress_pct = min(int(job.progress_pct or 0), 99)
-                        job.completed_at = _now_utc()
-                        job.session.status = VideoSessionStatus.failed
-                        await db.commit()
+            # Then fill free job slots
+            limit = scheduler.claim_limit()
+            if limit is not None:
+                job_id = await _claim_one_job(max_duration_seconds=limit)
+                if job_id is not None:
+                    scheduler.start(job_id, await _job_duration_seconds(job_id))
+                    running[asyncio.create_task(_process_job(job_id))] = job_id
+                    backoff.reset()
+                    continue  # Try the next slot immediately
+
+            # Sleep until a job finishes, work is published, or the safety-net poll.
+            # Analysis runs off the loop, so signals are handled while jobs run.
+            stop_wait = asyncio.create_task(stop_event.wait())
+            woken = asyncio.create_task(wakeup.wait(JOBS_TOPIC, backoff.next_delay()))
+            done, _ = await asyncio.wait(
+                {stop_wait, woken, *running}, return_when=asyncio.FIRST_COMPLETED
+            )
+            stop_wait.cancel()
+            woken.cancel()
+            if woken in done and woken.result():
+                backoff.reset()
+
+            for task in done - {stop_wait, woken}:
+                job_id = running.pop(task)
+                scheduler.finish(job_id)
+                try:
+                    task.result()
+                    logger.info("Completed job_id=%s", job_id)
+                except Exception as e:
+                    logger.exception("Job failed job_id=%s", job_id)
+                    await _mark_job_failed(job_id, e)
 
         except Exception:
             logger.exception("Worker loop error")
             await asyncio.sleep(poll_seconds)
 
+    # Stopping mid-job: cancel in-flight analysis and hand the jobs back
+    for task, job_id in running.items():
+        logger.info("Stopping mid-job; requeueing job_id=%s", job_id)
+        task.cancel()
+    await asyncio.gather(*running, return_exceptions=True)
+    for task, job_id in running.items():
+        if not task.cancelled() and task.exception() is None:
+            continue  # Finished before it could be cancelled
+        await _requeue_job(job_id)
+
+    await wakeup.close()
+    if _analysis_pool is not None:
+        await asyncio.to_thread(_analysis_pool.shutdown)
+
     # Dispose engine
     with contextlib.suppress(Exception):
         await get_engine().dispose()
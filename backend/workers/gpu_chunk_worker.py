@@ -7,8 +7,6 @@ Multiple GPU workers can run concurrently, each claiming chunks via SKIP LOCKED.
 from __future__ import annotations
 
 import asyncio
-import contextlib
-import json
 import logging
 import os
 import signal
@@ -17,13 +15,22 @@ from datetime import UTC, datetime
 from typing import Any, cast
 
 import boto3
-import cv2
 from botocore.exceptions import ClientError
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
 from backend.config import settings
-from backend.services.coach_plus_analysis import extract_pose_landmarks
+from backend.services.job_progress import job_progress_event, publish_job_progress
+from backend.services.job_wakeup import (
+    CHUNKS_TOPIC,
+    JOBS_TOPIC,
+    IdleBackoff,
+    get_wakeup_channel,
+    publish_wakeup,
+)
+from backend.services.pose_artifact import POSE_NPZ_CONTENT_TYPE, PoseArrays, dumps_pose_npz
+from backend.services.pose_service import extract_pose_keypoints_from_video, warm_pose_detector
+from backend.services.video_source import presign_video_stream
 from backend.sql_app.database import get_session_local
 from backend.sql_app.models import (
     VideoAnalysisChunk,
@@ -77,16 +84,30 @@ async def _download_from_s3(
     await loop.run_in_executor(None, _dl)
 
 
-async def _upload_json_to_s3(*, bucket: str, key: str, payload: dict[str, Any]) -> None:
-    """Upload JSON payload to S3.
+async def _open_video_source(*, bucket: str, key: str, tmpdir: str, chunk_id: str) -> str:
+    """Return what the decoder reads the video from.
+
+    A presigned URL: the pose service seeks to the chunk's start, so FFmpeg's
+    ranged reads fetch little beyond the chunk's own byte range. With
+    ``COACH_PLUS_STREAM_VIDEO_INPUT`` off, a full local copy in ``tmpdir``.
+    """
+    if settings.COACH_PLUS_STREAM_VIDEO_INPUT:
+        return await presign_video_stream(bucket=bucket, key=key, context=f"chunk_id={chunk_id}")
+    local_video_path = os.path.join(tmpdir, "video.mp4")
+    await _download_from_s3(bucket=bucket, key=key, dst_path=local_video_path, chunk_id=chunk_id)
+    return local_video_path
+
+
+async def _upload_bytes_to_s3(*, bucket: str, key: str, body: bytes, content_type: str) -> None:
+    """Upload an artifact to S3.
 
     Args:
         bucket: S3 bucket name
         key: S3 object key
-        payload: JSON payload to upload
+        body: Serialized artifact
+        content_type: MIME type stored with the object
     """
     s3 = cast(Any, boto3.client("s3", region_name=settings.AWS_REGION))
-    body = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
     loop = asyncio.get_running_loop()
 
     def _put() -> None:
@@ -94,7 +115,7 @@ async def _upload_json_to_s3(*, bucket: str, key: str, payload: dict[str, Any])
             Bucket=bucket,
             Key=key,
             Body=body,
-            ContentType="application/json",
+            ContentType=content_type,
         )
 
     await loop.run_in_executor(None, _put)
@@ -110,6 +131,10 @@ def extract_chunk_poses(
 ) -> dict[str, Any]:
     """Extract pose landmarks for a video chunk.
 
+    The pose service seeks straight to ``start_sec`` and stops at ``end_sec``, so
+    each chunk decodes and analyses only its own slice. Frame numbers and
+    timestamps in the returned poses are absolute to the whole video.
+
     Args:
         video_path: Path to video file
         start_sec: Chunk start time in seconds
@@ -120,60 +145,30 @@ def extract_chunk_poses(
     Returns:
         Dict with pose landmarks and metadata
     """
-    cap = cv2.VideoCapture(video_path)
-    try:
-        if not cap.isOpened():
-            raise ValueError(f"Could not open video: {video_path}")
-
-        # Get video properties
-        fps = cap.get(cv2.CAP_PROP_FPS)
-        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-
-        # Calculate frame range for chunk
-        start_frame = int(start_sec * fps)
-        end_frame = min(int(end_sec * fps), total_frames)
-
-        logger.info(
-            f"Processing chunk: start_sec={start_sec:.2f} end_sec={end_sec:.2f} "
-            f"start_frame={start_frame} end_frame={end_frame} fps={fps:.2f}"
-        )
-
-        # Seek to start position using CAP_PROP_POS_MSEC
-        start_ms = start_sec * 1000
-        cap.set(cv2.CAP_PROP_POS_MSEC, start_ms)
-
-        # Verify seek worked
-        actual_pos = cap.get(cv2.CAP_PROP_POS_MSEC) / 1000
-        logger.info(
-            f"Seeked to: requested={start_sec:.2f}s actual={actual_pos:.2f}s "
-            f"delta={abs(actual_pos - start_sec):.2f}s"
-        )
-
-        # Extract poses using existing service
-        # (This reuses the existing extract_pose_landmarks but on a seeked video)
-        # For simplicity, we'll extract from current position to end_sec
-        chunk_duration = end_sec - start_sec
-
-        poses = extract_pose_landmarks(
-            video_path=video_path,
-            sample_fps=sample_fps,
-            max_width=max_width,
-            max_seconds=chunk_duration,
-        )
-
-        return {
-            "poses": poses,
-            "metadata": {
-                "start_sec": start_sec,
-                "end_sec": end_sec,
-                "chunk_duration": chunk_duration,
-                "video_fps": fps,
-                "start_frame": start_frame,
-                "end_frame": end_frame,
-            },
-        }
-    finally:
-        cap.release()
+    logger.info(f"Processing chunk: start_sec={start_sec:.2f} end_sec={end_sec:.2f}")
+
+    pose_data = extract_pose_keypoints_from_video(
+        video_path=video_path,
+        sample_fps=sample_fps,
+        max_width=max_width,
+        start_sec=start_sec,
+        end_sec=end_sec,
+    )
+    segment = pose_data.get("segment") or {}
+    poses = pose_data.get("frames") or []
+
+    return {
+        "poses": poses,
+        "metadata": {
+            "start_sec": start_sec,
+            "end_sec": end_sec,
+            "chunk_duration": end_sec - start_sec,
+            "video_fps": pose_data.get("fps"),
+            "start_frame": segment.get("start_frame"),
+            "end_frame": segment.get("end_frame"),
+            "sampled_frames": len(poses),
+        },
+    }
 
 
 async def _process_chunk(chunk_id: str) -> None:
@@ -212,7 +207,7 @@ async def _process_chunk(chunk_id: str) -> None:
         # Check if artifact already exists (idempotency)
         from backend.services.video_chunking import check_chunk_artifact_exists
 
-        artifact_key = f"jobs/{job.id}/chunks/chunk_{chunk.chunk_index:04d}.json"
+        artifact_key = f"jobs/{job.id}/chunks/chunk_{chunk.chunk_index:04d}.npz"
         if await check_chunk_artifact_exists(bucket, artifact_key):
             logger.info(
                 f"Chunk artifact already exists: chunk_id={chunk_id} s3_key={artifact_key} "
@@ -228,34 +223,34 @@ async def _process_chunk(chunk_id: str) -> None:
                 job.progress_pct = min(99, int(100 * job.completed_chunks / job.total_chunks))
 
             await db.commit()
+            await publish_job_progress(job_progress_event(job))
+            await _wake_aggregation_if_complete(job)
             return
 
-        # Download video to temp file
+        # Stream only this chunk's window from S3 (or download the whole video when
+        # streaming is disabled)
         with tempfile.TemporaryDirectory(prefix="gpu_chunk_") as tmpdir:
-            local_video_path = os.path.join(tmpdir, "video.mp4")
-
-            await _download_from_s3(
-                bucket=bucket,
-                key=key,
-                dst_path=local_video_path,
-                chunk_id=chunk_id,
+            video_source = await _open_video_source(
+                bucket=bucket, key=key, tmpdir=tmpdir, chunk_id=chunk_id
             )
 
             # Extract poses for this chunk
             try:
                 chunk_data = extract_chunk_poses(
-                    video_path=local_video_path,
+                    video_path=video_source,
                     start_sec=chunk.start_sec,
                     end_sec=chunk.end_sec,
                     sample_fps=settings.SAMPLE_FPS,
                     max_width=settings.MAX_WIDTH,
                 )
 
-                # Upload chunk artifact to S3
-                await _upload_json_to_s3(
+                # Upload chunk artifact to S3 as columnar pose arrays (.npz)
+                poses = PoseArrays.from_frames(chunk_data["poses"], metadata=chunk_data["metadata"])
+                await _upload_bytes_to_s3(
                     bucket=bucket,
                     key=artifact_key,
-                    payload=chunk_data,
+                    body=dumps_pose_npz(poses),
+                    content_type=POSE_NPZ_CONTENT_TYPE,
                 )
 
                 # Mark chunk complete
@@ -273,6 +268,8 @@ async def _process_chunk(chunk_id: str) -> None:
                     job.progress_pct = min(99, int(100 * job.completed_chunks / job.total_chunks))
 
                 await db.commit()
+                await publish_job_progress(job_progress_event(job))
+                await _wake_aggregation_if_complete(job)
 
                 logger.info(
                     f"Chunk completed: chunk_id={chunk_id} index={chunk.chunk_index} "
@@ -292,6 +289,12 @@ async def _process_chunk(chunk_id: str) -> None:
                 raise
 
 
+async def _wake_aggregation_if_complete(job: VideoAnalysisJob) -> None:
+    """Wake the analysis worker once every chunk of ``job`` is done."""
+    if job.total_chunks and job.completed_chunks == job.total_chunks:
+        await publish_wakeup(JOBS_TOPIC, job.id)
+
+
 async def _claim_one_chunk() -> str | None:
     """Claim a single queued chunk for processing.
 
@@ -336,6 +339,9 @@ async def run_gpu_worker_loop(*, poll_seconds: float = 1.0) -> None:
         f"SAMPLE_FPS={settings.SAMPLE_FPS} MAX_WIDTH={settings.MAX_WIDTH}"
     )
 
+    # Load the pose model once up front rather than on the first chunk
+    await asyncio.to_thread(warm_pose_detector)
+
     stop_event = asyncio.Event()
 
     def _request_stop() -> None:
@@ -346,18 +352,32 @@ async def run_gpu_worker_loop(*, poll_seconds: float = 1.0) -> None:
     loop.add_signal_handler(signal.SIGINT, _request_stop)
     loop.add_signal_handler(signal.SIGTERM, _request_stop)
 
+    wakeup = get_wakeup_channel()
+    try:
+        await wakeup.start([CHUNKS_TOPIC])
+    except Exception as e:
+        logger.warning(f"Wake-up channel unavailable, polling only: {e}")
+    backoff = IdleBackoff(poll_seconds, settings.COACH_PLUS_IDLE_POLL_MAX_SECONDS)
+
     while not stop_event.is_set():
         chunk_id = await _claim_one_chunk()
         if chunk_id:
+            backoff.reset()
             try:
                 await _process_chunk(chunk_id)
             except Exception as e:
                 logger.exception(f"Chunk processing error: chunk_id={chunk_id} error={e!s}")
         else:
-            # No chunks available - wait before polling again
-            with contextlib.suppress(asyncio.TimeoutError):
-                await asyncio.wait_for(stop_event.wait(), timeout=poll_seconds)
-
+            # No chunks available - sleep until chunks are published (or the safety-net poll)
+            stop_wait = asyncio.create_task(stop_event.wait())
+            woken = asyncio.create_task(wakeup.wait(CHUNKS_TOPIC, backoff.next_delay()))
+            done, _ = await asyncio.wait({stop_wait, woken}, return_when=asyncio.FIRST_COMPLETED)
+            stop_wait.cancel()
+            woken.cancel()
+            if woken in done and woken.result():
+                backoff.reset()
+
+    await wakeup.close()
     logger.info("gpu_chunk_worker stopped")
 
 
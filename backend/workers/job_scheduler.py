@@ -0,0 +1,76 @@
+"""
+Job Scheduler - admission control for concurrent video analysis jobs.
+
+The analysis worker runs several jobs at once. Decode and inference cost scale
+with video length, so slots alone would let a couple of long net sessions
+monopolise a host while 30-second clips wait behind them. The scheduler decides,
+before each claim, how long a video the next job may be:
+
+- ``slots`` jobs run concurrently at most,
+- ``fast_lane_slots`` of them are reserved for clips no longer than
+  ``fast_lane_seconds``, so short clips are never stuck behind long sessions,
+- the summed duration of in-flight videos stays within ``max_inflight_seconds``
+  (a single job is always admitted, however long, so nothing starves).
+
+Jobs whose duration is not known yet are costed at
+``UNKNOWN_DURATION_ESTIMATE_SECONDS`` and never use the fast lane.
+"""
+
+from __future__ import annotations
+
+import math
+
+# Cost assumed for jobs whose video_duration_seconds has not been measured yet
+UNKNOWN_DURATION_ESTIMATE_SECONDS = 600.0
+
+
+def estimate_duration_seconds(duration_seconds: float | None) -> float:
+    """Scheduling cost of a video: its duration, or a conservative estimate."""
+    if duration_seconds is None or duration_seconds <= 0:
+        return UNKNOWN_DURATION_ESTIMATE_SECONDS
+    return float(duration_seconds)
+
+
+class JobScheduler:
+    """Tracks in-flight jobs and bounds what the worker may claim next."""
+
+    def __init__(
+        self,
+        *,
+        slots: int = 1,
+        fast_lane_slots: int = 1,
+        fast_lane_seconds: float = 120.0,
+        max_inflight_seconds: float = math.inf,
+    ) -> None:
+        self.slots = max(1, int(slots))
+        # A single-slot worker has no spare slot to reserve
+        self.fast_lane_slots = min(max(0, int(fast_lane_slots)), self.slots - 1)
+        self.fast_lane_seconds = float(fast_lane_seconds)
+        self.max_inflight_seconds = float(max_inflight_seconds)
+        self.inflight: dict[str, float] = {}
+
+    @property
+    def inflight_seconds(self) -> float:
+        return sum(self.inflight.values())
+
+    def is_short(self, cost_seconds: float) -> bool:
+        return cost_seconds <= self.fast_lane_seconds
+
+    def claim_limit(self) -> float | None:
+        """Longest video (in seconds) the next claim may take; ``None`` if no slot is free."""
+        if len(self.inflight) >= self.slots:
+            return None
+        if not self.inflight:
+            return math.inf
+
+        limit = self.max_inflight_seconds - self.inflight_seconds
+        long_running = sum(1 for cost in self.inflight.values() if not self.is_short(cost))
+        if long_running >= self.slots - self.fast_lane_slots:
+            limit = min(limit, self.fast_lane_seconds)
+        return limit if limit > 0 else None
+
+    def start(self, job_id: str, duration_seconds: float | None) -> None:
+        self.inflight[job_id] = estimate_duration_seconds(duration_seconds)
+
+    def finish(self, job_id: str) -> None:
+        self.inflight.pop(job_id, None)